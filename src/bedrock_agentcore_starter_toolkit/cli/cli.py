@@ -17,6 +17,7 @@ from .create.commands import create_app
 from .create.import_agent.commands import import_agent
 from .identity.commands import identity_app
 from .recommendation import print_recommendation
+from .runtime.bench_command import bench
 from .runtime.commands import (
     configure_app,
     deploy,
@@ -48,6 +49,7 @@ create_app.command("import")(import_agent)
 app.command("dev")(dev)
 app.command("deploy")(deploy)
 app.command("invoke")(invoke)
+app.command("bench")(bench)
 app.command("status")(status)
 app.command("destroy")(destroy)
 app.command("stop-session")(stop_session)
@@ -2,6 +2,7 @@
 
 import json
 import logging
+import sqlite3
 from pathlib import Path
 from typing import List, Optional
 
@@ -9,8 +10,16 @@ import typer
 from botocore.exceptions import ClientError
 
 from ...operations.evaluation import evaluator_processor, online_processor
+from ...operations.evaluation.batch_processor import (
+    DEFAULT_PREFETCH_SESSIONS,
+    BatchEvaluationRun,
+    evaluate_sessions,
+    read_session_ids,
+)
+from ...operations.evaluation.cache import EvaluationResultCache
 from ...operations.evaluation.control_plane_client import EvaluationControlPlaneClient
 from ...operations.evaluation.data_plane_client import EvaluationDataPlaneClient
+from ...operations.evaluation.evaluator_metadata import EvaluatorMetadataCache
 from ...operations.evaluation.formatters import (
     display_evaluation_results,
     display_evaluator_details,
@@ -20,6 +29,7 @@ from ...operations.evaluation.formatters import (
 )
 from ...operations.evaluation.models import ReferenceInputs
 from ...operations.evaluation.on_demand_processor import EvaluationProcessor
+from ...operations.observability import LocalTelemetrySource, ObservabilityCache, load_trace_data
 from ...utils.aws import ensure_valid_aws_creds
 from ...utils.runtime.config import load_config_if_exists
 from ..common import console
@@ -69,6 +79,39 @@ def _get_agent_config_from_file(agent_name: Optional[str] = None) -> Optional[di
         return None
 
 
+def _resolve_agent_id(agent: Optional[str], agent_id: Optional[str], config: Optional[dict]) -> str:
+    """Get the agent ID from --agent-id or the config, exiting with guidance if there is none."""
+    if agent_id:
+        return agent_id
+    if config and config.get("agent_id"):
+        return config["agent_id"]
+    if agent:
+        # User provided --agent but no config found - clear error
+        console.print(f"[red]Error:[/red] Agent '{agent}' not found in config")
+        console.print("\nOptions:")
+        console.print("  1. Check agent name: agentcore configure list")
+        console.print("  2. Use --agent-id instead if you have the agent ID")
+        raise typer.Exit(1)
+    console.print("[red]Error:[/red] No agent specified")
+    console.print("\nProvide agent via:")
+    console.print("  1. --agent-id AGENT_ID")
+    console.print("  2. --agent AGENT_NAME (requires config)")
+    raise typer.Exit(1)
+
+
+def _resolve_region(config: Optional[dict]) -> str:
+    """Get the region from the config or boto3's default resolution (env vars, AWS config, etc.)."""
+    if config and config.get("region"):
+        return config["region"]
+
+    import boto3
+
+    session = boto3.Session()
+    region = session.region_name or "us-east-1"
+    console.print(f"[dim]Using AWS region: {region}[/dim]")
+    return region
+
+
 # Removed: _display_evaluation_results - now using shared formatters.display_evaluation_results
 
 
@@ -105,10 +148,19 @@ def run_evaluation(
     expected_trajectory: List[str] = typer.Option(  # noqa: B008
         [], "--expected-trajectory", help="Expected tool trajectory step(s) (can specify multiple)"
     ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Query CloudWatch for the full time range instead of reusing cached session data"
+    ),
+    no_result_cache: bool = typer.Option(
+        False, "--no-result-cache", help="Call every evaluator again instead of reusing cached results"
+    ),
+    files: Optional[List[Path]] = typer.Option(  # noqa: B008
+        None, "--file", "-f", help="Read the session from exported JSON or OTLP files instead of CloudWatch"
+    ),
 ):
     """Run evaluation on a session.
 
-    Default behavior: Evaluates all traces (most recent 1000 spans).
+    Default behavior: Evaluates all traces (most recent spans that fit in one request).
     With --trace-id: Evaluates only that trace (includes spans from all previous traces for context).
 
     Examples:
@@ -132,12 +184,28 @@ def run_evaluation(
 
         # Save results to file
         agentcore eval run -o results.json
+
+        # Evaluate the latest session in exported spans and logs (no CloudWatch access)
+        agentcore eval run -f spans.jsonl -f logs.jsonl
+
+    Results are cached in .bedrock_agentcore/, so re-running only calls evaluators
+    whose spans, reference inputs or config changed; use --no-result-cache to call all of them.
     """
     # Get config from agent
     config = _get_agent_config_from_file(agent)
 
-    # Get session_id from CLI or config
-    if not session_id:
+    # Get session_id from CLI, the files or config
+    if files and not session_id:
+        try:
+            session_id = LocalTelemetrySource(files).get_latest_session_id(agent_id=agent_id)
+        except (OSError, ValueError) as e:
+            console.print(f"[red]Error:[/red] {e}")
+            raise typer.Exit(1) from e
+        if not session_id:
+            console.print("[red]Error:[/red] No sessions found in the given files")
+            raise typer.Exit(1)
+        console.print(f"[dim]Using latest session in files: {session_id}[/dim]")
+    elif not session_id:
         if config and config.get("session_id"):
             session_id = config["session_id"]
             console.print(f"[dim]Using session from config: {session_id}[/dim]")
@@ -148,36 +216,11 @@ def run_evaluation(
             console.print("  2. Configuration file: .bedrock_agentcore.yaml")
             raise typer.Exit(1)
 
-    # Get agent_id from CLI or config
-    if agent_id:
-        # Explicit --agent-id provided
-        pass
-    elif config and config.get("agent_id"):
-        agent_id = config["agent_id"]
-    elif agent:
-        # User provided --agent but no config found - clear error
-        console.print(f"[red]Error:[/red] Agent '{agent}' not found in config")
-        console.print("\nOptions:")
-        console.print("  1. Check agent name: agentcore configure list")
-        console.print("  2. Use --agent-id instead if you have the agent ID")
-        raise typer.Exit(1)
-    else:
-        console.print("[red]Error:[/red] No agent specified")
-        console.print("\nProvide agent via:")
-        console.print("  1. --agent-id AGENT_ID")
-        console.print("  2. --agent AGENT_NAME (requires config)")
-        raise typer.Exit(1)
-
-    # Get region from config or boto3 default
-    if config and config.get("region"):
-        region = config["region"]
-    else:
-        # Use boto3's default region resolution (env vars, AWS config, etc.)
-        import boto3
+    # Get agent_id from CLI or config; local files need no agent
+    if not files:
+        agent_id = _resolve_agent_id(agent, agent_id, config)
 
-        session = boto3.Session()
-        region = session.region_name or "us-east-1"
-        console.print(f"[dim]Using AWS region: {region}[/dim]")
+    region = _resolve_region(config)
 
     # Convert evaluators to list (Typer returns list or None)
     evaluator_list = evaluators if evaluators else ["Builtin.GoalSuccessRate"]
@@ -200,7 +243,7 @@ def run_evaluation(
     if trace_id:
         console.print(f"[cyan]Trace:[/cyan] {trace_id} (with previous traces for context)")
     else:
-        console.print("[cyan]Mode:[/cyan] All traces (most recent 1000 spans)")
+        console.print("[cyan]Mode:[/cyan] All traces (most recent spans that fit in one request)")
     console.print(f"[cyan]Evaluators:[/cyan] {', '.join(evaluator_list)}")
     if reference_inputs:
         parts = []
@@ -217,19 +260,38 @@ def run_evaluation(
         # Create evaluation clients and processor
         data_plane_client = EvaluationDataPlaneClient(region_name=region)
         control_plane_client = EvaluationControlPlaneClient(region_name=region)
-        processor = EvaluationProcessor(data_plane_client, control_plane_client)
+        observability_cache = None if no_cache or files else ObservabilityCache.for_project(Path.cwd())
+        result_cache = None if no_result_cache else EvaluationResultCache.for_project(Path.cwd())
+        processor = EvaluationProcessor(
+            data_plane_client,
+            control_plane_client,
+            observability_cache,
+            result_cache=result_cache,
+            evaluator_metadata=EvaluatorMetadataCache.for_project(Path.cwd(), region),
+        )
 
         # Run evaluation
         with console.status("[cyan]Running evaluation...[/cyan]"):
-            results = processor.evaluate_session(
-                session_id=session_id,
-                evaluators=evaluator_list,
-                agent_id=agent_id,
-                region=region,
-                trace_id=trace_id,
-                days=days,
-                reference_inputs=reference_inputs,
-            )
+            if files:
+                trace_data = load_trace_data(files, session_id=session_id, agent_id=agent_id)
+                if not trace_data.spans:
+                    raise RuntimeError(f"No spans found for session {session_id} in the given files")
+                results = processor.evaluate_trace_data(
+                    trace_data,
+                    evaluators=evaluator_list,
+                    trace_id=trace_id,
+                    reference_inputs=reference_inputs,
+                )
+            else:
+                results = processor.evaluate_session(
+                    session_id=session_id,
+                    evaluators=evaluator_list,
+                    agent_id=agent_id,
+                    region=region,
+                    trace_id=trace_id,
+                    days=days,
+                    reference_inputs=reference_inputs,
+                )
 
         # Display results
         display_evaluation_results(results, console)
@@ -246,12 +308,191 @@ def run_evaluation(
     except RuntimeError as e:
         console.print(f"\n[red]Error:[/red] {e}")
         raise typer.Exit(1) from e
-    except (ClientError, ValueError, KeyError, TypeError) as e:
+    except (ClientError, ValueError, KeyError, TypeError, OSError) as e:
         console.print(f"\n[red]Error:[/red] {e}")
         logger.exception("Evaluation failed")
         raise typer.Exit(1) from e
 
 
+@evaluation_app.command("batch")
+def run_batch_evaluation(
+    agent: Optional[str] = typer.Option(
+        None,
+        "--agent",
+        "-a",
+        help="Agent name (use 'agentcore configure list' to see available agents)",
+    ),
+    agent_id: Optional[str] = typer.Option(None, "--agent-id", help="Override agent ID from config"),
+    session_ids: List[str] = typer.Option(  # noqa: B008
+        [], "--session-id", "-s", help="Session(s) to evaluate (can specify multiple times)"
+    ),
+    sessions_file: Optional[Path] = typer.Option(  # noqa: B008
+        None, "--sessions-file", help="File with one session ID per line ('#' starts a comment)"
+    ),
+    last: Optional[int] = typer.Option(
+        None, "--last", "-n", min=1, help="Evaluate the agent's N most recently active sessions"
+    ),
+    evaluators: List[str] = typer.Option(  # noqa: B008
+        [], "--evaluator", "-e", help="Evaluator(s) to use (can specify multiple times)"
+    ),
+    days: int = typer.Option(7, "--days", "-d", help="Number of days to look back for session data (default: 7)"),
+    output: Path = typer.Option(  # noqa: B008
+        ..., "--output", "-o", help="JSONL file receiving one line of results per session"
+    ),
+    resume: bool = typer.Option(
+        False, "--resume", help="Continue an interrupted batch from the checkpoint next to --output"
+    ),
+    prefetch: int = typer.Option(
+        DEFAULT_PREFETCH_SESSIONS, "--prefetch", min=1, help="Sessions to fetch ahead of the one being evaluated"
+    ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Query CloudWatch for the full time range instead of reusing cached session data"
+    ),
+    no_result_cache: bool = typer.Option(
+        False, "--no-result-cache", help="Call every evaluator again instead of reusing cached results"
+    ),
+):
+    """Evaluate many sessions in one run, writing results to a JSONL file.
+
+    The next sessions are fetched while the current one is evaluated, and each
+    session's results are appended to --output as soon as it finishes. The
+    session list is saved to a checkpoint next to the output, so an
+    interrupted batch continues with --resume.
+
+    Examples:
+        # Score the agent's 500 most recent sessions
+        agentcore eval batch --last 500 -o nightly.jsonl
+
+        # Evaluate sessions listed in a file with two evaluators
+        agentcore eval batch --sessions-file sessions.txt -e Builtin.Helpfulness -e Builtin.Correctness -o out.jsonl
+
+        # Continue after an interruption
+        agentcore eval batch -o nightly.jsonl --resume
+    """
+    config = _get_agent_config_from_file(agent)
+    run = BatchEvaluationRun(output)
+
+    if resume:
+        if session_ids or sessions_file or last or evaluators:
+            console.print("[red]Error:[/red] --resume continues the saved batch; session and evaluator options")
+            console.print("cannot be combined with it")
+            raise typer.Exit(1)
+        try:
+            checkpoint, pending = run.resume()
+        except FileNotFoundError as e:
+            console.print(f"[red]Error:[/red] No batch checkpoint found at {run.checkpoint_path}")
+            console.print("[dim]Tip: Start the batch without --resume first[/dim]")
+            raise typer.Exit(1) from e
+        except ValueError as e:
+            console.print(f"[red]Error:[/red] {e}")
+            raise typer.Exit(1) from e
+        agent_id = _resolve_agent_id(agent, agent_id or checkpoint.agent_id, config)
+        region = _resolve_region(config)
+        evaluator_list = checkpoint.evaluators
+        total = len(checkpoint.session_ids)
+        console.print(f"[dim]Resuming batch: {total - len(pending)} of {total} sessions already evaluated[/dim]")
+    else:
+        if last and (session_ids or sessions_file):
+            console.print("[red]Error:[/red] Use either --last or --session-id/--sessions-file")
+            raise typer.Exit(1)
+        agent_id = _resolve_agent_id(agent, agent_id, config)
+        region = _resolve_region(config)
+        evaluator_list = evaluators if evaluators else ["Builtin.GoalSuccessRate"]
+
+    try:
+        data_plane_client = EvaluationDataPlaneClient(region_name=region)
+        control_plane_client = EvaluationControlPlaneClient(region_name=region)
+        observability_cache = None if no_cache else ObservabilityCache.for_project(Path.cwd())
+        result_cache = None if no_result_cache else EvaluationResultCache.for_project(Path.cwd())
+        processor = EvaluationProcessor(
+            data_plane_client,
+            control_plane_client,
+            observability_cache,
+            result_cache=result_cache,
+            evaluator_metadata=EvaluatorMetadataCache.for_project(Path.cwd(), region),
+        )
+
+        if not resume:
+            pending = list(session_ids)
+            if sessions_file:
+                pending.extend(read_session_ids(sessions_file))
+            if last:
+                with console.status(f"[cyan]Finding the {last} most recent sessions...[/cyan]"):
+                    pending = processor.get_latest_sessions(agent_id, region, limit=last, days=days)
+            pending = list(dict.fromkeys(pending))
+            if not pending:
+                console.print("[red]Error:[/red] No sessions to evaluate")
+                console.print("\nProvide sessions via --session-id, --sessions-file or --last")
+                raise typer.Exit(1)
+            run.start(pending, evaluator_list, agent_id=agent_id)
+            total = len(pending)
+
+        console.print(f"\n[cyan]Evaluating {len(pending)} session(s)[/cyan] with {', '.join(evaluator_list)}")
+        console.print(f"[cyan]Writing results to:[/cyan] {run.output_path}\n")
+
+        failed_sessions = 0
+        done = total - len(pending)
+        for results in evaluate_sessions(
+            processor, pending, evaluator_list, agent_id, region, days=days, prefetch=prefetch
+        ):
+            run.append(results)
+            done += 1
+            failed = len(results.get_failed_results())
+            if failed:
+                failed_sessions += 1
+                console.print(
+                    f"[yellow]✗[/yellow] [{done}/{total}] {results.session_id}: "
+                    f"{failed} of {len(results.results)} evaluations failed"
+                )
+            else:
+                console.print(f"[green]✓[/green] [{done}/{total}] {results.session_id}")
+
+    except KeyboardInterrupt as e:
+        console.print(f"\n[yellow]Interrupted.[/yellow] Continue with: agentcore eval batch -o {output} --resume")
+        raise typer.Exit(130) from e
+    except typer.Exit:
+        raise
+    except (RuntimeError, ClientError, ValueError, KeyError, TypeError, OSError) as e:
+        console.print(f"\n[red]Error:[/red] {e}")
+        logger.exception("Batch evaluation failed")
+        raise typer.Exit(1) from e
+
+    console.print(f"\n[green]✓[/green] Evaluated {len(pending)} session(s); results saved to: {run.output_path}")
+    if failed_sessions:
+        console.print(f"[yellow]Warning:[/yellow] {failed_sessions} session(s) had failed evaluations")
+        raise typer.Exit(1)
+
+
+@evaluation_app.command("clear-cache")
+def clear_result_cache(
+    evaluators: List[str] = typer.Option(  # noqa: B008
+        [], "--evaluator", "-e", help="Only clear results of these evaluator(s) (default: all)"
+    ),
+):
+    """Clear cached evaluation results so evaluators are called again.
+
+    Examples:
+        # Clear all cached results
+        agentcore eval clear-cache
+
+        # Clear the results of one evaluator
+        agentcore eval clear-cache -e Builtin.Helpfulness
+    """
+    cache = EvaluationResultCache.for_project(Path.cwd())
+    try:
+        if evaluators:
+            removed = sum(cache.invalidate(evaluator) for evaluator in evaluators)
+        else:
+            removed = cache.invalidate()
+    except sqlite3.Error as e:
+        console.print(f"[red]Error:[/red] Could not clear evaluation cache {cache.path}: {e}")
+        raise typer.Exit(1) from e
+    finally:
+        cache.close()
+
+    console.print(f"[green]✓[/green] Removed {removed} cached evaluation result(s)")
+
+
 # ===========================
 # Evaluator Management Commands
 # ===========================
@@ -512,6 +753,7 @@ def update_evaluator(
 
         with console.status(f"[cyan]Updating evaluator {evaluator_id}...[/cyan]"):
             response = evaluator_processor.update_evaluator(client, evaluator_id, description, config_to_update)
+        EvaluatorMetadataCache.for_project(Path.cwd(), region).invalidate(evaluator_id)
 
         console.print("\n[green]✓[/green] Evaluator updated successfully!")
         if "updatedAt" in response:
@@ -552,6 +794,7 @@ def delete_evaluator(
 
         with console.status(f"[cyan]Deleting evaluator {evaluator_id}...[/cyan]"):
             evaluator_processor.delete_evaluator(client, evaluator_id)
+        EvaluatorMetadataCache.for_project(Path.cwd(), region).invalidate(evaluator_id)
 
         console.print("\n[green]✓[/green] Evaluator deleted successfully")
 
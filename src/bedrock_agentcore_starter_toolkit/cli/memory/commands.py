@@ -181,23 +181,7 @@ def _validate_records_options(
 
 def _collect_all_events(manager: MemoryManager, memory_id: str) -> List[Dict[str, Any]]:
     """Collect all events across all actors/sessions in a memory."""
-    all_events = []
-    actors = manager.list_actors(memory_id)
-    for actor in actors:
-        actor_id = actor.get("actorId")
-        if not actor_id:
-            continue
-        sessions = manager.list_sessions(memory_id, actor_id)
-        for session in sessions:
-            session_id = session.get("sessionId")
-            if not session_id:
-                continue
-            events = manager.list_events(memory_id, actor_id, session_id, max_results=100)
-            for event in events:
-                event["_actorId"] = actor_id
-                event["_sessionId"] = session_id
-            all_events.extend(events)
-    return all_events
+    return list(manager.crawl_events(memory_id))
 
 
 def _collect_all_records(
@@ -216,64 +200,17 @@ def _collect_all_records(
             r["_namespace"] = namespace
         return records
 
-    # All namespaces - get from memory strategies
+    # All namespaces - get from memory strategies, resolving placeholders for every actor/session
     memory = manager.get_memory(memory_id)
     strategies = memory.get("strategies") or memory.get("memoryStrategies") or []
+    templates = [ns_template for strategy in strategies for ns_template in strategy.get("namespaces", [])]
 
-    for strategy in strategies:
-        for ns_template in strategy.get("namespaces", []):
-            _collect_records_from_namespace_template(manager, memory_id, ns_template, max_results, all_records)
-
-    return all_records
-
-
-def _collect_records_from_namespace_template(
-    manager: MemoryManager,
-    memory_id: str,
-    ns_template: str,
-    max_results: int,
-    all_records: List[Dict[str, Any]],
-) -> None:
-    """Collect records from a namespace template, resolving placeholders."""
-    if "{actorId}" not in ns_template and "{sessionId}" not in ns_template:
-        # Static namespace
-        _try_collect_records(manager, memory_id, ns_template, max_results, all_records)
-        return
-
-    # Need to enumerate actors/sessions
     try:
-        actors = manager.list_actors(memory_id)
-        for actor in actors[:5]:  # Limit actors
-            actor_id = actor.get("actorId", "")
-            ns = ns_template.replace("{actorId}", actor_id)
-
-            if "{sessionId}" in ns:
-                sessions = manager.list_sessions(memory_id, actor_id)
-                for sess in sessions[:3]:  # Limit sessions
-                    session_id = sess.get("sessionId", "")
-                    final_ns = ns.replace("{sessionId}", session_id)
-                    _try_collect_records(manager, memory_id, final_ns, max_results, all_records)
-            else:
-                _try_collect_records(manager, memory_id, ns, max_results, all_records)
+        all_records.extend(manager.crawl_records(memory_id, templates, max_results))
     except Exception as e:
         logger.debug("Error collecting records: %s", e)
 
-
-def _try_collect_records(
-    manager: MemoryManager,
-    memory_id: str,
-    namespace: str,
-    max_results: int,
-    all_records: List[Dict[str, Any]],
-) -> None:
-    """Try to collect records from a namespace, ignoring errors."""
-    try:
-        records = manager.list_records(memory_id, namespace, max_results)
-        for r in records:
-            r["_namespace"] = namespace
-        all_records.extend(records)
-    except Exception as e:
-        logger.debug("Error collecting records from namespace %s: %s", namespace, e)
+    return all_records
 
 
 # ==================== Main Memory Commands ====================
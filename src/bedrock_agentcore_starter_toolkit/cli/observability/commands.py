@@ -2,22 +2,31 @@
 
 import json
 import logging
+import time
+from dataclasses import asdict
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
 
 import typer
 from rich.text import Text
 
 from ...operations.constants import DEFAULT_LOOKBACK_DAYS, DEFAULT_RUNTIME_SUFFIX
 from ...operations.observability import (
+    LocalTelemetrySource,
+    ObservabilityCache,
     ObservabilityClient,
+    TailCursorStore,
+    TraceTailer,
     TraceVisualizer,
 )
 from ...operations.observability.formatters import calculate_age_seconds
-from ...operations.observability.telemetry import TraceData
+from ...operations.observability.query_builder import STATS_DIMENSIONS
+from ...operations.observability.tail import DEFAULT_POLL_INTERVAL_SECONDS
+from ...operations.observability.telemetry import LatencyStats, TraceData
 from ...operations.observability.trace_processor import TraceProcessor
-from ...utils.runtime.config import load_config_if_exists
+from ...operations.observability.trace_visualizer import DEFAULT_MAX_CHILDREN
+from ...utils.runtime.config import get_observability_tail_cursor_path, load_config_if_exists
 from ..common import console
 
 # Create a module-specific logger
@@ -69,6 +78,7 @@ def _create_observability_client(
     agent: Optional[str] = None,
     region: Optional[str] = None,
     runtime_suffix: Optional[str] = None,
+    use_cache: bool = False,
 ) -> tuple[ObservabilityClient, str, str]:
     """Create stateless ObservabilityClient and return agent context.
 
@@ -77,6 +87,7 @@ def _create_observability_client(
         agent: Agent name to load from config
         region: Explicit region (overrides config and auto-detection)
         runtime_suffix: Explicit runtime suffix (overrides config default)
+        use_cache: Serve previously fetched spans and logs from the project's local cache
 
     Returns:
         Tuple of (client, agent_id, endpoint_name) for passing to client methods
@@ -127,12 +138,35 @@ def _create_observability_client(
         final_endpoint_name = DEFAULT_RUNTIME_SUFFIX
 
     # Create stateless client - no agent_id/endpoint_name stored
-    client = ObservabilityClient(region_name=final_region)
+    cache = ObservabilityCache.for_project(Path.cwd()) if use_cache else None
+    client = ObservabilityClient(region_name=final_region, cache=cache)
 
     # Return client + context that callers will pass to methods
     return client, final_agent_id, final_endpoint_name
 
 
+def _create_telemetry_source(
+    files: Optional[List[Path]],
+    agent_id: Optional[str],
+    agent: Optional[str] = None,
+    use_cache: bool = False,
+) -> tuple:
+    """Create the source of spans and runtime logs: local files if given, else CloudWatch.
+
+    Args:
+        files: Exported JSON or OTLP files to read instead of CloudWatch
+        agent_id: Explicit agent ID; with files, only used to filter spans
+        agent: Agent name to load from config
+        use_cache: Serve previously fetched spans and logs from the project's local cache
+
+    Returns:
+        Tuple of (client, agent_id, endpoint_name) for passing to client methods
+    """
+    if files:
+        return LocalTelemetrySource(files), agent_id or "", DEFAULT_RUNTIME_SUFFIX
+    return _create_observability_client(agent_id, agent, use_cache=use_cache)
+
+
 def _display_trace_list(trace_data: TraceData, session_id: str) -> None:
     """Display numbered list of traces with input/output (reusable by CLI and notebook).
 
@@ -260,6 +294,21 @@ def show(
     ),
     output: Optional[str] = typer.Option(None, "--output", "-o", help="Export to JSON file"),
     last: int = typer.Option(1, "--last", "-n", help="[Session only] Show Nth most recent trace (default: 1 = latest)"),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Query CloudWatch for the full time range instead of reusing cached results"
+    ),
+    files: Optional[List[Path]] = typer.Option(  # noqa: B008
+        None, "--file", "-f", help="Read spans and runtime logs from exported JSON or OTLP files instead of CloudWatch"
+    ),
+    max_depth: Optional[int] = typer.Option(
+        None, "--max-depth", min=1, help="Collapse spans nested deeper than this into a summary line"
+    ),
+    max_children: int = typer.Option(
+        DEFAULT_MAX_CHILDREN,
+        "--max-children",
+        min=0,
+        help=f"Show at most this many children per span, summarizing the rest (default: {DEFAULT_MAX_CHILDREN})",
+    ),
 ) -> None:
     """Show trace details with full visualization.
 
@@ -296,15 +345,27 @@ def show(
         # Show only failed traces
         agentcore obs show --errors
 
+        # Skim a very large trace two levels deep
+        agentcore obs show --trace-id 690156557a198c... --max-depth 2
+
+    OFFLINE COMMANDS (no CloudWatch access needed):
+        # Show latest trace of the latest session in an OTLP/JSON file
+        agentcore obs show -f traces.jsonl
+
+        # Re-open an exported session
+        agentcore obs show -f session.json --all
+
     Notes:
         - --all, --errors, --last only work with sessions, not individual traces
         - Use --verbose/-v to show full event payloads and detailed metadata without truncation
         - Default view shows truncated payloads for cleaner output
+        - Results are cached in .bedrock_agentcore/; use --no-cache to re-scan the whole time range
+        - Wide traces list the first and last --max-children children of each span; use --max-children 0 to see all
         - To list traces with Input/Output, use 'agentcore obs list' instead
     """
     try:
         # Get stateless client + agent context
-        client, final_agent_id, endpoint_name = _create_observability_client(agent_id, agent)
+        client, final_agent_id, endpoint_name = _create_telemetry_source(files, agent_id, agent, use_cache=not no_cache)
         start_time_ms, end_time_ms = _get_default_time_range(days)
 
         # Validate mutually exclusive options
@@ -340,6 +401,8 @@ def show(
                 output,
                 agent_id=final_agent_id,
                 endpoint_name=endpoint_name,
+                max_depth=max_depth,
+                max_children=max_children,
             )
 
         elif session_id:
@@ -356,11 +419,13 @@ def show(
                 endpoint_name=endpoint_name,
                 show_all=all_traces,
                 nth_last=last,
+                max_depth=max_depth,
+                max_children=max_children,
             )
 
         else:
             # No ID provided - try config first, then fallback to latest session
-            config = _get_agent_config_from_file(agent)
+            config = None if files else _get_agent_config_from_file(agent)
             session_id = config.get("session_id") if config else None
 
             if not session_id:
@@ -393,6 +458,8 @@ def show(
                 endpoint_name=endpoint_name,
                 show_all=all_traces,
                 nth_last=last,
+                max_depth=max_depth,
+                max_children=max_children,
             )
 
     except Exception as e:
@@ -410,11 +477,16 @@ def _show_trace_view(
     output: Optional[str],
     agent_id: str,
     endpoint_name: str = "DEFAULT",
+    max_depth: Optional[int] = None,
+    max_children: Optional[int] = None,
 ) -> None:
     """Show a specific trace."""
     console.print(f"[cyan]Fetching trace:[/cyan] {trace_id}\n")
 
-    spans = client.query_spans_by_trace(trace_id, start_time_ms, end_time_ms, agent_id=agent_id)
+    # Runtime logs are always fetched to show messages (verbose controls truncation)
+    spans, runtime_logs = client.fetch_trace_telemetry(
+        trace_id, start_time_ms, end_time_ms, agent_id=agent_id, endpoint_name=endpoint_name
+    )
 
     if not spans:
         console.print(f"[yellow]No spans found for trace {trace_id}[/yellow]")
@@ -422,22 +494,22 @@ def _show_trace_view(
 
     trace_data = TraceData(spans=spans, agent_id=agent_id)
     TraceProcessor.group_spans_by_trace(trace_data)
-
-    # Query runtime logs to show messages (always fetch, verbose controls truncation)
-    try:
-        runtime_logs = client.query_runtime_logs_by_traces(
-            [trace_id], start_time_ms, end_time_ms, agent_id=agent_id, endpoint_name=endpoint_name
-        )
-        trace_data.runtime_logs = runtime_logs
-    except Exception as e:
-        logger.warning("Failed to retrieve runtime logs: %s", e)
+    trace_data.runtime_logs = runtime_logs
 
     if output:
         _export_trace_data_to_json(trace_data, output, data_type="trace")
 
     visualizer = TraceVisualizer(console)
     # Always show messages, but verbose controls truncation and filtering
-    visualizer.visualize_trace(trace_data, trace_id, show_details=False, show_messages=True, verbose=verbose)
+    visualizer.visualize_trace(
+        trace_data,
+        trace_id,
+        show_details=False,
+        show_messages=True,
+        verbose=verbose,
+        max_depth=max_depth,
+        max_children=max_children,
+    )
 
     console.print(f"\n[green]✓[/green] Visualized {len(spans)} spans")
 
@@ -454,6 +526,8 @@ def _show_session_view(
     endpoint_name: str = "DEFAULT",
     show_all: bool = True,
     nth_last: int = 1,
+    max_depth: Optional[int] = None,
+    max_children: Optional[int] = None,
 ) -> None:
     """Show traces from a session.
 
@@ -469,6 +543,8 @@ def _show_session_view(
         endpoint_name: Runtime log group suffix
         show_all: If True, shows all traces. If False, shows only the Nth most recent trace.
         nth_last: Which trace to show when show_all=False (1=latest, 2=2nd latest, etc.)
+        max_depth: Collapse spans nested deeper than this into a summary (None = no limit)
+        max_children: Show at most this many children per span (None or 0 = no limit)
     """
     if show_all:
         console.print(f"[cyan]Fetching session:[/cyan] {session_id}\n")
@@ -505,7 +581,14 @@ def _show_session_view(
             _export_trace_data_to_json(trace_data, output, data_type="session")
 
         visualizer = TraceVisualizer(console)
-        visualizer.visualize_all_traces(trace_data, show_details=False, show_messages=True, verbose=verbose)
+        visualizer.visualize_all_traces(
+            trace_data,
+            show_details=False,
+            show_messages=True,
+            verbose=verbose,
+            max_depth=max_depth,
+            max_children=max_children,
+        )
         console.print(f"\n[green]✓[/green] Found {len(trace_data.traces)} traces with {len(spans)} total spans")
 
     else:
@@ -542,7 +625,15 @@ def _show_session_view(
             _export_trace_data_to_json(single_trace_data, output, data_type="trace")
 
         visualizer = TraceVisualizer(console)
-        visualizer.visualize_trace(single_trace_data, trace_id, show_details=False, show_messages=True, verbose=verbose)
+        visualizer.visualize_trace(
+            single_trace_data,
+            trace_id,
+            show_details=False,
+            show_messages=True,
+            verbose=verbose,
+            max_depth=max_depth,
+            max_children=max_children,
+        )
 
         console.print(f"\n[green]✓[/green] Showing trace {nth_last} of {len(sorted_traces)}")
         if len(sorted_traces) > 1:
@@ -565,6 +656,12 @@ def list_traces(
         DEFAULT_LOOKBACK_DAYS, "--days", "-d", help=f"Number of days to look back (default: {DEFAULT_LOOKBACK_DAYS})"
     ),
     errors_only: bool = typer.Option(False, "--errors", help="Show only failed traces"),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Query CloudWatch for the full time range instead of reusing cached results"
+    ),
+    files: Optional[List[Path]] = typer.Option(  # noqa: B008
+        None, "--file", "-f", help="Read spans and runtime logs from exported JSON or OTLP files instead of CloudWatch"
+    ),
 ) -> None:
     """List all traces in a session with numbered index for easy selection.
 
@@ -577,15 +674,18 @@ def list_traces(
 
         # List only failed traces
         agentcore obs list --errors
+
+        # List traces from exported spans and logs
+        agentcore obs list -f spans.jsonl -f logs.jsonl
     """
     try:
         # Get stateless client + agent context
-        client, final_agent_id, endpoint_name = _create_observability_client(agent_id, agent)
+        client, final_agent_id, endpoint_name = _create_telemetry_source(files, agent_id, agent, use_cache=not no_cache)
         start_time_ms, end_time_ms = _get_default_time_range(days)
 
         # Get session ID from config if not provided, or fallback to latest session
         if not session_id:
-            config = _get_agent_config_from_file(agent)
+            config = None if files else _get_agent_config_from_file(agent)
             session_id = config.get("session_id") if config else None
 
             if not session_id:
@@ -650,5 +750,254 @@ def list_traces(
         raise typer.Exit(1) from e
 
 
+def _display_latency_stats(
+    title: str, stats: List[LatencyStats], baseline: Optional[List[LatencyStats]] = None
+) -> None:
+    """Display aggregated latency statistics as a table.
+
+    Args:
+        title: Table title
+        stats: Statistics per group, in display order
+        baseline: Statistics for the previous period; adds a p90 change column
+    """
+    from rich.table import Table
+
+    from ...operations.observability.formatters import format_duration_seconds, get_duration_style
+
+    baseline_by_group = {item.group: item for item in baseline or []}
+
+    table = Table(title=title)
+    table.add_column("Name", style="cyan", no_wrap=False)
+    table.add_column("Count", justify="right")
+    table.add_column("p50", justify="right")
+    table.add_column("p90", justify="right")
+    table.add_column("p99", justify="right")
+    if baseline is not None:
+        table.add_column("p90 Δ", justify="right")
+    table.add_column("Errors", justify="right")
+    table.add_column("Throttles", justify="right")
+    table.add_column("Tokens in/out", justify="right", style="dim")
+
+    def duration(value: Optional[float]) -> str:
+        if value is None:
+            return "[dim]-[/dim]"
+        return f"[{get_duration_style(value)}]{format_duration_seconds(value)}[/{get_duration_style(value)}]"
+
+    def rate(count: int, value: float) -> str:
+        return f"[red]{count} ({value:.1%})[/red]" if count else "[dim]0[/dim]"
+
+    for item in stats:
+        row = [item.group, str(item.span_count), duration(item.p50_ms), duration(item.p90_ms), duration(item.p99_ms)]
+        if baseline is not None:
+            previous = baseline_by_group.get(item.group)
+            if previous is None or not previous.p90_ms or item.p90_ms is None:
+                row.append("[dim]new[/dim]")
+            else:
+                change = (item.p90_ms - previous.p90_ms) / previous.p90_ms
+                style = "red" if change > 0.1 else "green" if change < -0.1 else "dim"
+                row.append(f"[{style}]{change:+.0%}[/{style}]")
+        row.extend(
+            [
+                rate(item.error_count, item.error_rate),
+                rate(item.throttle_count, item.throttle_rate),
+                f"{item.input_tokens:,}/{item.output_tokens:,}" if item.input_tokens or item.output_tokens else "-",
+            ]
+        )
+        table.add_row(*row)
+
+    console.print(table)
+
+
+@observability_app.command("stats")
+def stats(
+    agent: Optional[str] = typer.Option(
+        None,
+        "--agent",
+        "-a",
+        help="Agent name (use 'agentcore configure list' to see available agents)",
+    ),
+    agent_id: Optional[str] = typer.Option(None, "--agent-id", help="Override agent ID from config"),
+    days: int = typer.Option(
+        DEFAULT_LOOKBACK_DAYS, "--days", "-d", help=f"Number of days to aggregate (default: {DEFAULT_LOOKBACK_DAYS})"
+    ),
+    group_by: Optional[List[str]] = typer.Option(  # noqa: B008
+        None, "--by", "-b", help="Group by span, tool or model; repeat for several (default: all)"
+    ),
+    limit: int = typer.Option(20, "--limit", "-l", help="Maximum rows per table, slowest p90 first"),
+    compare: bool = typer.Option(False, "--compare", help="Compare p90 with the previous period of the same length"),
+    output: Optional[str] = typer.Option(None, "--output", "-o", help="Export to JSON file"),
+) -> None:
+    """Show latency percentiles, error and throttle rates and token usage across sessions.
+
+    Aggregation runs in CloudWatch Logs Insights, so only one row per span
+    name, tool or model is downloaded however many sessions the range covers.
+
+    Examples:
+        # Latency by span name, tool and model over the default range
+        agentcore obs stats
+
+        # Which tool got slower this week?
+        agentcore obs stats --by tool --days 7 --compare
+
+        # Export model statistics
+        agentcore obs stats --by model -o model-stats.json
+    """
+    try:
+        dimensions = tuple(dict.fromkeys(group_by or STATS_DIMENSIONS))
+        unknown = [dimension for dimension in dimensions if dimension not in STATS_DIMENSIONS]
+        if unknown:
+            console.print(f"[red]Error:[/red] Unknown --by value: {', '.join(unknown)}")
+            console.print(f"[dim]Choose from: {', '.join(STATS_DIMENSIONS)}[/dim]")
+            raise typer.Exit(1)
+
+        client, final_agent_id, _ = _create_observability_client(agent_id, agent)
+        start_time_ms, end_time_ms = _get_default_time_range(days)
+
+        console.print(f"[cyan]Aggregating spans for agent:[/cyan] {final_agent_id} [dim](last {days} days)[/dim]\n")
+        report = client.query_latency_report(start_time_ms, end_time_ms, final_agent_id, dimensions, limit)
+
+        baseline: Optional[Dict[str, List[LatencyStats]]] = None
+        if compare:
+            period_ms = end_time_ms - start_time_ms
+            baseline = client.query_latency_report(
+                start_time_ms - period_ms, start_time_ms, final_agent_id, dimensions, limit
+            )
+
+        if not any(report.values()):
+            console.print(f"[yellow]No spans found for agent in the last {days} days[/yellow]")
+            return
+
+        titles = {"span": "Latency by Span Name", "tool": "Latency by Tool", "model": "Latency by Model"}
+        for dimension in dimensions:
+            if not report[dimension]:
+                console.print(f"[dim]No {dimension} spans found[/dim]\n")
+                continue
+            _display_latency_stats(
+                titles[dimension], report[dimension], baseline[dimension] if baseline is not None else None
+            )
+            console.print()
+
+        if output:
+            data = {
+                "agent_id": final_agent_id,
+                "start_time_ms": start_time_ms,
+                "end_time_ms": end_time_ms,
+                "stats": {dimension: [asdict(item) for item in items] for dimension, items in report.items()},
+            }
+            if baseline is not None:
+                data["baseline"] = {
+                    dimension: [asdict(item) for item in items] for dimension, items in baseline.items()
+                }
+            with open(output, "w") as f:
+                json.dump(data, f, indent=2)
+            console.print(f"[green]✓[/green] Exported statistics to {output}")
+
+    except typer.Exit:
+        raise
+    except Exception as e:
+        console.print(f"[red]Error:[/red] {str(e)}")
+        logger.exception("Failed to aggregate statistics")
+        raise typer.Exit(1) from e
+
+
+@observability_app.command("tail")
+def tail(
+    agent: Optional[str] = typer.Option(
+        None,
+        "--agent",
+        "-a",
+        help="Agent name (use 'agentcore configure list' to see available agents)",
+    ),
+    agent_id: Optional[str] = typer.Option(None, "--agent-id", help="Override agent ID from config"),
+    since: int = typer.Option(60, "--since", help="Seconds of recent activity to include when starting (default: 60)"),
+    errors_only: bool = typer.Option(False, "--errors", help="Only render traces that contain failed spans"),
+    interval: float = typer.Option(
+        DEFAULT_POLL_INTERVAL_SECONDS, "--interval", help="Seconds between polls for new spans and logs"
+    ),
+    resume: bool = typer.Option(
+        False, "--resume", help="Continue from where the previous 'agentcore obs tail' stopped instead of --since"
+    ),
+    verbose: bool = typer.Option(
+        False, "--verbose", "-v", help="Show full event payloads and detailed metadata without truncation"
+    ),
+) -> None:
+    """Follow an agent live, rendering each trace as soon as it completes.
+
+    Failed spans are reported the moment they are ingested; the full trace tree
+    follows once the trace's root span has arrived. Press Ctrl+C to stop.
+
+    Examples:
+        # Follow the config agent
+        agentcore obs tail
+
+        # Only show failing traces during a load test
+        agentcore obs tail --errors
+
+        # Pick up where the last tail stopped
+        agentcore obs tail --resume
+
+    Notes:
+        - Only newly ingested events are read on each poll, not the whole lookback window
+        - The read position is saved in .bedrock_agentcore/ for --resume
+    """
+    try:
+        client, final_agent_id, endpoint_name = _create_observability_client(agent_id, agent)
+        start_time_ms = int((datetime.now() - timedelta(seconds=since)).timestamp() * 1000)
+        tailer = TraceTailer(
+            client,
+            agent_id=final_agent_id,
+            endpoint_name=endpoint_name,
+            start_time_ms=start_time_ms,
+            cursor_store=TailCursorStore(get_observability_tail_cursor_path(Path.cwd())),
+            resume=resume,
+        )
+    except typer.Exit:
+        raise
+    except Exception as e:
+        console.print(f"[red]Error:[/red] {str(e)}")
+        logger.exception("Failed to start tail")
+        raise typer.Exit(1) from e
+
+    visualizer = TraceVisualizer(console)
+    rendered = 0
+    console.print(f"[cyan]Following agent:[/cyan] {final_agent_id} [dim](Ctrl+C to stop)[/dim]\n")
+
+    def render(trace_data: TraceData) -> int:
+        if errors_only and not TraceProcessor.filter_error_traces(trace_data):
+            return 0
+        trace_id = next(iter(trace_data.traces))
+        visualizer.visualize_trace(
+            trace_data,
+            trace_id,
+            show_details=False,
+            show_messages=True,
+            verbose=verbose,
+            max_children=DEFAULT_MAX_CHILDREN,
+        )
+        console.print()
+        return 1
+
+    try:
+        while True:
+            batch = tailer.poll()
+            for span in batch.spans:
+                if span.status_code == "ERROR":
+                    console.print(
+                        f"[red]✗ ERROR[/red] {span.span_name} [dim]trace {span.trace_id}[/dim]"
+                        + (f" - {span.status_message}" if span.status_message else "")
+                    )
+            for trace_data in batch.completed:
+                rendered += render(trace_data)
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        for trace_data in tailer.flush():
+            rendered += render(trace_data)
+        console.print(f"\n[green]✓[/green] Stopped following; rendered {rendered} traces")
+    except Exception as e:
+        console.print(f"[red]Error:[/red] {str(e)}")
+        logger.exception("Failed to tail traces")
+        raise typer.Exit(1) from e
+
+
 if __name__ == "__main__":
     observability_app()
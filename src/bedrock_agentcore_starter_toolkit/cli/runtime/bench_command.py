@@ -0,0 +1,155 @@
+"""Benchmark command for Bedrock AgentCore CLI."""
+
+import logging
+import os
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.table import Table
+
+from ...operations.runtime.bench import load_benchmark_payloads, run_benchmark
+from ...operations.runtime.models import BenchmarkResult, LatencyStats
+from ...services.async_runtime import InvokeMetrics
+from ...utils.runtime.config import load_config
+from ..common import _handle_error, _print_success, console
+from .commands import _parse_custom_headers
+
+logger = logging.getLogger(__name__)
+
+
+def bench(
+    payload_file: Path = typer.Argument(  # noqa: B008
+        ..., help="JSON array or JSON Lines file of payloads to replay", exists=True, dir_okay=False
+    ),
+    agent: Optional[str] = typer.Option(
+        None, "--agent", "-a", help="Agent name (use 'bedrock_agentcore configure list' to see available)"
+    ),
+    requests: Optional[int] = typer.Option(
+        None, "--requests", "-n", min=1, help="Total requests to send, cycling through payloads (default: one each)"
+    ),
+    concurrency: int = typer.Option(1, "--concurrency", "-c", min=1, help="Maximum requests in flight"),
+    rate: Optional[float] = typer.Option(None, "--rate", "-r", min=0.001, help="Maximum requests started per second"),
+    sessions: Optional[int] = typer.Option(
+        None, "--sessions", min=1, help="Spread requests over this many sessions (default: new session per request)"
+    ),
+    local_mode: bool = typer.Option(False, "--local", "-l", help="Benchmark a running local container"),
+    dev_mode: bool = typer.Option(False, "--dev", "-d", help="Benchmark the local development server"),
+    port: int = typer.Option(8080, "--port", help="Port for local development server"),
+    bearer_token: Optional[str] = typer.Option(
+        None, "--bearer-token", "-bt", help="Bearer token for OAuth authentication"
+    ),
+    user_id: Optional[str] = typer.Option(None, "--user-id", "-u", help="User id for authorization flows"),
+    headers: Optional[str] = typer.Option(
+        None,
+        "--headers",
+        help="Custom headers (format: 'Header1:value,Header2:value2'). "
+        "Headers will be auto-prefixed with 'X-Amzn-Bedrock-AgentCore-Runtime-Custom-' if not already present.",
+    ),
+    output: Optional[Path] = typer.Option(  # noqa: B008
+        None, "--output", "-o", help="Write the full results to a JSON file"
+    ),
+) -> None:
+    """Measure latency and throughput of an agent endpoint."""
+    if local_mode and dev_mode:
+        _handle_error("Use only one of --local and --dev")
+
+    config_path = Path.cwd() / ".bedrock_agentcore.yaml"
+    target = "dev" if dev_mode else "local" if local_mode else "cloud"
+
+    try:
+        payloads = load_benchmark_payloads(payload_file)
+    except ValueError as e:
+        _handle_error(str(e), e)
+
+    try:
+        custom_headers = _parse_custom_headers(headers) if headers else {}
+    except ValueError as e:
+        _handle_error(f"Invalid headers format: {e}", e)
+
+    if target != "dev":
+        try:
+            agent_config = load_config(config_path).get_agent_config(agent)
+        except FileNotFoundError as e:
+            _handle_error("No .bedrock_agentcore.yaml found. Run 'agentcore configure' or use --dev.", e)
+        except ValueError as e:
+            _handle_error(str(e), e)
+        # Only send a bearer token to agents configured for OAuth, as in 'agentcore invoke'
+        if agent_config.authorizer_configuration is not None:
+            bearer_token = bearer_token or os.getenv("BEDROCK_AGENTCORE_BEARER_TOKEN")
+        else:
+            bearer_token = None
+
+    total = requests or len(payloads)
+    completed = 0
+
+    with console.status(f"[bold]Benchmarking ({target}): 0/{total} requests[/bold]") as status:
+
+        def on_result(_result: InvokeMetrics) -> None:
+            nonlocal completed
+            completed += 1
+            status.update(f"[bold]Benchmarking ({target}): {completed}/{total} requests[/bold]")
+
+        try:
+            result = run_benchmark(
+                config_path,
+                payloads,
+                total_requests=total,
+                concurrency=concurrency,
+                rate_limit=rate,
+                target=target,
+                port=port,
+                agent_name=agent,
+                bearer_token=bearer_token,
+                user_id=user_id,
+                custom_headers=custom_headers,
+                sessions=sessions,
+                on_result=on_result,
+            )
+        except ValueError as e:
+            _handle_error(f"Benchmark failed: {e}", e)
+
+    _show_benchmark_result(result)
+
+    if output:
+        output.write_text(result.model_dump_json(indent=2), encoding="utf-8")
+        _print_success(f"Results written to {output}")
+
+    if result.requests and result.errors == result.requests:
+        raise typer.Exit(1)
+
+
+def _format_stat(value: Optional[float], scale: float = 1.0, fmt: str = "{:.0f}") -> str:
+    return "-" if value is None else fmt.format(value * scale)
+
+
+def _show_benchmark_result(result: BenchmarkResult) -> None:
+    """Print a summary table of a benchmark run."""
+    table = Table(title=f"Benchmark: {result.agent_name or 'dev server'} ({result.target})")
+    table.add_column("Metric", style="cyan")
+    for column in ("p50", "p90", "p99", "mean", "max"):
+        table.add_column(column, justify="right")
+
+    def add_row(name: str, stats: LatencyStats, scale: float, fmt: str) -> None:
+        table.add_row(
+            name, *(_format_stat(getattr(stats, c), scale, fmt) for c in ("p50", "p90", "p99", "mean", "max"))
+        )
+
+    add_row("TTFB (ms)", result.ttfb, 1000, "{:.0f}")
+    add_row("Latency (ms)", result.latency, 1000, "{:.0f}")
+    add_row("Tokens/s", result.tokens_per_second, 1, "{:.1f}")
+    console.print(table)
+
+    console.print(
+        f"Requests: {result.requests}  Concurrency: {result.concurrency}  "
+        f"Wall time: {result.wall_time:.2f}s  Throughput: {result.throughput:.2f} req/s"
+    )
+    error_style = "red" if result.errors else "green"
+    console.print(
+        f"[{error_style}]Errors: {result.errors} ({result.error_rate:.1%})[/{error_style}]  "
+        f"Throttled: {result.throttles} ({result.throttle_rate:.1%})"
+    )
+
+    distinct_errors = list(dict.fromkeys(r.error for r in result.results if r.error))
+    for error in distinct_errors[:3]:
+        console.print(f"  {error}", style="dim", markup=False, highlight=False)
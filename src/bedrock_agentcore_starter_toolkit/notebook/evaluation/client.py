@@ -6,6 +6,7 @@ from typing import Dict, List, Optional
 from rich.console import Console
 
 from ...operations.evaluation import evaluator_processor, online_processor
+from ...operations.evaluation.batch_processor import DEFAULT_PREFETCH_SESSIONS, BatchEvaluationRun, evaluate_sessions
 from ...operations.evaluation.control_plane_client import EvaluationControlPlaneClient
 from ...operations.evaluation.data_plane_client import EvaluationDataPlaneClient
 from ...operations.evaluation.formatters import (
@@ -164,7 +165,7 @@ class Evaluation:
     ) -> EvaluationResults:
         """Run evaluation on a session (mirrors: agentcore eval run).
 
-        Default: Evaluates all traces (most recent 1000 spans).
+        Default: Evaluates all traces (most recent spans that fit in one request).
         With trace_id: Evaluates only that trace (includes spans from all previous traces for context).
 
         Args:
@@ -230,7 +231,7 @@ class Evaluation:
         if trace_id:
             self.console.print(f"[cyan]Trace:[/cyan] {trace_id} (with previous traces for context)")
         else:
-            self.console.print("[cyan]Mode:[/cyan] All traces (most recent 1000 spans)")
+            self.console.print("[cyan]Mode:[/cyan] All traces (most recent spans that fit in one request)")
         self.console.print(f"[cyan]Evaluators:[/cyan] {', '.join(evaluators)}\n")
 
         # Run evaluation using processor
@@ -250,6 +251,92 @@ class Evaluation:
 
         return results
 
+    def run_batch(
+        self,
+        agent_id: str,
+        session_ids: Optional[List[str]] = None,
+        last: Optional[int] = None,
+        evaluators: Optional[List[str]] = None,
+        output: Optional[str] = None,
+        resume: bool = False,
+        days: int = 7,
+        prefetch: int = DEFAULT_PREFETCH_SESSIONS,
+        reference_inputs: Optional[ReferenceInputs] = None,
+    ) -> List[EvaluationResults]:
+        """Evaluate many sessions in one run (mirrors: agentcore eval batch).
+
+        The next sessions are fetched while the current one is evaluated. With
+        output, each session's results are appended to that JSONL file as it
+        finishes, and an interrupted run continues with resume=True.
+
+        Args:
+            agent_id: Agent ID to evaluate (required)
+            session_ids: Sessions to evaluate
+            last: Evaluate the agent's N most recently active sessions instead of session_ids
+            evaluators: List of evaluators to use (default: ["Builtin.GoalSuccessRate"])
+            output: Optional JSONL file for the results, with a checkpoint saved next to it
+            resume: Continue the run saved at output, evaluating only the sessions not in it yet
+            days: Number of days to look back for session data (default: 7)
+            prefetch: Number of sessions to fetch ahead of the one being evaluated
+            reference_inputs: Optional reference inputs applied to every session
+
+        Returns:
+            EvaluationResults for each session evaluated by this call, without input spans
+
+        Example:
+            # Score the 200 most recent sessions
+            results = eval_client.run_batch(agent_id="my-agent", last=200, output="nightly.jsonl")
+
+            # Continue after an interruption
+            results = eval_client.run_batch(agent_id="my-agent", output="nightly.jsonl", resume=True)
+        """
+        if not agent_id:
+            raise ValueError("agent_id is required for run_batch()")
+
+        run = BatchEvaluationRun(Path(output)) if output else None
+        if resume:
+            if not run:
+                raise ValueError("resume requires output, the JSONL file of the run to continue")
+            checkpoint, pending = run.resume()
+            evaluators = checkpoint.evaluators
+        else:
+            if last and session_ids:
+                raise ValueError("Provide either session_ids or last, not both")
+            evaluators = evaluators or ["Builtin.GoalSuccessRate"]
+            if last:
+                pending = self._processor.get_latest_sessions(agent_id, self.region, limit=last, days=days)
+            else:
+                pending = list(dict.fromkeys(session_ids or []))
+            if not pending:
+                raise ValueError("No sessions to evaluate. Provide session_ids or last.")
+            if run:
+                run.start(pending, evaluators, agent_id=agent_id)
+
+        self.console.print(f"\n[cyan]Evaluating {len(pending)} session(s)[/cyan] with {', '.join(evaluators)}\n")
+
+        batch_results = []
+        for results in evaluate_sessions(
+            self._processor,
+            pending,
+            evaluators,
+            agent_id,
+            self.region,
+            days=days,
+            prefetch=prefetch,
+            reference_inputs=reference_inputs,
+        ):
+            if run:
+                run.append(results)
+            # Input spans of thousands of sessions would not fit in memory
+            results.input_data = None
+            batch_results.append(results)
+            status = "[yellow]✗[/yellow]" if results.has_errors() else "[green]✓[/green]"
+            self.console.print(f"{status} [{len(batch_results)}/{len(pending)}] {results.session_id}")
+
+        if run:
+            self.console.print(f"\n[green]✓[/green] Results saved to: {run.output_path}")
+        return batch_results
+
     # ===========================
     # Evaluator Management Methods
     # ===========================
@@ -36,6 +36,7 @@ class Observability:
         agent_name: Optional[str] = None,
         region: Optional[str] = None,
         runtime_suffix: str = DEFAULT_RUNTIME_SUFFIX,
+        use_cache: bool = True,
     ):
         """Initialize observability interface.
 
@@ -44,6 +45,7 @@ class Observability:
             agent_name: Agent name to load from config
             region: AWS region (auto-detected if not provided)
             runtime_suffix: Runtime log group suffix
+            use_cache: Reuse spans and logs cached under .bedrock_agentcore/ instead of re-scanning
         """
         self.console = Console()
 
@@ -57,6 +59,7 @@ class Observability:
             agent_id=agent_id,
             region=region,
             runtime_suffix=runtime_suffix,
+            use_cache=use_cache,
         )
 
         # Store region for reference
@@ -197,12 +200,11 @@ class Observability:
                 endpoint_name=self.endpoint_name,
             )
             # Return TraceData for programmatic use
-            spans = self.client.query_spans_by_trace(trace_id, start_time_ms, end_time_ms, agent_id=self.agent_id)
+            spans, runtime_logs = self.client.fetch_trace_telemetry(
+                trace_id, start_time_ms, end_time_ms, agent_id=self.agent_id, endpoint_name=self.endpoint_name
+            )
             trace_data = TraceData(spans=spans, agent_id=self.agent_id)
             TraceProcessor.group_spans_by_trace(trace_data)
-            runtime_logs = self.client.query_runtime_logs_by_traces(
-                [trace_id], start_time_ms, end_time_ms, agent_id=self.agent_id, endpoint_name=self.endpoint_name
-            )
             trace_data.runtime_logs = runtime_logs
             return trace_data
 
@@ -2,18 +2,20 @@
 
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, AsyncIterator, Dict, Iterable, List, Literal, Optional
 
 from ...operations.runtime import (
     configure_bedrock_agentcore,
     destroy_bedrock_agentcore,
     get_status,
     invoke_bedrock_agentcore,
+    invoke_bedrock_agentcore_concurrently,
     launch_bedrock_agentcore,
     stop_runtime_session,
     validate_agent_name,
 )
 from ...operations.runtime.models import ConfigureResult, DestroyResult, LaunchResult, StatusResult
+from ...services.async_runtime import InvokeMetrics
 
 # Setup centralized logging for SDK usage (notebooks, scripts, imports)
 from ...utils.logging_config import setup_toolkit_logging
@@ -430,6 +432,52 @@ class Runtime:
         )
         return result.response
 
+    def invoke_concurrently(
+        self,
+        payloads: Iterable[Any],
+        bearer_token: Optional[str] = None,
+        local: Optional[bool] = False,
+        user_id: Optional[str] = None,
+        max_concurrency: int = 10,
+        rate_limit: Optional[float] = None,
+        capture_response: bool = False,
+    ) -> AsyncIterator[InvokeMetrics]:
+        """Invoke the endpoint with many payloads concurrently.
+
+        Each payload gets a new session unless passed as an ``InvokeRequest``.
+
+        Example:
+            async for result in runtime.invoke_concurrently([{"prompt": "hi"}] * 50, max_concurrency=10):
+                print(result.index, result.ttfb, result.ttlb, result.error)
+
+        Args:
+            payloads: Payloads to send
+            bearer_token: Optional bearer token for HTTP authentication
+            local: Send requests to a running local container
+            user_id: User id for authorization flows
+            max_concurrency: Maximum requests in flight
+            rate_limit: Maximum requests started per second
+            capture_response: Keep response bodies on the results
+
+        Returns:
+            Async iterator of per-request timing and errors, in completion order
+        """
+        if not self._config_path:
+            log.warning("Agent not configured and deployed")
+            log.info("Required workflow: .configure() → .launch() → .invoke_concurrently()")
+            raise ValueError("Must configure and launch first.")
+
+        return invoke_bedrock_agentcore_concurrently(
+            config_path=self._config_path,
+            payloads=payloads,
+            bearer_token=bearer_token,
+            local_mode=local,
+            user_id=user_id,
+            max_concurrency=max_concurrency,
+            rate_limit=rate_limit,
+            capture_response=capture_response,
+        )
+
     def stop_session(self, session_id: Optional[str] = None) -> Dict[str, Any]:
         """Stop an active runtime session.
 
@@ -88,6 +88,10 @@ DEFAULT_RUNTIME_SUFFIX = DEFAULT_RUNTIME_ENDPOINT
 
 # Evaluation Configuration
 DEFAULT_MAX_EVALUATION_ITEMS = int(os.getenv("AGENTCORE_MAX_EVAL_ITEMS", "1000"))
+# Size of the compacted spans/logs sent in one evaluate request
+DEFAULT_MAX_EVALUATION_PAYLOAD_BYTES = int(os.getenv("AGENTCORE_MAX_EVAL_PAYLOAD_BYTES", str(4 * 1024 * 1024)))
+# Longer attribute and log body strings (e.g. tool payloads) are truncated
+DEFAULT_MAX_EVALUATION_VALUE_BYTES = int(os.getenv("AGENTCORE_MAX_EVAL_VALUE_BYTES", str(16 * 1024)))
 MAX_SPAN_IDS_IN_CONTEXT = int(os.getenv("AGENTCORE_MAX_SPAN_IDS", "20"))
 
 
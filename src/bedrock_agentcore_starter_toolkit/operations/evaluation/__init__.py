@@ -9,8 +9,10 @@ Refactored structure:
 """
 
 from . import formatters
+from .cache import EvaluationResultCache
 from .control_plane_client import EvaluationControlPlaneClient
 from .data_plane_client import EvaluationDataPlaneClient
+from .evaluator_metadata import EvaluatorMetadataCache
 from .models import EvaluationRequest, EvaluationResult, EvaluationResults
 from .on_demand_processor import EvaluationProcessor
 
@@ -18,6 +20,8 @@ __all__ = [
     "EvaluationDataPlaneClient",
     "EvaluationControlPlaneClient",
     "EvaluationProcessor",
+    "EvaluationResultCache",
+    "EvaluatorMetadataCache",
     "EvaluationRequest",
     "EvaluationResult",
     "EvaluationResults",
@@ -0,0 +1,277 @@
+"""Batch evaluation - evaluates many sessions in one run.
+
+Session data for the next sessions is fetched in the background while the
+current session is evaluated, and each session's results are appended to a
+JSONL file as soon as it finishes. A checkpoint next to the output records the
+sessions of the run, so an interrupted run can resume where it stopped.
+"""
+
+import json
+import logging
+import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Deque, Iterable, Iterator, List, Optional, Set, Tuple
+
+from botocore.exceptions import ClientError
+
+from ..observability.client import ObservabilityClient
+from ..observability.telemetry import TraceData
+from .models import EvaluationResult, EvaluationResults, ReferenceInputs
+from .on_demand_processor import DEFAULT_LOOKBACK_DAYS, EvaluationProcessor
+
+logger = logging.getLogger(__name__)
+
+# Sessions fetched ahead of the one being evaluated
+DEFAULT_PREFETCH_SESSIONS = 4
+CHECKPOINT_SUFFIX = ".checkpoint.json"
+
+
+def read_session_ids(path: Path) -> List[str]:
+    """Read session IDs from a file with one ID per line.
+
+    Blank lines and lines starting with ``#`` are skipped, and repeated IDs
+    are only kept once.
+
+    Args:
+        path: File to read
+
+    Returns:
+        Session IDs in file order
+    """
+    session_ids = []
+    for line in Path(path).read_text().splitlines():
+        line = line.strip()
+        if line and not line.startswith("#"):
+            session_ids.append(line)
+    return list(dict.fromkeys(session_ids))
+
+
+@dataclass
+class BatchCheckpoint:
+    """Sessions and evaluators of a batch run, saved so the run can be resumed."""
+
+    session_ids: List[str]
+    evaluators: List[str]
+    agent_id: Optional[str] = None
+    created_at: Optional[str] = None
+
+    @classmethod
+    def load(cls, path: Path) -> "BatchCheckpoint":
+        """Load a checkpoint.
+
+        Raises:
+            FileNotFoundError: If there is no checkpoint at path
+            ValueError: If the checkpoint is not valid
+        """
+        try:
+            data = json.loads(Path(path).read_text())
+            return cls(
+                session_ids=list(data["session_ids"]),
+                evaluators=list(data["evaluators"]),
+                agent_id=data.get("agent_id"),
+                created_at=data.get("created_at"),
+            )
+        except (KeyError, TypeError, json.JSONDecodeError) as e:
+            raise ValueError(f"Invalid batch checkpoint {path}: {e}") from e
+
+    def save(self, path: Path) -> None:
+        """Save the checkpoint, replacing any previous one atomically."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(asdict(self), indent=2))
+        os.replace(tmp_path, path)
+
+
+class BatchEvaluationRun:
+    """Output file and checkpoint of one batch evaluation.
+
+    Each finished session is one line of the JSONL output, written in the
+    ``EvaluationResults.to_dict()`` format without the input spans. The output
+    doubles as the progress log: on resume, sessions with a line in it are
+    skipped, except sessions whose every evaluator failed (e.g. a throttled
+    fetch), which are retried. A retried session gets another line, so the
+    last line of a session holds its final results.
+
+    Example:
+        run = BatchEvaluationRun(Path("nightly.jsonl"))
+        checkpoint = run.start(session_ids, ["Builtin.Helpfulness"])
+        for results in evaluate_sessions(processor, checkpoint.session_ids, ...):
+            run.append(results)
+    """
+
+    def __init__(self, output_path: Path):
+        """Initialize the run.
+
+        Args:
+            output_path: JSONL file for the results; the checkpoint is stored next to it
+        """
+        self.output_path = Path(output_path)
+        self.checkpoint_path = self.output_path.with_name(self.output_path.name + CHECKPOINT_SUFFIX)
+
+    def start(self, session_ids: List[str], evaluators: List[str], agent_id: Optional[str] = None) -> BatchCheckpoint:
+        """Start a new run, replacing the output and checkpoint of any previous one.
+
+        Returns:
+            The saved checkpoint
+        """
+        checkpoint = BatchCheckpoint(
+            session_ids=list(session_ids),
+            evaluators=list(evaluators),
+            agent_id=agent_id,
+            created_at=datetime.now().isoformat(timespec="seconds"),
+        )
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        self.output_path.write_text("")
+        checkpoint.save(self.checkpoint_path)
+        return checkpoint
+
+    def resume(self) -> Tuple[BatchCheckpoint, List[str]]:
+        """Load the checkpoint of an interrupted run.
+
+        Returns:
+            Tuple of (checkpoint, session IDs not evaluated yet)
+
+        Raises:
+            FileNotFoundError: If the run has no checkpoint
+            ValueError: If the checkpoint is not valid
+        """
+        checkpoint = BatchCheckpoint.load(self.checkpoint_path)
+        completed = self.completed_session_ids()
+        self._end_partial_line()
+        return checkpoint, [session_id for session_id in checkpoint.session_ids if session_id not in completed]
+
+    def completed_session_ids(self) -> Set[str]:
+        """Get the sessions whose results are in the output.
+
+        A line cut short by an interruption or otherwise malformed, or whose
+        results are all errors, is ignored, so its session is evaluated again.
+        """
+        completed: Set[str] = set()
+        if not self.output_path.exists():
+            return completed
+        with open(self.output_path) as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    session_id = record.get("session_id")
+                    results = record.get("results") or []
+                    all_failed = bool(results) and all(result.get("error") for result in results)
+                except (json.JSONDecodeError, AttributeError, TypeError):
+                    continue
+                if all_failed:
+                    continue
+                if session_id:
+                    completed.add(session_id)
+        return completed
+
+    def append(self, results: EvaluationResults) -> None:
+        """Append a session's results to the output."""
+        record = results.to_dict()
+        record.pop("input_data", None)
+        with open(self.output_path, "a") as f:
+            f.write(json.dumps(record, default=str) + "\n")
+
+    def _end_partial_line(self) -> None:
+        """Terminate a line cut short by an interruption so appended lines stay separate."""
+        try:
+            with open(self.output_path, "rb+") as f:
+                f.seek(0, os.SEEK_END)
+                if f.tell() == 0:
+                    return
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    f.write(b"\n")
+        except FileNotFoundError:
+            pass
+
+
+def evaluate_sessions(
+    processor: EvaluationProcessor,
+    session_ids: Iterable[str],
+    evaluators: List[str],
+    agent_id: str,
+    region: str,
+    days: int = DEFAULT_LOOKBACK_DAYS,
+    prefetch: int = DEFAULT_PREFETCH_SESSIONS,
+    reference_inputs: Optional[ReferenceInputs] = None,
+) -> Iterator[EvaluationResults]:
+    """Evaluate sessions one after another, fetching the next ones in the background.
+
+    Up to ``prefetch`` sessions are fetched from CloudWatch while the current
+    session's evaluators run. A session that cannot be fetched or evaluated
+    yields results with one error result per evaluator instead of stopping
+    the batch.
+
+    Args:
+        processor: Processor used to fetch and evaluate each session
+        session_ids: Sessions to evaluate; consumed lazily
+        evaluators: List of evaluator identifiers
+        agent_id: Agent ID for fetching session data
+        region: AWS region
+        days: Number of days to look back for session data (default: 7)
+        prefetch: Number of sessions to fetch ahead of the one being evaluated
+        reference_inputs: Optional reference inputs applied to every session
+
+    Yields:
+        EvaluationResults for each session, in the order of session_ids
+
+    Raises:
+        ValueError: If evaluators or prefetch are invalid
+    """
+    EvaluationProcessor._validate_evaluators(evaluators)
+    if prefetch < 1:
+        raise ValueError("prefetch must be at least 1")
+
+    # One client for all fetches; it is safe to share between threads
+    obs_client = ObservabilityClient(region_name=region, cache=processor.observability_cache)
+    session_iter = iter(session_ids)
+    pending: Deque[Tuple[str, Future]] = deque()
+    executor = ThreadPoolExecutor(max_workers=prefetch, thread_name_prefix="agentcore-eval-fetch")
+
+    def fill() -> None:
+        while len(pending) < prefetch:
+            session_id = next(session_iter, None)
+            if session_id is None:
+                return
+            future = executor.submit(processor.fetch_session_data, session_id, agent_id, region, days, obs_client)
+            pending.append((session_id, future))
+
+    try:
+        fill()
+        while pending:
+            session_id, future = pending.popleft()
+            # Start the next fetch before evaluating this session
+            fill()
+            try:
+                trace_data: TraceData = future.result()
+                results = processor.evaluate_trace_data(
+                    trace_data, evaluators, session_id=session_id, reference_inputs=reference_inputs
+                )
+            except (RuntimeError, ClientError, ValueError, KeyError, TypeError) as e:
+                logger.warning("Session %s could not be evaluated: %s", session_id, e)
+                results = _failed_session_results(session_id, evaluators, e)
+            yield results
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _failed_session_results(session_id: str, evaluators: List[str], error: Exception) -> EvaluationResults:
+    """Build results recording that a whole session failed, one error per evaluator."""
+    results = EvaluationResults(session_id=session_id)
+    for evaluator in evaluators:
+        results.add_result(
+            EvaluationResult(
+                evaluator_id=evaluator,
+                evaluator_name=evaluator,
+                evaluator_arn="",
+                explanation=f"Evaluation failed: {error}",
+                context={"spanContext": {"sessionId": session_id}},
+                error=str(error),
+            )
+        )
+    return results
@@ -0,0 +1,203 @@
+"""Persistent local cache for evaluation results.
+
+An evaluator scores exactly the spans, target and reference inputs it is sent,
+so its results only need to be fetched from the evaluation service once. The
+cache keeps the raw ``evaluationResults`` of each evaluate call in SQLite, keyed
+by a digest of everything that goes into the call plus the evaluator's version.
+
+Invalidation policy: a changed span payload, target or reference input yields a
+new key. A custom evaluator's version is derived from its update time (or
+config), so editing it also yields new keys; custom evaluators whose version is
+unknown are never cached. Built-in evaluators are versioned by the service, and
+their cached results can be dropped with :meth:`EvaluationResultCache.invalidate`.
+
+The version comes from the evaluator metadata cache, which is reused for up to
+``AGENTCORE_EVAL_METADATA_TTL_SECONDS`` (15 minutes by default). Edits made
+through ``agentcore eval evaluator update`` take effect at once, but an
+evaluator edited elsewhere (console, SDK) can be served results cached under
+its previous version until that TTL expires. Run
+``agentcore eval clear-cache -e <evaluator-id>`` after such an edit to drop them
+right away.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Evaluator fields that change whenever the evaluator is edited, in order of preference.
+# updatedAt is in both list_evaluators summaries and get_evaluator details.
+_VERSION_FIELDS = ("updatedAt", "evaluatorConfig")
+
+_SCHEMA_VERSION = 1
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS evaluation_results (
+    key TEXT PRIMARY KEY,
+    evaluator_id TEXT NOT NULL,
+    created_ms INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS evaluation_results_evaluator ON evaluation_results (evaluator_id);
+"""
+
+
+def evaluator_version(details: Dict[str, Any]) -> Optional[str]:
+    """Derive a version for an evaluator from its control plane details.
+
+    Args:
+        details: ``get_evaluator`` response or ``list_evaluators`` summary
+
+    Returns:
+        Digest of the evaluator's update time (or config, if the update time
+        is missing), or None if the details contain neither
+    """
+    for name in _VERSION_FIELDS:
+        if details.get(name):
+            return hashlib.sha256(_canonical_json({name: details[name]}).encode("utf-8")).hexdigest()
+    return None
+
+
+def _canonical_json(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+
+
+class EvaluationResultCache:
+    """SQLite-backed cache of evaluate API results keyed by evaluator and payload.
+
+    Safe to share between threads; several processes may use the same file.
+
+    Example:
+        cache = EvaluationResultCache.for_project(Path.cwd())
+        processor = EvaluationProcessor(data_plane_client, control_plane_client, result_cache=cache)
+    """
+
+    def __init__(self, path: Path):
+        """Initialize the cache.
+
+        Args:
+            path: SQLite database file (created on first use)
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @classmethod
+    def for_project(cls, project_root: Path) -> "EvaluationResultCache":
+        """Create the cache stored under ``{project_root}/.bedrock_agentcore/``."""
+        from ...utils.runtime.config import get_evaluation_cache_path
+
+        return cls(get_evaluation_cache_path(project_root))
+
+    @staticmethod
+    def digest_spans(otel_spans: List[Dict[str, Any]]) -> str:
+        """Digest the exact spans/logs sent to the evaluators.
+
+        Computed once per payload and shared by the keys of all evaluators it is sent to.
+        """
+        digest = hashlib.sha256()
+        for span in otel_spans:
+            digest.update(_canonical_json(span).encode("utf-8"))
+            digest.update(b"\n")
+        return digest.hexdigest()
+
+    @staticmethod
+    def key(
+        evaluator_id: str,
+        evaluator_version: str,
+        spans_digest: str,
+        evaluation_target: Optional[Dict[str, Any]] = None,
+        reference_inputs: Optional[List[Dict[str, Any]]] = None,
+    ) -> str:
+        """Build the cache key for one evaluate call.
+
+        Args:
+            evaluator_id: Evaluator identifier
+            evaluator_version: Version from :func:`evaluator_version`, or the ID for built-ins
+            spans_digest: Digest of the spans from :meth:`digest_spans`
+            evaluation_target: Target sent with the spans, if any
+            reference_inputs: Serialized reference inputs sent with the spans, if any
+
+        Returns:
+            Hex digest identifying the call
+        """
+        parts = [evaluator_id, evaluator_version, spans_digest, evaluation_target, reference_inputs]
+        return hashlib.sha256(_canonical_json(parts).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        """Load the API results cached for a key.
+
+        Returns:
+            The ``evaluationResults`` of the cached call, or None on a miss
+        """
+        with self._lock:
+            row = self._connect().execute("SELECT data FROM evaluation_results WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, key: str, evaluator_id: str, api_results: List[Dict[str, Any]]) -> None:
+        """Save the API results of an evaluate call.
+
+        Args:
+            key: Key from :meth:`key`
+            evaluator_id: Evaluator identifier, used by :meth:`invalidate`
+            api_results: ``evaluationResults`` returned by the service
+        """
+        data = json.dumps(api_results, default=str)
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO evaluation_results VALUES (?, ?, ?, ?)",
+                    (key, evaluator_id, int(time.time() * 1000), data),
+                )
+
+    def invalidate(self, evaluator_id: Optional[str] = None) -> int:
+        """Remove cached results so the next run calls the evaluators again.
+
+        Args:
+            evaluator_id: Only remove this evaluator's results (default: all)
+
+        Returns:
+            Number of cached results removed
+        """
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                if evaluator_id is None:
+                    cursor = conn.execute("DELETE FROM evaluation_results")
+                else:
+                    cursor = conn.execute("DELETE FROM evaluation_results WHERE evaluator_id = ?", (evaluator_id,))
+        return cursor.rowcount
+
+    def clear(self) -> None:
+        """Remove all cached results."""
+        self.invalidate()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use, creating or migrating the schema."""
+        if self._conn is not None:
+            return self._conn
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        if conn.execute("PRAGMA user_version").fetchone()[0] != _SCHEMA_VERSION:
+            with conn:
+                conn.execute("DROP TABLE IF EXISTS evaluation_results")
+            conn.executescript(_SCHEMA)
+            conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        self._conn = conn
+        logger.debug("Opened evaluation cache at %s", self.path)
+        return conn
@@ -67,13 +67,14 @@ class EvaluationControlPlaneClient:
                 endpoint_url=self.endpoint_url,
             )
 
-    def list_evaluators(self, max_results: int = 50) -> Dict[str, Any]:
+    def list_evaluators(self, max_results: int = 50, next_token: Optional[str] = None) -> Dict[str, Any]:
         """List all evaluators (builtin and custom).
 
         Returns evaluators with level and description for display.
 
         Args:
             max_results: Maximum number of evaluators to return
+            next_token: Token from a previous response to fetch the next page
 
         Returns:
             API response with evaluators list
@@ -91,7 +92,10 @@ class EvaluationControlPlaneClient:
                 ]
             }
         """
-        return self.client.list_evaluators(maxResults=max_results)
+        params = {"maxResults": max_results}
+        if next_token:
+            params["nextToken"] = next_token
+        return self.client.list_evaluators(**params)
 
     def get_evaluator(self, evaluator_id: str) -> Dict[str, Any]:
         """Get evaluator details.
@@ -16,6 +16,9 @@ from .models import EvaluationRequest
 
 logger = logging.getLogger(__name__)
 
+# Attempts per evaluate call, including throttled ones retried by botocore
+EVALUATE_MAX_ATTEMPTS = 8
+
 
 class EvaluationDataPlaneClient:
     """Thin client for AgentCore Evaluation Data Plane API.
@@ -40,11 +43,13 @@ class EvaluationDataPlaneClient:
         if boto_client:
             self.client = boto_client
         else:
-            # Configure retries for transient failures
+            # Configure retries for transient failures. Adaptive mode also rate limits
+            # requests on the client once the service throttles, which keeps
+            # concurrent evaluator calls sharing this client under the quota.
             retry_config = Config(
                 retries={
-                    "max_attempts": 3,
-                    "mode": "adaptive",  # Adaptive retry mode for better reliability
+                    "max_attempts": EVALUATE_MAX_ATTEMPTS,
+                    "mode": "adaptive",
                 }
             )
             self.client = boto3.client(
@@ -0,0 +1,251 @@
+"""Cached evaluator metadata - the level and version of each evaluator.
+
+Evaluations need every evaluator's level to choose the spans to send, and its
+version for the result cache key. Built-in evaluator levels come from a static
+table. Other evaluators are resolved from one paginated ``list_evaluators``
+sweep, and evaluators missing from it (e.g. created since the sweep) are looked
+up with concurrent ``get_evaluator`` calls.
+
+Staleness policy: entries and sweeps are reused for ``ttl_seconds``. Editing an
+evaluator through the CLI invalidates its entry right away; edits made
+elsewhere are picked up once the entry expires.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from botocore.exceptions import ClientError
+
+from .cache import evaluator_version
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_METADATA_TTL_SECONDS = int(os.getenv("AGENTCORE_EVAL_METADATA_TTL_SECONDS", "900"))
+# get_evaluator calls in flight at once for evaluators missing from the sweep
+DEFAULT_MAX_CONCURRENT_LOOKUPS = 5
+LIST_PAGE_SIZE = 100
+
+BUILTIN_EVALUATOR_LEVELS = {
+    "Builtin.GoalSuccessRate": "SESSION",
+    "Builtin.Helpfulness": "TRACE",
+    "Builtin.Correctness": "TRACE",
+    "Builtin.Faithfulness": "TRACE",
+    "Builtin.ResponseRelevance": "TRACE",
+    "Builtin.Conciseness": "TRACE",
+    "Builtin.Coherence": "TRACE",
+    "Builtin.InstructionFollowing": "TRACE",
+    "Builtin.Refusal": "TRACE",
+    "Builtin.Harmfulness": "TRACE",
+    "Builtin.Stereotyping": "TRACE",
+    "Builtin.ToolSelectionAccuracy": "TOOL_CALL",
+    "Builtin.ToolParameterAccuracy": "TOOL_CALL",
+}
+
+_FORMAT_VERSION = 1
+
+
+@dataclass
+class EvaluatorMetadata:
+    """Level and version of an evaluator."""
+
+    evaluator_id: str
+    level: str
+    version: Optional[str] = None
+
+
+class EvaluatorMetadataCache:
+    """Evaluator metadata for one region, kept in memory and optionally in a JSON file.
+
+    Safe to share between threads. Several processes may use the same file;
+    the last one to save wins, which at worst causes extra lookups.
+
+    Example:
+        metadata = EvaluatorMetadataCache.for_project(Path.cwd(), region="us-east-1")
+        processor = EvaluationProcessor(data_plane_client, control_plane_client, evaluator_metadata=metadata)
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        region: str = "",
+        ttl_seconds: int = DEFAULT_METADATA_TTL_SECONDS,
+    ):
+        """Initialize the cache.
+
+        Args:
+            path: JSON file to persist metadata in (default: memory only)
+            region: AWS region the evaluators belong to
+            ttl_seconds: How long entries and sweeps are reused
+        """
+        self.path = Path(path) if path else None
+        self.region = region
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._data: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def for_project(cls, project_root: Path, region: str, **kwargs: Any) -> "EvaluatorMetadataCache":
+        """Create the cache stored under ``{project_root}/.bedrock_agentcore/``."""
+        from ...utils.runtime.config import get_evaluator_metadata_cache_path
+
+        return cls(get_evaluator_metadata_cache_path(project_root), region=region, **kwargs)
+
+    def resolve(
+        self,
+        control_plane_client: Any,
+        evaluator_ids: List[str],
+        max_workers: int = DEFAULT_MAX_CONCURRENT_LOOKUPS,
+    ) -> Dict[str, EvaluatorMetadata]:
+        """Get the metadata of evaluators, fetching only what is not cached.
+
+        Args:
+            control_plane_client: Client used for ``list_evaluators`` and ``get_evaluator``
+            evaluator_ids: Evaluators to resolve
+            max_workers: Maximum concurrent ``get_evaluator`` calls
+
+        Returns:
+            Metadata by evaluator ID; evaluators that could not be fetched are left out
+        """
+        resolved = {
+            evaluator_id: EvaluatorMetadata(evaluator_id, BUILTIN_EVALUATOR_LEVELS[evaluator_id])
+            for evaluator_id in evaluator_ids
+            if evaluator_id in BUILTIN_EVALUATOR_LEVELS
+        }
+
+        # Network calls run without the lock so other threads can read cached entries meanwhile
+        with self._lock:
+            now = time.time()
+            region_data = self._region_data()
+            entries = region_data["evaluators"]
+            missing = [
+                e for e in dict.fromkeys(evaluator_ids) if e not in resolved and not self._fresh(entries, e, now)
+            ]
+            sweep_due = bool(missing) and now - region_data.get("listed_at", 0) >= self.ttl_seconds
+
+        fetched: Dict[str, Dict[str, Any]] = {}
+        swept = False
+        if sweep_due:
+            listed = self._sweep(control_plane_client)
+            swept = listed is not None
+            if listed:
+                fetched.update(listed)
+            missing = [e for e in missing if e not in fetched]
+        if missing:
+            fetched.update(self._lookup(control_plane_client, missing, max_workers))
+
+        with self._lock:
+            region_data = self._region_data()
+            entries = region_data["evaluators"]
+            if swept:
+                region_data["listed_at"] = now
+            for evaluator_id, details in fetched.items():
+                entries[evaluator_id] = self._entry(details, now)
+            if swept or fetched:
+                self._save()
+
+            for evaluator_id in evaluator_ids:
+                entry = entries.get(evaluator_id)
+                if evaluator_id not in resolved and entry:
+                    resolved[evaluator_id] = EvaluatorMetadata(evaluator_id, entry["level"], entry.get("version"))
+        return resolved
+
+    def invalidate(self, evaluator_id: Optional[str] = None) -> None:
+        """Forget cached metadata so it is fetched again on the next resolve.
+
+        Args:
+            evaluator_id: Only forget this evaluator, in every region (default: everything)
+        """
+        with self._lock:
+            changed = False
+            for region_data in self._load()["regions"].values():
+                if evaluator_id is None:
+                    changed = changed or bool(region_data["evaluators"]) or "listed_at" in region_data
+                    region_data["evaluators"].clear()
+                    region_data.pop("listed_at", None)
+                elif region_data["evaluators"].pop(evaluator_id, None) is not None:
+                    changed = True
+            if changed:
+                self._save()
+
+    def _fresh(self, entries: Dict[str, Any], evaluator_id: str, now: float) -> bool:
+        entry = entries.get(evaluator_id)
+        return bool(entry) and now - entry.get("fetched_at", 0) < self.ttl_seconds
+
+    @staticmethod
+    def _entry(details: Dict[str, Any], now: float) -> Dict[str, Any]:
+        return {
+            "level": details.get("level") or details.get("evaluatorLevel") or "TRACE",
+            "version": evaluator_version(details),
+            "fetched_at": now,
+        }
+
+    @staticmethod
+    def _sweep(control_plane_client: Any) -> Optional[Dict[str, Dict[str, Any]]]:
+        """List every evaluator with a paginated ``list_evaluators``; returns None if it failed."""
+        listed: Dict[str, Dict[str, Any]] = {}
+        next_token = None
+        try:
+            while True:
+                response = control_plane_client.list_evaluators(max_results=LIST_PAGE_SIZE, next_token=next_token)
+                for summary in response.get("evaluators", []):
+                    if summary.get("evaluatorId"):
+                        listed[summary["evaluatorId"]] = summary
+                next_token = response.get("nextToken")
+                if not next_token:
+                    return listed
+        except (ClientError, RuntimeError, KeyError, ValueError) as e:
+            logger.debug("Could not list evaluators, looking them up one by one: %s", e)
+            return None
+
+    @staticmethod
+    def _lookup(control_plane_client: Any, evaluator_ids: List[str], max_workers: int) -> Dict[str, Dict[str, Any]]:
+        """Fetch evaluator details concurrently, skipping evaluators that cannot be fetched."""
+
+        def get(evaluator_id: str) -> Optional[Dict[str, Any]]:
+            try:
+                return control_plane_client.get_evaluator(evaluator_id)
+            except (ClientError, RuntimeError, KeyError, ValueError) as e:
+                logger.debug("Could not fetch evaluator %s: %s", evaluator_id, e)
+                return None
+
+        workers = max(1, min(max_workers, len(evaluator_ids)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="agentcore-eval-metadata") as executor:
+            details = list(executor.map(get, evaluator_ids))
+        return {evaluator_id: d for evaluator_id, d in zip(evaluator_ids, details, strict=True) if d is not None}
+
+    def _region_data(self) -> Dict[str, Any]:
+        return self._load()["regions"].setdefault(self.region, {"evaluators": {}})
+
+    def _load(self) -> Dict[str, Any]:
+        """Read the file on first use; a missing or unreadable file starts an empty cache."""
+        if self._data is not None:
+            return self._data
+        data: Dict[str, Any] = {"format_version": _FORMAT_VERSION, "regions": {}}
+        if self.path and self.path.exists():
+            try:
+                loaded = json.loads(self.path.read_text())
+                if loaded.get("format_version") == _FORMAT_VERSION and isinstance(loaded.get("regions"), dict):
+                    data = loaded
+            except (OSError, ValueError, AttributeError) as e:
+                logger.debug("Ignoring unreadable evaluator metadata cache %s: %s", self.path, e)
+        self._data = data
+        return data
+
+    def _save(self) -> None:
+        """Write the cache atomically; failures only cost lookups on the next run."""
+        if not self.path or self._data is None:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(self._data, default=str))
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning("Could not save evaluator metadata cache %s: %s", self.path, e)
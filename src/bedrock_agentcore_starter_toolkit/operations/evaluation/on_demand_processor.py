@@ -5,23 +5,34 @@ Separates business logic from API client calls for better testability and reusab
 
 import copy
 import logging
+import os
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
 from botocore.exceptions import ClientError
 
-from ..constants import DEFAULT_RUNTIME_SUFFIX, InstrumentationScopes
+from ..constants import DEFAULT_MAX_EVALUATION_PAYLOAD_BYTES, DEFAULT_RUNTIME_SUFFIX, InstrumentationScopes
+from ..observability.cache import ObservabilityCache
 from ..observability.client import ObservabilityClient
 from ..observability.telemetry import TraceData
+from .cache import EvaluationResultCache
+from .evaluator_metadata import EvaluatorMetadataCache
+from .evaluator_processor import is_builtin_evaluator
 from .models import EvaluationResult, EvaluationResults, ReferenceInputs
+from .payload import compact_documents
 
 logger = logging.getLogger(__name__)
 
 
 # Default configuration
-DEFAULT_MAX_EVALUATION_ITEMS = 1000
 DEFAULT_LOOKBACK_DAYS = 7
 MAX_EVALUATORS_PER_REQUEST = 20
+# Evaluate calls in flight at once; each is an LLM-as-judge round trip of several seconds
+DEFAULT_MAX_CONCURRENT_EVALUATIONS = int(os.getenv("AGENTCORE_EVAL_MAX_CONCURRENCY", "5"))
+# Failures of the result cache file, database or stored data; any of them bypasses the cache
+_RESULT_CACHE_ERRORS = (sqlite3.Error, OSError, ValueError)
 
 
 class EvaluationProcessor:
@@ -34,15 +45,41 @@ class EvaluationProcessor:
     - Orchestrating evaluation flow
     """
 
-    def __init__(self, data_plane_client, control_plane_client=None):
+    def __init__(
+        self,
+        data_plane_client,
+        control_plane_client=None,
+        observability_cache: Optional[ObservabilityCache] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENT_EVALUATIONS,
+        result_cache: Optional[EvaluationResultCache] = None,
+        evaluator_metadata: Optional[EvaluatorMetadataCache] = None,
+    ):
         """Initialize processor with API clients.
 
         Args:
             data_plane_client: Client for evaluation data plane API
             control_plane_client: Optional client for control plane (evaluator management)
+            observability_cache: Optional local cache for session spans and runtime logs
+            max_concurrency: Maximum number of evaluators to run at once
+            result_cache: Optional local cache for evaluation results; evaluators whose
+                results for the same spans, target and reference inputs are cached are not called again
+            evaluator_metadata: Optional shared cache of evaluator levels and versions
+                (default: an in-memory cache reused by this processor's evaluations)
+
+        Raises:
+            ValueError: If max_concurrency is less than 1
         """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
         self.data_plane_client = data_plane_client
         self.control_plane_client = control_plane_client
+        self.observability_cache = observability_cache
+        self.max_concurrency = max_concurrency
+        self.result_cache = result_cache
+        self.evaluator_metadata = evaluator_metadata or EvaluatorMetadataCache()
+        # Versions of the evaluators fetched from the control plane, part of the result cache key
+        self._evaluator_versions: Dict[str, str] = {}
 
     def get_latest_session(self, agent_id: str, region: str) -> Optional[str]:
         """Get the latest session ID for an agent.
@@ -85,8 +122,50 @@ class EvaluationProcessor:
             logger.debug("Stack trace for get_latest_session error:", exc_info=True)
             return None
 
+    def get_latest_sessions(
+        self, agent_id: str, region: str, limit: int, days: int = DEFAULT_LOOKBACK_DAYS
+    ) -> List[str]:
+        """Get the IDs of an agent's most recent sessions.
+
+        Args:
+            agent_id: Agent ID to query
+            region: AWS region
+            limit: Maximum number of sessions
+            days: Number of days to look back (default: 7)
+
+        Returns:
+            Session IDs, most recently active first
+
+        Raises:
+            ValueError: If agent_id or region is invalid
+            RuntimeError: If the sessions cannot be queried
+        """
+        if not agent_id or not agent_id.strip():
+            raise ValueError("agent_id is required and cannot be empty")
+        if not region or not region.strip():
+            raise ValueError("region is required and cannot be empty")
+
+        obs_client = ObservabilityClient(region_name=region, cache=self.observability_cache)
+        end_time = datetime.now()
+        start_time = end_time - timedelta(days=days)
+
+        try:
+            return obs_client.get_latest_session_ids(
+                start_time_ms=int(start_time.timestamp() * 1000),
+                end_time_ms=int(end_time.timestamp() * 1000),
+                agent_id=agent_id,
+                limit=limit,
+            )
+        except (ClientError, ValueError, KeyError) as e:
+            raise RuntimeError(f"Failed to fetch latest sessions: {e}") from e
+
     def fetch_session_data(
-        self, session_id: str, agent_id: str, region: str, days: int = DEFAULT_LOOKBACK_DAYS
+        self,
+        session_id: str,
+        agent_id: str,
+        region: str,
+        days: int = DEFAULT_LOOKBACK_DAYS,
+        obs_client: Optional[ObservabilityClient] = None,
     ) -> TraceData:
         """Fetch session data from CloudWatch.
 
@@ -95,6 +174,7 @@ class EvaluationProcessor:
             agent_id: Agent ID for filtering
             region: AWS region
             days: Number of days to look back (default: 7)
+            obs_client: Client to query with, e.g. one shared by several fetches (default: a new client)
 
         Returns:
             TraceData with session spans and logs
@@ -111,8 +191,9 @@ class EvaluationProcessor:
         if not region or not region.strip():
             raise ValueError("region is required and cannot be empty")
 
-        # ObservabilityClient is stateless - only takes region
-        obs_client = ObservabilityClient(region_name=region)
+        # ObservabilityClient is stateless - only takes region and an optional cache
+        if obs_client is None:
+            obs_client = ObservabilityClient(region_name=region, cache=self.observability_cache)
 
         # Configurable lookback
         end_time = datetime.now()
@@ -121,26 +202,18 @@ class EvaluationProcessor:
         end_time_ms = int(end_time.timestamp() * 1000)
 
         try:
-            # Query spans for the session
-            spans = obs_client.query_spans_by_session(
-                session_id=session_id, start_time_ms=start_time_ms, end_time_ms=end_time_ms, agent_id=agent_id
-            )
-
-            if not spans:
-                raise RuntimeError(f"No spans found for session {session_id}")
-
-            # Get unique trace IDs from spans
-            trace_ids = list(set(span.trace_id for span in spans if span.trace_id))
-
-            # Query runtime logs for all traces
-            runtime_logs = obs_client.query_runtime_logs_by_traces(
-                trace_ids=trace_ids,
+            # Query spans for the session and runtime logs for all of its traces
+            spans, runtime_logs = obs_client.fetch_session_telemetry(
+                session_id=session_id,
                 start_time_ms=start_time_ms,
                 end_time_ms=end_time_ms,
                 agent_id=agent_id,
                 endpoint_name=DEFAULT_RUNTIME_SUFFIX,
             )
 
+            if not spans:
+                raise RuntimeError(f"No spans found for session {session_id}")
+
             # Build TraceData object
             trace_data = TraceData(session_id=session_id, agent_id=agent_id, spans=spans, runtime_logs=runtime_logs)
 
@@ -246,19 +319,24 @@ class EvaluationProcessor:
         )
 
     def get_most_recent_spans(
-        self, trace_data: TraceData, max_items: int = DEFAULT_MAX_EVALUATION_ITEMS
+        self,
+        trace_data: TraceData,
+        max_items: Optional[int] = None,
+        max_bytes: int = DEFAULT_MAX_EVALUATION_PAYLOAD_BYTES,
     ) -> List[Dict[str, Any]]:
         """Get most recent relevant spans across all traces in session.
 
         Collects spans from known instrumentation scopes and log events with conversation data,
-        sorted by timestamp to get the most recent items.
+        sorted by timestamp to get the most recent items. The items are compacted for the
+        evaluation API (see ``payload.compact_documents``) and taken until they fill ``max_bytes``.
 
         Args:
             trace_data: TraceData containing all session data
-            max_items: Maximum number of items to return
+            max_items: Optional maximum number of items to return
+            max_bytes: Maximum encoded size of the returned items together
 
         Returns:
-            List of raw span documents, most recent first
+            List of compacted span documents, most recent first
         """
         # Extract raw spans from all traces
         raw_spans = self.extract_raw_spans(trace_data)
@@ -276,8 +354,8 @@ class EvaluationProcessor:
 
         relevant_spans.sort(key=get_timestamp, reverse=True)
 
-        # Return most recent max_items
-        return relevant_spans[:max_items]
+        # Compact the most recent items that fit in the request
+        return compact_documents(relevant_spans, max_bytes=max_bytes, max_items=max_items)
 
     def count_span_types(self, raw_spans: List[Dict[str, Any]]) -> tuple:
         """Count spans, logs, and scoped spans.
@@ -306,7 +384,8 @@ class EvaluationProcessor:
         evaluator_level: str,
         trace_data: TraceData,
         trace_id: Optional[str] = None,
-        max_items: int = DEFAULT_MAX_EVALUATION_ITEMS,
+        max_items: Optional[int] = None,
+        max_bytes: int = DEFAULT_MAX_EVALUATION_PAYLOAD_BYTES,
     ) -> tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
         """Determine which spans to send based on evaluator level.
 
@@ -314,7 +393,8 @@ class EvaluationProcessor:
             evaluator_level: "SESSION" or "TRACE"
             trace_data: Full session data
             trace_id: Optional specific trace to evaluate
-            max_items: Maximum items to return
+            max_items: Optional maximum number of items to return
+            max_bytes: Maximum encoded size of the spans to send
 
         Returns:
             Tuple of (spans_to_send, evaluation_target)
@@ -323,19 +403,19 @@ class EvaluationProcessor:
         """
         if evaluator_level == "SESSION":
             # Session-level: send most recent spans across all traces
-            spans = self.get_most_recent_spans(trace_data, max_items=max_items)
+            spans = self.get_most_recent_spans(trace_data, max_items=max_items, max_bytes=max_bytes)
             return spans, None
 
         elif evaluator_level == "TRACE":
             # Trace-level: send target trace + previous traces for context
             if trace_id:
                 filtered_data = self.filter_traces_up_to(trace_data, trace_id)
-                spans = self.get_most_recent_spans(filtered_data, max_items=max_items)
+                spans = self.get_most_recent_spans(filtered_data, max_items=max_items, max_bytes=max_bytes)
                 evaluation_target = {"traceIds": [trace_id]}
                 return spans, evaluation_target
             else:
                 # No specific trace, evaluate all traces
-                spans = self.get_most_recent_spans(trace_data, max_items=max_items)
+                spans = self.get_most_recent_spans(trace_data, max_items=max_items, max_bytes=max_bytes)
                 return spans, None
         else:
             raise ValueError(f"Unknown evaluator level: {evaluator_level}")
@@ -351,7 +431,10 @@ class EvaluationProcessor:
     ) -> List[EvaluationResult]:
         """Execute evaluators and return results.
 
-        Calls data plane API once per evaluator.
+        Calls data plane API once per evaluator, with up to ``max_concurrency``
+        calls in flight. All calls share the same spans and reference inputs,
+        and results are returned in the order of ``evaluators``. With a result
+        cache, evaluators whose results for this payload are cached are not called.
 
         Args:
             evaluators: List of evaluator identifiers
@@ -378,42 +461,125 @@ class EvaluationProcessor:
                     resolved.expected_response = {target_trace: resolved.expected_response}
             eval_ref_inputs = resolved.to_api_dict(session_id)
 
-        results = []
+        spans_digest = self.result_cache.digest_spans(otel_spans) if self.result_cache else None
+
+        workers = min(self.max_concurrency, len(evaluators))
+        if workers <= 1:
+            results_by_evaluator = [
+                self._run_evaluator(evaluator, otel_spans, session_id, evaluation_target, eval_ref_inputs, spans_digest)
+                for evaluator in evaluators
+            ]
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="agentcore-eval") as executor:
+                futures = [
+                    executor.submit(
+                        self._run_evaluator,
+                        evaluator,
+                        otel_spans,
+                        session_id,
+                        evaluation_target,
+                        eval_ref_inputs,
+                        spans_digest,
+                    )
+                    for evaluator in evaluators
+                ]
+                results_by_evaluator = [future.result() for future in futures]
+
+        # Keep the order of the evaluators regardless of which finished first
+        return [result for results in results_by_evaluator for result in results]
+
+    def _run_evaluator(
+        self,
+        evaluator: str,
+        otel_spans: List[Dict[str, Any]],
+        session_id: str,
+        evaluation_target: Optional[Dict[str, Any]],
+        eval_ref_inputs: Optional[List[Dict[str, Any]]],
+        spans_digest: Optional[str] = None,
+    ) -> List[EvaluationResult]:
+        """Call the data plane API for one evaluator, turning failures into error results.
 
-        for evaluator in evaluators:
+        Cached results are returned without calling the API, and new successful
+        results are added to the cache. Error results are never cached.
+        """
+        cache = self.result_cache
+        cache_key = self._result_cache_key(evaluator, spans_digest, evaluation_target, eval_ref_inputs)
+        if cache and cache_key:
             try:
-                # Call API with single evaluator
-                response = self.data_plane_client.evaluate(
-                    evaluator_id=evaluator,
-                    session_spans=otel_spans,
-                    evaluation_target=evaluation_target,
-                    evaluation_reference_inputs=eval_ref_inputs,
-                )
+                cached = cache.get(cache_key)
+                if cached is not None:
+                    logger.debug("Using cached results for evaluator %s", evaluator)
+                    return [EvaluationResult.from_api_response(api_result) for api_result in cached]
+            except (*_RESULT_CACHE_ERRORS, KeyError, TypeError, AttributeError) as e:
+                # Unreadable rows are treated like an unavailable cache rather than failed evaluations
+                self._disable_result_cache(e)
+                cache, cache_key = None, None
 
-                # API returns {evaluationResults: [...]}
-                api_results = response.get("evaluationResults", [])
-
-                if not api_results:
-                    logger.warning("Evaluator %s returned no results", evaluator)
-
-                for api_result in api_results:
-                    result = EvaluationResult.from_api_response(api_result)
-                    results.append(result)
-
-            except (RuntimeError, ClientError, KeyError, ValueError, TypeError) as e:
-                # Create error result for API failures and data processing errors
-                logger.warning("Evaluator %s failed: %s", evaluator, str(e))
-                error_result = EvaluationResult(
-                    evaluator_id=evaluator,
-                    evaluator_name=evaluator,
-                    evaluator_arn="",
-                    explanation=f"Evaluation failed: {str(e)}",
-                    context={"spanContext": {"sessionId": session_id}},
-                    error=str(e),
-                )
-                results.append(error_result)
+        try:
+            # Call API with single evaluator
+            response = self.data_plane_client.evaluate(
+                evaluator_id=evaluator,
+                session_spans=otel_spans,
+                evaluation_target=evaluation_target,
+                evaluation_reference_inputs=eval_ref_inputs,
+            )
 
-        return results
+            # API returns {evaluationResults: [...]}
+            api_results = response.get("evaluationResults", [])
+
+            if not api_results:
+                logger.warning("Evaluator %s returned no results", evaluator)
+
+            results = [EvaluationResult.from_api_response(api_result) for api_result in api_results]
+
+            # Only complete, successful results are reused; failures are retried next time
+            if cache and cache_key and results and not any(result.has_error() for result in results):
+                try:
+                    cache.put(cache_key, evaluator, api_results)
+                except _RESULT_CACHE_ERRORS as e:
+                    self._disable_result_cache(e)
+
+            return results
+
+        except (RuntimeError, ClientError, KeyError, ValueError, TypeError) as e:
+            # Create error result for API failures and data processing errors
+            logger.warning("Evaluator %s failed: %s", evaluator, str(e))
+            error_result = EvaluationResult(
+                evaluator_id=evaluator,
+                evaluator_name=evaluator,
+                evaluator_arn="",
+                explanation=f"Evaluation failed: {str(e)}",
+                context={"spanContext": {"sessionId": session_id}},
+                error=str(e),
+            )
+            return [error_result]
+
+    def _result_cache_key(
+        self,
+        evaluator: str,
+        spans_digest: Optional[str],
+        evaluation_target: Optional[Dict[str, Any]],
+        eval_ref_inputs: Optional[List[Dict[str, Any]]],
+    ) -> Optional[str]:
+        """Build the result cache key for an evaluator, or None if its results cannot be cached.
+
+        Built-in evaluators are identified by their ID. Custom evaluators can be
+        edited, so they are only cached once their version is known from the
+        control plane.
+        """
+        if self.result_cache is None or spans_digest is None:
+            return None
+        version = self._evaluator_versions.get(evaluator)
+        if version is None:
+            if not is_builtin_evaluator(evaluator):
+                return None
+            version = evaluator
+        return self.result_cache.key(evaluator, version, spans_digest, evaluation_target, eval_ref_inputs)
+
+    def _disable_result_cache(self, error: Exception) -> None:
+        """Stop using a result cache that failed; evaluators are called directly from then on."""
+        logger.warning("Evaluation result cache unavailable, calling evaluators directly: %s", error)
+        self.result_cache = None
 
     def evaluate_session(
         self,
@@ -450,27 +616,55 @@ class EvaluationProcessor:
             ValueError: If required parameters are invalid
             RuntimeError: If session data cannot be fetched or evaluation fails
         """
-        # Input validation
-        if not evaluators or not isinstance(evaluators, list):
-            raise ValueError("evaluators must be a non-empty list")
-
-        if len(evaluators) > MAX_EVALUATORS_PER_REQUEST:
-            raise ValueError(
-                f"Too many evaluators: {len(evaluators)}. Maximum allowed is {MAX_EVALUATORS_PER_REQUEST} per request."
-            )
+        self._validate_evaluators(evaluators)
 
         # 1. Fetch session data (validates session_id, agent_id, region internally)
         trace_data = self.fetch_session_data(session_id, agent_id, region, days)
 
         # Removed verbose session stats logging
 
+        return self.evaluate_trace_data(
+            trace_data, evaluators, session_id=session_id, trace_id=trace_id, reference_inputs=reference_inputs
+        )
+
+    def evaluate_trace_data(
+        self,
+        trace_data: TraceData,
+        evaluators: List[str],
+        session_id: Optional[str] = None,
+        trace_id: Optional[str] = None,
+        reference_inputs: Optional[ReferenceInputs] = None,
+    ) -> EvaluationResults:
+        """Evaluate a session whose spans and runtime logs are already loaded.
+
+        Used for sessions read from local files, e.g. with ``load_trace_data``,
+        so nothing is queried from CloudWatch. Evaluators still run in the
+        evaluation service.
+
+        Args:
+            trace_data: Session spans and runtime logs
+            evaluators: List of evaluator identifiers
+            session_id: Session ID to evaluate (default: ``trace_data.session_id``)
+            trace_id: Optional trace ID to evaluate
+            reference_inputs: Optional reference inputs (ground truth / assertions)
+
+        Returns:
+            EvaluationResults containing all evaluation results
+
+        Raises:
+            ValueError: If required parameters are invalid
+            RuntimeError: If evaluation fails
+        """
+        self._validate_evaluators(evaluators)
+        session_id = session_id or trace_data.session_id
+        if not session_id:
+            raise ValueError("session_id is required and cannot be empty")
+
         results = EvaluationResults(session_id=session_id, trace_id=trace_id)
         input_spans = []
 
         # 2. Group evaluators by level (if control plane available)
         if self.control_plane_client:
-            # TODO: Fetch evaluator details to get levels
-            # For now, use default behavior
             evaluators_by_level = self._group_evaluators_by_level(evaluators)
         else:
             # Default: treat all as TRACE level
@@ -485,7 +679,7 @@ class EvaluationProcessor:
 
             # Determine spans for this level
             otel_spans, evaluation_target = self.determine_spans_for_evaluator(
-                evaluator_level=level, trace_data=trace_data, trace_id=trace_id, max_items=DEFAULT_MAX_EVALUATION_ITEMS
+                evaluator_level=level, trace_data=trace_data, trace_id=trace_id
             )
 
             if not otel_spans:
@@ -512,6 +706,16 @@ class EvaluationProcessor:
 
         return results
 
+    @staticmethod
+    def _validate_evaluators(evaluators: List[str]) -> None:
+        if not evaluators or not isinstance(evaluators, list):
+            raise ValueError("evaluators must be a non-empty list")
+
+        if len(evaluators) > MAX_EVALUATORS_PER_REQUEST:
+            raise ValueError(
+                f"Too many evaluators: {len(evaluators)}. Maximum allowed is {MAX_EVALUATORS_PER_REQUEST} per request."
+            )
+
     def _group_evaluators_by_level(self, evaluators: List[str]) -> Dict[str, List[str]]:
         """Group evaluators by their level (SESSION or TRACE).
 
@@ -525,22 +729,31 @@ class EvaluationProcessor:
         """
         grouped = {"SESSION": [], "TRACE": []}
 
+        # Built-ins and cached evaluators need no control plane calls
+        metadata = self.evaluator_metadata.resolve(
+            self.control_plane_client, evaluators, max_workers=self.max_concurrency
+        )
+
         for evaluator_id in evaluators:
-            try:
-                # Fetch evaluator details
-                details = self.control_plane_client.get_evaluator(evaluator_id)
-                level = details.get("level", "TRACE")
-
-                # Map levels to SESSION or TRACE
-                # TOOL_CALL and any other levels default to TRACE
-                if level == "SESSION":
-                    grouped["SESSION"].append(evaluator_id)
-                else:
-                    # TRACE, TOOL_CALL, or any other level -> TRACE
-                    grouped["TRACE"].append(evaluator_id)
-            except (ClientError, RuntimeError, KeyError, ValueError) as e:
+            entry = metadata.get(evaluator_id)
+            if entry is None:
                 # Default to TRACE if we can't fetch evaluator details
-                logger.debug("Could not fetch level for evaluator %s: %s - defaulting to TRACE", evaluator_id, e)
+                logger.debug("Could not fetch level for evaluator %s - defaulting to TRACE", evaluator_id)
+                self._evaluator_versions.pop(evaluator_id, None)
+                grouped["TRACE"].append(evaluator_id)
+                continue
+
+            if entry.version:
+                self._evaluator_versions[evaluator_id] = entry.version
+            else:
+                self._evaluator_versions.pop(evaluator_id, None)
+
+            # Map levels to SESSION or TRACE
+            # TOOL_CALL and any other levels default to TRACE
+            if entry.level == "SESSION":
+                grouped["SESSION"].append(evaluator_id)
+            else:
+                # TRACE, TOOL_CALL, or any other level -> TRACE
                 grouped["TRACE"].append(evaluator_id)
 
         return grouped
@@ -0,0 +1,155 @@
+"""Compaction of the span and log documents sent to the evaluation API.
+
+Raw span documents carry much more than the evaluators read: every document
+repeats the same resource block, and tool payloads can be megabytes. Compaction
+keeps the fields evaluators consume, sends each distinct resource block in full
+only once, and truncates oversized attribute and log body strings. Documents
+are then added until the request reaches its byte budget.
+"""
+
+import json
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from ..constants import DEFAULT_MAX_EVALUATION_PAYLOAD_BYTES, DEFAULT_MAX_EVALUATION_VALUE_BYTES
+
+# Top-level fields of span and log documents that evaluators read
+SPAN_FIELDS = (
+    "traceId",
+    "spanId",
+    "parentSpanId",
+    "name",
+    "kind",
+    "startTimeUnixNano",
+    "endTimeUnixNano",
+    "durationNano",
+    "attributes",
+    "events",
+    "status",
+)
+LOG_FIELDS = ("traceId", "spanId", "timeUnixNano", "severityNumber", "severityText", "body", "attributes")
+SCOPE_FIELDS = ("name", "version")
+# Resource attributes kept on documents whose resource was already sent in full
+RESOURCE_IDENTITY_ATTRIBUTES = ("service.name", "aws.service.type")
+# Fields whose string values are truncated to the per-value limit
+TRIMMED_FIELDS = ("attributes", "events", "body")
+
+TRUNCATION_MARKER = "... [truncated {} bytes]"
+
+
+def _encoded_size(document: Dict[str, Any]) -> int:
+    return len(json.dumps(document, separators=(",", ":"), default=str).encode("utf-8"))
+
+
+def truncate_value(value: Any, max_bytes: int) -> Any:
+    """Truncate strings nested in a value to at most ``max_bytes`` UTF-8 bytes each.
+
+    The value is not modified; containers holding truncated strings are copied.
+
+    Args:
+        value: String, dict, list or scalar
+        max_bytes: Maximum encoded size of each string
+
+    Returns:
+        The value with long strings cut short and marked as truncated
+    """
+    if isinstance(value, str):
+        encoded = value.encode("utf-8")
+        if len(encoded) <= max_bytes:
+            return value
+        return encoded[:max_bytes].decode("utf-8", "ignore") + TRUNCATION_MARKER.format(len(encoded) - max_bytes)
+    if isinstance(value, dict):
+        return {key: truncate_value(item, max_bytes) for key, item in value.items()}
+    if isinstance(value, list):
+        return [truncate_value(item, max_bytes) for item in value]
+    return value
+
+
+class PayloadCompactor:
+    """Compacts span and log documents for one evaluate request.
+
+    Tracks the resource blocks already emitted, so use one compactor per request.
+    """
+
+    def __init__(self, max_value_bytes: int = DEFAULT_MAX_EVALUATION_VALUE_BYTES):
+        """Initialize the compactor.
+
+        Args:
+            max_value_bytes: Maximum size of each attribute or log body string
+        """
+        self.max_value_bytes = max_value_bytes
+        self._seen_resources: Set[str] = set()
+
+    def compact(self, document: Dict[str, Any]) -> Dict[str, Any]:
+        """Compact one span or log document without modifying it.
+
+        Args:
+            document: Raw span or log document
+
+        Returns:
+            New document with only the fields evaluators consume
+        """
+        fields = SPAN_FIELDS if "startTimeUnixNano" in document else LOG_FIELDS
+        compacted: Dict[str, Any] = {}
+
+        resource = document.get("resource")
+        if isinstance(resource, dict):
+            compacted["resource"] = self._compact_resource(resource)
+
+        scope = document.get("scope")
+        if isinstance(scope, dict):
+            compacted["scope"] = {key: scope[key] for key in SCOPE_FIELDS if key in scope}
+
+        for field in fields:
+            if field not in document:
+                continue
+            value = document[field]
+            compacted[field] = truncate_value(value, self.max_value_bytes) if field in TRIMMED_FIELDS else value
+        return compacted
+
+    def _compact_resource(self, resource: Dict[str, Any]) -> Dict[str, Any]:
+        """Keep a resource block in full the first time, and only its identity after that."""
+        key = json.dumps(resource, sort_keys=True, default=str)
+        if key not in self._seen_resources:
+            self._seen_resources.add(key)
+            return resource
+        attributes = resource.get("attributes")
+        if not isinstance(attributes, dict):
+            return {}
+        return {"attributes": {name: attributes[name] for name in RESOURCE_IDENTITY_ATTRIBUTES if name in attributes}}
+
+
+def compact_documents(
+    documents: Iterable[Dict[str, Any]],
+    max_bytes: int = DEFAULT_MAX_EVALUATION_PAYLOAD_BYTES,
+    max_value_bytes: int = DEFAULT_MAX_EVALUATION_VALUE_BYTES,
+    max_items: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """Compact documents in order until the payload reaches its byte budget.
+
+    Documents are taken in the given order, so pass the most important (for
+    evaluation, the most recent) first. The first document that does not fit
+    ends the payload, keeping it a contiguous run of documents.
+
+    Args:
+        documents: Raw span and log documents in priority order
+        max_bytes: Maximum encoded size of the compacted documents together
+        max_value_bytes: Maximum size of each attribute or log body string
+        max_items: Optional maximum number of documents
+
+    Returns:
+        Compacted documents, in the given order
+    """
+    compactor = PayloadCompactor(max_value_bytes=max_value_bytes)
+    compacted: List[Dict[str, Any]] = []
+    # Enclosing brackets of the JSON array
+    size = 2
+    for document in documents:
+        if max_items is not None and len(compacted) >= max_items:
+            break
+        item = compactor.compact(document)
+        item_size = _encoded_size(item) + (1 if compacted else 0)
+        if size + item_size > max_bytes:
+            break
+        compacted.append(item)
+        size += item_size
+    return compacted
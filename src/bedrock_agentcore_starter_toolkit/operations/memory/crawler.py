@@ -0,0 +1,274 @@
+"""Concurrent crawl of the actors, sessions, events and records in a memory.
+
+Every page of ``list_actors``, ``list_sessions``, ``list_events`` and
+``list_memory_records`` is a task on a bounded worker pool. The tasks a page
+uncovers (the sessions of each actor on it, the events of each session) run
+before the next page of its parent listing, so the crawl goes depth first: the
+backlog stays around one page per level, and items are yielded as soon as their
+page arrives instead of after the whole memory has been walked.
+
+Throttled calls are retried with jittered backoff, and each throttle halves
+the number of calls in flight; it grows back by one after that many
+successful calls in a row.
+"""
+
+import logging
+import os
+import random
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Set
+
+from botocore.exceptions import ClientError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENT_LISTINGS = int(os.getenv("AGENTCORE_MEMORY_MAX_CONCURRENT_LISTINGS", "8"))
+# Largest page the data plane list APIs return
+PAGE_SIZE = 100
+THROTTLE_ERROR_CODES = ("ThrottlingException", "ThrottledException", "TooManyRequestsException")
+
+
+def is_throttle(error: ClientError) -> bool:
+    """Whether a data plane call was rejected for exceeding the request rate."""
+    if error.response.get("Error", {}).get("Code") in THROTTLE_ERROR_CODES:
+        return True
+    return error.response.get("ResponseMetadata", {}).get("HTTPStatusCode") == 429
+
+
+@dataclass
+class _Listing:
+    """One paginated list call and where its items belong."""
+
+    operation: str
+    response_key: str
+    params: Dict[str, str]
+    context: Dict[str, str] = field(default_factory=dict)
+    limit: Optional[int] = None
+    next_token: Optional[str] = None
+    fetched: int = 0
+    attempt: int = 0
+
+
+class _AdaptiveLimit:
+    """Calls allowed in flight: halved on each throttle, then raised by one per window of successes."""
+
+    def __init__(self, maximum: int):
+        self.maximum = maximum
+        self.current = maximum
+        self._successes = 0
+
+    def throttled(self) -> None:
+        self.current = max(1, self.current // 2)
+        self._successes = 0
+
+    def succeeded(self) -> None:
+        self._successes += 1
+        if self.current < self.maximum and self._successes >= self.current:
+            self.current += 1
+            self._successes = 0
+
+
+class MemoryCrawler:
+    """Streams the events or records of a memory using concurrent list calls.
+
+    Example:
+        crawler = MemoryCrawler(data_plane_client, max_workers=16)
+        for event in crawler.events("mem-123"):
+            print(event["_actorId"], event["_sessionId"], event["eventId"])
+    """
+
+    # Retries of a throttled call before the crawl fails
+    MAX_THROTTLE_RETRIES = 8
+    BACKOFF_BASE_SECONDS = 0.2
+    BACKOFF_MAX_SECONDS = 10.0
+
+    def __init__(self, data_plane_client: Any, max_workers: int = DEFAULT_MAX_CONCURRENT_LISTINGS):
+        """Initialize the crawler.
+
+        Args:
+            data_plane_client: boto3 ``bedrock-agentcore`` client
+            max_workers: Maximum list calls in flight
+        """
+        self.data_plane_client = data_plane_client
+        self.max_workers = max(1, max_workers)
+
+    def events(self, memory_id: str, max_results_per_session: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Yield every event in a memory, tagged with ``_actorId`` and ``_sessionId``.
+
+        Args:
+            memory_id: The memory resource ID
+            max_results_per_session: Optional maximum events per session (default: all)
+
+        Yields:
+            Event dicts, in no particular order
+
+        Raises:
+            ClientError: If a list call fails, or is still throttled after retries
+        """
+
+        def expand(listing: _Listing, items: List[Dict[str, Any]]) -> Iterable[Any]:
+            for item in items:
+                if listing.operation == "list_actors":
+                    if item.get("actorId"):
+                        yield self._sessions(memory_id, item["actorId"])
+                elif listing.operation == "list_sessions":
+                    if item.get("sessionId"):
+                        yield _Listing(
+                            "list_events",
+                            "events",
+                            {
+                                "memoryId": memory_id,
+                                "actorId": listing.context["actorId"],
+                                "sessionId": item["sessionId"],
+                            },
+                            {"_actorId": listing.context["actorId"], "_sessionId": item["sessionId"]},
+                            limit=max_results_per_session,
+                        )
+                else:
+                    yield {**item, **listing.context}
+
+        return self._crawl([self._actors(memory_id)], expand)
+
+    def records(
+        self,
+        memory_id: str,
+        namespace_templates: Iterable[str],
+        max_results_per_namespace: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield the records in every namespace of the templates, tagged with ``_namespace``.
+
+        ``{actorId}`` and ``{sessionId}`` placeholders are resolved against every
+        actor and session in the memory, which are listed once for all templates.
+        Namespaces whose records cannot be listed are skipped.
+
+        Args:
+            memory_id: The memory resource ID
+            namespace_templates: Namespaces, optionally with placeholders
+            max_results_per_namespace: Optional maximum records per namespace (default: all)
+
+        Yields:
+            Record summary dicts, in no particular order
+
+        Raises:
+            ClientError: If listing actors or sessions fails, or is still throttled after retries
+        """
+        templates = list(dict.fromkeys(namespace_templates))
+        static = [t for t in templates if "{actorId}" not in t and "{sessionId}" not in t]
+        per_actor = [t for t in templates if "{actorId}" in t and "{sessionId}" not in t]
+        per_session = [t for t in templates if "{sessionId}" in t]
+        seen: Set[str] = set()
+
+        def namespaces(names: Iterable[str]) -> Iterator[_Listing]:
+            for namespace in names:
+                if namespace not in seen:
+                    seen.add(namespace)
+                    yield _Listing(
+                        "list_memory_records",
+                        "memoryRecordSummaries",
+                        {"memoryId": memory_id, "namespace": namespace},
+                        {"_namespace": namespace},
+                        limit=max_results_per_namespace,
+                    )
+
+        def expand(listing: _Listing, items: List[Dict[str, Any]]) -> Iterable[Any]:
+            for item in items:
+                if listing.operation == "list_actors":
+                    actor_id = item.get("actorId")
+                    if not actor_id:
+                        continue
+                    yield from namespaces(t.replace("{actorId}", actor_id) for t in per_actor)
+                    if per_session:
+                        yield self._sessions(memory_id, actor_id)
+                elif listing.operation == "list_sessions":
+                    session_id = item.get("sessionId")
+                    if not session_id:
+                        continue
+                    actor_id = listing.context["actorId"]
+                    yield from namespaces(
+                        t.replace("{actorId}", actor_id).replace("{sessionId}", session_id) for t in per_session
+                    )
+                else:
+                    yield {**item, **listing.context}
+
+        seeds: List[_Listing] = list(namespaces(static))
+        if per_actor or per_session:
+            seeds.append(self._actors(memory_id))
+        return self._crawl(seeds, expand)
+
+    @staticmethod
+    def _actors(memory_id: str) -> _Listing:
+        return _Listing("list_actors", "actorSummaries", {"memoryId": memory_id})
+
+    @staticmethod
+    def _sessions(memory_id: str, actor_id: str) -> _Listing:
+        return _Listing(
+            "list_sessions", "sessionSummaries", {"memoryId": memory_id, "actorId": actor_id}, {"actorId": actor_id}
+        )
+
+    def _crawl(
+        self,
+        seeds: List[_Listing],
+        expand: Callable[[_Listing, List[Dict[str, Any]]], Iterable[Any]],
+    ) -> Iterator[Dict[str, Any]]:
+        """Run listings on the pool, yielding items and queueing the listings ``expand`` returns."""
+        queue: Deque[_Listing] = deque(seeds)
+        limit = _AdaptiveLimit(self.max_workers)
+        pending: Dict[Future, _Listing] = {}
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="agentcore-memory-crawl")
+        try:
+            while queue or pending:
+                while queue and len(pending) < limit.current:
+                    listing = queue.popleft()
+                    pending[executor.submit(self._fetch, listing)] = listing
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    listing = pending.pop(future)
+                    try:
+                        response = future.result()
+                    except ClientError as e:
+                        if is_throttle(e) and listing.attempt < self.MAX_THROTTLE_RETRIES:
+                            limit.throttled()
+                            listing.attempt += 1
+                            logger.debug("%s throttled, %d calls in flight", listing.operation, limit.current)
+                            queue.appendleft(listing)
+                            continue
+                        if listing.operation == "list_memory_records" and not is_throttle(e):
+                            logger.debug("Skipping namespace %s: %s", listing.params["namespace"], e)
+                            continue
+                        raise
+                    limit.succeeded()
+
+                    items = response.get(listing.response_key, [])
+                    if listing.limit is not None:
+                        items = items[: listing.limit - listing.fetched]
+                    listing.fetched += len(items)
+                    listing.next_token = response.get("nextToken")
+                    listing.attempt = 0
+                    if listing.next_token and (listing.limit is None or listing.fetched < listing.limit):
+                        queue.append(listing)
+
+                    # Children go first so the crawl finishes what it found before listing more
+                    children: List[_Listing] = []
+                    for result in expand(listing, items):
+                        if isinstance(result, _Listing):
+                            children.append(result)
+                        else:
+                            yield result
+                    queue.extendleft(reversed(children))
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _fetch(self, listing: _Listing) -> Dict[str, Any]:
+        """Fetch the next page of a listing, backing off first if it was throttled."""
+        if listing.attempt:
+            backoff = min(self.BACKOFF_BASE_SECONDS * 2 ** (listing.attempt - 1), self.BACKOFF_MAX_SECONDS)
+            time.sleep(backoff * random.uniform(0.5, 1.0))  # nosec B311 - jitter, not cryptography
+        kwargs: Dict[str, Any] = dict(listing.params)
+        kwargs["maxResults"] = PAGE_SIZE if listing.limit is None else min(PAGE_SIZE, listing.limit - listing.fetched)
+        if listing.next_token:
+            kwargs["nextToken"] = listing.next_token
+        return getattr(self.data_plane_client, listing.operation)(**kwargs)
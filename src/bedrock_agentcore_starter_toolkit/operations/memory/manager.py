@@ -4,7 +4,7 @@ import copy
 import logging
 import time
 import uuid
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
 
 import boto3
 from botocore.config import Config as BotocoreConfig
@@ -13,6 +13,7 @@ from rich.console import Console
 
 from ..observability.delivery import ObservabilityDeliveryManager
 from .constants import MemoryStatus, MemoryStrategyStatus, OverrideType, StrategyType
+from .crawler import DEFAULT_MAX_CONCURRENT_LISTINGS, MemoryCrawler
 from .models import convert_strategies_to_dicts
 from .models.Memory import Memory
 from .models.MemoryStrategy import MemoryStrategy
@@ -864,6 +865,62 @@ class MemoryManager:
             logger.error("Error searching records: %s", e)
             raise
 
+    def crawl_events(
+        self,
+        memory_id: str,
+        max_results_per_session: Optional[int] = None,
+        max_workers: int = DEFAULT_MAX_CONCURRENT_LISTINGS,
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream every event in a memory, listing actors, sessions and events concurrently.
+
+        Events are yielded as their pages arrive, tagged with ``_actorId`` and
+        ``_sessionId``. Throttled calls are retried with fewer calls in flight.
+
+        Args:
+            memory_id: The memory resource ID.
+            max_results_per_session: Maximum events per session. If None, fetches all.
+            max_workers: Maximum list calls in flight.
+
+        Returns:
+            Iterator of event dicts, in no particular order.
+
+        Raises:
+            ClientError: If a list call fails.
+        """
+        logger.debug("Crawling events in memory: %s", memory_id)
+        return MemoryCrawler(self._data_plane_client, max_workers).events(memory_id, max_results_per_session)
+
+    def crawl_records(
+        self,
+        memory_id: str,
+        namespace_templates: Iterable[str],
+        max_results_per_namespace: Optional[int] = None,
+        max_workers: int = DEFAULT_MAX_CONCURRENT_LISTINGS,
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream the memory records in every namespace matching the templates.
+
+        ``{actorId}`` and ``{sessionId}`` placeholders are resolved against every
+        actor and session in the memory. Records are yielded as their pages
+        arrive, tagged with ``_namespace``; namespaces that cannot be listed are
+        skipped.
+
+        Args:
+            memory_id: The memory resource ID.
+            namespace_templates: Namespaces, optionally containing placeholders.
+            max_results_per_namespace: Maximum records per namespace. If None, fetches all.
+            max_workers: Maximum list calls in flight.
+
+        Returns:
+            Iterator of record dicts, in no particular order.
+
+        Raises:
+            ClientError: If listing actors or sessions fails.
+        """
+        logger.debug("Crawling records in memory: %s", memory_id)
+        return MemoryCrawler(self._data_plane_client, max_workers).records(
+            memory_id, namespace_templates, max_results_per_namespace
+        )
+
     # ==================== STRATEGY METHODS ====================
 
     def add_semantic_strategy(
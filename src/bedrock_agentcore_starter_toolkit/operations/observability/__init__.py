@@ -1,5 +1,6 @@
 """Observability operations for querying spans, traces, and logs."""
 
+from .cache import ObservabilityCache
 from .client import ObservabilityClient
 from .delivery import ObservabilityDeliveryManager, enable_observability_for_resource
 from .formatters import (
@@ -12,18 +13,26 @@ from .formatters import (
     get_status_icon,
     get_status_style,
 )
-from .telemetry import RuntimeLog, Span, TraceData
+from .loader import LocalTelemetrySource, load_trace_data
+from .tail import TailCursorStore, TraceTailer
+from .telemetry import LatencyStats, RuntimeLog, Span, TraceData
 from .trace_visualizer import TraceVisualizer
 
 __all__ = [
+    "ObservabilityCache",
     "ObservabilityClient",
     "ObservabilityDeliveryManager",
     "enable_observability_for_resource",
+    "LatencyStats",
+    "LocalTelemetrySource",
     "Span",
+    "TailCursorStore",
+    "TraceTailer",
     "RuntimeLog",
     "TraceData",
     "TraceVisualizer",
     "format_age",
+    "load_trace_data",
     "format_duration_ms",
     "format_duration_seconds",
     "format_status_display",
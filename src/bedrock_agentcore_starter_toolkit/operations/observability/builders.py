@@ -1,9 +1,73 @@
 """Builders for constructing telemetry models from CloudWatch Logs Insights results."""
 
 import json
-from typing import Any, Optional
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
 
-from .telemetry import RuntimeLog, Span
+from .telemetry import LatencyStats, RuntimeLog, Span
+
+
+def get_result_field(result: Any, field_name: str) -> Any:
+    """Get a field value from one CloudWatch Logs Insights result row.
+
+    Args:
+        result: List of field dictionaries (or a dict with a "fields" list)
+        field_name: Field to look up
+
+    Returns:
+        The field value, or None if absent
+    """
+    fields = result if isinstance(result, list) else result.get("fields", [])
+    for field_item in fields:
+        if field_item.get("field") == field_name:
+            return field_item.get("value")
+    return None
+
+
+def result_sort_key(result: Any, sort_field: str) -> str:
+    """Build a key that orders result rows the way the query's ``sort`` clause does.
+
+    Insights returns numeric fields as strings, so integers are zero-padded to
+    make string order match numeric order.
+
+    Args:
+        result: Result row
+        sort_field: Field the query sorts by (e.g. ``startTimeUnixNano``)
+
+    Returns:
+        Sortable string; empty if the field is missing
+    """
+    value = get_result_field(result, sort_field)
+    if value is None:
+        return ""
+    value = str(value)
+    return value.zfill(24) if value.isdigit() else value
+
+
+def format_event_timestamp(timestamp_ms: int) -> str:
+    """Format an epoch timestamp the way Insights returns ``@timestamp``.
+
+    Args:
+        timestamp_ms: Milliseconds since epoch
+
+    Returns:
+        ``YYYY-MM-DD HH:MM:SS.mmm`` in UTC
+    """
+    return datetime.fromtimestamp(timestamp_ms / 1000, tz=timezone.utc).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+
+
+def _index_fields(result: Any) -> Dict[str, Any]:
+    """Map field names to values for one result row in a single pass.
+
+    Like a linear lookup, the first occurrence of a field wins.
+    """
+    fields = result if isinstance(result, list) else result.get("fields", [])
+    values: Dict[str, Any] = {}
+    for field_item in fields:
+        name = field_item.get("field")
+        if name not in values and "value" in field_item:
+            values[name] = field_item["value"]
+    return values
 
 
 class CloudWatchResultBuilder:
@@ -13,29 +77,17 @@ class CloudWatchResultBuilder:
     def build_span(result: Any) -> Span:
         """Build a Span from CloudWatch Logs Insights query result.
 
+        ``@message`` and ``events`` are kept as JSON strings and decoded when
+        the span's payload is first accessed.
+
         Args:
             result: List of field dictionaries from CloudWatch query result
 
         Returns:
             Span object populated from the result
         """
-        fields = result if isinstance(result, list) else result.get("fields", [])
-
-        def get_field(field_name: str, default: Any = None) -> Any:
-            for field_item in fields:
-                if field_item.get("field") == field_name:
-                    return field_item.get("value", default)
-            return default
-
-        def parse_json_field(field_name: str) -> Any:
-            """Parse JSON string field. CloudWatch returns @message as JSON string."""
-            value = get_field(field_name)
-            if value and isinstance(value, str):
-                try:
-                    return json.loads(value)
-                except Exception:
-                    return value
-            return value
+        values = _index_fields(result)
+        get_field = values.get
 
         def get_float(field_name: str) -> Optional[float]:
             """Get field as float. CloudWatch returns numeric fields as strings."""
@@ -47,16 +99,6 @@ class CloudWatchResultBuilder:
             value = get_field(field_name)
             return int(value) if value is not None else None
 
-        # Parse @message to get attributes and resource.attributes
-        raw_message = parse_json_field("@message")
-        attributes = {}
-        resource_attributes = {}
-
-        if isinstance(raw_message, dict):
-            attributes = raw_message.get("attributes", {}) or {}
-            resource_data = raw_message.get("resource", {}) or {}
-            resource_attributes = resource_data.get("attributes", {}) or {}
-
         return Span(
             trace_id=get_field("traceId", ""),
             span_id=get_field("spanId", ""),
@@ -69,14 +111,12 @@ class CloudWatchResultBuilder:
             status_message=get_field("statusMessage"),
             parent_span_id=get_field("parentSpanId"),
             kind=get_field("kind"),
-            events=parse_json_field("events") or [],
-            attributes=attributes,
-            resource_attributes=resource_attributes,
             service_name=get_field("serviceName"),
             resource_id=get_field("resourceId"),
             service_type=get_field("serviceType"),
             timestamp=get_field("@timestamp"),
-            raw_message=raw_message,
+            message_json=get_field("@message"),
+            events_json=get_field("events"),
         )
 
     @staticmethod
@@ -87,31 +127,167 @@ class CloudWatchResultBuilder:
             result: List of field dictionaries from CloudWatch query result
 
         Returns:
-            RuntimeLog object populated from the result
+            RuntimeLog object populated from the result; ``raw_message`` is
+            parsed from the message when first accessed
         """
-        fields = result if isinstance(result, list) else result.get("fields", [])
+        values = _index_fields(result)
+
+        return RuntimeLog(
+            timestamp=values.get("@timestamp", ""),
+            message=values.get("@message", ""),
+            span_id=values.get("spanId"),
+            trace_id=values.get("traceId"),
+            log_stream=values.get("@logStream"),
+            lazy_raw_message=True,
+        )
 
-        def get_field(field_name: str, default: Any = None) -> Any:
-            for field_item in fields:
-                if field_item.get("field") == field_name:
-                    return field_item.get("value", default)
-            return default
+    @staticmethod
+    def build_latency_stats(result: Any) -> LatencyStats:
+        """Build LatencyStats from one row of a latency stats query.
 
-        def parse_json_field(field_name: str) -> Any:
-            """Parse JSON string field."""
-            value = get_field(field_name)
-            if value and isinstance(value, str):
-                try:
-                    return json.loads(value)
-                except Exception:
-                    return value
-            return value
+        Args:
+            result: List of field dictionaries from CloudWatch query result
+
+        Returns:
+            LatencyStats for the row's group
+        """
+        values = _index_fields(result)
+
+        def get_float(field_name: str) -> Optional[float]:
+            value = values.get(field_name)
+            return float(value) if value not in (None, "") else None
+
+        def get_count(field_name: str) -> int:
+            value = get_float(field_name)
+            return int(value) if value is not None else 0
+
+        return LatencyStats(
+            group=values.get("groupName", ""),
+            span_count=get_count("spanCount"),
+            p50_ms=get_float("p50Ms"),
+            p90_ms=get_float("p90Ms"),
+            p99_ms=get_float("p99Ms"),
+            avg_ms=get_float("avgMs"),
+            max_ms=get_float("maxMs"),
+            error_count=get_count("errorCount"),
+            throttle_count=get_count("throttleCount"),
+            input_tokens=get_count("inputTokens"),
+            output_tokens=get_count("outputTokens"),
+        )
+
+    @staticmethod
+    def build_span_from_event(event: Dict[str, Any]) -> Optional[Span]:
+        """Build a Span from a raw ``aws/spans`` log event.
+
+        ``FilterLogEvents`` returns the OTel span document unprojected, so the
+        fields an Insights span query selects are read from it here.
+
+        Args:
+            event: Log event with ``timestamp`` and ``message`` keys
+
+        Returns:
+            Span object, or None if the message is not an OTel span document
+        """
+        try:
+            document = json.loads(event.get("message") or "")
+        except ValueError:
+            return None
+        timestamp_ms = event.get("timestamp")
+        return CloudWatchResultBuilder.build_span_from_document(
+            document, timestamp=format_event_timestamp(timestamp_ms) if timestamp_ms is not None else None
+        )
+
+    @staticmethod
+    def build_span_from_document(document: Any, timestamp: Optional[str] = None) -> Optional[Span]:
+        """Build a Span from an OTel span document as stored in ``aws/spans``.
+
+        Args:
+            document: Span document with flattened attributes
+            timestamp: Ingestion timestamp in the Insights ``@timestamp`` format
+
+        Returns:
+            Span object, or None if the document has no trace ID
+        """
+        if not isinstance(document, dict) or not document.get("traceId"):
+            return None
+
+        status = document.get("status") or {}
+        attributes = document.get("attributes") or {}
+        resource_attributes = (document.get("resource") or {}).get("attributes") or {}
+        duration_nano = document.get("durationNano")
+
+        return Span(
+            trace_id=document["traceId"],
+            span_id=document.get("spanId", ""),
+            span_name=document.get("name", ""),
+            session_id=attributes.get("session.id"),
+            start_time_unix_nano=document.get("startTimeUnixNano"),
+            end_time_unix_nano=document.get("endTimeUnixNano"),
+            duration_ms=duration_nano / 1_000_000 if duration_nano is not None else None,
+            status_code=status.get("code"),
+            status_message=status.get("message"),
+            parent_span_id=document.get("parentSpanId"),
+            kind=document.get("kind"),
+            events=document.get("events") or [],
+            attributes=attributes,
+            resource_attributes=resource_attributes,
+            service_name=resource_attributes.get("service.name"),
+            resource_id=resource_attributes.get("cloud.resource_id"),
+            service_type=attributes.get("aws.remote.service"),
+            timestamp=timestamp,
+            raw_message=document,
+        )
+
+    @staticmethod
+    def build_runtime_log_from_event(event: Dict[str, Any]) -> RuntimeLog:
+        """Build a RuntimeLog from a raw runtime log group event.
+
+        Args:
+            event: Log event with ``timestamp``, ``message`` and ``logStreamName`` keys
+
+        Returns:
+            RuntimeLog object; trace and span IDs are read from JSON messages
+        """
+        message = event.get("message") or ""
+        try:
+            document = json.loads(message)
+        except ValueError:
+            document = None
+        timestamp_ms = event.get("timestamp")
+
+        return CloudWatchResultBuilder.build_runtime_log_from_document(
+            document,
+            message=message,
+            timestamp=format_event_timestamp(timestamp_ms) if timestamp_ms is not None else "",
+            log_stream=event.get("logStreamName"),
+        )
+
+    @staticmethod
+    def build_runtime_log_from_document(
+        document: Any,
+        message: str,
+        timestamp: str = "",
+        log_stream: Optional[str] = None,
+    ) -> RuntimeLog:
+        """Build a RuntimeLog from a runtime log message and its parsed JSON.
+
+        Args:
+            document: Parsed message; anything but a dict is treated as plain text
+            message: Message text as written to the log group
+            timestamp: Timestamp in the Insights ``@timestamp`` format
+            log_stream: Log stream the message was written to
+
+        Returns:
+            RuntimeLog object; trace and span IDs are read from the document
+        """
+        if not isinstance(document, dict):
+            document = None
 
         return RuntimeLog(
-            timestamp=get_field("@timestamp", ""),
-            message=get_field("@message", ""),
-            span_id=get_field("spanId"),
-            trace_id=get_field("traceId"),
-            log_stream=get_field("@logStream"),
-            raw_message=parse_json_field("@message"),
+            timestamp=timestamp,
+            message=message,
+            span_id=document.get("spanId") if document else None,
+            trace_id=document.get("traceId") if document else None,
+            log_stream=log_stream,
+            raw_message=document,
         )
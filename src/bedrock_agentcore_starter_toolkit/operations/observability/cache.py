@@ -0,0 +1,354 @@
+"""Persistent local cache for CloudWatch Logs Insights query results.
+
+Span and runtime-log events do not change once ingested, so the rows a query
+returns for a time range only need to be fetched once. The cache keeps raw
+Insights result rows in SQLite together with the time ranges already fetched for
+each query scope (region, log group and the session/trace query itself), so
+callers only send CloudWatch the ranges that are not covered yet.
+
+Staleness policy: ranges older than ``settle_seconds`` are cached permanently.
+The most recent ``settle_seconds`` may still receive spans (the session can be
+active and ingestion lags), so that tail is only reused for ``ttl_seconds``
+before it is fetched again. Rows are de-duplicated, so re-fetching overlapping
+ranges is safe.
+
+The cache also keeps the time bounds learned for sessions and traces (see
+:mod:`.windows`), so a later process can narrow the query window of a session
+it is given by ID instead of scanning the full lookback period.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterable, List, Optional, Tuple
+
+from .builders import get_result_field, result_sort_key
+
+logger = logging.getLogger(__name__)
+
+# Ingestion delay plus slack for sessions still in flight
+DEFAULT_SETTLE_SECONDS = int(os.getenv("AGENTCORE_OBS_CACHE_SETTLE_SECONDS", "300"))
+# How long an unsettled tail is reused before it is fetched again
+DEFAULT_TTL_SECONDS = int(os.getenv("AGENTCORE_OBS_CACHE_TTL_SECONDS", "60"))
+
+# Window starts are floored to this boundary so that "last N days" windows
+# opened minutes apart resolve to the same range instead of a tiny leading gap.
+# Kept small because it also widens the narrowed windows of sessions and traces.
+START_ALIGNMENT_MS = 5 * 60 * 1000
+
+_SCHEMA_VERSION = 2
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS coverage (
+    scope TEXT NOT NULL,
+    start_ms INTEGER NOT NULL,
+    end_ms INTEGER NOT NULL,
+    expires_ms INTEGER
+);
+CREATE INDEX IF NOT EXISTS coverage_scope ON coverage (scope);
+CREATE TABLE IF NOT EXISTS result_rows (
+    scope TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    timestamp_ms INTEGER,
+    sort_key TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (scope, digest)
+);
+CREATE INDEX IF NOT EXISTS result_rows_scope_time ON result_rows (scope, timestamp_ms);
+CREATE TABLE IF NOT EXISTS activity_bounds (
+    key TEXT PRIMARY KEY,
+    lower_ms INTEGER NOT NULL,
+    upper_ms INTEGER
+);
+"""
+
+Range = Tuple[int, int]
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+def parse_timestamp_ms(value: Optional[str]) -> Optional[int]:
+    """Parse an Insights ``@timestamp`` value to milliseconds since epoch.
+
+    Args:
+        value: ``YYYY-MM-DD HH:MM:SS.mmm`` (UTC) or a numeric epoch in ms or ns
+
+    Returns:
+        Milliseconds since epoch, or None if the value cannot be parsed
+    """
+    if not value:
+        return None
+    if value.isdigit():
+        number = int(value)
+        return number // 1_000_000 if number > 10**15 else number
+    try:
+        parsed = datetime.strptime(value, "%Y-%m-%d %H:%M:%S.%f")
+    except ValueError:
+        return None
+    return int(parsed.replace(tzinfo=timezone.utc).timestamp() * 1000)
+
+
+def subtract_ranges(start_ms: int, end_ms: int, covered: Iterable[Range]) -> List[Range]:
+    """Return the parts of ``[start_ms, end_ms]`` not covered by any of ``covered``.
+
+    Args:
+        start_ms: Window start
+        end_ms: Window end
+        covered: Covered ranges, in any order and possibly overlapping
+
+    Returns:
+        Uncovered ranges in ascending order
+    """
+    missing = []
+    cursor = start_ms
+    for covered_start, covered_end in sorted(covered):
+        if covered_end < cursor:
+            continue
+        if covered_start > end_ms:
+            break
+        if covered_start > cursor:
+            missing.append((cursor, covered_start))
+        cursor = max(cursor, covered_end)
+    if cursor < end_ms:
+        missing.append((cursor, end_ms))
+    return missing
+
+
+class ObservabilityCache:
+    """SQLite-backed cache of Insights result rows keyed by query scope and time range.
+
+    Safe to share between threads; several processes may use the same file.
+
+    Example:
+        cache = ObservabilityCache.for_project(Path.cwd())
+        client = ObservabilityClient(region_name="us-east-1", cache=cache)
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        settle_seconds: int = DEFAULT_SETTLE_SECONDS,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+    ):
+        """Initialize the cache.
+
+        Args:
+            path: SQLite database file (created on first use)
+            settle_seconds: Age after which fetched ranges are treated as immutable
+            ttl_seconds: How long the unsettled tail of a range is reused
+        """
+        self.path = Path(path)
+        self.settle_ms = settle_seconds * 1000
+        self.ttl_ms = ttl_seconds * 1000
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @classmethod
+    def for_project(cls, project_root: Path, **kwargs: Any) -> "ObservabilityCache":
+        """Create the cache stored under ``{project_root}/.bedrock_agentcore/``."""
+        from ...utils.runtime.config import get_observability_cache_path
+
+        return cls(get_observability_cache_path(project_root), **kwargs)
+
+    @staticmethod
+    def scope(region: str, log_group_name: str, query_string: str) -> str:
+        """Build the cache key for a query; any change to the query yields a new scope."""
+        return hashlib.sha256(f"{region}\n{log_group_name}\n{query_string}".encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def align_start(start_ms: int) -> int:
+        """Floor a window start to ``START_ALIGNMENT_MS``."""
+        return start_ms - start_ms % START_ALIGNMENT_MS
+
+    def missing_ranges(self, scope: str, start_ms: int, end_ms: int, now_ms: Optional[int] = None) -> List[Range]:
+        """Get the parts of a window that have to be fetched from CloudWatch.
+
+        Args:
+            scope: Query scope from :meth:`scope`
+            start_ms: Window start in milliseconds since epoch
+            end_ms: Window end in milliseconds since epoch
+            now_ms: Current time (defaults to the wall clock)
+
+        Returns:
+            Uncovered ranges in ascending order; empty if fully cached
+        """
+        now_ms = _now_ms() if now_ms is None else now_ms
+        start_ms = self.align_start(start_ms)
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT start_ms, end_ms FROM coverage "
+                "WHERE scope = ? AND end_ms >= ? AND start_ms <= ? AND (expires_ms IS NULL OR expires_ms > ?)",
+                (scope, start_ms, end_ms, now_ms),
+            )
+            covered = [(row[0], row[1]) for row in rows]
+        return subtract_ranges(start_ms, end_ms, covered)
+
+    def store(
+        self,
+        scope: str,
+        results: List[Any],
+        start_ms: int,
+        end_ms: int,
+        complete: bool = True,
+        sort_field: str = "@timestamp",
+        now_ms: Optional[int] = None,
+    ) -> None:
+        """Save the rows fetched for a range and mark the range as covered.
+
+        Args:
+            scope: Query scope from :meth:`scope`
+            results: Insights result rows for ``[start_ms, end_ms]``
+            start_ms: Range start in milliseconds since epoch
+            end_ms: Range end in milliseconds since epoch
+            complete: False if the results were truncated; rows are kept but the
+                range stays uncovered so it is fetched again
+            sort_field: Result field that orders rows, as in the query's ``sort``
+            now_ms: Current time (defaults to the wall clock)
+        """
+        now_ms = _now_ms() if now_ms is None else now_ms
+        records = []
+        for row in results:
+            data = json.dumps(row, sort_keys=True, separators=(",", ":"))
+            records.append(
+                (
+                    scope,
+                    hashlib.sha256(data.encode("utf-8")).hexdigest(),
+                    parse_timestamp_ms(get_result_field(row, "@timestamp")),
+                    result_sort_key(row, sort_field),
+                    data,
+                )
+            )
+
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany("INSERT OR IGNORE INTO result_rows VALUES (?, ?, ?, ?, ?)", records)
+                if not complete:
+                    return
+                conn.execute("DELETE FROM coverage WHERE scope = ? AND expires_ms <= ?", (scope, now_ms))
+                settled_end = min(end_ms, now_ms - self.settle_ms)
+                if settled_end > start_ms:
+                    self._add_settled_range(conn, scope, start_ms, settled_end)
+                if end_ms > max(start_ms, settled_end):
+                    conn.execute(
+                        "INSERT INTO coverage VALUES (?, ?, ?, ?)",
+                        (scope, max(start_ms, settled_end), end_ms, now_ms + self.ttl_ms),
+                    )
+
+    def get_rows(self, scopes: List[str], start_ms: int, end_ms: int) -> List[Any]:
+        """Load cached rows for one or more scopes within a window.
+
+        Args:
+            scopes: Query scopes from :meth:`scope`
+            start_ms: Window start in milliseconds since epoch
+            end_ms: Window end in milliseconds since epoch
+
+        Returns:
+            Result rows ordered by each scope's sort field, then timestamp
+        """
+        if not scopes:
+            return []
+        # Insights windows have one-second resolution
+        window_start = start_ms - start_ms % 1000
+        window_end = end_ms - end_ms % 1000 + 999
+        placeholders = ", ".join("?" * len(scopes))
+        with self._lock:
+            rows = (
+                self._connect()
+                .execute(
+                    f"SELECT data FROM result_rows WHERE scope IN ({placeholders}) "  # nosec B608
+                    "AND (timestamp_ms IS NULL OR timestamp_ms BETWEEN ? AND ?) "
+                    "ORDER BY sort_key, timestamp_ms, rowid",
+                    (*scopes, window_start, window_end),
+                )
+                .fetchall()
+            )
+        return [json.loads(row[0]) for row in rows]
+
+    def get_bounds(self, key: str) -> Optional[Tuple[int, Optional[int]]]:
+        """Get the stored time bounds of a session or trace.
+
+        Args:
+            key: Activity key, e.g. region, agent and session ID joined together
+
+        Returns:
+            (earliest start, latest end or None if open) in milliseconds, or None if unknown
+        """
+        with self._lock:
+            row = (
+                self._connect()
+                .execute("SELECT lower_ms, upper_ms FROM activity_bounds WHERE key = ?", (key,))
+                .fetchone()
+            )
+        return None if row is None else (row[0], row[1])
+
+    def store_bounds(self, key: str, lower_ms: int, upper_ms: Optional[int], replace: bool = True) -> None:
+        """Save the time bounds of a session or trace.
+
+        Args:
+            key: Activity key, as in :meth:`get_bounds`
+            lower_ms: Earliest start in milliseconds since epoch
+            upper_ms: Latest end in milliseconds since epoch, or None if still open
+            replace: False to keep bounds already stored for the key
+        """
+        verb = "INSERT OR REPLACE" if replace else "INSERT OR IGNORE"
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(f"{verb} INTO activity_bounds VALUES (?, ?, ?)", (key, lower_ms, upper_ms))  # nosec B608
+
+    def clear(self) -> None:
+        """Remove all cached rows, coverage and activity bounds."""
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM coverage")
+                conn.execute("DELETE FROM result_rows")
+                conn.execute("DELETE FROM activity_bounds")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use, creating or migrating the schema."""
+        if self._conn is not None:
+            return self._conn
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        if conn.execute("PRAGMA user_version").fetchone()[0] != _SCHEMA_VERSION:
+            with conn:
+                conn.execute("DROP TABLE IF EXISTS coverage")
+                conn.execute("DROP TABLE IF EXISTS result_rows")
+                conn.execute("DROP TABLE IF EXISTS activity_bounds")
+            conn.executescript(_SCHEMA)
+            conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        self._conn = conn
+        logger.debug("Opened observability cache at %s", self.path)
+        return conn
+
+    @staticmethod
+    def _add_settled_range(conn: sqlite3.Connection, scope: str, start_ms: int, end_ms: int) -> None:
+        """Record a permanent range, merging it with overlapping or adjacent permanent ranges."""
+        overlapping = conn.execute(
+            "SELECT rowid, start_ms, end_ms FROM coverage "
+            "WHERE scope = ? AND expires_ms IS NULL AND end_ms >= ? AND start_ms <= ?",
+            (scope, start_ms, end_ms),
+        ).fetchall()
+        for rowid, covered_start, covered_end in overlapping:
+            start_ms = min(start_ms, covered_start)
+            end_ms = max(end_ms, covered_end)
+            conn.execute("DELETE FROM coverage WHERE rowid = ?", (rowid,))
+        conn.execute("INSERT INTO coverage VALUES (?, ?, ?, NULL)", (scope, start_ms, end_ms))
@@ -1,14 +1,21 @@
 """Client for querying observability data from CloudWatch Logs."""
 
+import asyncio
 import logging
+import os
+import sqlite3
 import time
-from typing import Dict, List, Optional
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Optional, Tuple
 
 import boto3
+from botocore.exceptions import ClientError
 
-from .builders import CloudWatchResultBuilder
+from .builders import CloudWatchResultBuilder, get_result_field, result_sort_key
+from .cache import ObservabilityCache
 from .query_builder import CloudWatchQueryBuilder
-from .telemetry import RuntimeLog, Span
+from .telemetry import LatencyStats, RuntimeLog, Span
+from .windows import ActivityWindows, narrow
 
 
 class ObservabilityClient:
@@ -16,21 +23,43 @@ class ObservabilityClient:
 
     All operations require agent_id and runtime_suffix as parameters, making the client
     reusable across multiple agents without maintaining state.
+
+    With a cache, span and runtime-log queries only scan the time ranges not
+    fetched before; see :mod:`.cache` for the staleness policy.
+
+    Query windows are narrowed to the known bounds of the session or trace
+    being looked up; see :mod:`.windows`.
     """
 
     SPANS_LOG_GROUP = "aws/spans"
     QUERY_TIMEOUT_SECONDS = 60
+    # Aggregations scan every span in the window, which takes longer than a lookup
+    STATS_QUERY_TIMEOUT_SECONDS = 300
+    # Polling starts fast for short queries and backs off to POLL_INTERVAL_SECONDS
+    POLL_INITIAL_INTERVAL_SECONDS = 0.1
+    POLL_BACKOFF_FACTOR = 1.5
     POLL_INTERVAL_SECONDS = 2
-
-    def __init__(self, region_name: str):
+    # Logs Insights returns at most this many rows per query
+    MAX_QUERY_RESULTS = 10000
+    # Queries in flight per call; the account quota is shared by all Insights users
+    MAX_CONCURRENT_QUERIES = int(os.getenv("AGENTCORE_OBS_MAX_CONCURRENT_QUERIES", "4"))
+    # Windows are only split into shards at least this long
+    MIN_SHARD_SECONDS = 6 * 60 * 60
+    # Retries when start_query is rejected for exceeding the concurrent query quota
+    START_QUERY_MAX_RETRIES = 5
+
+    def __init__(self, region_name: str, cache: Optional[ObservabilityCache] = None):
         """Initialize the stateless ObservabilityClient.
 
         Args:
             region_name: AWS region name
+            cache: Optional local cache for span and runtime-log query results
         """
         self.region = region_name
         self.logs_client = boto3.client("logs", region_name=region_name)
         self.query_builder = CloudWatchQueryBuilder()
+        self.cache = cache
+        self.windows = ActivityWindows(cache, region_name)
 
         # Initialize the logger
         self.logger = logging.getLogger("bedrock_agentcore.observability")
@@ -63,17 +92,22 @@ class ObservabilityClient:
 
         # Pass agent_id to prevent cross-agent session ID collisions
         query_string = self.query_builder.build_spans_by_session_query(session_id, agent_id=agent_id)
+        session_key = ("session", agent_id, session_id)
+        start_time_ms, end_time_ms = narrow(start_time_ms, end_time_ms, self.windows.get(session_key))
 
-        results = self._execute_cloudwatch_query(
+        results = self._execute_cached_query(
             query_string=query_string,
             log_group_name=self.SPANS_LOG_GROUP,
             start_time=start_time_ms,
             end_time=end_time_ms,
+            sort_field="startTimeUnixNano",
         )
 
         spans = [CloudWatchResultBuilder.build_span(result) for result in results]
         self.logger.debug("Found %d spans for session %s", len(spans), session_id)
 
+        self.windows.record_spans(session_key, spans)
+        self._record_trace_windows(spans)
         return spans
 
     def query_spans_by_trace(
@@ -98,17 +132,30 @@ class ObservabilityClient:
 
         # Note: Trace IDs are globally unique, so no agent_id filter needed in query
         query_string = self.query_builder.build_spans_by_trace_query(trace_id)
+        window = narrow(start_time_ms, end_time_ms, self.windows.trace_bounds(trace_id))
 
-        results = self._execute_cloudwatch_query(
+        results = self._execute_cached_query(
             query_string=query_string,
             log_group_name=self.SPANS_LOG_GROUP,
-            start_time=start_time_ms,
-            end_time=end_time_ms,
+            start_time=window[0],
+            end_time=window[1],
+            sort_field="startTimeUnixNano",
         )
+        if not results and window != (start_time_ms, end_time_ms):
+            # Not every trace ID encodes its start time, so a miss retries the full window
+            self.logger.debug("No spans for trace %s in narrowed window, retrying full window", trace_id)
+            results = self._execute_cached_query(
+                query_string=query_string,
+                log_group_name=self.SPANS_LOG_GROUP,
+                start_time=start_time_ms,
+                end_time=end_time_ms,
+                sort_field="startTimeUnixNano",
+            )
 
         spans = [CloudWatchResultBuilder.build_span(result) for result in results]
         self.logger.debug("Found %d spans for trace %s", len(spans), trace_id)
 
+        self._record_trace_windows(spans)
         return spans
 
     def query_runtime_logs_by_traces(
@@ -137,21 +184,25 @@ class ObservabilityClient:
             return []
 
         runtime_log_group = f"/aws/bedrock-agentcore/runtimes/{agent_id}-{endpoint_name}"
+        start_time_ms, end_time_ms = self._runtime_logs_window(trace_ids, start_time_ms, end_time_ms)
 
         self.logger.debug(
             "Querying runtime logs for %d traces from %s (single batch query)", len(trace_ids), runtime_log_group
         )
 
-        # Use optimized batch query instead of looping
-        query_string = self.query_builder.build_runtime_logs_by_traces_batch(trace_ids)
-
         try:
-            results = self._execute_cloudwatch_query(
-                query_string=query_string,
-                log_group_name=runtime_log_group,
-                start_time=start_time_ms,
-                end_time=end_time_ms,
-            )
+            if self.cache is not None:
+                results = self._query_runtime_logs_cached(
+                    self.cache, trace_ids, runtime_log_group, start_time_ms, end_time_ms
+                )
+            else:
+                # Use optimized batch query instead of looping
+                results, _ = self._execute_sharded_query(
+                    query_string=self.query_builder.build_runtime_logs_by_traces_batch(trace_ids),
+                    log_group_name=runtime_log_group,
+                    start_time=start_time_ms,
+                    end_time=end_time_ms,
+                )
 
             logs = [CloudWatchResultBuilder.build_runtime_log(result) for result in results]
             self.logger.debug("Found total %d runtime logs across %d traces", len(logs), len(trace_ids))
@@ -163,6 +214,93 @@ class ObservabilityClient:
             self.logger.info("Falling back to individual queries per trace")
             return self._query_runtime_logs_individually(trace_ids, start_time_ms, end_time_ms, agent_id, endpoint_name)
 
+    def fetch_trace_telemetry(
+        self,
+        trace_id: str,
+        start_time_ms: int,
+        end_time_ms: int,
+        agent_id: str,
+        endpoint_name: str = "DEFAULT",
+    ) -> Tuple[List[Span], List[RuntimeLog]]:
+        """Fetch the spans and runtime logs of a trace with both queries running at once.
+
+        Args:
+            trace_id: The trace ID to fetch
+            start_time_ms: Start time in milliseconds since epoch
+            end_time_ms: End time in milliseconds since epoch
+            agent_id: Agent ID for filtering and the runtime log group name
+            endpoint_name: Runtime endpoint name for log group (default: DEFAULT)
+
+        Returns:
+            Tuple of (spans, runtime logs); runtime logs are empty if their query failed
+        """
+        logs_window = self._runtime_logs_window([trace_id], start_time_ms, end_time_ms)
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="agentcore-obs") as executor:
+            logs_future = executor.submit(
+                self.query_runtime_logs_by_traces, [trace_id], start_time_ms, end_time_ms, agent_id, endpoint_name
+            )
+            spans = self.query_spans_by_trace(trace_id, start_time_ms, end_time_ms, agent_id=agent_id)
+            try:
+                runtime_logs = logs_future.result()
+            except Exception as e:
+                self.logger.warning("Failed to retrieve runtime logs: %s", e)
+                runtime_logs = []
+
+        # The trace ID guessed a window its spans fall outside of; fetch logs for the real one
+        actual_start, actual_end = self._runtime_logs_window([trace_id], start_time_ms, end_time_ms)
+        if spans and (actual_start < logs_window[0] or actual_end > logs_window[1]):
+            try:
+                runtime_logs = self.query_runtime_logs_by_traces(
+                    [trace_id], start_time_ms, end_time_ms, agent_id=agent_id, endpoint_name=endpoint_name
+                )
+            except Exception as e:
+                self.logger.warning("Failed to retrieve runtime logs: %s", e)
+        return spans, runtime_logs
+
+    def fetch_session_telemetry(
+        self,
+        session_id: str,
+        start_time_ms: int,
+        end_time_ms: int,
+        agent_id: str,
+        endpoint_name: str = "DEFAULT",
+    ) -> Tuple[List[Span], List[RuntimeLog]]:
+        """Fetch the spans of a session and the runtime logs of all its traces.
+
+        Runtime log events such as ``gen_ai.*`` messages carry a trace ID but no
+        session ID, so the runtime-log query is started as soon as the span
+        query has produced the session's trace IDs.
+
+        Args:
+            session_id: The session ID to fetch
+            start_time_ms: Start time in milliseconds since epoch
+            end_time_ms: End time in milliseconds since epoch
+            agent_id: Agent ID for filtering and the runtime log group name
+            endpoint_name: Runtime endpoint name for log group (default: DEFAULT)
+
+        Returns:
+            Tuple of (spans, runtime logs); both empty if the session has no spans
+        """
+        spans = self.query_spans_by_session(session_id, start_time_ms, end_time_ms, agent_id=agent_id)
+        trace_ids = list(dict.fromkeys(span.trace_id for span in spans if span.trace_id))
+        runtime_logs = self.query_runtime_logs_by_traces(
+            trace_ids, start_time_ms, end_time_ms, agent_id=agent_id, endpoint_name=endpoint_name
+        )
+        return spans, runtime_logs
+
+    async def fetch_trace_telemetry_async(self, *args: Any, **kwargs: Any) -> Tuple[List[Span], List[RuntimeLog]]:
+        """Awaitable :meth:`fetch_trace_telemetry`; the queries run on a worker thread."""
+        return await asyncio.to_thread(self.fetch_trace_telemetry, *args, **kwargs)
+
+    async def fetch_session_telemetry_async(self, *args: Any, **kwargs: Any) -> Tuple[List[Span], List[RuntimeLog]]:
+        """Awaitable :meth:`fetch_session_telemetry`; the queries run on a worker thread.
+
+        Several sessions can be fetched concurrently with ``asyncio.gather``. Each
+        call runs up to ``MAX_CONCURRENT_QUERIES`` queries of its own, and queries
+        over the account quota are retried with backoff.
+        """
+        return await asyncio.to_thread(self.fetch_session_telemetry, *args, **kwargs)
+
     def _query_runtime_logs_individually(
         self,
         trace_ids: List[str],
@@ -190,7 +328,7 @@ class ObservabilityClient:
             query_string = self.query_builder.build_runtime_logs_by_trace_direct(trace_id)
 
             try:
-                results = self._execute_cloudwatch_query(
+                results = self._execute_cached_query(
                     query_string=query_string,
                     log_group_name=runtime_log_group,
                     start_time=start_time_ms,
@@ -227,7 +365,35 @@ class ObservabilityClient:
         """
         self.logger.info("Fetching latest session ID for agent: %s", agent_id)
 
-        query_string = self.query_builder.build_latest_session_query(agent_id, limit=1)
+        session_ids = self.get_latest_session_ids(start_time_ms, end_time_ms, agent_id=agent_id, limit=1)
+        if not session_ids:
+            self.logger.info("No sessions found for agent %s", agent_id)
+            return None
+
+        self.logger.info("Found latest session: %s", session_ids[0])
+        return session_ids[0]
+
+    def get_latest_session_ids(
+        self,
+        start_time_ms: int,
+        end_time_ms: int,
+        agent_id: str,
+        limit: int = 100,
+    ) -> List[str]:
+        """Get the IDs of an agent's most recent sessions.
+
+        Args:
+            start_time_ms: Start time in milliseconds since epoch
+            end_time_ms: End time in milliseconds since epoch
+            agent_id: Agent ID to query for
+            limit: Maximum number of sessions (at most ``MAX_QUERY_RESULTS``)
+
+        Returns:
+            Session IDs, most recently active first
+        """
+        query_string = self.query_builder.build_latest_session_query(
+            agent_id, limit=max(1, min(limit, self.MAX_QUERY_RESULTS))
+        )
 
         results = self._execute_cloudwatch_query(
             query_string=query_string,
@@ -236,23 +402,298 @@ class ObservabilityClient:
             end_time=end_time_ms,
         )
 
-        if not results or not results[0]:
-            self.logger.info("No sessions found for agent %s", agent_id)
-            return None
+        session_ids = []
+        for result in results:
+            session_id = get_result_field(result, "attributes.session.id")
+            if not session_id:
+                continue
+            session_ids.append(session_id)
 
-        # Extract session ID from first result
-        session_id = None
-        for field in results[0]:
-            if field.get("field") == "attributes.session.id":
-                session_id = field.get("value")
-                break
+            # Bound the later span queries for the session by its last activity
+            max_end = get_result_field(result, "maxEnd")
+            if max_end and str(max_end).isdigit():
+                self.windows.record_last_end(("session", agent_id, session_id), int(max_end) // 1_000_000)
+
+        return session_ids
+
+    def query_latency_stats(
+        self,
+        start_time_ms: int,
+        end_time_ms: int,
+        agent_id: str,
+        group_by: str = "span",
+        limit: int = 50,
+    ) -> List[LatencyStats]:
+        """Aggregate span latency, errors and token usage for an agent server-side.
+
+        Args:
+            start_time_ms: Start time in milliseconds since epoch
+            end_time_ms: End time in milliseconds since epoch
+            agent_id: Agent ID to aggregate spans for
+            group_by: "span" (span name), "tool" (tool name) or "model" (requested model)
+            limit: Maximum number of groups to return
 
-        if session_id:
-            self.logger.info("Found latest session: %s", session_id)
-        else:
-            self.logger.info("No session ID found in results")
+        Returns:
+            Statistics per group, slowest p90 first
+        """
+        self.logger.info("Aggregating %s latency for agent: %s", group_by, agent_id)
 
-        return session_id
+        query_string = self.query_builder.build_latency_stats_query(agent_id, group_by=group_by, limit=limit)
+        results = self._execute_cloudwatch_query(
+            query_string=query_string,
+            log_group_name=self.SPANS_LOG_GROUP,
+            start_time=start_time_ms,
+            end_time=end_time_ms,
+            timeout_seconds=self.STATS_QUERY_TIMEOUT_SECONDS,
+        )
+        return [CloudWatchResultBuilder.build_latency_stats(result) for result in results]
+
+    def query_latency_report(
+        self,
+        start_time_ms: int,
+        end_time_ms: int,
+        agent_id: str,
+        group_bys: Tuple[str, ...] = ("span", "tool", "model"),
+        limit: int = 50,
+    ) -> Dict[str, List[LatencyStats]]:
+        """Aggregate latency statistics by several dimensions with the queries running at once.
+
+        Args:
+            start_time_ms: Start time in milliseconds since epoch
+            end_time_ms: End time in milliseconds since epoch
+            agent_id: Agent ID to aggregate spans for
+            group_bys: Dimensions to aggregate by
+            limit: Maximum number of groups per dimension
+
+        Returns:
+            Dictionary mapping each dimension to its statistics
+        """
+        workers = max(1, min(self.MAX_CONCURRENT_QUERIES, len(group_bys)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="agentcore-obs") as executor:
+            futures = {
+                group_by: executor.submit(
+                    self.query_latency_stats, start_time_ms, end_time_ms, agent_id, group_by, limit
+                )
+                for group_by in group_bys
+            }
+            return {group_by: future.result() for group_by, future in futures.items()}
+
+    def _execute_cached_query(
+        self,
+        query_string: str,
+        log_group_name: str,
+        start_time: int,
+        end_time: int,
+        sort_field: str = "@timestamp",
+    ) -> List[Dict]:
+        """Execute a query, scanning only the time ranges not already in the cache.
+
+        Args:
+            query_string: The CloudWatch Logs Insights query
+            log_group_name: The log group to query
+            start_time: Start time in milliseconds since epoch
+            end_time: End time in milliseconds since epoch
+            sort_field: Result field the query sorts by, used to order merged ranges
+
+        Returns:
+            List of result dictionaries
+        """
+        cache = self.cache
+        if cache is None:
+            return self._execute_sharded_query(query_string, log_group_name, start_time, end_time, sort_field)[0]
+
+        try:
+            scope = cache.scope(self.region, log_group_name, query_string)
+            for range_start, range_end in cache.missing_ranges(scope, start_time, end_time):
+                results, complete = self._execute_sharded_query(
+                    query_string, log_group_name, range_start, range_end, sort_field
+                )
+                cache.store(scope, results, range_start, range_end, complete=complete, sort_field=sort_field)
+            return cache.get_rows([scope], start_time, end_time)
+        except sqlite3.Error as e:
+            self._disable_cache(e)
+            return self._execute_sharded_query(query_string, log_group_name, start_time, end_time, sort_field)[0]
+
+    def _query_runtime_logs_cached(
+        self,
+        cache: ObservabilityCache,
+        trace_ids: List[str],
+        runtime_log_group: str,
+        start_time_ms: int,
+        end_time_ms: int,
+    ) -> List[Dict]:
+        """Batch-query runtime logs for the traces and ranges missing from the cache.
+
+        Rows are cached per trace, so later requests for any subset of these
+        traces are served locally. Traces missing the same ranges (the usual
+        case) share one batch query per range.
+
+        Args:
+            cache: Cache to read from and fill
+            trace_ids: Trace IDs to get logs for
+            runtime_log_group: Agent runtime log group
+            start_time_ms: Start time in milliseconds since epoch
+            end_time_ms: End time in milliseconds since epoch
+
+        Returns:
+            Result rows for all traces ordered by timestamp
+        """
+        try:
+            scopes = {
+                trace_id: cache.scope(
+                    self.region,
+                    runtime_log_group,
+                    self.query_builder.build_runtime_logs_by_trace_direct(trace_id),
+                )
+                for trace_id in trace_ids
+            }
+            pending: Dict[tuple, List[str]] = {}
+            for trace_id, scope in scopes.items():
+                missing = tuple(cache.missing_ranges(scope, start_time_ms, end_time_ms))
+                if missing:
+                    pending.setdefault(missing, []).append(trace_id)
+
+            for missing, batch in pending.items():
+                query_string = self.query_builder.build_runtime_logs_by_traces_batch(batch)
+                for range_start, range_end in missing:
+                    results, complete = self._execute_sharded_query(
+                        query_string, runtime_log_group, range_start, range_end
+                    )
+                    by_trace: Dict[str, List[Dict]] = {trace_id: [] for trace_id in batch}
+                    for row in results:
+                        row_trace_id = next((f.get("value") for f in row if f.get("field") == "traceId"), None)
+                        if row_trace_id in by_trace:
+                            by_trace[row_trace_id].append(row)
+                    for trace_id, rows in by_trace.items():
+                        cache.store(scopes[trace_id], rows, range_start, range_end, complete=complete)
+
+            self.logger.debug(
+                "Runtime logs: %d of %d traces served from cache",
+                len(trace_ids) - sum(len(batch) for batch in pending.values()),
+                len(trace_ids),
+            )
+            return cache.get_rows(list(scopes.values()), start_time_ms, end_time_ms)
+        except sqlite3.Error as e:
+            self._disable_cache(e)
+            return self._execute_sharded_query(
+                self.query_builder.build_runtime_logs_by_traces_batch(trace_ids),
+                runtime_log_group,
+                start_time_ms,
+                end_time_ms,
+            )[0]
+
+    def _record_trace_windows(self, spans: List[Span]) -> None:
+        """Record the bounds of every trace in a span result."""
+        by_trace: Dict[str, List[Span]] = {}
+        for span in spans:
+            if span.trace_id:
+                by_trace.setdefault(span.trace_id, []).append(span)
+        for trace_id, trace_spans in by_trace.items():
+            self.windows.record_spans(("trace", trace_id), trace_spans)
+
+    def _runtime_logs_window(self, trace_ids: List[str], start_time_ms: int, end_time_ms: int) -> Tuple[int, int]:
+        """Narrow a runtime-log window to the bounds of the given traces."""
+        bounds = ActivityWindows.union(self.windows.trace_bounds(trace_id) for trace_id in trace_ids)
+        return narrow(start_time_ms, end_time_ms, bounds)
+
+    def _disable_cache(self, error: Exception) -> None:
+        """Stop using a cache that failed; queries go straight to CloudWatch from then on."""
+        self.logger.warning("Observability cache unavailable, querying CloudWatch directly: %s", error)
+        self.cache = None
+        self.windows.cache = None
+
+    def _execute_sharded_query(
+        self,
+        query_string: str,
+        log_group_name: str,
+        start_time: int,
+        end_time: int,
+        sort_field: str = "@timestamp",
+    ) -> Tuple[List[Dict], bool]:
+        """Execute a row-returning query as concurrent time shards.
+
+        The window is split into up to ``MAX_CONCURRENT_QUERIES`` shards of at
+        least ``MIN_SHARD_SECONDS``. A shard that comes back with
+        ``MAX_QUERY_RESULTS`` rows may have been truncated, so it is bisected and
+        both halves are queried again, down to single seconds. Adjacent shards
+        share their boundary second and the duplicate rows are dropped when the
+        shards are merged.
+
+        Args:
+            query_string: The CloudWatch Logs Insights query (must not aggregate)
+            log_group_name: The log group to query
+            start_time: Start time in milliseconds since epoch
+            end_time: End time in milliseconds since epoch
+            sort_field: Result field the query sorts by, used to order merged shards
+
+        Returns:
+            Tuple of (result rows, False if a one-second shard still hit the row limit)
+        """
+        shards = self._split_time_range(start_time // 1000, end_time // 1000)
+        finished: List[Tuple[int, List[Dict]]] = []
+        complete = True
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(len(shards), self.MAX_CONCURRENT_QUERIES) or 1,
+            thread_name_prefix="agentcore-insights",
+        )
+        pending: Dict[Future, Tuple[int, int]] = {}
+
+        def submit(shard_start: int, shard_end: int) -> None:
+            future = executor.submit(
+                self._execute_cloudwatch_query, query_string, log_group_name, shard_start * 1000, shard_end * 1000
+            )
+            pending[future] = (shard_start, shard_end)
+
+        try:
+            for shard in shards:
+                submit(*shard)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    shard_start, shard_end = pending.pop(future)
+                    results = future.result()
+                    if len(results) < self.MAX_QUERY_RESULTS:
+                        finished.append((shard_start, results))
+                    elif shard_end - shard_start >= 2:
+                        mid = (shard_start + shard_end) // 2
+                        self.logger.debug("Shard %d-%d hit the result limit, bisecting", shard_start, shard_end)
+                        submit(shard_start, mid)
+                        submit(mid, shard_end)
+                    elif shard_end > shard_start:
+                        submit(shard_start, shard_start)
+                        submit(shard_end, shard_end)
+                    else:
+                        self.logger.warning(
+                            "More than %d results in one second at %d; results are incomplete",
+                            self.MAX_QUERY_RESULTS,
+                            shard_start,
+                        )
+                        complete = False
+                        finished.append((shard_start, results))
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        if len(shards) == 1 and len(finished) == 1:
+            return finished[0][1], complete
+
+        # Only drop a row already seen in another shard; identical rows within one shard are real
+        merged = []
+        seen: Dict[tuple, int] = {}
+        for index, (_, results) in enumerate(sorted(finished, key=lambda item: item[0])):
+            for row in results:
+                key = tuple((item.get("field"), item.get("value")) for item in row)
+                if seen.setdefault(key, index) == index:
+                    merged.append(row)
+        merged.sort(key=lambda row: result_sort_key(row, sort_field))
+        self.logger.debug("Merged %d rows from %d shards", len(merged), len(finished))
+        return merged, complete
+
+    def _split_time_range(self, start_s: int, end_s: int) -> List[Tuple[int, int]]:
+        """Split ``[start_s, end_s]`` into equal shards sharing their boundary seconds."""
+        count = max(1, min(self.MAX_CONCURRENT_QUERIES, (end_s - start_s) // self.MIN_SHARD_SECONDS))
+        bounds = [start_s + (end_s - start_s) * i // count for i in range(count + 1)]
+        return list(zip(bounds, bounds[1:], strict=False))
 
     def _execute_cloudwatch_query(
         self,
@@ -260,6 +701,7 @@ class ObservabilityClient:
         log_group_name: str,
         start_time: int,
         end_time: int,
+        timeout_seconds: Optional[int] = None,
     ) -> List[Dict]:
         """Execute a CloudWatch Logs Insights query and wait for results.
 
@@ -268,6 +710,7 @@ class ObservabilityClient:
             log_group_name: The log group to query
             start_time: Start time in milliseconds since epoch
             end_time: End time in milliseconds since epoch
+            timeout_seconds: How long to wait for results (default: QUERY_TIMEOUT_SECONDS)
 
         Returns:
             List of result dictionaries
@@ -279,27 +722,40 @@ class ObservabilityClient:
         self.logger.debug("Starting CloudWatch query on log group: %s", log_group_name)
         self.logger.debug("Query: %s", query_string)
 
-        # Start the query
-        try:
-            response = self.logs_client.start_query(
-                logGroupName=log_group_name,
-                startTime=start_time // 1000,  # Convert to seconds
-                endTime=end_time // 1000,  # Convert to seconds
-                queryString=query_string,
-            )
-        except self.logs_client.exceptions.ResourceNotFoundException as e:
-            self.logger.error("Log group not found: %s", log_group_name)
-            raise Exception(f"Log group not found: {log_group_name}") from e
+        # Start the query, backing off while the account's concurrent query quota is used up
+        for attempt in range(self.START_QUERY_MAX_RETRIES + 1):
+            try:
+                response = self.logs_client.start_query(
+                    logGroupName=log_group_name,
+                    startTime=start_time // 1000,  # Convert to seconds
+                    endTime=end_time // 1000,  # Convert to seconds
+                    queryString=query_string,
+                )
+                break
+            except self.logs_client.exceptions.ResourceNotFoundException as e:
+                self.logger.error("Log group not found: %s", log_group_name)
+                raise Exception(f"Log group not found: {log_group_name}") from e
+            except ClientError as e:
+                if (
+                    e.response.get("Error", {}).get("Code") != "LimitExceededException"
+                    or attempt == self.START_QUERY_MAX_RETRIES
+                ):
+                    raise
+                self.logger.debug("Concurrent query limit reached, retrying")
+                time.sleep(min(2**attempt, 10))
 
         query_id = response["queryId"]
         self.logger.debug("Query started with ID: %s", query_id)
 
         # Poll for results
+        if timeout_seconds is None:
+            timeout_seconds = self.QUERY_TIMEOUT_SECONDS
         start_poll_time = time.time()
+        poll_interval = self.POLL_INITIAL_INTERVAL_SECONDS
         while True:
             elapsed = time.time() - start_poll_time
-            if elapsed > self.QUERY_TIMEOUT_SECONDS:
-                raise TimeoutError(f"Query {query_id} timed out after {self.QUERY_TIMEOUT_SECONDS} seconds")
+            if elapsed > timeout_seconds:
+                raise TimeoutError(f"Query {query_id} timed out after {timeout_seconds} seconds")
 
             result = self.logs_client.get_query_results(queryId=query_id)
             status = result["status"]
@@ -311,4 +767,5 @@ class ObservabilityClient:
             elif status == "Failed" or status == "Cancelled":
                 raise Exception(f"Query {query_id} failed with status: {status}")
 
-            time.sleep(self.POLL_INTERVAL_SECONDS)
+            time.sleep(min(poll_interval, self.POLL_INTERVAL_SECONDS))
+            poll_interval *= self.POLL_BACKOFF_FACTOR
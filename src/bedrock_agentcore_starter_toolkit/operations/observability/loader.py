@@ -0,0 +1,529 @@
+"""Load spans and runtime logs from local files instead of CloudWatch.
+
+Traces can be analyzed offline from files in any of these shapes, one per
+file or mixed:
+
+* OTLP/JSON export requests (``resourceSpans`` / ``resourceLogs``), as written
+  by the OpenTelemetry Collector file exporter, one request per line
+* span and log documents as stored in ``aws/spans`` and the runtime log groups
+* ``FilterLogEvents`` responses (``aws logs filter-log-events`` output)
+* ``{"timestamp": ..., "raw_otel_json": {...}}`` records
+* trace data exported with ``agentcore obs show -o``
+
+Files are read incrementally: concatenated or newline-delimited documents and
+the elements of a top-level JSON array are decoded one at a time, so only the
+records kept by the filters are held in memory. A single top-level object,
+such as an ``obs show`` export, is decoded whole.
+"""
+
+import base64
+import binascii
+import json
+import logging
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from .builders import CloudWatchResultBuilder, format_event_timestamp
+from .telemetry import RuntimeLog, Span, TraceData
+from .trace_processor import TraceProcessor
+
+logger = logging.getLogger(__name__)
+
+READ_CHUNK_SIZE = 1 << 20
+
+# OTLP enum values, by number and by protobuf enum name
+SPAN_KINDS = {0: "UNSPECIFIED", 1: "INTERNAL", 2: "SERVER", 3: "CLIENT", 4: "PRODUCER", 5: "CONSUMER"}
+STATUS_CODES = {0: "UNSET", 1: "OK", 2: "ERROR"}
+
+_SKIPPED = re.compile(r"\s*")
+
+TelemetryRecord = Union[Span, RuntimeLog]
+
+
+def iter_json_values(path: Union[str, Path]) -> Iterator[Any]:
+    """Decode the JSON values in a file one at a time.
+
+    Handles a single document, concatenated or newline-delimited documents,
+    and a top-level array, whose elements are yielded individually.
+
+    Args:
+        path: File to read
+
+    Yields:
+        Decoded JSON values
+
+    Raises:
+        ValueError: If the file contains invalid JSON
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pos = 0
+    offset = 0
+    read_size = READ_CHUNK_SIZE
+    in_array = False
+    eof = False
+
+    with open(path, encoding="utf-8-sig") as f:
+        while True:
+            pos = _SKIPPED.match(buffer, pos).end()
+            if pos < len(buffer):
+                char = buffer[pos]
+                if in_array and char in ",]":
+                    in_array = char == ","
+                    pos += 1
+                    continue
+                if not in_array and char == "[":
+                    in_array = True
+                    pos += 1
+                    continue
+                try:
+                    value, pos = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError as e:
+                    if eof:
+                        raise ValueError(f"{path}: invalid JSON at character {offset + e.pos}") from e
+                else:
+                    yield value
+                    continue
+            elif eof:
+                if in_array:
+                    raise ValueError(f"{path}: unterminated JSON array")
+                return
+
+            chunk = f.read(read_size)
+            eof = not chunk
+            offset += pos
+            buffer = buffer[pos:] + chunk
+            pos = 0
+            # A value larger than the buffer is retried with twice the data, not once per chunk
+            read_size = max(READ_CHUNK_SIZE, len(buffer))
+
+
+def _any_value(value: Any) -> Any:
+    """Convert an OTLP ``AnyValue`` to a plain value."""
+    if not isinstance(value, dict):
+        return value
+    if "stringValue" in value:
+        return value["stringValue"]
+    if "intValue" in value:
+        return int(value["intValue"])
+    if "doubleValue" in value:
+        return float(value["doubleValue"])
+    if "boolValue" in value:
+        return value["boolValue"]
+    if "arrayValue" in value:
+        return [_any_value(item) for item in (value["arrayValue"] or {}).get("values", [])]
+    if "kvlistValue" in value:
+        return _attributes((value["kvlistValue"] or {}).get("values"))
+    if "bytesValue" in value:
+        return value["bytesValue"]
+    return None
+
+
+def _attributes(key_values: Optional[List[Dict[str, Any]]]) -> Dict[str, Any]:
+    """Flatten an OTLP ``KeyValue`` list the way CloudWatch stores attributes."""
+    return {kv["key"]: _any_value(kv.get("value")) for kv in key_values or [] if "key" in kv}
+
+
+def _hex_id(value: Optional[str]) -> Optional[str]:
+    """Normalize a trace or span ID to lowercase hex.
+
+    OTLP/JSON encodes IDs as hex, but exporters using the generic protobuf
+    JSON mapping write them as base64.
+    """
+    if not value:
+        return None
+    try:
+        int(value, 16)
+        return value.lower()
+    except ValueError:
+        pass
+    try:
+        return base64.b64decode(value, validate=True).hex()
+    except (binascii.Error, ValueError):
+        return value
+
+
+def _nanos(value: Any) -> Optional[int]:
+    """Parse an OTLP ``fixed64`` timestamp, which OTLP/JSON writes as a string."""
+    if value is None or value == "":
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _enum_name(value: Any, names: Dict[int, str], prefix: str) -> Optional[str]:
+    """Convert an OTLP enum given by number or protobuf name to its short name."""
+    if value is None:
+        return None
+    if isinstance(value, int):
+        return names.get(value, str(value))
+    value = str(value)
+    return value[len(prefix) :] if value.startswith(prefix) else value
+
+
+def _nanos_timestamp(nanos: Optional[int]) -> Optional[str]:
+    return format_event_timestamp(nanos // 1_000_000) if nanos else None
+
+
+def _otlp_span_document(span: Dict[str, Any], resource: Dict[str, Any], scope: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert an OTLP span to the document shape stored in ``aws/spans``."""
+    start = _nanos(span.get("startTimeUnixNano"))
+    end = _nanos(span.get("endTimeUnixNano"))
+    status = span.get("status") or {}
+
+    document: Dict[str, Any] = {
+        "resource": resource,
+        "scope": scope,
+        "traceId": _hex_id(span.get("traceId")),
+        "spanId": _hex_id(span.get("spanId")),
+        "flags": span.get("flags"),
+        "name": span.get("name", ""),
+        "kind": _enum_name(span.get("kind"), SPAN_KINDS, "SPAN_KIND_"),
+        "startTimeUnixNano": start,
+        "endTimeUnixNano": end,
+        "durationNano": end - start if start is not None and end is not None else None,
+        "attributes": _attributes(span.get("attributes")),
+        "status": {"code": _enum_name(status.get("code", 0), STATUS_CODES, "STATUS_CODE_")},
+        "events": [
+            {
+                "timeUnixNano": _nanos(event.get("timeUnixNano")),
+                "name": event.get("name", ""),
+                "attributes": _attributes(event.get("attributes")),
+            }
+            for event in span.get("events") or []
+        ],
+    }
+    parent_span_id = _hex_id(span.get("parentSpanId"))
+    if parent_span_id:
+        document["parentSpanId"] = parent_span_id
+    if status.get("message"):
+        document["status"]["message"] = status["message"]
+    return document
+
+
+def _otlp_log_document(record: Dict[str, Any], resource: Dict[str, Any], scope: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert an OTLP log record to the document shape stored in runtime log groups."""
+    return {
+        "resource": resource,
+        "scope": scope,
+        "timeUnixNano": _nanos(record.get("timeUnixNano")),
+        "observedTimeUnixNano": _nanos(record.get("observedTimeUnixNano")),
+        "severityNumber": record.get("severityNumber"),
+        "severityText": record.get("severityText"),
+        "body": _any_value(record.get("body")),
+        "attributes": _attributes(record.get("attributes")),
+        "flags": record.get("flags"),
+        "traceId": _hex_id(record.get("traceId")),
+        "spanId": _hex_id(record.get("spanId")),
+    }
+
+
+def _otlp_records(request: Dict[str, Any]) -> Iterator[TelemetryRecord]:
+    """Convert an OTLP/JSON export request to spans and runtime logs."""
+    for resource_spans in request.get("resourceSpans") or []:
+        resource = {"attributes": _attributes((resource_spans.get("resource") or {}).get("attributes"))}
+        for scope_spans in resource_spans.get("scopeSpans") or resource_spans.get("instrumentationLibrarySpans") or []:
+            scope = scope_spans.get("scope") or scope_spans.get("instrumentationLibrary") or {}
+            for span in scope_spans.get("spans") or []:
+                document = _otlp_span_document(span, resource, scope)
+                built = CloudWatchResultBuilder.build_span_from_document(
+                    document, timestamp=_nanos_timestamp(document["endTimeUnixNano"])
+                )
+                if built is not None:
+                    yield built
+
+    for resource_logs in request.get("resourceLogs") or []:
+        resource = {"attributes": _attributes((resource_logs.get("resource") or {}).get("attributes"))}
+        for scope_logs in resource_logs.get("scopeLogs") or resource_logs.get("instrumentationLibraryLogs") or []:
+            scope = scope_logs.get("scope") or scope_logs.get("instrumentationLibrary") or {}
+            for record in scope_logs.get("logRecords") or []:
+                document = _otlp_log_document(record, resource, scope)
+                yield CloudWatchResultBuilder.build_runtime_log_from_document(
+                    document,
+                    message=json.dumps(document),
+                    timestamp=_nanos_timestamp(document["timeUnixNano"] or document["observedTimeUnixNano"]) or "",
+                )
+
+
+def _exported_records(export: Dict[str, Any]) -> Iterator[TelemetryRecord]:
+    """Rebuild spans and runtime logs from an ``obs show -o`` export."""
+
+    def walk(exported_spans: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        for exported in exported_spans:
+            yield exported
+            yield from walk(exported.get("children") or [])
+
+    for trace in (export.get("traces") or {}).values():
+        for exported in walk(trace.get("root_spans") or []):
+            start = exported.get("start_time_unix_nano")
+            end = exported.get("end_time_unix_nano")
+            duration_ms = exported.get("duration_ms")
+            document: Dict[str, Any] = {
+                "resource": {"attributes": exported.get("resource_attributes") or {}},
+                "traceId": exported.get("trace_id"),
+                "spanId": exported.get("span_id"),
+                "name": exported.get("span_name", ""),
+                "kind": exported.get("kind"),
+                "startTimeUnixNano": start,
+                "endTimeUnixNano": end,
+                "durationNano": duration_ms * 1_000_000 if duration_ms is not None else None,
+                "attributes": exported.get("attributes") or {},
+                "status": {"code": exported.get("status_code"), "message": exported.get("status_message")},
+                "events": exported.get("events") or [],
+            }
+            if exported.get("parent_span_id"):
+                document["parentSpanId"] = exported["parent_span_id"]
+            if exported.get("scope"):
+                document["scope"] = exported["scope"]
+            span = CloudWatchResultBuilder.build_span_from_document(document, timestamp=exported.get("timestamp"))
+            if span is not None:
+                yield span
+
+    for exported in export.get("runtime_logs") or []:
+        yield CloudWatchResultBuilder.build_runtime_log_from_document(
+            exported.get("raw_message"),
+            message=exported.get("message") or "",
+            timestamp=exported.get("timestamp") or "",
+            log_stream=exported.get("log_stream"),
+        )
+
+
+def _document_record(document: Dict[str, Any], timestamp: Optional[str] = None) -> Optional[TelemetryRecord]:
+    """Build a span or runtime log from a CloudWatch-style OTel document."""
+    if "startTimeUnixNano" in document or "durationNano" in document:
+        if timestamp is None:
+            timestamp = _nanos_timestamp(_nanos(document.get("endTimeUnixNano")))
+        return CloudWatchResultBuilder.build_span_from_document(document, timestamp=timestamp)
+    if timestamp is None:
+        timestamp = _nanos_timestamp(_nanos(document.get("timeUnixNano") or document.get("observedTimeUnixNano")))
+    return CloudWatchResultBuilder.build_runtime_log_from_document(
+        document, message=json.dumps(document), timestamp=timestamp or ""
+    )
+
+
+def _event_record(event: Dict[str, Any]) -> Optional[TelemetryRecord]:
+    """Build a span or runtime log from a ``FilterLogEvents`` event."""
+    message = event.get("message") or ""
+    try:
+        document = json.loads(message)
+    except ValueError:
+        document = None
+    timestamp_ms = event.get("timestamp")
+    timestamp = format_event_timestamp(timestamp_ms) if timestamp_ms is not None else None
+
+    if isinstance(document, dict) and ("startTimeUnixNano" in document or "durationNano" in document):
+        return CloudWatchResultBuilder.build_span_from_document(document, timestamp=timestamp)
+    return CloudWatchResultBuilder.build_runtime_log_from_document(
+        document, message=message, timestamp=timestamp or "", log_stream=event.get("logStreamName")
+    )
+
+
+def _records_from_value(value: Any) -> Iterator[TelemetryRecord]:
+    """Recognize the shape of one decoded JSON value and convert it."""
+    if isinstance(value, list):
+        for item in value:
+            yield from _records_from_value(item)
+        return
+    if not isinstance(value, dict):
+        return
+
+    if "resourceSpans" in value or "resourceLogs" in value:
+        yield from _otlp_records(value)
+    elif "traces" in value and "runtime_logs" in value:
+        yield from _exported_records(value)
+    elif "raw_otel_json" in value:
+        document = value["raw_otel_json"]
+        if isinstance(document, str):
+            document = json.loads(document)
+        if isinstance(document, dict):
+            record = _document_record(document, timestamp=value.get("timestamp"))
+            if record is not None:
+                yield record
+    elif "events" in value and "traceId" not in value:
+        for event in value["events"] or []:
+            if isinstance(event, dict):
+                record = _event_record(event)
+                if record is not None:
+                    yield record
+    elif "message" in value and "logStreamName" in value:
+        record = _event_record(value)
+        if record is not None:
+            yield record
+    elif "traceId" in value:
+        record = _document_record(value)
+        if record is not None:
+            yield record
+
+
+def iter_telemetry(paths: Iterable[Union[str, Path]]) -> Iterator[TelemetryRecord]:
+    """Read spans and runtime logs from local files.
+
+    Args:
+        paths: Files in any of the shapes listed in the module docstring
+
+    Yields:
+        Span and RuntimeLog objects in file order
+    """
+    for path in paths:
+        logger.debug("Reading telemetry from %s", path)
+        for value in iter_json_values(path):
+            yield from _records_from_value(value)
+
+
+def _span_matches(span: Span, session_id: Optional[str], trace_id: Optional[str], agent_id: Optional[str]) -> bool:
+    if session_id and span.session_id != session_id:
+        return False
+    if trace_id and span.trace_id != trace_id:
+        return False
+    return not agent_id or f"runtime/{agent_id}/" in (span.resource_id or "")
+
+
+def _runtime_logs(paths: Iterable[Union[str, Path]], trace_ids: Set[str]) -> List[RuntimeLog]:
+    """Read the runtime logs of the given traces."""
+    return [log for log in iter_telemetry(paths) if isinstance(log, RuntimeLog) and log.trace_id in trace_ids]
+
+
+def load_trace_data(
+    paths: Iterable[Union[str, Path]],
+    session_id: Optional[str] = None,
+    trace_id: Optional[str] = None,
+    agent_id: Optional[str] = None,
+) -> TraceData:
+    """Load spans and runtime logs from local files into grouped TraceData.
+
+    Runtime logs carry no session or agent, so with any filter the files are
+    read twice: once for the matching spans and once for the runtime logs of
+    their traces. Only what is kept is held in memory.
+
+    Args:
+        paths: Files to read
+        session_id: Keep only spans of this session
+        trace_id: Keep only spans of this trace
+        agent_id: Keep only spans whose resource is this agent's runtime
+
+    Returns:
+        TraceData with spans grouped by trace, ordered by start time
+    """
+    paths = list(paths)
+    filtered = bool(session_id or trace_id or agent_id)
+    spans: List[Span] = []
+    runtime_logs: List[RuntimeLog] = []
+
+    for record in iter_telemetry(paths):
+        if isinstance(record, Span):
+            if _span_matches(record, session_id, trace_id, agent_id):
+                spans.append(record)
+        elif not filtered and record.trace_id:
+            runtime_logs.append(record)
+
+    if filtered and spans:
+        trace_ids = {span.trace_id for span in spans}
+        runtime_logs = _runtime_logs(paths, trace_ids)
+
+    spans.sort(key=lambda span: span.start_time_unix_nano or 0)
+    trace_data = TraceData(session_id=session_id, agent_id=agent_id, spans=spans, runtime_logs=runtime_logs)
+    TraceProcessor.group_spans_by_trace(trace_data)
+    return trace_data
+
+
+class LocalTelemetrySource:
+    """Serves the ``ObservabilityClient`` telemetry queries from local files.
+
+    Query time windows are ignored; the files are the whole data set. Agent
+    filters apply only when an agent ID is given, since spans collected
+    outside AgentCore Runtime have no runtime resource ID.
+
+    Example:
+        source = LocalTelemetrySource(["traces.jsonl"])
+        spans, runtime_logs = source.fetch_session_telemetry(session_id, 0, 0, agent_id="")
+    """
+
+    def __init__(self, paths: Iterable[Union[str, Path]]):
+        """Initialize the source.
+
+        Args:
+            paths: Files to read
+
+        Raises:
+            FileNotFoundError: If a file does not exist
+        """
+        self.paths = [Path(path) for path in paths]
+        for path in self.paths:
+            if not path.is_file():
+                raise FileNotFoundError(f"Telemetry file not found: {path}")
+
+    def query_spans_by_session(
+        self, session_id: str, start_time_ms: int, end_time_ms: int, agent_id: Optional[str] = None
+    ) -> List[Span]:
+        """Get the spans of a session, ordered by start time."""
+        return self._spans(session_id=session_id, agent_id=agent_id)
+
+    def query_spans_by_trace(
+        self, trace_id: str, start_time_ms: int, end_time_ms: int, agent_id: Optional[str] = None
+    ) -> List[Span]:
+        """Get the spans of a trace, ordered by start time."""
+        return self._spans(trace_id=trace_id, agent_id=agent_id)
+
+    def query_runtime_logs_by_traces(
+        self,
+        trace_ids: List[str],
+        start_time_ms: int,
+        end_time_ms: int,
+        agent_id: Optional[str] = None,
+        endpoint_name: str = "DEFAULT",
+    ) -> List[RuntimeLog]:
+        """Get the runtime logs of the given traces."""
+        if not trace_ids:
+            return []
+        return _runtime_logs(self.paths, set(trace_ids))
+
+    def fetch_trace_telemetry(
+        self,
+        trace_id: str,
+        start_time_ms: int,
+        end_time_ms: int,
+        agent_id: Optional[str] = None,
+        endpoint_name: str = "DEFAULT",
+    ) -> Tuple[List[Span], List[RuntimeLog]]:
+        """Get the spans and runtime logs of a trace."""
+        trace_data = load_trace_data(self.paths, trace_id=trace_id, agent_id=agent_id)
+        return trace_data.spans, trace_data.runtime_logs
+
+    def fetch_session_telemetry(
+        self,
+        session_id: str,
+        start_time_ms: int,
+        end_time_ms: int,
+        agent_id: Optional[str] = None,
+        endpoint_name: str = "DEFAULT",
+    ) -> Tuple[List[Span], List[RuntimeLog]]:
+        """Get the spans of a session and the runtime logs of all its traces."""
+        trace_data = load_trace_data(self.paths, session_id=session_id, agent_id=agent_id)
+        return trace_data.spans, trace_data.runtime_logs
+
+    def get_latest_session_id(
+        self, start_time_ms: Optional[int] = None, end_time_ms: Optional[int] = None, agent_id: Optional[str] = None
+    ) -> Optional[str]:
+        """Get the session whose last span ended most recently."""
+        latest: Dict[str, int] = {}
+        for record in iter_telemetry(self.paths):
+            if isinstance(record, Span) and record.session_id and _span_matches(record, None, None, agent_id):
+                end = record.end_time_unix_nano or record.start_time_unix_nano or 0
+                latest[record.session_id] = max(latest.get(record.session_id, 0), end)
+        if not latest:
+            return None
+        return max(latest, key=latest.__getitem__)
+
+    def _spans(
+        self, session_id: Optional[str] = None, trace_id: Optional[str] = None, agent_id: Optional[str] = None
+    ) -> List[Span]:
+        spans = [
+            record
+            for record in iter_telemetry(self.paths)
+            if isinstance(record, Span) and _span_matches(record, session_id, trace_id, agent_id)
+        ]
+        spans.sort(key=lambda span: span.start_time_unix_nano or 0)
+        return spans
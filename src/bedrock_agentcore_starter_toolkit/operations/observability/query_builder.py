@@ -1,5 +1,12 @@
 """CloudWatch Logs Insights query builder for observability queries."""
 
+# Span fields that latency statistics can be grouped by
+STATS_DIMENSIONS = {
+    "span": "name",
+    "tool": "attributes.gen_ai.tool.name",
+    "model": "attributes.gen_ai.request.model",
+}
+
 
 class CloudWatchQueryBuilder:
     """Builder for CloudWatch Logs Insights queries for spans, traces, and runtime logs."""
@@ -164,3 +171,50 @@ class CloudWatchQueryBuilder:
                 min(startTimeUnixNano) as sessionStart,
                 max(endTimeUnixNano) as sessionEnd
           by sessionId"""
+
+    @staticmethod
+    def build_latency_stats_query(agent_id: str, group_by: str = "span", limit: int = 50) -> str:
+        """Build query aggregating span latency, errors and token usage for an agent.
+
+        Percentiles are computed by Insights, so the result is one row per group
+        however many sessions the time range covers.
+
+        Args:
+            agent_id: Agent ID to aggregate spans for
+            group_by: Dimension from ``STATS_DIMENSIONS`` ("span", "tool" or "model")
+            limit: Maximum number of groups to return, slowest p90 first
+
+        Returns:
+            CloudWatch Logs Insights query string
+
+        Raises:
+            ValueError: If group_by is not a known dimension
+        """
+        if group_by not in STATS_DIMENSIONS:
+            expected = ", ".join(STATS_DIMENSIONS)
+            raise ValueError(f"Unknown stats dimension '{group_by}', expected one of: {expected}")
+
+        # Strands reports input/output tokens, LangChain (via Traceloop) prompt/completion tokens
+        return f"""fields {STATS_DIMENSIONS[group_by]} as groupName,
+               durationNano/1000000 as durationMs,
+               status.code as statusCode,
+               attributes.http.response.status_code as httpStatusCode,
+               coalesce(attributes.gen_ai.usage.input_tokens,
+                        attributes.gen_ai.usage.prompt_tokens, 0) as inTokens,
+               coalesce(attributes.gen_ai.usage.output_tokens,
+                        attributes.gen_ai.usage.completion_tokens, 0) as outTokens
+        | parse resource.attributes.cloud.resource_id "runtime/*/" as parsedAgentId
+        | filter parsedAgentId = '{agent_id}' and ispresent(groupName)
+        | stats count(*) as spanCount,
+                pct(durationMs, 50) as p50Ms,
+                pct(durationMs, 90) as p90Ms,
+                pct(durationMs, 99) as p99Ms,
+                avg(durationMs) as avgMs,
+                max(durationMs) as maxMs,
+                sum(statusCode = 'ERROR' or httpStatusCode >= 400) as errorCount,
+                sum(httpStatusCode = 429) as throttleCount,
+                sum(inTokens) as inputTokens,
+                sum(outTokens) as outputTokens
+          by groupName
+        | sort p90Ms desc
+        | limit {limit}"""
@@ -0,0 +1,336 @@
+"""Live follow of agent spans and runtime logs for ``agentcore obs tail``.
+
+Instead of re-running Insights queries over the lookback window, each poll
+reads only the events ingested since the last one with ``FilterLogEvents``.
+Events can be ingested out of order, so every poll re-reads the last
+``LATE_ARRIVAL_MS`` before the cursor and drops events it has already seen
+by ``eventId``. The cursor (newest timestamp plus the IDs inside the overlap)
+can be persisted so a restarted tail resumes where the previous one stopped.
+
+Spans are grouped into traces incrementally as they arrive. Spans are exported
+when they end and the root span ends last, so a trace is treated as complete
+shortly after its root span arrives, or after it has been idle for
+``TRACE_IDLE_MS`` if no root span is recognized.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from botocore.exceptions import ClientError
+
+from .builders import CloudWatchResultBuilder
+from .client import ObservabilityClient
+from .telemetry import RuntimeLog, Span, TraceData
+from .trace_processor import TraceProcessor
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POLL_INTERVAL_SECONDS = float(os.getenv("AGENTCORE_OBS_TAIL_INTERVAL_SECONDS", "1"))
+# Window re-read before the cursor on every poll to pick up late-ingested events
+LATE_ARRIVAL_MS = 10_000
+# Quiet period after a trace's root span arrives, for trailing runtime logs
+ROOT_SETTLE_MS = 1_000
+# Quiet period after which a trace without a recognized root span is rendered
+TRACE_IDLE_MS = 15_000
+# Upper bound on pages read per log group in one poll, so a burst cannot stall rendering
+MAX_PAGES_PER_POLL = 20
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+class TailCursorStore:
+    """JSON file recording how far each log group has been read.
+
+    Example:
+        store = TailCursorStore(get_observability_tail_cursor_path(Path.cwd()))
+    """
+
+    def __init__(self, path: Path):
+        """Initialize the store.
+
+        Args:
+            path: JSON file (created on first save)
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get the saved cursor for a log group, or None if there is none."""
+        with self._lock:
+            return self._read().get(key)
+
+    def save(self, key: str, cursor: Dict[str, Any]) -> None:
+        """Save the cursor for a log group, keeping the others in the file."""
+        with self._lock:
+            cursors = self._read()
+            cursors[key] = cursor
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.path.with_suffix(".tmp")
+                tmp_path.write_text(json.dumps(cursors))
+                os.replace(tmp_path, self.path)
+            except OSError as e:
+                logger.debug("Could not save tail cursor to %s: %s", self.path, e)
+
+    def _read(self) -> Dict[str, Any]:
+        try:
+            cursors = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return {}
+        return cursors if isinstance(cursors, dict) else {}
+
+
+class LogGroupFollower:
+    """Reads the events newly ingested into one log group."""
+
+    def __init__(
+        self,
+        logs_client: Any,
+        log_group_name: str,
+        start_time_ms: int,
+        filter_pattern: Optional[str] = None,
+        cursor: Optional[Dict[str, Any]] = None,
+    ):
+        """Initialize the follower.
+
+        Args:
+            logs_client: boto3 CloudWatch Logs client
+            log_group_name: Log group to follow
+            start_time_ms: Earliest event timestamp to read when there is no cursor
+            filter_pattern: Optional CloudWatch filter pattern applied server-side
+            cursor: Saved cursor from ``cursor()`` to resume from
+        """
+        self.logs_client = logs_client
+        self.log_group_name = log_group_name
+        self.filter_pattern = filter_pattern
+        self.position_ms = start_time_ms
+        self._seen: Dict[str, int] = {}
+        if cursor:
+            self.position_ms = int(cursor.get("timestamp", start_time_ms))
+            self._seen = {str(k): int(v) for k, v in (cursor.get("event_ids") or {}).items()}
+
+    def poll(self) -> List[Dict[str, Any]]:
+        """Read events ingested since the previous poll.
+
+        Returns:
+            New events ordered by timestamp; empty if the log group does not exist yet
+        """
+        params: Dict[str, Any] = {
+            "logGroupName": self.log_group_name,
+            "startTime": max(self.position_ms - LATE_ARRIVAL_MS, 0),
+        }
+        if self.filter_pattern:
+            params["filterPattern"] = self.filter_pattern
+
+        new_events: List[Dict[str, Any]] = []
+        for _ in range(MAX_PAGES_PER_POLL):
+            try:
+                response = self.logs_client.filter_log_events(**params)
+            except self.logs_client.exceptions.ResourceNotFoundException:
+                logger.debug("Log group %s does not exist yet", self.log_group_name)
+                break
+            except ClientError as e:
+                if e.response.get("Error", {}).get("Code") != "ThrottlingException":
+                    raise
+                logger.debug("FilterLogEvents throttled on %s, retrying next poll", self.log_group_name)
+                break
+
+            for event in response.get("events", []):
+                event_id = event.get("eventId")
+                timestamp_ms = event.get("timestamp", 0)
+                if event_id in self._seen:
+                    continue
+                self._seen[event_id] = timestamp_ms
+                new_events.append(event)
+                self.position_ms = max(self.position_ms, timestamp_ms)
+
+            next_token = response.get("nextToken")
+            if not next_token:
+                break
+            params["nextToken"] = next_token
+
+        # IDs before the overlap window can no longer be returned
+        horizon = self.position_ms - LATE_ARRIVAL_MS
+        self._seen = {event_id: ts for event_id, ts in self._seen.items() if ts >= horizon}
+
+        new_events.sort(key=lambda e: e.get("timestamp", 0))
+        return new_events
+
+    def cursor(self) -> Dict[str, Any]:
+        """Get the read position in a JSON-serializable form."""
+        return {"timestamp": self.position_ms, "event_ids": dict(self._seen)}
+
+
+@dataclass
+class TailBatch:
+    """What one poll of a ``TraceTailer`` produced."""
+
+    spans: List[Span] = field(default_factory=list)
+    runtime_logs: List[RuntimeLog] = field(default_factory=list)
+    completed: List[TraceData] = field(default_factory=list)
+
+
+class TraceTailer:
+    """Follows an agent's spans and runtime logs and assembles them into traces.
+
+    Example:
+        tailer = TraceTailer(client, agent_id="my-agent-abc123")
+        while True:
+            batch = tailer.poll()
+            for trace in batch.completed:
+                visualizer.visualize_trace(trace, next(iter(trace.traces)))
+            time.sleep(1)
+    """
+
+    def __init__(
+        self,
+        client: ObservabilityClient,
+        agent_id: str,
+        endpoint_name: str = "DEFAULT",
+        start_time_ms: Optional[int] = None,
+        cursor_store: Optional[TailCursorStore] = None,
+        resume: bool = False,
+    ):
+        """Initialize the tailer.
+
+        Args:
+            client: ObservabilityClient whose CloudWatch Logs client is used
+            agent_id: Agent whose spans and runtime logs are followed
+            endpoint_name: Runtime endpoint name (default: "DEFAULT")
+            start_time_ms: Earliest event to read (default: now)
+            cursor_store: Where read positions are persisted after every poll
+            resume: Continue from the positions saved in ``cursor_store``
+        """
+        self.agent_id = agent_id
+        self.cursor_store = cursor_store
+        self.trace_data = TraceData(agent_id=agent_id)
+        self._resource_marker = f"runtime/{agent_id}/"
+        self._last_activity_ms: Dict[str, int] = {}
+        self._root_seen: Dict[str, bool] = {}
+
+        if start_time_ms is None:
+            start_time_ms = _now_ms()
+
+        runtime_log_group = f"/aws/bedrock-agentcore/runtimes/{agent_id}-{endpoint_name}"
+        self._cursor_keys = {
+            "spans": f"{client.region}:{client.SPANS_LOG_GROUP}",
+            "logs": f"{client.region}:{runtime_log_group}",
+        }
+        self._followers = {
+            "spans": self._make_follower(
+                client, client.SPANS_LOG_GROUP, "spans", start_time_ms, f'"{self._resource_marker}"', resume
+            ),
+            "logs": self._make_follower(client, runtime_log_group, "logs", start_time_ms, None, resume),
+        }
+
+    def poll(self, now_ms: Optional[int] = None) -> TailBatch:
+        """Read new spans and runtime logs and return the traces that completed.
+
+        Args:
+            now_ms: Current time, for tests
+
+        Returns:
+            TailBatch with this poll's new spans and logs and the completed traces
+        """
+        if now_ms is None:
+            now_ms = _now_ms()
+
+        spans = []
+        for event in self._followers["spans"].poll():
+            span = CloudWatchResultBuilder.build_span_from_event(event)
+            # The filter pattern is a substring match; check the parsed resource ID
+            if span is not None and self._resource_marker in (span.resource_id or ""):
+                spans.append(span)
+
+        runtime_logs = []
+        for event in self._followers["logs"].poll():
+            runtime_log = CloudWatchResultBuilder.build_runtime_log_from_event(event)
+            if runtime_log.trace_id:
+                runtime_logs.append(runtime_log)
+
+        for trace_id in TraceProcessor.add_spans(self.trace_data, spans):
+            self._last_activity_ms[trace_id] = now_ms
+            self._root_seen[trace_id] = self._root_seen.get(trace_id) or self._has_root(trace_id)
+        for runtime_log in runtime_logs:
+            self.trace_data.runtime_logs.append(runtime_log)
+            self._last_activity_ms[runtime_log.trace_id] = now_ms
+
+        self._save_cursors()
+        return TailBatch(spans=spans, runtime_logs=runtime_logs, completed=self._pop_completed(now_ms))
+
+    def flush(self) -> List[TraceData]:
+        """Return every pending trace that has spans, complete or not."""
+        return self._pop_completed(now_ms=None)
+
+    @property
+    def pending_trace_count(self) -> int:
+        """Number of traces still waiting for spans."""
+        return len(self.trace_data.traces)
+
+    def _make_follower(
+        self,
+        client: ObservabilityClient,
+        log_group_name: str,
+        name: str,
+        start_time_ms: int,
+        filter_pattern: Optional[str],
+        resume: bool,
+    ) -> LogGroupFollower:
+        cursor = None
+        if resume and self.cursor_store:
+            cursor = self.cursor_store.load(self._cursor_keys[name])
+        return LogGroupFollower(client.logs_client, log_group_name, start_time_ms, filter_pattern, cursor)
+
+    def _save_cursors(self) -> None:
+        if not self.cursor_store:
+            return
+        for name, follower in self._followers.items():
+            self.cursor_store.save(self._cursor_keys[name], follower.cursor())
+
+    def _has_root(self, trace_id: str) -> bool:
+        """Check whether the outermost span of a trace has arrived.
+
+        The server span's parent usually lives in the caller's trace context
+        rather than ``aws/spans``, so a root is a span without a parent or one
+        whose parent is unknown and whose time range encloses every other span.
+        """
+        spans = self.trace_data.traces.get(trace_id, [])
+        span_ids = {span.span_id for span in spans}
+        first_start = min((s.start_time_unix_nano or 0) for s in spans)
+        last_end = max((s.end_time_unix_nano or 0) for s in spans)
+        for span in spans:
+            if not span.parent_span_id:
+                return True
+            if (
+                span.parent_span_id not in span_ids
+                and (span.start_time_unix_nano or 0) <= first_start
+                and (span.end_time_unix_nano or 0) >= last_end
+            ):
+                return True
+        return False
+
+    def _pop_completed(self, now_ms: Optional[int]) -> List[TraceData]:
+        completed = []
+        for trace_id, last_activity_ms in list(self._last_activity_ms.items()):
+            idle_ms = None if now_ms is None else now_ms - last_activity_ms
+            has_spans = trace_id in self.trace_data.traces
+
+            if idle_ms is not None:
+                settle_ms = ROOT_SETTLE_MS if self._root_seen.get(trace_id) and has_spans else TRACE_IDLE_MS
+                if idle_ms < settle_ms:
+                    continue
+
+            popped = TraceProcessor.pop_trace(self.trace_data, trace_id)
+            del self._last_activity_ms[trace_id]
+            self._root_seen.pop(trace_id, None)
+            if has_spans:
+                completed.append(popped)
+        return completed
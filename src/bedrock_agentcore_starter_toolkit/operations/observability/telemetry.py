@@ -1,48 +1,263 @@
 """Data models for observability spans, traces, and logs.
 
-These are pure data classes (POJOs) with no business logic.
+These are pure data classes (POJOs) with no business logic. Span and
+RuntimeLog use ``__slots__`` and decode their JSON payloads lazily, since a
+busy session yields many thousands of them.
 """
 
+import json
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
+_UNSET: Any = object()
+
+
+def _decode_json(value: Any) -> Any:
+    """Decode a JSON string field; CloudWatch returns @message and events as strings."""
+    if value and isinstance(value, str):
+        try:
+            return json.loads(value)
+        except Exception:
+            return value
+    return value
+
 
-@dataclass
 class Span:
-    """Represents an OpenTelemetry span with trace and timing information."""
+    """Represents an OpenTelemetry span with trace and timing information.
 
-    trace_id: str
-    span_id: str
-    span_name: str
-    session_id: Optional[str] = None
-    start_time_unix_nano: Optional[int] = None
-    end_time_unix_nano: Optional[int] = None
-    duration_ms: Optional[float] = None
-    status_code: Optional[str] = None
-    status_message: Optional[str] = None
-    parent_span_id: Optional[str] = None
-    kind: Optional[str] = None
-    events: List[Dict[str, Any]] = field(default_factory=list)
-    attributes: Dict[str, Any] = field(default_factory=dict)
-    resource_attributes: Dict[str, Any] = field(default_factory=dict)
-    service_name: Optional[str] = None
-    resource_id: Optional[str] = None
-    service_type: Optional[str] = None
-    timestamp: Optional[str] = None
-    raw_message: Optional[Dict[str, Any]] = None
-    children: List["Span"] = field(default_factory=list, repr=False)
+    Spans built from query results keep ``@message`` and ``events`` as the
+    JSON strings CloudWatch returned; ``raw_message``, ``attributes``,
+    ``resource_attributes`` and ``events`` are decoded on first access.
+    """
+
+    __slots__ = (
+        "trace_id",
+        "span_id",
+        "span_name",
+        "session_id",
+        "start_time_unix_nano",
+        "end_time_unix_nano",
+        "duration_ms",
+        "status_code",
+        "status_message",
+        "parent_span_id",
+        "kind",
+        "service_name",
+        "resource_id",
+        "service_type",
+        "timestamp",
+        "children",
+        "_events",
+        "_attributes",
+        "_resource_attributes",
+        "_raw_message",
+        "_message_json",
+        "_events_json",
+    )
+
+    _FIELDS = (
+        "trace_id",
+        "span_id",
+        "span_name",
+        "session_id",
+        "start_time_unix_nano",
+        "end_time_unix_nano",
+        "duration_ms",
+        "status_code",
+        "status_message",
+        "parent_span_id",
+        "kind",
+        "events",
+        "attributes",
+        "resource_attributes",
+        "service_name",
+        "resource_id",
+        "service_type",
+        "timestamp",
+        "raw_message",
+    )
+
+    def __init__(
+        self,
+        trace_id: str,
+        span_id: str,
+        span_name: str,
+        session_id: Optional[str] = None,
+        start_time_unix_nano: Optional[int] = None,
+        end_time_unix_nano: Optional[int] = None,
+        duration_ms: Optional[float] = None,
+        status_code: Optional[str] = None,
+        status_message: Optional[str] = None,
+        parent_span_id: Optional[str] = None,
+        kind: Optional[str] = None,
+        events: Optional[List[Dict[str, Any]]] = None,
+        attributes: Optional[Dict[str, Any]] = None,
+        resource_attributes: Optional[Dict[str, Any]] = None,
+        service_name: Optional[str] = None,
+        resource_id: Optional[str] = None,
+        service_type: Optional[str] = None,
+        timestamp: Optional[str] = None,
+        raw_message: Optional[Dict[str, Any]] = None,
+        children: Optional[List["Span"]] = None,
+        *,
+        message_json: Optional[str] = None,
+        events_json: Optional[str] = None,
+    ):
+        """Initialize a Span.
+
+        ``message_json`` and ``events_json`` are the undecoded ``@message`` and
+        ``events`` strings; fields not passed explicitly are derived from them
+        on first access.
+        """
+        self.trace_id = trace_id
+        self.span_id = span_id
+        self.span_name = span_name
+        self.session_id = session_id
+        self.start_time_unix_nano = start_time_unix_nano
+        self.end_time_unix_nano = end_time_unix_nano
+        self.duration_ms = duration_ms
+        self.status_code = status_code
+        self.status_message = status_message
+        self.parent_span_id = parent_span_id
+        self.kind = kind
+        self.service_name = service_name
+        self.resource_id = resource_id
+        self.service_type = service_type
+        self.timestamp = timestamp
+        self.children = children if children is not None else []
+
+        lazy_message = message_json is not None and raw_message is None
+        self._message_json = message_json if lazy_message else None
+        self._raw_message = _UNSET if lazy_message else raw_message
+        self._attributes = attributes if attributes is not None else (_UNSET if lazy_message else {})
+        self._resource_attributes = (
+            resource_attributes if resource_attributes is not None else (_UNSET if lazy_message else {})
+        )
+        self._events_json = events_json if events is None else None
+        self._events = events if events is not None else (_UNSET if events_json is not None else [])
+
+    @property
+    def raw_message(self) -> Optional[Dict[str, Any]]:
+        """Full OTel span document parsed from ``@message``."""
+        if self._raw_message is _UNSET:
+            self._raw_message = _decode_json(self._message_json)
+            self._message_json = None
+        return self._raw_message
+
+    @raw_message.setter
+    def raw_message(self, value: Optional[Dict[str, Any]]) -> None:
+        self._raw_message = value
+        self._message_json = None
+
+    @property
+    def attributes(self) -> Dict[str, Any]:
+        """Span attributes from the span document."""
+        if self._attributes is _UNSET:
+            raw_message = self.raw_message
+            self._attributes = (raw_message.get("attributes", {}) or {}) if isinstance(raw_message, dict) else {}
+        return self._attributes
+
+    @attributes.setter
+    def attributes(self, value: Dict[str, Any]) -> None:
+        self._attributes = value
+
+    @property
+    def resource_attributes(self) -> Dict[str, Any]:
+        """Resource attributes from the span document."""
+        if self._resource_attributes is _UNSET:
+            raw_message = self.raw_message
+            resource_data = (raw_message.get("resource", {}) or {}) if isinstance(raw_message, dict) else {}
+            self._resource_attributes = resource_data.get("attributes", {}) or {}
+        return self._resource_attributes
+
+    @resource_attributes.setter
+    def resource_attributes(self, value: Dict[str, Any]) -> None:
+        self._resource_attributes = value
+
+    @property
+    def events(self) -> List[Dict[str, Any]]:
+        """Span events."""
+        if self._events is _UNSET:
+            self._events = _decode_json(self._events_json) or []
+            self._events_json = None
+        return self._events
+
+    @events.setter
+    def events(self, value: List[Dict[str, Any]]) -> None:
+        self._events = value
+        self._events_json = None
+
+    def __eq__(self, other: object) -> bool:
+        """Compare field by field, like a dataclass."""
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self._FIELDS + ("children",))
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Represent like a dataclass, without children."""
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._FIELDS)
+        return f"Span({fields})"
 
 
-@dataclass
 class RuntimeLog:
-    """Represents a runtime log entry from agent-specific log groups."""
+    """Represents a runtime log entry from agent-specific log groups.
+
+    Entries built from query results decode ``raw_message`` from ``message``
+    on first access instead of keeping a second, parsed copy.
+    """
+
+    __slots__ = ("timestamp", "message", "span_id", "trace_id", "log_stream", "_raw_message")
+
+    _FIELDS = ("timestamp", "message", "span_id", "trace_id", "log_stream", "raw_message")
+
+    def __init__(
+        self,
+        timestamp: str,
+        message: str,
+        span_id: Optional[str] = None,
+        trace_id: Optional[str] = None,
+        log_stream: Optional[str] = None,
+        raw_message: Optional[Dict[str, Any]] = None,
+        *,
+        lazy_raw_message: bool = False,
+    ):
+        """Initialize a RuntimeLog.
+
+        With ``lazy_raw_message``, ``raw_message`` is parsed from ``message``
+        when first read.
+        """
+        self.timestamp = timestamp
+        self.message = message
+        self.span_id = span_id
+        self.trace_id = trace_id
+        self.log_stream = log_stream
+        self._raw_message = _UNSET if lazy_raw_message and raw_message is None else raw_message
+
+    @property
+    def raw_message(self) -> Optional[Dict[str, Any]]:
+        """OTel log record parsed from the message."""
+        if self._raw_message is _UNSET:
+            self._raw_message = _decode_json(self.message) if self.message else None
+        return self._raw_message
 
-    timestamp: str
-    message: str
-    span_id: Optional[str] = None
-    trace_id: Optional[str] = None
-    log_stream: Optional[str] = None
-    raw_message: Optional[Dict[str, Any]] = None
+    @raw_message.setter
+    def raw_message(self, value: Optional[Dict[str, Any]]) -> None:
+        self._raw_message = value
+
+    def __eq__(self, other: object) -> bool:
+        """Compare field by field, like a dataclass."""
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self._FIELDS)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Represent like a dataclass."""
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._FIELDS)
+        return f"RuntimeLog({fields})"
 
 
 @dataclass
@@ -56,3 +271,30 @@ class TraceData:
     traces: Dict[str, List[Span]] = field(default_factory=dict)
     start_time: Optional[int] = None
     end_time: Optional[int] = None
+
+
+@dataclass
+class LatencyStats:
+    """Aggregated latency, error and token statistics for one group of spans."""
+
+    group: str
+    span_count: int = 0
+    p50_ms: Optional[float] = None
+    p90_ms: Optional[float] = None
+    p99_ms: Optional[float] = None
+    avg_ms: Optional[float] = None
+    max_ms: Optional[float] = None
+    error_count: int = 0
+    throttle_count: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+
+    @property
+    def error_rate(self) -> float:
+        """Fraction of spans that failed."""
+        return self.error_count / self.span_count if self.span_count else 0.0
+
+    @property
+    def throttle_rate(self) -> float:
+        """Fraction of spans that were throttled (HTTP 429)."""
+        return self.throttle_count / self.span_count if self.span_count else 0.0
@@ -3,12 +3,58 @@
 This module contains all business logic for processing TraceData, Spans, and RuntimeLogs.
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional
 
 from .message_parser import UnifiedLogParser
 from .telemetry import RuntimeLog, Span, TraceData
 
 
+class SpanMessages(Mapping[str, List[Dict[str, Any]]]):
+    """Messages and exceptions from runtime logs by span ID, parsed on first lookup.
+
+    Grouping logs by span is cheap; parsing them is not, so a span's logs are
+    only run through ``UnifiedLogParser`` when that span is looked up. Spans
+    that are never displayed are never parsed.
+    """
+
+    def __init__(self, runtime_logs: Iterable[RuntimeLog], parser: Optional[UnifiedLogParser] = None):
+        """Group runtime logs by span ID.
+
+        Args:
+            runtime_logs: Logs to index; logs without a span ID are skipped
+            parser: Parser to use (default: a new UnifiedLogParser)
+        """
+        self._parser = parser or UnifiedLogParser()
+        self._logs: Dict[str, List[RuntimeLog]] = {}
+        self._items: Dict[str, List[Dict[str, Any]]] = {}
+        for log in runtime_logs:
+            if log.span_id:
+                self._logs.setdefault(log.span_id, []).append(log)
+
+    def __getitem__(self, span_id: str) -> List[Dict[str, Any]]:
+        """Get the parsed items of a span, sorted by timestamp."""
+        items = self._items.get(span_id)
+        if items is None:
+            items = []
+            for log in self._logs[span_id]:
+                items.extend(self._parser.parse(log.raw_message, log.timestamp))
+            items.sort(key=lambda m: m.get("timestamp", ""))
+            self._items[span_id] = items
+        return items
+
+    def __contains__(self, span_id: object) -> bool:
+        """Check whether a span has runtime logs, without parsing them."""
+        return span_id in self._logs
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the span IDs that have runtime logs."""
+        return iter(self._logs)
+
+    def __len__(self) -> int:
+        """Number of spans with runtime logs."""
+        return len(self._logs)
+
+
 class TraceProcessor:
     """Processor for processing and analyzing trace data."""
 
@@ -28,6 +74,55 @@ class TraceProcessor:
         for trace_id in trace_data.traces:
             trace_data.traces[trace_id].sort(key=lambda s: s.start_time_unix_nano or 0)
 
+    @staticmethod
+    def add_spans(trace_data: TraceData, spans: List[Span]) -> List[str]:
+        """Add newly arrived spans to already grouped trace data.
+
+        Unlike ``group_spans_by_trace`` this only touches the traces the new
+        spans belong to, so it can be called for every batch of a live stream.
+
+        Args:
+            trace_data: TraceData whose ``traces`` are already grouped
+            spans: Spans to add
+
+        Returns:
+            IDs of the traces that received spans, in order of first appearance
+        """
+        touched: Dict[str, None] = {}
+        for span in spans:
+            trace_data.spans.append(span)
+            trace_data.traces.setdefault(span.trace_id, []).append(span)
+            touched[span.trace_id] = None
+
+        for trace_id in touched:
+            trace_data.traces[trace_id].sort(key=lambda s: s.start_time_unix_nano or 0)
+        return list(touched)
+
+    @staticmethod
+    def pop_trace(trace_data: TraceData, trace_id: str) -> TraceData:
+        """Remove one trace and its runtime logs from grouped trace data.
+
+        Args:
+            trace_data: TraceData whose ``traces`` are already grouped
+            trace_id: The trace ID to remove
+
+        Returns:
+            New TraceData holding only the removed trace
+        """
+        spans = trace_data.traces.pop(trace_id, [])
+        trace_data.spans = [span for span in trace_data.spans if span.trace_id != trace_id]
+        runtime_logs = [log for log in trace_data.runtime_logs if log.trace_id == trace_id]
+        trace_data.runtime_logs = [log for log in trace_data.runtime_logs if log.trace_id != trace_id]
+
+        popped = TraceData(
+            session_id=spans[0].session_id if spans else None,
+            agent_id=trace_data.agent_id,
+            spans=spans,
+            runtime_logs=runtime_logs,
+        )
+        popped.traces = {trace_id: spans} if spans else {}
+        return popped
+
     @staticmethod
     def build_span_hierarchy(trace_data: TraceData, trace_id: str) -> List[Span]:
         """Build hierarchical structure of spans for a trace.
@@ -72,23 +167,24 @@ class TraceProcessor:
         Returns:
             Dictionary mapping span_id to list of items (messages/exceptions)
         """
-        parser = UnifiedLogParser()
-        items_by_span: Dict[str, List[Dict[str, Any]]] = {}
+        messages = TraceProcessor.index_messages_by_span(trace_data)
+        return {span_id: items for span_id, items in messages.items() if items}
 
-        for log in trace_data.runtime_logs:
-            if not log.span_id:
-                continue
-
-            # Parse all items from this log
-            items = parser.parse(log.raw_message, log.timestamp)
-            if items:
-                items_by_span.setdefault(log.span_id, []).extend(items)
+    @staticmethod
+    def index_messages_by_span(trace_data: TraceData, trace_id: Optional[str] = None) -> SpanMessages:
+        """Index runtime logs by span ID for parsing on demand.
 
-        # Sort items by timestamp within each span
-        for items in items_by_span.values():
-            items.sort(key=lambda m: m.get("timestamp", ""))
+        Args:
+            trace_data: TraceData containing runtime logs
+            trace_id: Only index logs of this trace
 
-        return items_by_span
+        Returns:
+            SpanMessages mapping span_id to items, parsed when first looked up
+        """
+        runtime_logs: Iterable[RuntimeLog] = trace_data.runtime_logs
+        if trace_id:
+            runtime_logs = (log for log in runtime_logs if log.trace_id in (trace_id, None))
+        return SpanMessages(runtime_logs)
 
     @staticmethod
     def calculate_trace_duration(spans: List[Span]) -> float:
@@ -214,6 +310,9 @@ class TraceProcessor:
 
         def span_to_dict(span: Span) -> Dict[str, Any]:
             """Convert span to dictionary recursively."""
+            # Evaluation selects spans by instrumentation scope, so keep it for re-import
+            raw_message = span.raw_message
+            scope = raw_message.get("scope") if isinstance(raw_message, dict) else None
             return {
                 "trace_id": span.trace_id,
                 "span_id": span.span_id,
@@ -232,6 +331,7 @@ class TraceProcessor:
                 "service_name": span.service_name,
                 "resource_id": span.resource_id,
                 "service_type": span.service_type,
+                "scope": scope,
                 "timestamp": span.timestamp,
                 "children": [span_to_dict(child) for child in span.children],
             }
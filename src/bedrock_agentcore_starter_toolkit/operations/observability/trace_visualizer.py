@@ -1,10 +1,12 @@
 """Trace visualization with hierarchical tree views."""
 
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
 
+from rich.cells import cell_len
 from rich.console import Console
+from rich.segment import Segment, Segments
 from rich.text import Text
-from rich.tree import Tree
 
 from ..constants import GenAIAttributes, LLMAttributes, TruncationConfig
 from .formatters import (
@@ -22,6 +24,45 @@ from .formatters import (
 from .telemetry import Span, TraceData
 from .trace_processor import TraceProcessor
 
+# Default for the CLI's --max-children; the API has no limit unless one is given
+DEFAULT_MAX_CHILDREN = 50
+
+# (space, vertical, branch, last branch), as drawn by rich.tree.Tree
+_TREE_GUIDES = ("    ", "│   ", "├── ", "└── ")
+_ASCII_GUIDES = ("    ", "|   ", "+-- ", "`-- ")
+_GUIDE_STYLE = "cyan"
+
+_LLM_ATTRIBUTES = (
+    # Modern OpenTelemetry GenAI attributes (OpenAI, Anthropic, etc.)
+    GenAIAttributes.REQUEST_MODEL_INPUT,
+    GenAIAttributes.RESPONSE_MODEL_OUTPUT,
+    # Legacy attributes
+    GenAIAttributes.PROMPT,
+    GenAIAttributes.COMPLETION,
+    LLMAttributes.PROMPTS,
+    LLMAttributes.RESPONSES,
+    # Provider-specific invocation attributes
+    GenAIAttributes.INVOCATION_BEDROCK,
+    GenAIAttributes.INVOCATION_INPUT,
+    GenAIAttributes.INVOCATION_OUTPUT,
+)
+
+
+@dataclass
+class _RenderState:
+    """Options and bookkeeping for printing one trace."""
+
+    show_details: bool
+    show_messages: bool
+    verbose: bool
+    messages_by_span: Mapping[str, List[Dict[str, Any]]]
+    max_depth: Optional[int] = None
+    max_children: Optional[int] = None
+    # Message IDs already shown (to prevent duplication across the hierarchy)
+    seen_messages: Set[str] = field(default_factory=set)
+    # _has_meaningful_data results by span ID
+    meaningful: Dict[str, bool] = field(default_factory=dict)
+
 
 class TraceVisualizer:
     """Visualizer for displaying traces in an intuitive hierarchical format."""
@@ -41,57 +82,42 @@ class TraceVisualizer:
         show_details: bool = True,
         show_messages: bool = False,
         verbose: bool = False,
+        max_depth: Optional[int] = None,
+        max_children: Optional[int] = None,
     ) -> None:
         """Visualize a single trace as a hierarchical tree.
 
+        The tree is printed span by span as it is formatted, so long traces
+        start printing immediately, and runtime logs are only parsed for the
+        spans that are displayed.
+
         Args:
             trace_data: TraceData containing the spans
             trace_id: The trace ID to visualize
             show_details: Whether to show detailed span information
             show_messages: Whether to show chat messages and invocation payloads
             verbose: Whether to show full details without truncation
+            max_depth: Collapse spans nested deeper than this into a summary (default: no limit)
+            max_children: Show at most this many children per span, collapsing
+                the middle ones into a summary (default: no limit)
         """
         # Ensure spans are grouped and hierarchy is built
         if trace_id not in trace_data.traces:
             TraceProcessor.group_spans_by_trace(trace_data)
 
-        if trace_id not in trace_data.traces:
-            self.console.print(f"[red]Trace {trace_id} not found[/red]")
-            return
-
-        # Build span hierarchy
-        root_spans = TraceProcessor.build_span_hierarchy(trace_data, trace_id)
-
-        if not root_spans:
-            self.console.print(f"[yellow]No spans found for trace {trace_id}[/yellow]")
-            return
-
-        # Get messages grouped by span if show_messages is enabled
-        messages_by_span = TraceProcessor.get_messages_by_span(trace_data) if show_messages else {}
-
-        # Create the tree
-        trace_tree = Tree(
-            self._format_trace_header(trace_id, trace_data.traces[trace_id]),
-            guide_style="cyan",
+        messages_by_span = TraceProcessor.index_messages_by_span(trace_data, trace_id) if show_messages else {}
+        self._visualize_trace(
+            trace_data, trace_id, show_details, show_messages, verbose, messages_by_span, max_depth, max_children
         )
 
-        # Track seen messages to avoid duplication across hierarchy
-        seen_messages: set = set()
-
-        # Add each root span and its children
-        for root_span in root_spans:
-            self._add_span_to_tree(
-                trace_tree, root_span, show_details, show_messages, messages_by_span, seen_messages, verbose
-            )
-
-        self.console.print(trace_tree)
-
     def visualize_all_traces(
         self,
         trace_data: TraceData,
         show_details: bool = False,
         show_messages: bool = False,
         verbose: bool = False,
+        max_depth: Optional[int] = None,
+        max_children: Optional[int] = None,
     ) -> None:
         """Visualize all traces in the trace data.
 
@@ -100,6 +126,8 @@ class TraceVisualizer:
             show_details: Whether to show detailed span information
             show_messages: Whether to show chat messages and invocation payloads
             verbose: Whether to show full details without truncation
+            max_depth: Collapse spans nested deeper than this into a summary (default: no limit)
+            max_children: Show at most this many children per span (default: no limit)
         """
         TraceProcessor.group_spans_by_trace(trace_data)
 
@@ -109,10 +137,49 @@ class TraceVisualizer:
 
         self.console.print(f"\n[bold cyan]Found {len(trace_data.traces)} traces:[/bold cyan]\n")
 
+        # One index for all traces rather than one scan of the logs per trace
+        messages_by_span = TraceProcessor.index_messages_by_span(trace_data) if show_messages else {}
         for trace_id in trace_data.traces:
-            self.visualize_trace(trace_data, trace_id, show_details, show_messages, verbose)
+            self._visualize_trace(
+                trace_data, trace_id, show_details, show_messages, verbose, messages_by_span, max_depth, max_children
+            )
             self.console.print()  # Empty line between traces
 
+    def _visualize_trace(
+        self,
+        trace_data: TraceData,
+        trace_id: str,
+        show_details: bool,
+        show_messages: bool,
+        verbose: bool,
+        messages_by_span: Mapping[str, List[Dict[str, Any]]],
+        max_depth: Optional[int],
+        max_children: Optional[int],
+    ) -> None:
+        """Print the tree of one trace, given the runtime log index to read messages from."""
+        if trace_id not in trace_data.traces:
+            self.console.print(f"[red]Trace {trace_id} not found[/red]")
+            return
+
+        # Build span hierarchy
+        root_spans = TraceProcessor.build_span_hierarchy(trace_data, trace_id)
+
+        if not root_spans:
+            self.console.print(f"[yellow]No spans found for trace {trace_id}[/yellow]")
+            return
+
+        self.console.print(self._format_trace_header(trace_id, trace_data.traces[trace_id]))
+
+        render = _RenderState(
+            show_details=show_details,
+            show_messages=show_messages,
+            verbose=verbose,
+            messages_by_span=messages_by_span,
+            max_depth=max_depth,
+            max_children=max_children,
+        )
+        self._print_children(root_spans, render, depth=0, guides=())
+
     def _format_trace_header(self, trace_id: str, spans: List[Span]) -> Text:
         """Format the trace header with summary information.
 
@@ -143,7 +210,8 @@ class TraceVisualizer:
         self,
         span: Span,
         show_messages: bool,
-        messages_by_span: Dict[str, List[Dict[str, Any]]],
+        messages_by_span: Mapping[str, List[Dict[str, Any]]],
+        memo: Optional[Dict[str, bool]] = None,
     ) -> bool:
         """Check if a span has meaningful data worth showing in non-verbose mode.
 
@@ -158,10 +226,25 @@ class TraceVisualizer:
             span: Span to check
             show_messages: Whether messages are being shown
             messages_by_span: Dictionary mapping span IDs to messages
+            memo: Results already computed for this render, by span ID
 
         Returns:
             True if span has meaningful data
         """
+        if memo is not None and span.span_id in memo:
+            return memo[span.span_id]
+        result = self._check_meaningful_data(span, show_messages, messages_by_span, memo)
+        if memo is not None:
+            memo[span.span_id] = result
+        return result
+
+    def _check_meaningful_data(
+        self,
+        span: Span,
+        show_messages: bool,
+        messages_by_span: Mapping[str, List[Dict[str, Any]]],
+        memo: Optional[Dict[str, bool]],
+    ) -> bool:
         # Always show root spans (no parent) to maintain hierarchy visibility
         if not span.parent_span_id:
             return True
@@ -181,77 +264,139 @@ class TraceVisualizer:
 
         # Show if has LLM interaction (gen_ai attributes with prompts/completions)
         if span.attributes:
-            llm_attrs = [
-                # Modern OpenTelemetry GenAI attributes (OpenAI, Anthropic, etc.)
-                GenAIAttributes.REQUEST_MODEL_INPUT,
-                GenAIAttributes.RESPONSE_MODEL_OUTPUT,
-                # Legacy attributes
-                GenAIAttributes.PROMPT,
-                GenAIAttributes.COMPLETION,
-                LLMAttributes.PROMPTS,
-                LLMAttributes.RESPONSES,
-                # Provider-specific invocation attributes
-                GenAIAttributes.INVOCATION_BEDROCK,
-                GenAIAttributes.INVOCATION_INPUT,
-                GenAIAttributes.INVOCATION_OUTPUT,
-            ]
-            if any(attr in span.attributes for attr in llm_attrs):
+            if any(attr in span.attributes for attr in _LLM_ATTRIBUTES):
                 return True
 
         # Show parent if any children have meaningful data (maintain hierarchy)
         for child in span.children:
-            if self._has_meaningful_data(child, show_messages, messages_by_span):
+            if self._has_meaningful_data(child, show_messages, messages_by_span, memo):
                 return True
 
         return False
 
-    def _add_span_to_tree(
-        self,
-        parent: Tree,
-        span: Span,
-        show_details: bool,
-        show_messages: bool,
-        messages_by_span: Dict[str, List[Dict[str, Any]]],
-        seen_messages: set,
-        verbose: bool,
-    ) -> None:
-        """Recursively add a span and its children to the tree.
+    def _visible_spans(self, spans: List[Span], render: "_RenderState") -> List[Span]:
+        """Get the spans to draw in place of ``spans``, skipping ones without meaningful data.
+
+        In non-verbose mode WITHOUT show_details, spans without meaningful data
+        are skipped; if show_details is True, all spans are shown (for debugging).
+        """
+        if render.verbose or render.show_details:
+            return spans
+        visible: List[Span] = []
+        for span in spans:
+            if self._has_meaningful_data(span, render.show_messages, render.messages_by_span, render.meaningful):
+                visible.append(span)
+            else:
+                # Still process children in case they have meaningful data
+                visible.extend(self._visible_spans(span.children, render))
+        return visible
+
+    def _print_children(self, spans: List[Span], render: "_RenderState", depth: int, guides: Tuple[bool, ...]) -> None:
+        """Print spans as the children of a tree node, applying the depth and width limits.
 
         Args:
-            parent: Parent Tree node
-            span: Span to add
-            show_details: Whether to show detailed information
-            show_messages: Whether to show chat messages and payloads
-            messages_by_span: Dictionary mapping span IDs to messages/events/exceptions
-            seen_messages: Set of message IDs already shown (to prevent duplication)
-            verbose: Whether to show full details without truncation
+            spans: Child spans, before hiding spans without meaningful data
+            render: Options and state of this render
+            depth: Nesting depth of the children (0 for root spans)
+            guides: For each ancestor level, whether more siblings follow it
         """
-        # In non-verbose mode WITHOUT show_details, skip spans without meaningful data
-        # If show_details is True, always show spans (for debugging)
-        if not verbose and not show_details and not self._has_meaningful_data(span, show_messages, messages_by_span):
-            # Still process children in case they have meaningful data
-            for child in span.children:
-                self._add_span_to_tree(
-                    parent, child, show_details, show_messages, messages_by_span, seen_messages, verbose
-                )
+        visible = self._visible_spans(spans, render)
+        if not visible:
             return
 
-        span_node = parent.add(
-            self._format_span(span, show_details, show_messages, messages_by_span, seen_messages, verbose)
+        if render.max_depth is not None and depth >= render.max_depth:
+            self._print_node(self._format_collapsed(visible, "nested deeper"), guides, is_last=True)
+            return
+
+        head, hidden, tail = visible, [], []
+        if render.max_children and len(visible) > render.max_children:
+            head_count = (render.max_children + 1) // 2
+            tail_count = render.max_children - head_count
+            head = visible[:head_count]
+            hidden = visible[head_count : len(visible) - tail_count]
+            tail = visible[len(visible) - tail_count :]
+
+        for index, span in enumerate(head):
+            self._print_span(span, render, depth, guides, is_last=not hidden and not tail and index == len(head) - 1)
+        if hidden:
+            self._print_node(self._format_collapsed(hidden, "collapsed"), guides, is_last=not tail)
+        for index, span in enumerate(tail):
+            self._print_span(span, render, depth, guides, is_last=index == len(tail) - 1)
+
+    def _print_span(
+        self, span: Span, render: "_RenderState", depth: int, guides: Tuple[bool, ...], is_last: bool
+    ) -> None:
+        """Print a span and, below it, its children."""
+        label = self._format_span(
+            span,
+            render.show_details,
+            render.show_messages,
+            render.messages_by_span,
+            render.seen_messages,
+            render.verbose,
         )
+        self._print_node(label, guides, is_last)
+        self._print_children(span.children, render, depth + 1, guides + (not is_last,))
 
-        # Add children recursively
-        for child in span.children:
-            self._add_span_to_tree(
-                span_node, child, show_details, show_messages, messages_by_span, seen_messages, verbose
-            )
+    def _print_node(self, label: Text, guides: Tuple[bool, ...], is_last: bool) -> None:
+        """Print one tree node with the same guide lines a Rich ``Tree`` draws.
+
+        Args:
+            label: Node text, possibly spanning several lines
+            guides: For each ancestor level, whether more siblings follow it
+            is_last: Whether this is the last child of its parent
+        """
+        space, vertical, branch, last_branch = _ASCII_GUIDES if self.console.options.ascii_only else _TREE_GUIDES
+        indent = "".join(vertical if more else space for more in guides)
+        first_prefix = indent + (last_branch if is_last else branch)
+        next_prefix = indent + (space if is_last else vertical)
+
+        guide_style = self.console.get_style(_GUIDE_STYLE)
+        options = self.console.options.update(width=max(self.console.width - cell_len(first_prefix), 1))
+        segments: List[Segment] = []
+        for index, line in enumerate(self.console.render_lines(label, options, pad=False)):
+            segments.append(Segment(first_prefix if index == 0 else next_prefix, guide_style))
+            segments.extend(line)
+            segments.append(Segment.line())
+        self.console.print(Segments(segments))
+
+    def _format_collapsed(self, spans: List[Span], reason: str) -> Text:
+        """Summarize spans left out of the tree, counting all of their descendants.
+
+        Args:
+            spans: Spans being left out
+            reason: Why they are left out, e.g. "collapsed"
+
+        Returns:
+            Formatted Rich Text object
+        """
+        count = 0
+        errors = 0
+        duration_ms = 0.0
+        pending = list(spans)
+        for span in spans:
+            duration_ms += span.duration_ms or 0
+        while pending:
+            span = pending.pop()
+            count += 1
+            if span.status_code == "ERROR":
+                errors += 1
+            pending.extend(span.children)
+
+        text = Text()
+        text.append(f"… {count} {'span' if count == 1 else 'spans'} {reason}", style="dim")
+        if duration_ms:
+            text.append(f" [{format_duration_ms(duration_ms)}]", style="dim")
+        if errors:
+            text.append(f", {errors} {'error' if errors == 1 else 'errors'}", style="red bold")
+        return text
 
     def _format_span(
         self,
         span: Span,
         show_details: bool,
         show_messages: bool,
-        messages_by_span: Dict[str, List[Dict[str, Any]]],
+        messages_by_span: Mapping[str, List[Dict[str, Any]]],
         seen_messages: set,
         verbose: bool = False,
     ) -> Text:
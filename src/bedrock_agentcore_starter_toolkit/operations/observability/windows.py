@@ -0,0 +1,191 @@
+"""Time bounds of sessions and traces, used to narrow CloudWatch query windows.
+
+Lookups default to scanning ``DEFAULT_LOOKBACK_DAYS`` of logs. AgentCore
+Runtime sessions and invocations run for at most eight hours, so once the
+start of a session or trace is known, all of its spans and runtime logs lie
+within ``[start, start + 8h]``. Starts are learned for free from data the
+toolkit already fetches:
+
+* span query results give the exact first and last span of each session
+  and trace
+* the latest-session query gives the session's last span end, and the
+  session cannot have started more than eight hours before it
+* AgentCore trace IDs use the X-Ray format, whose first eight hex digits
+  are the trace start in epoch seconds
+
+Bounds are widened by ``MARGIN_MS`` to absorb clock skew and ingestion lag.
+With an :class:`~.cache.ObservabilityCache` they are also persisted, so a
+session looked up by ID in a later process is narrowed too.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from typing import Dict, Hashable, Iterable, Optional, Tuple
+
+from .cache import ObservabilityCache
+from .telemetry import Span
+
+logger = logging.getLogger(__name__)
+
+# AgentCore Runtime limit on session lifetime and invocation duration
+MAX_ACTIVITY_MS = 8 * 60 * 60 * 1000
+MARGIN_MS = 15 * 60 * 1000
+
+# (earliest start, latest end or None if still open) in milliseconds since epoch
+Bounds = Tuple[int, Optional[int]]
+
+
+def xray_trace_start_ms(trace_id: Optional[str]) -> Optional[int]:
+    """Get the start time encoded in an X-Ray format trace ID.
+
+    Args:
+        trace_id: 32 hex digit trace ID
+
+    Returns:
+        Start time in milliseconds since epoch, or None if the ID is not hex
+    """
+    if not trace_id or len(trace_id) != 32:
+        return None
+    try:
+        int(trace_id, 16)
+    except ValueError:
+        return None
+    return int(trace_id[:8], 16) * 1000
+
+
+def narrow(start_ms: int, end_ms: int, bounds: Optional[Bounds]) -> Tuple[int, int]:
+    """Intersect a query window with activity bounds.
+
+    Args:
+        start_ms: Window start in milliseconds since epoch
+        end_ms: Window end in milliseconds since epoch
+        bounds: Activity bounds, or None if unknown
+
+    Returns:
+        The narrowed window; the original one if the bounds are unknown or
+        do not overlap it
+    """
+    if bounds is None:
+        return start_ms, end_ms
+    lower, upper = bounds
+    narrowed_start = max(start_ms, lower)
+    narrowed_end = end_ms if upper is None else min(end_ms, upper)
+    if narrowed_start > narrowed_end:
+        return start_ms, end_ms
+    return narrowed_start, narrowed_end
+
+
+class ActivityWindows:
+    """Bounds of the sessions and traces seen by one client, optionally persisted in a cache."""
+
+    def __init__(self, cache: Optional[ObservabilityCache] = None, region: str = "") -> None:
+        """Initialize an empty index.
+
+        Args:
+            cache: Optional cache to persist bounds in and read them back from
+            region: AWS region the sessions and traces belong to
+        """
+        self.cache = cache
+        self.region = region
+        self._bounds: Dict[Hashable, Bounds] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Bounds]:
+        """Get the recorded bounds for a session or trace key."""
+        with self._lock:
+            bounds = self._bounds.get(key)
+        if bounds is not None or self.cache is None:
+            return bounds
+        try:
+            bounds = self.cache.get_bounds(self._cache_key(key))
+        except sqlite3.Error as e:
+            self._disable_cache(e)
+            return None
+        if bounds is not None:
+            with self._lock:
+                bounds = self._bounds.setdefault(key, bounds)
+        return bounds
+
+    def trace_bounds(self, trace_id: str) -> Optional[Bounds]:
+        """Get bounds for a trace from its spans or, failing that, its ID."""
+        bounds = self.get(("trace", trace_id))
+        if bounds is not None:
+            return bounds
+        start_ms = xray_trace_start_ms(trace_id)
+        if start_ms is None:
+            return None
+        return start_ms - MARGIN_MS, start_ms + MAX_ACTIVITY_MS + MARGIN_MS
+
+    def record_spans(self, key: Hashable, spans: Iterable[Span], now_ms: Optional[int] = None) -> None:
+        """Record the exact bounds of a session or trace from its spans.
+
+        While the activity may still be running the upper bound is its
+        maximum lifetime; once that has passed, it is the last span end.
+        """
+        starts = []
+        ends = []
+        for span in spans:
+            if span.start_time_unix_nano:
+                starts.append(span.start_time_unix_nano // 1_000_000)
+            if span.end_time_unix_nano:
+                ends.append(span.end_time_unix_nano // 1_000_000)
+        if not starts:
+            return
+
+        first = min(starts)
+        if now_ms is None:
+            now_ms = int(time.time() * 1000)
+        if ends and first + MAX_ACTIVITY_MS + MARGIN_MS < now_ms:
+            upper = max(ends) + MARGIN_MS
+        else:
+            upper = first + MAX_ACTIVITY_MS + MARGIN_MS
+        with self._lock:
+            self._bounds[key] = (first - MARGIN_MS, upper)
+        self._persist(key, first - MARGIN_MS, upper, replace=True)
+
+    def record_last_end(self, key: Hashable, last_end_ms: int) -> None:
+        """Record that a session's latest span ended at ``last_end_ms``.
+
+        Only the lower bound follows from this; the session may still be running.
+        """
+        if self.get(key) is not None:
+            return
+        lower = last_end_ms - MAX_ACTIVITY_MS - MARGIN_MS
+        with self._lock:
+            if key in self._bounds:
+                return
+            self._bounds[key] = (lower, None)
+        self._persist(key, lower, None, replace=False)
+
+    @staticmethod
+    def union(bounds: Iterable[Optional[Bounds]]) -> Optional[Bounds]:
+        """Combine bounds into one window; None if any of them is unknown."""
+        lowers = []
+        uppers = []
+        for item in bounds:
+            if item is None:
+                return None
+            lowers.append(item[0])
+            uppers.append(item[1])
+        if not lowers:
+            return None
+        return min(lowers), None if None in uppers else max(uppers)
+
+    def _cache_key(self, key: Hashable) -> str:
+        parts = key if isinstance(key, tuple) else (key,)
+        return "\n".join([self.region, *(str(part) for part in parts)])
+
+    def _persist(self, key: Hashable, lower_ms: int, upper_ms: Optional[int], replace: bool) -> None:
+        if self.cache is None:
+            return
+        try:
+            self.cache.store_bounds(self._cache_key(key), lower_ms, upper_ms, replace=replace)
+        except sqlite3.Error as e:
+            self._disable_cache(e)
+
+    def _disable_cache(self, error: Exception) -> None:
+        """Keep bounds in memory only once the cache has failed."""
+        logger.debug("Not persisting activity bounds: %s", error)
+        self.cache = None
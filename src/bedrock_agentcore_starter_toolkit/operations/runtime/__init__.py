@@ -1,5 +1,6 @@
 """Bedrock AgentCore operations - shared business logic for CLI and notebook interfaces."""
 
+from .bench import run_benchmark
 from .configure import (
     configure_bedrock_agentcore,
     detect_entrypoint,
@@ -9,9 +10,10 @@ from .configure import (
     validate_agent_name,
 )
 from .destroy import destroy_bedrock_agentcore
-from .invoke import invoke_bedrock_agentcore
+from .invoke import invoke_bedrock_agentcore, invoke_bedrock_agentcore_concurrently
 from .launch import launch_bedrock_agentcore
 from .models import (
+    BenchmarkResult,
     ConfigureResult,
     DestroyResult,
     InvokeResult,
@@ -33,8 +35,11 @@ __all__ = [
     "infer_agent_name",
     "launch_bedrock_agentcore",
     "invoke_bedrock_agentcore",
+    "invoke_bedrock_agentcore_concurrently",
     "stop_runtime_session",
     "get_status",
+    "run_benchmark",
+    "BenchmarkResult",
     "ConfigureResult",
     "DestroyResult",
     "InvokeResult",
@@ -0,0 +1,257 @@
+"""Benchmark operation - replays payloads against an agent and summarizes latency."""
+
+import asyncio
+import itertools
+import json
+import logging
+import math
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Iterator, List, Optional, Sequence
+
+from ...services.async_runtime import AsyncLocalBedrockAgentCoreClient, InvokeMetrics, InvokeRequest
+from ...services.runtime import generate_session_id
+from ...utils.runtime.config import load_config
+from ...utils.runtime.create import resolve_create_with_iac_project_config
+from .invoke import invoke_bedrock_agentcore_concurrently
+from .models import BenchmarkRequestResult, BenchmarkResult, LatencyStats
+
+log = logging.getLogger(__name__)
+
+BENCHMARK_TARGETS = ("cloud", "local", "dev")
+
+
+def load_benchmark_payloads(path: Path) -> List[Any]:
+    """Load payloads from a JSON array or a JSON Lines file.
+
+    Args:
+        path: File with a JSON array of payloads, a single JSON payload, or one JSON payload per line
+
+    Returns:
+        List of payloads
+
+    Raises:
+        ValueError: If the file is empty or not valid JSON / JSON Lines
+    """
+    text = path.read_text(encoding="utf-8").strip()
+    if not text:
+        raise ValueError(f"Payload file is empty: {path}")
+
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError:
+        try:
+            return [json.loads(line) for line in text.splitlines() if line.strip()]
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Payload file must be JSON or JSON Lines: {path} ({e})") from e
+
+    return data if isinstance(data, list) else [data]
+
+
+def percentile(values: Sequence[float], pct: float) -> Optional[float]:
+    """Linear-interpolated percentile.
+
+    Args:
+        values: Measurements
+        pct: Percentile in [0, 100]
+
+    Returns:
+        The percentile, or None for no values
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    low, high = math.floor(rank), math.ceil(rank)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def _latency_stats(values: Sequence[float]) -> LatencyStats:
+    if not values:
+        return LatencyStats()
+    return LatencyStats(
+        p50=percentile(values, 50),
+        p90=percentile(values, 90),
+        p99=percentile(values, 99),
+        mean=sum(values) / len(values),
+        max=max(values),
+    )
+
+
+def _request_result(metrics: InvokeMetrics) -> BenchmarkRequestResult:
+    tokens_per_second = None
+    if metrics.ok and metrics.events and metrics.ttfb is not None and metrics.ttlb is not None:
+        streaming_time = metrics.ttlb - metrics.ttfb
+        if streaming_time > 0:
+            tokens_per_second = metrics.events / streaming_time
+    return BenchmarkRequestResult(
+        index=metrics.index,
+        session_id=metrics.session_id,
+        status_code=metrics.status_code,
+        ttfb=metrics.ttfb,
+        latency=metrics.ttlb,
+        events=metrics.events,
+        tokens_per_second=tokens_per_second,
+        error=metrics.error,
+        throttled=metrics.throttled,
+    )
+
+
+def summarize_benchmark(
+    results: Sequence[InvokeMetrics],
+    wall_time: float,
+    target: str,
+    concurrency: int,
+    started_at: str,
+    rate_limit: Optional[float] = None,
+    agent_name: Optional[str] = None,
+    agent_arn: Optional[str] = None,
+) -> BenchmarkResult:
+    """Aggregate per-request metrics into a benchmark report.
+
+    Latency and token-rate percentiles are computed over successful requests only.
+    """
+    request_results = sorted((_request_result(metrics) for metrics in results), key=lambda r: r.index)
+    succeeded = [r for r in request_results if r.error is None]
+    total = len(request_results)
+    errors = total - len(succeeded)
+    throttles = sum(1 for r in request_results if r.throttled)
+
+    return BenchmarkResult(
+        agent_name=agent_name,
+        agent_arn=agent_arn,
+        target=target,
+        started_at=started_at,
+        concurrency=concurrency,
+        rate_limit=rate_limit,
+        requests=total,
+        wall_time=wall_time,
+        throughput=total / wall_time if wall_time > 0 else 0.0,
+        errors=errors,
+        error_rate=errors / total if total else 0.0,
+        throttles=throttles,
+        throttle_rate=throttles / total if total else 0.0,
+        ttfb=_latency_stats([r.ttfb for r in succeeded if r.ttfb is not None]),
+        latency=_latency_stats([r.latency for r in succeeded if r.latency is not None]),
+        tokens_per_second=_latency_stats([r.tokens_per_second for r in succeeded if r.tokens_per_second is not None]),
+        results=request_results,
+    )
+
+
+def _iter_requests(payloads: Sequence[Any], total: int, sessions: Optional[int]) -> Iterator[InvokeRequest]:
+    """Cycle through payloads, spreading them over a fixed pool of sessions if requested."""
+    session_ids = [generate_session_id() for _ in range(sessions)] if sessions else None
+    for index, payload in enumerate(itertools.islice(itertools.cycle(payloads), total)):
+        yield InvokeRequest(payload, session_ids[index % len(session_ids)] if session_ids else None)
+
+
+def run_benchmark(
+    config_path: Path,
+    payloads: Sequence[Any],
+    total_requests: Optional[int] = None,
+    concurrency: int = 1,
+    rate_limit: Optional[float] = None,
+    target: str = "cloud",
+    port: int = 8080,
+    agent_name: Optional[str] = None,
+    bearer_token: Optional[str] = None,
+    user_id: Optional[str] = None,
+    custom_headers: Optional[dict] = None,
+    sessions: Optional[int] = None,
+    on_result: Optional[Callable[[InvokeMetrics], None]] = None,
+) -> BenchmarkResult:
+    """Replay payloads against an agent at a target concurrency.
+
+    Args:
+        config_path: Path to the BedrockAgentCore configuration file (not required for ``dev``)
+        payloads: Payloads to replay, cycled until ``total_requests`` are sent
+        total_requests: Number of requests to send (defaults to one per payload)
+        concurrency: Maximum requests in flight
+        rate_limit: Maximum requests started per second
+        target: ``cloud`` (deployed endpoint), ``local`` (local container) or ``dev`` (dev server)
+        port: Dev server port
+        agent_name: Agent to benchmark, defaults to the configured default agent
+        bearer_token: Bearer token for JWT authentication
+        user_id: Runtime user ID
+        custom_headers: Extra headers to send with every request
+        sessions: Spread requests over this many sessions (default: a new session per request)
+        on_result: Callback invoked with each request's metrics as it completes
+
+    Returns:
+        Aggregated benchmark result
+    """
+    if target not in BENCHMARK_TARGETS:
+        raise ValueError(f"Invalid target '{target}'. Must be one of: {', '.join(BENCHMARK_TARGETS)}")
+    if not payloads:
+        raise ValueError("At least one payload is required")
+    if sessions is not None and sessions < 1:
+        raise ValueError("sessions must be at least 1")
+
+    total = total_requests if total_requests is not None else len(payloads)
+    requests = _iter_requests(payloads, total, sessions)
+
+    agent_arn = None
+    if target == "dev":
+        client = AsyncLocalBedrockAgentCoreClient(
+            f"http://localhost:{port}",
+            max_concurrency=concurrency,
+            rate_limit=rate_limit,
+            custom_headers=custom_headers,
+        )
+        stream = _invoke_with(client, requests)
+    else:
+        project_config = load_config(config_path)
+        if project_config.is_agentcore_create_with_iac:
+            project_config = resolve_create_with_iac_project_config(config_path)
+        agent_config = project_config.get_agent_config(agent_name)
+        agent_name = agent_config.name
+        if target == "cloud":
+            agent_arn = agent_config.bedrock_agentcore.agent_arn
+        stream = invoke_bedrock_agentcore_concurrently(
+            config_path,
+            requests,
+            agent_name=agent_name,
+            bearer_token=bearer_token,
+            user_id=user_id,
+            local_mode=target == "local",
+            custom_headers=custom_headers,
+            max_concurrency=concurrency,
+            rate_limit=rate_limit,
+        )
+
+    started_at = datetime.now(timezone.utc).isoformat()
+    log.debug("Benchmarking %s target with %d requests at concurrency %d", target, total, concurrency)
+    start = time.perf_counter()
+    results = asyncio.run(_collect(stream, on_result))
+    wall_time = time.perf_counter() - start
+
+    return summarize_benchmark(
+        results,
+        wall_time,
+        target=target,
+        concurrency=concurrency,
+        started_at=started_at,
+        rate_limit=rate_limit,
+        agent_name=agent_name,
+        agent_arn=agent_arn,
+    )
+
+
+async def _invoke_with(
+    client: AsyncLocalBedrockAgentCoreClient, requests: Iterator[InvokeRequest]
+) -> AsyncIterator[InvokeMetrics]:
+    async with client:
+        async for result in client.invoke_many(requests):
+            yield result
+
+
+async def _collect(
+    stream: AsyncIterator[InvokeMetrics], on_result: Optional[Callable[[InvokeMetrics], None]]
+) -> List[InvokeMetrics]:
+    results = []
+    async for result in stream:
+        results.append(result)
+        if on_result:
+            on_result(result)
+    return results
@@ -1,13 +1,21 @@
 """Invoke operation - invokes deployed Bedrock AgentCore endpoints."""
 
+import atexit
 import json
 import logging
+import threading
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Dict, Iterable, Optional, Tuple, Union
 
 from bedrock_agentcore.services.identity import IdentityClient
 
 from ...operations.identity.oauth2_callback_server import WORKLOAD_USER_ID, BedrockAgentCoreIdentity3loCallback
+from ...services.async_runtime import (
+    DEFAULT_MAX_CONCURRENCY,
+    AsyncHttpBedrockAgentCoreClient,
+    AsyncLocalBedrockAgentCoreClient,
+    InvokeMetrics,
+)
 from ...services.runtime import (
     BedrockAgentCoreClient,
     HttpBedrockAgentCoreClient,
@@ -16,11 +24,48 @@ from ...services.runtime import (
 )
 from ...utils.runtime.config import load_config, save_config
 from ...utils.runtime.create import resolve_create_with_iac_project_config
-from ...utils.runtime.schema import BedrockAgentCoreConfigSchema
+from ...utils.runtime.schema import BedrockAgentCoreAgentSchema, BedrockAgentCoreConfigSchema
 from .models import InvokeResult
 
 log = logging.getLogger(__name__)
 
+LOCAL_ENDPOINT = "http://127.0.0.1:8080"
+
+# HTTP invoke clients kept for the life of the process, so repeated invocations
+# reuse their pooled TCP/TLS connections instead of reconnecting every time
+_shared_clients: Dict[Tuple[str, str], Union[HttpBedrockAgentCoreClient, LocalBedrockAgentCoreClient]] = {}
+_shared_clients_lock = threading.Lock()
+
+
+def get_http_client(region: str) -> HttpBedrockAgentCoreClient:
+    """Get the shared bearer-token HTTP client for a region."""
+    with _shared_clients_lock:
+        client = _shared_clients.get(("http", region))
+        if client is None:
+            client = _shared_clients[("http", region)] = HttpBedrockAgentCoreClient(region)
+        return client
+
+
+def get_local_client(endpoint: str = LOCAL_ENDPOINT) -> LocalBedrockAgentCoreClient:
+    """Get the shared client for a local agent server."""
+    with _shared_clients_lock:
+        client = _shared_clients.get(("local", endpoint))
+        if client is None:
+            client = _shared_clients[("local", endpoint)] = LocalBedrockAgentCoreClient(endpoint)
+        return client
+
+
+def close_shared_clients() -> None:
+    """Close the shared HTTP invoke clients; they are created again on next use."""
+    with _shared_clients_lock:
+        clients = list(_shared_clients.values())
+        _shared_clients.clear()
+    for client in clients:
+        client.close()
+
+
+atexit.register(close_shared_clients)
+
 
 def invoke_bedrock_agentcore(
     config_path: Path,
@@ -31,8 +76,14 @@ def invoke_bedrock_agentcore(
     user_id: Optional[str] = None,
     local_mode: Optional[bool] = False,
     custom_headers: Optional[dict] = None,
+    http_client: Optional[Union[HttpBedrockAgentCoreClient, LocalBedrockAgentCoreClient]] = None,
 ) -> InvokeResult:
-    """Invoke deployed Bedrock AgentCore endpoint."""
+    """Invoke deployed Bedrock AgentCore endpoint.
+
+    Bearer-token and local invocations use ``http_client`` when given, otherwise
+    the shared client for the region or local endpoint. The client is not
+    closed, so its pooled connections are reused by later invocations.
+    """
     # Load project configuration
     project_config = load_config(config_path)
     if project_config.is_agentcore_create_with_iac:
@@ -69,21 +120,11 @@ def invoke_bedrock_agentcore(
         payload_str = str(payload)
 
     if local_mode:
-        identity_client = IdentityClient(region)
-        workload_name = _get_workload_name(project_config, config_path, agent_config.name, identity_client)
-        workload_access_token = identity_client.get_workload_access_token(
-            workload_name=workload_name, user_token=bearer_token, user_id=user_id
-        )["workloadAccessToken"]
-
-        agent_config.oauth_configuration[WORKLOAD_USER_ID] = user_id
-        save_config(project_config, config_path)
-
-        oauth2_callback_url = BedrockAgentCoreIdentity3loCallback.get_oauth2_callback_endpoint()
-        _update_workload_identity_with_oauth2_callback_url(
-            identity_client, workload_name=workload_name, oauth2_callback_url=oauth2_callback_url
+        workload_access_token, oauth2_callback_url = _prepare_local_invoke(
+            project_config, agent_config, config_path, region, bearer_token, user_id
         )
 
-        client = LocalBedrockAgentCoreClient("http://127.0.0.1:8080")
+        client = http_client or get_local_client()
         response = client.invoke_endpoint(
             session_id, payload_str, workload_access_token, oauth2_callback_url, custom_headers
         )
@@ -99,7 +140,7 @@ def invoke_bedrock_agentcore(
             # DO NOT send user_id header with JWT - it's for SIGV4 auth only
             log.info("Using JWT authentication")
 
-            client = HttpBedrockAgentCoreClient(region)
+            client = http_client or get_http_client(region)
             response = client.invoke_endpoint(
                 agent_arn=agent_arn,
                 payload=payload_str,
@@ -126,6 +167,116 @@ def invoke_bedrock_agentcore(
     )
 
 
+def invoke_bedrock_agentcore_concurrently(
+    config_path: Path,
+    payloads: Iterable[Any],
+    agent_name: Optional[str] = None,
+    bearer_token: Optional[str] = None,
+    user_id: Optional[str] = None,
+    local_mode: Optional[bool] = False,
+    custom_headers: Optional[dict] = None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    rate_limit: Optional[float] = None,
+    capture_response: bool = False,
+) -> AsyncIterator[InvokeMetrics]:
+    """Invoke a Bedrock AgentCore endpoint with many payloads concurrently.
+
+    Uses the same endpoint and authentication as ``invoke_bedrock_agentcore``
+    (bearer token, SigV4 or the local container), but sends requests on an
+    asyncio connection pool. Every payload gets its own runtime session unless
+    it is given as an ``InvokeRequest`` with a session ID.
+
+    Args:
+        config_path: Path to the BedrockAgentCore configuration file
+        payloads: Payloads or ``InvokeRequest`` items; consumed lazily
+        agent_name: Agent to invoke, defaults to the configured default agent
+        bearer_token: Bearer token for JWT authentication
+        user_id: Runtime user ID
+        local_mode: Invoke the local container on port 8080
+        custom_headers: Extra headers to send with every request
+        max_concurrency: Maximum requests in flight
+        rate_limit: Maximum requests started per second
+        capture_response: Keep response bodies on the results
+
+    Returns:
+        Async iterator of per-request metrics in completion order
+    """
+    project_config = load_config(config_path)
+    if project_config.is_agentcore_create_with_iac:
+        project_config = resolve_create_with_iac_project_config(config_path)
+    agent_config = project_config.get_agent_config(agent_name)
+
+    region = agent_config.aws.region
+    if not region:
+        raise ValueError("Region not configured.")
+
+    client_options: Dict[str, Any] = {
+        "max_concurrency": max_concurrency,
+        "rate_limit": rate_limit,
+        "capture_response": capture_response,
+        "custom_headers": custom_headers,
+    }
+    client: Union[AsyncLocalBedrockAgentCoreClient, AsyncHttpBedrockAgentCoreClient]
+    if local_mode:
+        workload_access_token, oauth2_callback_url = _prepare_local_invoke(
+            project_config, agent_config, config_path, region, bearer_token, user_id
+        )
+        client = AsyncLocalBedrockAgentCoreClient(
+            LOCAL_ENDPOINT, workload_access_token, oauth2_callback_url, **client_options
+        )
+    else:
+        agent_arn = agent_config.bedrock_agentcore.agent_arn
+        if not agent_arn:
+            raise ValueError("Bedrock AgentCore not deployed. Run launch first.")
+        client = AsyncHttpBedrockAgentCoreClient(
+            agent_arn,
+            region,
+            bearer_token=bearer_token,
+            user_id=None if bearer_token else user_id,  # JWT carries the user identity
+            **client_options,
+        )
+
+    log.info("Invoking agent '%s' with up to %d concurrent requests", agent_config.name, max_concurrency)
+    return _invoke_many(client, payloads)
+
+
+async def _invoke_many(
+    client: Union[AsyncLocalBedrockAgentCoreClient, AsyncHttpBedrockAgentCoreClient], payloads: Iterable[Any]
+) -> AsyncIterator[InvokeMetrics]:
+    async with client:
+        async for result in client.invoke_many(payloads):
+            yield result
+
+
+def _prepare_local_invoke(
+    project_config: BedrockAgentCoreConfigSchema,
+    agent_config: BedrockAgentCoreAgentSchema,
+    config_path: Path,
+    region: str,
+    bearer_token: Optional[str],
+    user_id: Optional[str],
+) -> Tuple[str, str]:
+    """Get a workload access token and register the OAuth2 callback for local invocation.
+
+    Returns:
+        Tuple of (workload access token, OAuth2 callback URL)
+    """
+    identity_client = IdentityClient(region)
+    workload_name = _get_workload_name(project_config, config_path, agent_config.name, identity_client)
+    workload_access_token = identity_client.get_workload_access_token(
+        workload_name=workload_name, user_token=bearer_token, user_id=user_id
+    )["workloadAccessToken"]
+
+    agent_config.oauth_configuration[WORKLOAD_USER_ID] = user_id
+    save_config(project_config, config_path)
+
+    oauth2_callback_url = BedrockAgentCoreIdentity3loCallback.get_oauth2_callback_endpoint()
+    _update_workload_identity_with_oauth2_callback_url(
+        identity_client, workload_name=workload_name, oauth2_callback_url=oauth2_callback_url
+    )
+    return workload_access_token, oauth2_callback_url
+
+
 def _update_workload_identity_with_oauth2_callback_url(
     identity_client: IdentityClient,
     workload_name: str,
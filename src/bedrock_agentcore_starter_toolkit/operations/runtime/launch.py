@@ -14,6 +14,7 @@ from rich.console import Console
 from ...services.codebuild import CodeBuildService
 from ...services.ecr import deploy_to_ecr, generate_image_tag, get_or_create_ecr_repository
 from ...services.runtime import BedrockAgentCoreClient
+from ...services.s3 import upload_file_if_changed
 from ...services.xray import enable_traces_delivery_for_runtime, enable_transaction_search_if_needed
 from ...utils.aws import get_partition
 from ...utils.runtime.agentcore_identity import _load_api_key_from_env_if_configured
@@ -1294,7 +1295,7 @@ def _launch_with_direct_code_deploy(
 
     # Step 4: Create deployment package
     step_start = time.time()
-    from ...utils.runtime.config import get_agentcore_directory
+    from ...utils.runtime.config import get_agentcore_directory, get_package_cache_directory
     from ...utils.runtime.entrypoint import detect_dependencies
     from ...utils.runtime.package import CodeZipPackager
 
@@ -1313,6 +1314,7 @@ def _launch_with_direct_code_deploy(
         runtime_version=agent_config.runtime_type,
         requirements_file=Path(dep_info.resolved_path) if dep_info.found else None,
         force_rebuild_deps=force_rebuild_deps,
+        shared_cache_dir=get_package_cache_directory(config_path.parent),
     )
 
     try:
@@ -1361,7 +1363,7 @@ def _launch_with_direct_code_deploy(
             # Use configured bucket
             s3 = session.client("s3")
             log.info("Uploading to s3://%s/%s...", bucket_name, s3_key)
-            s3.upload_file(str(deployment_zip), bucket_name, s3_key, ExtraArgs={"ExpectedBucketOwner": account_id})
+            upload_file_if_changed(s3, deployment_zip, bucket_name, s3_key, account_id)
             s3_location = f"s3://{bucket_name}/{s3_key}"
         else:
             # Fallback to existing logic
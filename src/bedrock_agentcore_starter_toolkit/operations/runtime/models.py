@@ -120,3 +120,50 @@ class StopSessionResult(BaseModel):
     agent_name: str = Field(..., description="Name of the agent")
     status_code: int = Field(..., description="HTTP status code of the operation")
     message: str = Field(default="Session stopped successfully", description="Result message")
+
+
+# Benchmark operation models
+class LatencyStats(BaseModel):
+    """Distribution of a per-request measurement."""
+
+    p50: Optional[float] = Field(default=None, description="Median")
+    p90: Optional[float] = Field(default=None, description="90th percentile")
+    p99: Optional[float] = Field(default=None, description="99th percentile")
+    mean: Optional[float] = Field(default=None, description="Arithmetic mean")
+    max: Optional[float] = Field(default=None, description="Maximum")
+
+
+class BenchmarkRequestResult(BaseModel):
+    """Outcome of one benchmark request."""
+
+    index: int = Field(..., description="Position of the request in the run")
+    session_id: str = Field(..., description="Runtime session ID used")
+    status_code: Optional[int] = Field(None, description="HTTP status code, if a response was received")
+    ttfb: Optional[float] = Field(None, description="Seconds to the first response byte")
+    latency: Optional[float] = Field(None, description="Seconds to the last response byte")
+    events: int = Field(0, description="SSE data events received")
+    tokens_per_second: Optional[float] = Field(None, description="SSE events per second after the first byte")
+    error: Optional[str] = Field(None, description="Error message for failed requests")
+    throttled: bool = Field(False, description="Whether the request was throttled")
+
+
+class BenchmarkResult(BaseModel):
+    """Result of benchmark operation."""
+
+    agent_name: Optional[str] = Field(None, description="Name of the benchmarked agent")
+    agent_arn: Optional[str] = Field(None, description="Agent ARN for cloud targets")
+    target: str = Field(..., description="Benchmark target: cloud, local or dev")
+    started_at: str = Field(..., description="UTC start time (ISO 8601)")
+    concurrency: int = Field(..., description="Maximum requests in flight")
+    rate_limit: Optional[float] = Field(None, description="Maximum requests started per second")
+    requests: int = Field(..., description="Requests completed")
+    wall_time: float = Field(..., description="Seconds from the first request to the last response")
+    throughput: float = Field(..., description="Completed requests per second")
+    errors: int = Field(..., description="Failed requests (including throttled)")
+    error_rate: float = Field(..., description="Fraction of requests that failed")
+    throttles: int = Field(..., description="Throttled requests")
+    throttle_rate: float = Field(..., description="Fraction of requests that were throttled")
+    ttfb: LatencyStats = Field(..., description="Time to first byte of successful requests (seconds)")
+    latency: LatencyStats = Field(..., description="Full-response latency of successful requests (seconds)")
+    tokens_per_second: LatencyStats = Field(..., description="Per-request SSE events per second")
+    results: List[BenchmarkRequestResult] = Field(default_factory=list, description="Per-request results")
@@ -0,0 +1,351 @@
+"""Asyncio clients for invoking agents concurrently with per-request timing.
+
+These clients send the same requests as ``HttpBedrockAgentCoreClient`` and
+``LocalBedrockAgentCoreClient`` but on an ``httpx.AsyncClient``, so many
+invocations can be in flight at once over a shared connection pool.
+``invoke_many`` bounds the number of in-flight requests, optionally caps the
+request start rate, and yields an ``InvokeMetrics`` for each request as it
+completes.
+"""
+
+import asyncio
+import json
+import logging
+import time
+import urllib.parse
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, NamedTuple, Optional, Tuple, Union
+
+import boto3
+import httpx
+from botocore.auth import SigV4Auth
+from botocore.awsrequest import AWSRequest
+
+from ..utils.endpoints import get_data_plane_endpoint
+from .runtime import _get_user_agent, generate_session_id
+from .sse import aiter_sse_events
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = 10
+THROTTLE_STATUS_CODES = (429,)
+# Error body characters kept in InvokeMetrics.error
+_ERROR_BODY_LIMIT = 500
+
+
+class InvokeRequest(NamedTuple):
+    """A payload to invoke, optionally pinned to a runtime session."""
+
+    payload: Any
+    session_id: Optional[str] = None
+
+
+@dataclass
+class InvokeMetrics:
+    """Outcome and timing of one invocation.
+
+    Times are seconds measured from when the request was sent (after waiting
+    for a concurrency slot and the rate limiter).
+    """
+
+    index: int
+    session_id: str
+    status_code: Optional[int] = None
+    ttfb: Optional[float] = None
+    ttlb: Optional[float] = None
+    events: int = 0
+    bytes_received: int = 0
+    error: Optional[str] = None
+    throttled: bool = False
+    response: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the invocation completed with a successful status."""
+        return self.error is None
+
+
+class _RateLimiter:
+    """Spaces request starts at least ``1 / rate`` seconds apart."""
+
+    def __init__(self, rate: float):
+        self._interval = 1.0 / rate
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next_start - now
+            self._next_start = max(now, self._next_start) + self._interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def _encode_payload(payload: Any) -> bytes:
+    """Encode a payload the same way as the synchronous HTTP clients."""
+    if isinstance(payload, str):
+        try:
+            payload = json.loads(payload)
+        except json.JSONDecodeError:
+            payload = {"payload": payload}
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+class _AsyncInvokeClient(ABC):
+    """Shared request loop for the async invoke clients."""
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        rate_limit: Optional[float] = None,
+        timeout: float = 900,
+        capture_response: bool = False,
+        custom_headers: Optional[Dict[str, str]] = None,
+    ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if rate_limit is not None and rate_limit <= 0:
+            raise ValueError("rate_limit must be positive")
+
+        self.max_concurrency = max_concurrency
+        self.rate_limit = rate_limit
+        self.capture_response = capture_response
+        self.custom_headers = dict(custom_headers or {})
+        self._client = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=max_concurrency, max_keepalive_connections=max_concurrency),
+        )
+
+    @abstractmethod
+    def _build_request(self, payload: Any, session_id: str) -> Tuple[str, Dict[str, str], bytes]:
+        """Return (url, headers, body) for one invocation."""
+
+    async def invoke_endpoint(self, payload: Any, session_id: Optional[str] = None, index: int = 0) -> InvokeMetrics:
+        """Invoke the agent once and measure it.
+
+        Transport and HTTP errors are recorded on the result rather than raised.
+
+        Args:
+            payload: Payload to send (dict or JSON string)
+            session_id: Runtime session ID; a new one is generated if omitted
+            index: Position of the request, echoed on the result
+
+        Returns:
+            Timing and outcome of the invocation
+        """
+        metrics = InvokeMetrics(index=index, session_id=session_id or generate_session_id())
+        url, headers, body = self._build_request(payload, metrics.session_id)
+        chunks = []
+
+        start = time.perf_counter()
+        try:
+            async with self._client.stream("POST", url, headers=headers, content=body) as response:
+                metrics.status_code = response.status_code
+                metrics.throttled = response.status_code in THROTTLE_STATUS_CODES
+
+                async def body_chunks() -> AsyncIterator[bytes]:
+                    async for chunk in response.aiter_bytes():
+                        if metrics.ttfb is None:
+                            metrics.ttfb = time.perf_counter() - start
+                        metrics.bytes_received += len(chunk)
+                        yield chunk
+
+                if response.is_success and "text/event-stream" in response.headers.get("content-type", ""):
+                    async for event in aiter_sse_events(body_chunks()):
+                        metrics.events += 1
+                        if self.capture_response:
+                            chunks.append(event.data)
+                else:
+                    async for chunk in body_chunks():
+                        if self.capture_response or not response.is_success:
+                            chunks.append(chunk.decode("utf-8", errors="replace"))
+
+                metrics.ttlb = time.perf_counter() - start
+                if metrics.ttfb is None:
+                    metrics.ttfb = metrics.ttlb
+
+                if not response.is_success:
+                    text = "".join(chunks)
+                    metrics.error = f"{response.status_code} {response.reason_phrase}: {text[:_ERROR_BODY_LIMIT]}"
+                    if "ThrottlingException" in text:
+                        metrics.throttled = True
+                elif self.capture_response:
+                    metrics.response = "\n".join(chunks) if metrics.events else "".join(chunks)
+        except httpx.HTTPError as e:
+            metrics.ttlb = time.perf_counter() - start
+            metrics.error = f"{type(e).__name__}: {e}"
+
+        return metrics
+
+    async def invoke_many(
+        self, payloads: Iterable[Union[InvokeRequest, Any]], session_id: Optional[str] = None
+    ) -> AsyncIterator[InvokeMetrics]:
+        """Invoke many payloads concurrently, yielding results as they complete.
+
+        At most ``max_concurrency`` requests are in flight, and with
+        ``rate_limit`` set, requests start no faster than that many per second.
+        Payloads are consumed lazily, so ``payloads`` may be a generator.
+
+        Args:
+            payloads: Payloads, or ``InvokeRequest`` items to pin a session per payload
+            session_id: Session for payloads without one; each gets a new session if omitted
+
+        Yields:
+            Metrics for each invocation in completion order; ``index`` is the input position
+        """
+        items: Iterator[Tuple[int, Union[InvokeRequest, Any]]] = enumerate(payloads)
+        results: "asyncio.Queue[Union[InvokeMetrics, BaseException, None]]" = asyncio.Queue()
+        limiter = _RateLimiter(self.rate_limit) if self.rate_limit else None
+
+        async def worker() -> None:
+            try:
+                for index, item in items:
+                    request = item if isinstance(item, InvokeRequest) else InvokeRequest(item)
+                    if limiter:
+                        await limiter.wait()
+                    await results.put(
+                        await self.invoke_endpoint(request.payload, request.session_id or session_id, index)
+                    )
+            except Exception as e:
+                await results.put(e)
+            finally:
+                await results.put(None)
+
+        workers = [asyncio.create_task(worker()) for _ in range(self.max_concurrency)]
+        try:
+            remaining = len(workers)
+            while remaining:
+                result = await results.get()
+                if result is None:
+                    remaining -= 1
+                elif isinstance(result, BaseException):
+                    raise result
+                else:
+                    yield result
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def aclose(self) -> None:
+        """Close pooled connections."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> Any:
+        """Enter async context manager."""
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Close pooled connections on exit."""
+        await self.aclose()
+
+
+class AsyncHttpBedrockAgentCoreClient(_AsyncInvokeClient):
+    """Async client for a deployed agent's data-plane endpoint.
+
+    Authenticates with a bearer token when one is given, otherwise signs each
+    request with SigV4 using the default boto3 credentials.
+
+    Example:
+        async with AsyncHttpBedrockAgentCoreClient(agent_arn, "us-west-2", max_concurrency=20) as client:
+            async for result in client.invoke_many([{"prompt": "hi"}] * 100):
+                print(result.ttfb, result.error)
+    """
+
+    def __init__(
+        self,
+        agent_arn: str,
+        region: str,
+        bearer_token: Optional[str] = None,
+        user_id: Optional[str] = None,
+        endpoint_name: str = "DEFAULT",
+        boto_session: Optional[boto3.Session] = None,
+        **kwargs: Any,
+    ):
+        """Initialize the client.
+
+        Args:
+            agent_arn: Agent runtime ARN to invoke
+            region: AWS region of the agent
+            bearer_token: Bearer token for JWT authentication; SigV4 is used if omitted
+            user_id: Runtime user ID (SigV4 mode only)
+            endpoint_name: Endpoint qualifier, defaults to "DEFAULT"
+            boto_session: Session supplying SigV4 credentials
+            **kwargs: ``max_concurrency``, ``rate_limit``, ``timeout``, ``capture_response``, ``custom_headers``
+        """
+        super().__init__(**kwargs)
+        self.region = region
+        self.bearer_token = bearer_token
+        self.user_id = user_id
+        escaped_arn = urllib.parse.quote(agent_arn, safe="")
+        qualifier = urllib.parse.urlencode({"qualifier": endpoint_name})
+        self.url = f"{get_data_plane_endpoint(region)}/runtimes/{escaped_arn}/invocations?{qualifier}"
+
+        self._credentials = None
+        if not bearer_token:
+            self._credentials = (boto_session or boto3.Session(region_name=region)).get_credentials()
+            if self._credentials is None:
+                raise ValueError("No AWS credentials found for SigV4 signing; provide a bearer token instead")
+
+    def _build_request(self, payload: Any, session_id: str) -> Tuple[str, Dict[str, str], bytes]:
+        body = _encode_payload(payload)
+        headers = {
+            "Content-Type": "application/json",
+            "Accept": "text/event-stream, application/json",
+            "X-Amzn-Bedrock-AgentCore-Runtime-Session-Id": session_id,
+            "User-Agent": _get_user_agent(),
+        }
+        if self.bearer_token:
+            headers["Authorization"] = f"Bearer {self.bearer_token}"
+        elif self.user_id:
+            headers["X-Amzn-Bedrock-AgentCore-Runtime-User-Id"] = self.user_id
+        headers.update(self.custom_headers)
+
+        if self._credentials is not None:
+            request = AWSRequest(method="POST", url=self.url, data=body, headers=headers)
+            SigV4Auth(self._credentials.get_frozen_credentials(), "bedrock-agentcore", self.region).add_auth(request)
+            headers = dict(request.headers.items())
+
+        return self.url, headers, body
+
+
+class AsyncLocalBedrockAgentCoreClient(_AsyncInvokeClient):
+    """Async client for an agent served locally (dev server or local container)."""
+
+    def __init__(
+        self,
+        endpoint: str,
+        workload_access_token: Optional[str] = None,
+        oauth2_callback_url: Optional[str] = None,
+        **kwargs: Any,
+    ):
+        """Initialize the client.
+
+        Args:
+            endpoint: Base URL of the local agent server
+            workload_access_token: Workload access token forwarded to the agent
+            oauth2_callback_url: OAuth2 callback URL forwarded to the agent
+            **kwargs: ``max_concurrency``, ``rate_limit``, ``timeout``, ``capture_response``, ``custom_headers``
+        """
+        super().__init__(**kwargs)
+        self.url = f"{endpoint.rstrip('/')}/invocations"
+        self.workload_access_token = workload_access_token
+        self.oauth2_callback_url = oauth2_callback_url
+
+    def _build_request(self, payload: Any, session_id: str) -> Tuple[str, Dict[str, str], bytes]:
+        from bedrock_agentcore.runtime.models import ACCESS_TOKEN_HEADER, OAUTH2_CALLBACK_URL_HEADER, SESSION_HEADER
+
+        headers = {
+            "Content-Type": "application/json",
+            "Accept": "text/event-stream, application/json",
+            SESSION_HEADER: session_id,
+            "User-Agent": _get_user_agent(),
+        }
+        if self.workload_access_token:
+            headers[ACCESS_TOKEN_HEADER] = self.workload_access_token
+        if self.oauth2_callback_url:
+            headers[OAUTH2_CALLBACK_URL_HEADER] = self.oauth2_callback_url
+        headers.update(self.custom_headers)
+        return self.url, headers, _encode_payload(payload)
@@ -1,6 +1,5 @@
 """CodeBuild service for ARM64 container builds."""
 
-import fnmatch
 import logging
 import os
 import tempfile
@@ -14,7 +13,9 @@ import boto3
 from botocore.exceptions import ClientError
 
 from ..operations.runtime.create_role import get_or_create_codebuild_execution_role
+from ..utils.runtime.ignore import get_ignore_matcher
 from .ecr import generate_image_tag, sanitize_ecr_repo_name
+from .s3 import upload_file_if_changed
 
 
 class CodeBuildService:
@@ -85,7 +86,7 @@ class CodeBuildService:
         self.source_bucket = bucket_name
 
         # Parse .dockerignore patterns from template for consistent filtering
-        ignore_patterns = self._parse_dockerignore()
+        matcher = get_ignore_matcher(tuple(self._parse_dockerignore()), match_nested_files=True)
 
         with tempfile.NamedTemporaryFile(suffix=".zip", delete=False) as temp_zip:
             try:
@@ -101,16 +102,14 @@ class CodeBuildService:
                         dirs[:] = [
                             d
                             for d in dirs
-                            if not self._should_ignore(
-                                os.path.join(rel_root, d) if rel_root else d, ignore_patterns, is_dir=True
-                            )
+                            if not matcher.is_ignored(os.path.join(rel_root, d) if rel_root else d, is_dir=True)
                         ]
 
                         for file in files:
                             file_rel_path = os.path.join(rel_root, file) if rel_root else file
 
                             # Skip if matches ignore pattern
-                            if self._should_ignore(file_rel_path, ignore_patterns, is_dir=False):
+                            if matcher.is_ignored(file_rel_path, is_dir=False):
                                 continue
 
                             file_path = Path(root) / file
@@ -129,11 +128,8 @@ class CodeBuildService:
                 # Create agent-organized S3 key: agentname/source.zip (fixed naming for cache consistency)
                 s3_key = f"{agent_name}/source.zip"
 
-                self.s3_client.upload_file(
-                    temp_zip.name, bucket_name, s3_key, ExtraArgs={"ExpectedBucketOwner": account_id}
-                )
-
-                self.logger.info("Uploaded source to S3: %s", s3_key)
+                if upload_file_if_changed(self.s3_client, temp_zip.name, bucket_name, s3_key, account_id):
+                    self.logger.info("Uploaded source to S3: %s", s3_key)
                 return f"s3://{bucket_name}/{s3_key}"
 
             finally:
@@ -347,46 +343,8 @@ phases:
 
     def _should_ignore(self, path: str, patterns: List[str], is_dir: bool = False) -> bool:
         """Check if path should be ignored based on dockerignore patterns."""
-        # Normalize path
-        if path.startswith("./"):
-            path = path[2:]
-
-        should_ignore = False  # Default state: don't ignore
-
-        for pattern in patterns:
-            # Handle negation patterns
-            if pattern.startswith("!"):
-                if self._matches_pattern(path, pattern[1:], is_dir):
-                    should_ignore = False  # Negation pattern: don't ignore
-            else:
-                # Regular ignore patterns
-                if self._matches_pattern(path, pattern, is_dir):
-                    should_ignore = True  # Regular pattern: ignore
-
-        return should_ignore
+        return get_ignore_matcher(tuple(patterns), match_nested_files=True).is_ignored(path, is_dir)
 
     def _matches_pattern(self, path: str, pattern: str, is_dir: bool) -> bool:
         """Check if path matches a dockerignore pattern."""
-        # Directory-specific patterns
-        if pattern.endswith("/"):
-            if not is_dir:
-                return False
-            pattern = pattern[:-1]
-
-        # Exact match
-        if path == pattern:
-            return True
-
-        # Glob pattern match
-        if fnmatch.fnmatch(path, pattern):
-            return True
-
-        # Directory prefix match
-        if is_dir and pattern in path.split("/"):
-            return True
-
-        # File in ignored directory
-        if not is_dir and any(fnmatch.fnmatch(part, pattern) for part in path.split("/")):
-            return True
-
-        return False
+        return get_ignore_matcher((pattern,), match_nested_files=True).is_ignored(path, is_dir)
@@ -2,6 +2,7 @@
 
 import json
 import logging
+import os
 import time
 import urllib.parse
 import uuid
@@ -12,13 +13,18 @@ import boto3
 import requests
 from botocore.config import Config
 from botocore.exceptions import ClientError
+from requests.adapters import HTTPAdapter
 from rich.console import Console
 
 from ..utils.endpoints import get_control_plane_endpoint, get_data_plane_endpoint
+from .sse import iter_response_chunks, iter_sse_events
 
 logger = logging.getLogger(__name__)
 console = Console()
 
+# Connections kept open per host by the HTTP invoke clients
+HTTP_POOL_SIZE = int(os.getenv("AGENTCORE_HTTP_POOL_SIZE", "10"))
+
 
 def _get_user_agent() -> str:
     """Get user-agent string for agentcore-st.
@@ -33,6 +39,25 @@ def _get_user_agent() -> str:
     return f"agentcore-st/{pkg_version}"
 
 
+def _create_http_session(pool_size: int, keep_alive: bool) -> requests.Session:
+    """Create a pooled HTTP session for invoking agents.
+
+    Args:
+        pool_size: Maximum connections kept open per host
+        keep_alive: Whether to reuse connections between requests
+
+    Returns:
+        Configured ``requests.Session``
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if not keep_alive:
+        session.headers["Connection"] = "close"
+    return session
+
+
 def generate_session_id() -> str:
     """Generate session ID."""
     return str(uuid.uuid4())
@@ -108,24 +133,16 @@ def _handle_aws_response(response) -> dict:
 
 
 def _handle_streaming_response(response) -> Dict[str, Any]:
-    complete_text = ""
-    for line in response.iter_lines(chunk_size=1):
-        if line:
-            line = line.decode("utf-8")
-            if line.startswith("data: "):
-                json_chunk = line[6:]
-                try:
-                    parsed_chunk = json.loads(json_chunk)
-                    if isinstance(parsed_chunk, str):
-                        text_chunk = parsed_chunk
-                    else:
-                        text_chunk = json.dumps(parsed_chunk, ensure_ascii=False)
-                        text_chunk += "\n\n"
-                    console.print(text_chunk, end="")
-                    complete_text += text_chunk
-                except json.JSONDecodeError:
-                    console.print(json_chunk)
-                    continue
+    for event in iter_sse_events(iter_response_chunks(response)):
+        try:
+            parsed_chunk = json.loads(event.data)
+        except json.JSONDecodeError:
+            console.print(event.data)
+            continue
+        if isinstance(parsed_chunk, str):
+            console.print(parsed_chunk, end="")
+        else:
+            console.print(json.dumps(parsed_chunk, ensure_ascii=False) + "\n\n", end="")
     console.print()
     return {}
 
@@ -778,19 +795,38 @@ class BedrockAgentCoreClient:
 class HttpBedrockAgentCoreClient:
     """Bedrock AgentCore client for agent management using HTTP requests with bearer token."""
 
-    def __init__(self, region: str):
+    def __init__(self, region: str, pool_size: int = HTTP_POOL_SIZE, keep_alive: bool = True):
         """Initialize HttpBedrockAgentCoreClient.
 
+        The client owns a pooled HTTP session, so repeated invocations reuse
+        TCP/TLS connections. Call ``close()`` or use the client as a context
+        manager to release them.
+
         Args:
             region: AWS region for the client
+            pool_size: Maximum connections kept open to the data plane
+            keep_alive: Whether to reuse connections between invocations
         """
         self.region = region
         self.dp_endpoint = get_data_plane_endpoint(region)
         self.logger = logging.getLogger(f"bedrock_agentcore.http_runtime.{region}")
+        self.session = _create_http_session(pool_size, keep_alive)
 
         self.logger.debug("Initializing HTTP Bedrock AgentCore client for region: %s", region)
         self.logger.debug("Data plane: %s", self.dp_endpoint)
 
+    def close(self) -> None:
+        """Close pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> "HttpBedrockAgentCoreClient":
+        """Enter context manager."""
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Close pooled connections on exit."""
+        self.close()
+
     def invoke_endpoint(
         self,
         agent_arn: str,
@@ -853,7 +889,7 @@ class HttpBedrockAgentCoreClient:
 
         try:
             # Make request with timeout
-            response = requests.post(
+            response = self.session.post(
                 url,
                 params={"qualifier": endpoint_name},
                 headers=headers,
@@ -861,7 +897,11 @@ class HttpBedrockAgentCoreClient:
                 timeout=900,
                 stream=True,
             )
-            return _handle_http_response(response)
+            try:
+                return _handle_http_response(response)
+            finally:
+                # Return the connection to the pool even if the body was not fully read
+                response.close()
         except requests.exceptions.RequestException as e:
             self.logger.error("Failed to invoke agent endpoint: %s", str(e))
             raise
@@ -870,10 +910,29 @@ class HttpBedrockAgentCoreClient:
 class LocalBedrockAgentCoreClient:
     """Local Bedrock AgentCore client for invoking endpoints."""
 
-    def __init__(self, endpoint: str):
-        """Initialize the local client with the given endpoint."""
+    def __init__(self, endpoint: str, pool_size: int = HTTP_POOL_SIZE, keep_alive: bool = True):
+        """Initialize the local client with the given endpoint.
+
+        Args:
+            endpoint: Base URL of the local agent server
+            pool_size: Maximum connections kept open to the server
+            keep_alive: Whether to reuse connections between invocations
+        """
         self.endpoint = endpoint
         self.logger = logging.getLogger("bedrock_agentcore.http_local")
+        self.session = _create_http_session(pool_size, keep_alive)
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> "LocalBedrockAgentCoreClient":
+        """Enter context manager."""
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Close pooled connections on exit."""
+        self.close()
 
     def invoke_endpoint(
         self,
@@ -910,8 +969,11 @@ class LocalBedrockAgentCoreClient:
 
         try:
             # Make request with timeout
-            response = requests.post(url, headers=headers, json=body, timeout=900, stream=True)
-            return _handle_http_response(response)
+            response = self.session.post(url, headers=headers, json=body, timeout=900, stream=True)
+            try:
+                return _handle_http_response(response)
+            finally:
+                response.close()
         except requests.exceptions.RequestException as e:
             self.logger.error("Failed to invoke agent endpoint: %s", str(e))
             raise
@@ -1,13 +1,31 @@
 """S3 service integration."""
 
+import hashlib
 import logging
+import os
 import re
+from pathlib import Path
+from typing import Any, Union
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
 
 log = logging.getLogger(__name__)
 
+# Object metadata key holding the SHA256 of an uploaded package (x-amz-meta-agentcore-sha256)
+PACKAGE_DIGEST_METADATA_KEY = "agentcore-sha256"
+
+# Multipart upload tuning for deployment packages
+UPLOAD_CHUNK_SIZE = int(os.getenv("AGENTCORE_S3_UPLOAD_CHUNK_MB", "16")) * 1024 * 1024
+UPLOAD_MAX_CONCURRENCY = int(os.getenv("AGENTCORE_S3_UPLOAD_CONCURRENCY", "10"))
+UPLOAD_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=UPLOAD_CHUNK_SIZE,
+    multipart_chunksize=UPLOAD_CHUNK_SIZE,
+    max_concurrency=UPLOAD_MAX_CONCURRENCY,
+    use_threads=True,
+)
+
 
 def sanitize_s3_bucket_name(name: str, account_id: str, region: str) -> str:
     """Sanitize agent name for S3 bucket naming requirements."""
@@ -88,3 +106,57 @@ def create_s3_bucket(bucket_name: str, region: str, account_id: str) -> str:
             return bucket_name
         else:
             raise RuntimeError(f"Failed to create S3 bucket: {e}") from e
+
+
+def compute_file_digest(file_path: Union[str, Path]) -> str:
+    """Compute the SHA256 of a file, reading it in chunks.
+
+    Args:
+        file_path: File to hash
+
+    Returns:
+        SHA256 hash as hex string
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def upload_file_if_changed(s3_client: Any, file_path: Union[str, Path], bucket: str, key: str, account_id: str) -> bool:
+    """Upload a package to S3 unless an identical copy is already stored at the key.
+
+    The package's SHA256 is stored as object metadata on upload and compared with a
+    HEAD of the existing object, so re-deploys that only change configuration skip
+    the transfer entirely. Uploads use multipart with tuned chunk size and concurrency.
+
+    Args:
+        s3_client: Boto3 S3 client
+        file_path: Local package to upload
+        bucket: Destination bucket
+        key: Destination object key
+        account_id: Expected bucket owner account ID
+
+    Returns:
+        True if the file was uploaded, False if the upload was skipped
+    """
+    digest = compute_file_digest(file_path)
+
+    try:
+        head = s3_client.head_object(Bucket=bucket, Key=key, ExpectedBucketOwner=account_id)
+        if head.get("Metadata", {}).get(PACKAGE_DIGEST_METADATA_KEY) == digest:
+            log.info("Package unchanged (sha256 %s), skipping upload to s3://%s/%s", digest[:12], bucket, key)
+            return False
+    except ClientError as e:
+        if e.response["Error"]["Code"] not in ("404", "NoSuchKey", "NotFound"):
+            log.debug("Could not check existing object s3://%s/%s: %s", bucket, key, e)
+
+    s3_client.upload_file(
+        str(file_path),
+        bucket,
+        key,
+        ExtraArgs={"ExpectedBucketOwner": account_id, "Metadata": {PACKAGE_DIGEST_METADATA_KEY: digest}},
+        Config=UPLOAD_TRANSFER_CONFIG,
+    )
+    return True
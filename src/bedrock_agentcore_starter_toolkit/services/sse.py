@@ -0,0 +1,217 @@
+"""Incremental Server-Sent Events parsing for streamed agent responses.
+
+Responses are read in whatever chunks the transport delivers and split into
+lines only once, so long responses cost time linear in their size regardless of
+how the frames are fragmented on the wire. Parsing follows the WHATWG
+``text/event-stream`` rules: ``event``/``data``/``id``/``retry`` fields, comment
+lines, multi-line ``data`` and LF, CRLF or CR line endings.
+"""
+
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Iterator, List, NamedTuple, Optional
+
+# Upper bound for a single read from the response body; reads return early with
+# whatever has arrived, so this only limits how much is buffered per read
+READ_SIZE = 64 * 1024
+# Read size when the stream cannot return early; each read blocks until it is full
+FALLBACK_READ_SIZE = 1024
+
+_LINE_ENDINGS = (b"\n", b"\r")
+
+
+class SSEEvent(NamedTuple):
+    """A dispatched server-sent event."""
+
+    data: str
+    event: str = "message"
+    id: Optional[str] = None
+    retry: Optional[int] = None
+
+
+class SSEParser:
+    """Incremental ``text/event-stream`` parser.
+
+    Example:
+        parser = SSEParser()
+        for chunk in chunks:
+            for event in parser.feed(chunk):
+                handle(event)
+        for event in parser.close():
+            handle(event)
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty parser."""
+        self._buffer = bytearray()
+        self._skip_lf = False
+        self._data: List[str] = []
+        self._event = ""
+        self._last_id: Optional[str] = None
+        self._retry: Optional[int] = None
+
+    def feed(self, chunk: bytes) -> List[SSEEvent]:
+        """Consume a chunk of the stream.
+
+        Args:
+            chunk: Raw bytes as received; may split lines and UTF-8 sequences anywhere
+
+        Returns:
+            Events completed by this chunk, in stream order
+        """
+        if self._skip_lf and chunk.startswith(b"\n"):
+            # Second half of a "\r\n" split across chunks
+            chunk = chunk[1:]
+        self._skip_lf = False
+        if not chunk:
+            return []
+
+        if b"\n" not in chunk and b"\r" not in chunk:
+            self._buffer += chunk
+            return []
+
+        self._buffer += chunk
+        lines = bytes(self._buffer).splitlines(keepends=True)
+        self._buffer.clear()
+        if not lines[-1].endswith(_LINE_ENDINGS):
+            self._buffer += lines.pop()
+        self._skip_lf = not self._buffer and lines[-1].endswith(b"\r")
+
+        events = []
+        for line in lines:
+            event = self._process_line(line[:-2] if line.endswith(b"\r\n") else line[:-1])
+            if event is not None:
+                events.append(event)
+        return events
+
+    def close(self) -> List[SSEEvent]:
+        """Finish the stream, dispatching an event left unterminated by the server.
+
+        Returns:
+            The final event, if any
+        """
+        events = []
+        if self._buffer:
+            line = bytes(self._buffer)
+            self._buffer.clear()
+            event = self._process_line(line)
+            if event is not None:
+                events.append(event)
+        event = self._dispatch()
+        if event is not None:
+            events.append(event)
+        return events
+
+    def _process_line(self, line: bytes) -> Optional[SSEEvent]:
+        """Apply one line (without its terminator) and return an event on a blank line."""
+        if not line:
+            return self._dispatch()
+        if line.startswith(b":"):
+            return None
+
+        field, sep, value = line.partition(b":")
+        if sep and value.startswith(b" "):
+            value = value[1:]
+        text = value.decode("utf-8", errors="replace")
+
+        if field == b"data":
+            self._data.append(text)
+        elif field == b"event":
+            self._event = text
+        elif field == b"id":
+            if "\0" not in text:
+                self._last_id = text
+        elif field == b"retry":
+            if text.isdigit():
+                self._retry = int(text)
+        return None
+
+    def _dispatch(self) -> Optional[SSEEvent]:
+        """Emit the pending event and reset per-event state."""
+        if not self._data:
+            self._event = ""
+            return None
+        event = SSEEvent("\n".join(self._data), self._event or "message", self._last_id, self._retry)
+        self._data = []
+        self._event = ""
+        return event
+
+
+def iter_sse_events(chunks: Iterable[bytes]) -> Iterator[SSEEvent]:
+    """Parse a stream of byte chunks into events.
+
+    Args:
+        chunks: Response body chunks
+
+    Yields:
+        Events as soon as each one is complete
+    """
+    parser = SSEParser()
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+async def aiter_sse_events(chunks: AsyncIterable[bytes]) -> AsyncIterator[SSEEvent]:
+    """Parse an asynchronous stream of byte chunks (e.g. ``httpx`` ``aiter_bytes()``) into events.
+
+    Args:
+        chunks: Response body chunks
+
+    Yields:
+        Events as soon as each one is complete
+    """
+    parser = SSEParser()
+    async for chunk in chunks:
+        for event in parser.feed(chunk):
+            yield event
+    for event in parser.close():
+        yield event
+
+
+def iter_response_chunks(response: Any, read_size: int = READ_SIZE) -> Iterator[bytes]:
+    """Iterate over a streamed response body as data arrives.
+
+    Supports ``requests`` responses opened with ``stream=True`` and botocore
+    ``StreamingBody`` objects. Neither waits for a full ``read_size`` buffer
+    before yielding, so tokens are surfaced with no added latency. Streams
+    that cannot return early are read ``FALLBACK_READ_SIZE`` bytes at a time.
+
+    Args:
+        response: ``requests.Response`` or botocore ``StreamingBody``
+        read_size: Maximum bytes per read
+
+    Yields:
+        Non-empty body chunks
+    """
+    if hasattr(response, "iter_content"):
+        # chunk_size=None yields each transfer-encoding chunk as it is received
+        yield from (chunk for chunk in response.iter_content(chunk_size=None) if chunk)
+        return
+
+    # StreamingBody.read(n) blocks until n bytes arrive; read1 returns what is available
+    read1 = _find_read1(getattr(response, "_raw_stream", None))
+    if read1 is None:
+        chunk_size = min(read_size, FALLBACK_READ_SIZE)
+        yield from (chunk for chunk in response.iter_chunks(chunk_size=chunk_size) if chunk)
+        return
+
+    while True:
+        chunk = read1(read_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def _find_read1(raw_stream: Any) -> Optional[Any]:
+    """Get a read1 for a urllib3 response, or None if it has none.
+
+    urllib3 2 responses have read1. On urllib3 1.26 the underlying
+    ``http.client`` response is read directly, unless the body has a
+    content encoding that only urllib3 would decode.
+    """
+    read1 = getattr(raw_stream, "read1", None)
+    if read1 is not None:
+        return read1
+    headers = getattr(raw_stream, "headers", None) or {}
+    if headers.get("content-encoding"):
+        return None
+    return getattr(getattr(raw_stream, "_fp", None), "read1", None)
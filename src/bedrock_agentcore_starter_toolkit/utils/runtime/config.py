@@ -246,3 +246,63 @@ def get_agentcore_directory(project_root: Path, agent_name: str, source_path: Op
     else:
         # Legacy single-agent: artifacts at project root
         return project_root
+
+
+def get_package_cache_directory(project_root: Path) -> Path:
+    """Get the per-package dependency cache shared by all agents in a project.
+
+    Args:
+        project_root: Project root directory (typically Path.cwd())
+
+    Returns:
+        Path to {project_root}/.bedrock_agentcore/.package_cache/
+    """
+    return project_root / ".bedrock_agentcore" / ".package_cache"
+
+
+def get_observability_cache_path(project_root: Path) -> Path:
+    """Get the observability query cache shared by all agents in a project.
+
+    Args:
+        project_root: Project root directory (typically Path.cwd())
+
+    Returns:
+        Path to {project_root}/.bedrock_agentcore/observability_cache.sqlite3
+    """
+    return project_root / ".bedrock_agentcore" / "observability_cache.sqlite3"
+
+
+def get_evaluation_cache_path(project_root: Path) -> Path:
+    """Get the evaluation result cache shared by all agents in a project.
+
+    Args:
+        project_root: Project root directory (typically Path.cwd())
+
+    Returns:
+        Path to {project_root}/.bedrock_agentcore/evaluation_cache.sqlite3
+    """
+    return project_root / ".bedrock_agentcore" / "evaluation_cache.sqlite3"
+
+
+def get_evaluator_metadata_cache_path(project_root: Path) -> Path:
+    """Get the evaluator metadata cache shared by all agents in a project.
+
+    Args:
+        project_root: Project root directory (typically Path.cwd())
+
+    Returns:
+        Path to {project_root}/.bedrock_agentcore/evaluator_metadata.json
+    """
+    return project_root / ".bedrock_agentcore" / "evaluator_metadata.json"
+
+
+def get_observability_tail_cursor_path(project_root: Path) -> Path:
+    """Get the file recording how far ``agentcore obs tail`` has read each log group.
+
+    Args:
+        project_root: Project root directory (typically Path.cwd())
+
+    Returns:
+        Path to {project_root}/.bedrock_agentcore/observability_tail_cursor.json
+    """
+    return project_root / ".bedrock_agentcore" / "observability_tail_cursor.json"
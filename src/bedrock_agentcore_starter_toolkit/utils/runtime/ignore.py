@@ -0,0 +1,183 @@
+"""Compiled dockerignore-style pattern matching for source packaging.
+
+Patterns are translated to regular expressions once and consecutive patterns of
+the same polarity are combined into a single alternation, so checking a path
+costs one regex match per negation boundary instead of one ``fnmatch`` call per
+pattern. The last matching pattern decides, so ``!pattern`` re-includes paths
+excluded by earlier patterns.
+
+Matching rules for a pattern (a trailing ``/`` restricts it to directories):
+
+- the pattern matches the whole relative path, with ``*`` and ``?`` also matching
+  ``/`` (``fnmatch`` semantics) and ``**/`` matching zero or more directories
+- for directories, a slash-free pattern also matches any single path component
+- with ``match_nested_files``, a slash-free pattern also matches any component of
+  a file path (so ``.env`` excludes ``config/.env``)
+"""
+
+import functools
+import os
+import re
+from typing import List, Pattern, Sequence, Tuple
+
+_CHAR_CLASS_SPECIALS = re.compile(r"([&~|])")
+
+
+def _translate(pattern: str, cross_separators: bool) -> str:
+    """Translate a glob pattern into a regular expression body (no anchors).
+
+    Args:
+        pattern: Glob pattern
+        cross_separators: Whether ``*`` and ``?`` may match ``/``
+
+    Returns:
+        Regular expression source
+    """
+    star = ".*" if cross_separators else "[^/]*"
+    single = "." if cross_separators else "[^/]"
+    res = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        i += 1
+        if c == "*":
+            if i < n and pattern[i] == "*":
+                i += 1
+                if i < n and pattern[i] == "/":
+                    # "**/" matches zero or more leading directories
+                    i += 1
+                    res.append("(?:.*/)?")
+                else:
+                    res.append(".*")
+            else:
+                res.append(star)
+        elif c == "?":
+            res.append(single)
+        elif c == "[":
+            j = i
+            if j < n and pattern[j] == "!":
+                j += 1
+            if j < n and pattern[j] == "]":
+                j += 1
+            while j < n and pattern[j] != "]":
+                j += 1
+            if j >= n:
+                res.append("\\[")
+            else:
+                stuff = _CHAR_CLASS_SPECIALS.sub(r"\\\1", pattern[i:j].replace("\\", "\\\\"))
+                i = j + 1
+                if stuff.startswith("!"):
+                    stuff = "^" + stuff[1:]
+                elif stuff.startswith(("^", "[")):
+                    stuff = "\\" + stuff
+                res.append(f"[{stuff}]")
+        else:
+            res.append(re.escape(c))
+    return "".join(res)
+
+
+def _pattern_alternatives(pattern: str, match_nested_files: bool) -> Tuple[List[str], List[str]]:
+    """Build regex alternatives for one pattern.
+
+    Args:
+        pattern: Pattern without a leading ``!``
+        match_nested_files: Whether slash-free patterns match components of file paths
+
+    Returns:
+        Tuple of (alternatives for files, alternatives for directories)
+    """
+    dir_only = pattern.endswith("/")
+    if dir_only:
+        pattern = pattern[:-1]
+
+    full = _translate(pattern, cross_separators=True)
+    exact = re.escape(pattern)
+    file_alts = [] if dir_only else [full, exact]
+    dir_alts = [full, exact]
+
+    if "/" not in pattern:
+        dir_alts.append(f"(?:.*/)?{exact}(?:/.*)?")
+        if match_nested_files and not dir_only:
+            file_alts.append(f"(?:.*/)?{_translate(pattern, cross_separators=False)}(?:/.*)?")
+
+    return file_alts, dir_alts
+
+
+def _compile(alternatives: List[str]) -> Pattern[str]:
+    """Combine alternatives into one compiled full-match regex (matches nothing if empty)."""
+    if not alternatives:
+        return re.compile(r"(?!)")
+    return re.compile("|".join(f"(?:{alt})" for alt in dict.fromkeys(alternatives)), re.DOTALL)
+
+
+class IgnoreMatcher:
+    """Dockerignore-style matcher compiled once for a list of patterns."""
+
+    def __init__(self, patterns: Sequence[str], match_nested_files: bool = False):
+        """Compile patterns.
+
+        Args:
+            patterns: Ignore patterns in order; ``!`` prefixes re-include paths
+            match_nested_files: Whether slash-free patterns also match components of file paths
+        """
+        self.patterns = list(patterns)
+        self.match_nested_files = match_nested_files
+
+        # Group consecutive patterns by polarity: (negated, file regex, dir regex)
+        self._groups: List[Tuple[bool, Pattern[str], Pattern[str]]] = []
+        current: List[str] = []
+        current_negated = False
+
+        for raw in self.patterns:
+            negated = raw.startswith("!")
+            if current and negated != current_negated:
+                self._groups.append(self._compile_group(current, current_negated))
+                current = []
+            current_negated = negated
+            current.append(raw[1:] if negated else raw)
+
+        if current:
+            self._groups.append(self._compile_group(current, current_negated))
+
+    def _compile_group(self, patterns: List[str], negated: bool) -> Tuple[bool, Pattern[str], Pattern[str]]:
+        file_alts: List[str] = []
+        dir_alts: List[str] = []
+        for pattern in patterns:
+            files, dirs = _pattern_alternatives(pattern, self.match_nested_files)
+            file_alts.extend(files)
+            dir_alts.extend(dirs)
+        return negated, _compile(file_alts), _compile(dir_alts)
+
+    def is_ignored(self, path: str, is_dir: bool = False) -> bool:
+        """Check if a path relative to the source root should be ignored.
+
+        Args:
+            path: Relative path (``/`` or OS separators)
+            is_dir: Whether path is a directory
+
+        Returns:
+            True if the last matching pattern excludes the path
+        """
+        if os.sep != "/":
+            path = path.replace(os.sep, "/")
+        if path.startswith("./"):
+            path = path[2:]
+
+        for negated, file_regex, dir_regex in reversed(self._groups):
+            if (dir_regex if is_dir else file_regex).fullmatch(path):
+                return not negated
+        return False
+
+
+@functools.lru_cache(maxsize=32)
+def get_ignore_matcher(patterns: Tuple[str, ...], match_nested_files: bool = False) -> IgnoreMatcher:
+    """Get a cached compiled matcher for a tuple of patterns.
+
+    Args:
+        patterns: Ignore patterns in order
+        match_nested_files: Whether slash-free patterns also match components of file paths
+
+    Returns:
+        Compiled matcher
+    """
+    return IgnoreMatcher(patterns, match_nested_files)
@@ -1,7 +1,8 @@
 """Code zip packaging with smart dependency caching for Lambda-style deployments."""
 
-import fnmatch
+import contextlib
 import hashlib
+import json
 import logging
 import os
 import re
@@ -9,16 +10,33 @@ import shutil
 import subprocess  # nosec B404 - subprocess is required for pip/uv package installation
 import tempfile
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Set, Tuple
 
 import boto3
 
+from .ignore import get_ignore_matcher
+from .zip_writer import CompressedEntry, ParallelZipWriter, copy_raw_entries, read_raw_entry
+
 log = logging.getLogger(__name__)
 
 
+CODE_MANIFEST_VERSION = 1
+
+# Compression tuning (e.g. AGENTCORE_PACKAGE_COMPRESS_LEVEL=1 for fast dev deploys)
+DEFAULT_PACKAGE_WORKERS = int(os.getenv("AGENTCORE_PACKAGE_WORKERS", "0"))  # 0 = one per CPU
+DEFAULT_PACKAGE_COMPRESS_LEVEL = int(os.getenv("AGENTCORE_PACKAGE_COMPRESS_LEVEL", "6"))
+
+# Linux ARM64 platforms tried in order of preference when cross-compiling for AgentCore Runtime
+ARM64_PLATFORMS = ["aarch64-manylinux2014", "aarch64-manylinux_2_17", "aarch64-manylinux_2_28"]
+
+# Pinned requirement line as emitted by `uv pip compile` (name[extras]==version ; markers)
+_PINNED_REQUIREMENT_RE = re.compile(r"^([A-Za-z0-9][A-Za-z0-9._-]*)(?:\[[^\]]*\])?\s*==\s*([^\s;]+)\s*(?:;.*)?$")
+
+
 class PackageCache:
-    """Minimal cache for dependencies only."""
+    """Minimal cache for dependencies and the incremental code.zip."""
 
     def __init__(self, cache_dir: Path):
         """Initialize package cache.
@@ -39,6 +57,53 @@ class PackageCache:
         """Path to hash file for dependencies."""
         return self.cache_dir / "dependencies.hash"
 
+    @property
+    def code_zip(self) -> Path:
+        """Path to the code.zip from the previous build (source of reusable compressed entries)."""
+        return self.cache_dir / "code.zip"
+
+    @property
+    def code_manifest(self) -> Path:
+        """Path to the per-file manifest describing entries in the cached code.zip."""
+        return self.cache_dir / "code.manifest.json"
+
+    @property
+    def artifacts(self) -> List[Path]:
+        """All files this cache writes (excluded from code.zip when the cache lives in the source tree)."""
+        return [self.dependencies_zip, self.dependencies_hash, self.code_zip, self.code_manifest]
+
+    def load_code_manifest(self) -> Dict[str, Dict[str, Any]]:
+        """Load the code.zip manifest from the previous build.
+
+        Returns:
+            Mapping of archive name to entry metadata (size, mtime_ns, sha256, offset,
+            compress_size, compress_type, crc). Empty if there is no usable cache.
+        """
+        if not self.code_manifest.exists() or not self.code_zip.exists():
+            return {}
+
+        try:
+            data = json.loads(self.code_manifest.read_text())
+        except (OSError, ValueError) as e:
+            log.debug("Ignoring unreadable code manifest: %s", e)
+            return {}
+
+        if not isinstance(data, dict) or data.get("version") != CODE_MANIFEST_VERSION:
+            return {}
+
+        entries = data.get("entries")
+        return entries if isinstance(entries, dict) else {}
+
+    def save_code_manifest(self, code_zip: Path, entries: Dict[str, Dict[str, Any]]) -> None:
+        """Persist code.zip and its manifest for the next incremental build.
+
+        Args:
+            code_zip: Freshly built code.zip whose entry offsets are described by ``entries``
+            entries: Mapping of archive name to entry metadata
+        """
+        shutil.copyfile(code_zip, self.code_zip)
+        self.code_manifest.write_text(json.dumps({"version": CODE_MANIFEST_VERSION, "entries": entries}))
+
     def should_rebuild_dependencies(
         self,
         requirements_file: Path,
@@ -147,9 +212,74 @@ class PackageCache:
         return combined_hash
 
 
+class SharedPackageCache:
+    """Per-package cache of installed dependencies, shared by all agents in a project.
+
+    Each pinned distribution is installed once per (name, version, platform, Python
+    version) and stored as a zip fragment of its installed files. dependencies.zip is
+    then assembled by raw-copying fragments, so a version bump only installs the
+    packages that changed.
+    """
+
+    def __init__(self, cache_dir: Path):
+        """Initialize shared package cache.
+
+        Args:
+            cache_dir: Directory holding package fragments (e.g., .bedrock_agentcore/.package_cache/)
+        """
+        self.cache_dir = cache_dir
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def fragment_key(name: str, version: str, platform: str, python_version: str) -> str:
+        """Build the cache key for an installed distribution.
+
+        Args:
+            name: Distribution name (normalized per PEP 503)
+            version: Pinned version
+            platform: Target platform (e.g., "aarch64-manylinux2014")
+            python_version: Target Python version (e.g., "3.11")
+
+        Returns:
+            Cache key, safe to use as a file name
+        """
+        return f"{name}-{version}-{platform}-py{python_version}".replace("/", "_")
+
+    def fragment_path(self, name: str, version: str, platform: str, python_version: str) -> Path:
+        """Path to the zip fragment for an installed distribution."""
+        return self.cache_dir / f"{self.fragment_key(name, version, platform, python_version)}.zip"
+
+    def store_fragment(self, fragment: Path, name: str, version: str, platform: str, python_version: str) -> Path:
+        """Move a freshly built fragment into the cache atomically.
+
+        Args:
+            fragment: Built fragment zip (moved, not copied)
+            name: Distribution name
+            version: Pinned version
+            platform: Target platform
+            python_version: Target Python version
+
+        Returns:
+            Path of the cached fragment
+        """
+        target = self.fragment_path(name, version, platform, python_version)
+        os.replace(fragment, target)
+        return target
+
+
 class CodeZipPackager:
     """Creates Lambda-style deployment packages with smart caching."""
 
+    def __init__(self, workers: Optional[int] = None, compress_level: Optional[int] = None):
+        """Initialize the packager.
+
+        Args:
+            workers: Number of threads used to deflate zip entries (defaults to one per CPU)
+            compress_level: zlib compression level 0-9 (lower is faster, larger output)
+        """
+        self.workers = workers or DEFAULT_PACKAGE_WORKERS or os.cpu_count() or 1
+        self.compress_level = DEFAULT_PACKAGE_COMPRESS_LEVEL if compress_level is None else compress_level
+
     def create_deployment_package(
         self,
         source_dir: Path,
@@ -158,6 +288,7 @@ class CodeZipPackager:
         runtime_version: str,
         requirements_file: Optional[Path] = None,
         force_rebuild_deps: bool = False,
+        shared_cache_dir: Optional[Path] = None,
     ) -> tuple[Path, bool]:
         """Create deployment.zip with smart dependency caching.
 
@@ -174,6 +305,8 @@ class CodeZipPackager:
             runtime_version: Python runtime version (e.g., "python3.10")
             requirements_file: Path to requirements.txt or pyproject.toml
             force_rebuild_deps: Force rebuild of dependencies even if cached
+            shared_cache_dir: Project-wide per-package cache; when set, dependencies.zip is
+                assembled from cached per-package fragments and only changed packages are installed
 
         Returns:
             Tuple of (deployment_zip_path, has_otel_distro)
@@ -194,7 +327,8 @@ class CodeZipPackager:
 
             if needs_rebuild:
                 log.info("Building dependencies (this may take a minute)...")
-                self._build_dependencies_zip(requirements_file, cache.dependencies_zip, runtime_version)
+                shared_cache = SharedPackageCache(shared_cache_dir) if shared_cache_dir else None
+                self._build_dependencies_zip(requirements_file, cache.dependencies_zip, runtime_version, shared_cache)
                 cache.save_dependencies_hash(
                     requirements_file, user_lock if user_lock.exists() else None, runtime_version
                 )
@@ -208,7 +342,7 @@ class CodeZipPackager:
             deployment_zip = temp_dir / "deployment.zip"
 
             log.info("Packaging source code...")
-            self._build_direct_code_deploy(source_dir, direct_code_deploy)
+            self._build_direct_code_deploy(source_dir, direct_code_deploy, cache)
 
             log.info("Creating deployment package...")
             self._merge_zips(cache.dependencies_zip if has_dependencies else None, direct_code_deploy, deployment_zip)
@@ -230,13 +364,25 @@ class CodeZipPackager:
             shutil.rmtree(temp_dir, ignore_errors=True)
             raise
 
-    def _build_dependencies_zip(self, requirements_file: Path, output_zip: Path, runtime_version: str) -> None:
+    def _build_dependencies_zip(
+        self,
+        requirements_file: Path,
+        output_zip: Path,
+        runtime_version: str,
+        shared_cache: Optional[SharedPackageCache] = None,
+    ) -> None:
         """Build dependencies.zip to cache (expensive operation).
 
+        With a shared cache, requirements are resolved to exact pins and dependencies.zip is
+        assembled from per-package fragments, installing only packages not already cached.
+        Requirements that cannot be pinned (e.g., VCS or path dependencies) fall back to a
+        single full install.
+
         Args:
             requirements_file: Source requirements file
             output_zip: Path to output dependencies.zip
             runtime_version: Python runtime version
+            shared_cache: Project-wide per-package cache
         """
         with tempfile.TemporaryDirectory() as temp_dir:
             package_dir = Path(temp_dir) / "package"
@@ -249,6 +395,17 @@ class CodeZipPackager:
             else:
                 resolved_reqs = requirements_file
 
+            if shared_cache:
+                python_version = self._normalize_python_version(runtime_version)
+                resolution = self._resolve_pinned_requirements(resolved_reqs, python_version, Path(temp_dir))
+                if resolution:
+                    platform, pins = resolution
+                    self._assemble_dependencies_zip(
+                        pins, platform, python_version, shared_cache, output_zip, Path(temp_dir)
+                    )
+                    return
+                log.info("Could not pin all requirements, installing dependencies without the package cache")
+
             # Install dependencies (uv only)
             cross_compile = self._should_cross_compile()
             self._install_dependencies(resolved_reqs, package_dir, runtime_version, cross_compile)
@@ -258,15 +415,192 @@ class CodeZipPackager:
 
             # Create zip (keep metadata for proper package resolution)
             log.info("Creating dependencies.zip...")
-            with zipfile.ZipFile(output_zip, "w", zipfile.ZIP_DEFLATED) as zipf:
+            self._zip_directory(package_dir, output_zip, self.workers)
+
+    def _zip_directory(self, package_dir: Path, output_zip: Path, workers: int) -> None:
+        """Zip an install directory in sorted order, skipping __pycache__.
+
+        Args:
+            package_dir: Directory of installed packages
+            output_zip: Path to output zip
+            workers: Number of compression threads
+        """
+        with zipfile.ZipFile(output_zip, "w", zipfile.ZIP_DEFLATED) as zipf:
+            with ParallelZipWriter(zipf, workers, self.compress_level) as writer:
                 for root, dirs, files in os.walk(package_dir):
                     # Filter out __pycache__ directories
                     dirs[:] = [d for d in dirs if d != "__pycache__"]
+                    dirs.sort()
 
-                    for file in files:
+                    for file in sorted(files):
                         file_path = Path(root) / file
-                        arcname = file_path.relative_to(package_dir)
-                        zipf.write(file_path, arcname)
+                        writer.add_file(file_path, str(file_path.relative_to(package_dir)))
+
+    def _resolve_pinned_requirements(
+        self, requirements_file: Path, python_version: str, output_dir: Path
+    ) -> Optional[Tuple[str, List[Tuple[str, str]]]]:
+        """Resolve requirements to exact (name, version) pins for the Runtime platform.
+
+        Args:
+            requirements_file: Path to requirements.txt
+            python_version: Target Python version (e.g., "3.11")
+            output_dir: Directory for the compiled requirements file
+
+        Returns:
+            Tuple of (platform, pins) with pins sorted by name, or None if uv is missing,
+            resolution fails for every platform, or a requirement cannot be pinned
+        """
+        if not shutil.which("uv"):
+            return None
+
+        output_file = output_dir / "pinned-requirements.txt"
+        for platform in ARM64_PLATFORMS:
+            cmd = [
+                "uv",
+                "pip",
+                "compile",
+                str(requirements_file),
+                "--python-version",
+                python_version,
+                "--python-platform",
+                platform,
+                "--only-binary",
+                ":all:",
+                "--no-header",
+                "--no-annotate",
+                "--quiet",
+                "--output-file",
+                str(output_file),
+            ]
+            try:
+                subprocess.run(cmd, check=True, capture_output=True, text=True)  # nosec B603 - using uv command
+            except subprocess.CalledProcessError as e:
+                log.debug("Could not resolve requirements for %s: %s", platform, e.stderr)
+                continue
+
+            pins = self._parse_pinned_requirements(output_file.read_text())
+            return (platform, pins) if pins is not None else None
+
+        return None
+
+    @staticmethod
+    def _parse_pinned_requirements(content: str) -> Optional[List[Tuple[str, str]]]:
+        """Parse compiled requirements into (normalized name, version) pins.
+
+        Args:
+            content: Output of ``uv pip compile``
+
+        Returns:
+            Pins sorted by name, or None if any requirement is not an exact ``name==version`` pin
+        """
+        pins = {}
+        for line in content.splitlines():
+            line = line.split(" #", 1)[0].strip()
+            if not line or line.startswith("#"):
+                continue
+            match = _PINNED_REQUIREMENT_RE.match(line)
+            if not match:
+                log.debug("Requirement is not an exact pin: %s", line)
+                return None
+            name = re.sub(r"[-_.]+", "-", match.group(1)).lower()
+            pins[name] = match.group(2)
+        return sorted(pins.items())
+
+    def _assemble_dependencies_zip(
+        self,
+        pins: List[Tuple[str, str]],
+        platform: str,
+        python_version: str,
+        shared_cache: SharedPackageCache,
+        output_zip: Path,
+        work_dir: Path,
+    ) -> None:
+        """Install uncached pins into the shared cache and assemble dependencies.zip from fragments.
+
+        Args:
+            pins: (name, version) pins sorted by name
+            platform: Target platform
+            python_version: Target Python version
+            shared_cache: Project-wide per-package cache
+            output_zip: Path to output dependencies.zip
+            work_dir: Scratch directory for installs
+        """
+        missing = [
+            (name, version)
+            for name, version in pins
+            if not shared_cache.fragment_path(name, version, platform, python_version).exists()
+        ]
+        log.info(
+            "Dependencies: %d packages, %d cached, %d to install", len(pins), len(pins) - len(missing), len(missing)
+        )
+
+        def build_fragment(pin: Tuple[str, str]) -> None:
+            name, version = pin
+            key = shared_cache.fragment_key(name, version, platform, python_version)
+            package_dir = work_dir / "fragments" / key
+            package_dir.mkdir(parents=True)
+            self._install_package(name, version, package_dir, python_version, platform)
+            self._fix_shebangs_in_bin_dir(package_dir)
+            fragment = work_dir / "fragments" / f"{key}.zip"
+            self._zip_directory(package_dir, fragment, workers=1)
+            shared_cache.store_fragment(fragment, name, version, platform, python_version)
+
+        if missing:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                list(pool.map(build_fragment, missing))
+            log.info("✓ Installed %d packages with uv", len(missing))
+
+        log.info("Creating dependencies.zip...")
+        written: Set[str] = set()
+        with zipfile.ZipFile(output_zip, "w", zipfile.ZIP_DEFLATED) as out:
+            for name, version in pins:
+                fragment = shared_cache.fragment_path(name, version, platform, python_version)
+                written.update(copy_raw_entries(fragment, out, skip=written))
+
+    def _install_package(self, name: str, version: str, target_dir: Path, python_version: str, platform: str) -> None:
+        """Install a single pinned distribution (without dependencies) into a target directory.
+
+        Args:
+            name: Distribution name
+            version: Pinned version
+            target_dir: Target directory for installation
+            python_version: Target Python version
+            platform: Target platform
+
+        Raises:
+            RuntimeError: If installation fails
+        """
+        cmd = [
+            "uv",
+            "pip",
+            "install",
+            "--target",
+            str(target_dir),
+            "--python-version",
+            python_version,
+            "--python-platform",
+            platform,
+            "--only-binary",
+            ":all:",
+            "--no-deps",
+            f"{name}=={version}",
+        ]
+        try:
+            subprocess.run(cmd, check=True, capture_output=True, text=True)  # nosec B603 - using uv command
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(f"Failed to install {name}=={version} with uv: {e.stderr}") from e
+
+    @staticmethod
+    def _normalize_python_version(runtime_version: str) -> str:
+        """Normalize a runtime version to X.Y format.
+
+        Args:
+            runtime_version: "PYTHON_3_10" or "python3.10"
+
+        Returns:
+            Python version such as "3.10"
+        """
+        return runtime_version.upper().replace("PYTHON", "").replace("_", ".").strip("_. ")
 
     def _check_otel_distro(self, requirements_file: Optional[Path]) -> bool:
         """Check if aws-opentelemetry-distro is in requirements.
@@ -400,12 +734,11 @@ class CodeZipPackager:
             )
 
         # Normalize python version to X.Y format (e.g., "3.10")
-        # Input: "PYTHON_3_10" or "python3.10" → Output: "3.10"
-        python_version = runtime_version.upper().replace("PYTHON", "").replace("_", ".").strip("_. ")
+        python_version = self._normalize_python_version(runtime_version)
 
         if cross_compile:
             # Try multiple platforms in order of preference for better compatibility
-            platforms = ["aarch64-manylinux2014", "aarch64-manylinux_2_17", "aarch64-manylinux_2_28"]
+            platforms = ARM64_PLATFORMS
 
             for i, platform in enumerate(platforms):
                 cmd = self._build_uv_command(requirements_file, target_dir, python_version, platform)
@@ -484,60 +817,170 @@ class CodeZipPackager:
         log.info("Building dependencies for Linux ARM64 Runtime (manylinux2014_aarch64)")
         return True
 
-    def _build_direct_code_deploy(self, source_dir: Path, output_zip: Path) -> None:
+    def _build_direct_code_deploy(
+        self, source_dir: Path, output_zip: Path, cache: Optional[PackageCache] = None
+    ) -> None:
         """Build code.zip with source files (respects ignore patterns).
 
+        When a cache is given, files whose size and mtime (or, failing that, content hash)
+        match the manifest from the previous build are copied from the cached code.zip as
+        already-compressed bytes; only new or modified files are recompressed.
+
         Args:
             source_dir: Source directory
             output_zip: Path to output code.zip
+            cache: Package cache holding the previous code.zip and its manifest
         """
-        ignore_patterns = self._get_ignore_patterns()
+        previous = cache.load_code_manifest() if cache else {}
+        manifest: Dict[str, Dict[str, Any]] = {}
+        stats: Dict[str, os.stat_result] = {}
+        reused = 0
+
+        def record(entry: CompressedEntry) -> None:
+            name = entry.zinfo.filename
+            manifest[name] = self._manifest_entry(entry.zinfo, stats.pop(name), entry.sha256)
+
+        with contextlib.ExitStack() as stack:
+            cached_zip = stack.enter_context(open(cache.code_zip, "rb")) if cache and previous else None
+            zipf = stack.enter_context(zipfile.ZipFile(output_zip, "w", zipfile.ZIP_DEFLATED))
+            writer = stack.enter_context(ParallelZipWriter(zipf, self.workers, self.compress_level, on_write=record))
+
+            excluded = {p.resolve() for p in cache.artifacts} if cache else set()
+            for file_path, file_rel in self._iter_source_files(source_dir):
+                if excluded and file_path.resolve() in excluded:
+                    continue
 
-        with zipfile.ZipFile(output_zip, "w", zipfile.ZIP_DEFLATED) as zipf:
-            for root, dirs, files in os.walk(source_dir):
-                rel_root = os.path.relpath(root, source_dir)
-                if rel_root == ".":
-                    rel_root = ""
-
-                # Filter directories
-                dirs[:] = [
-                    d
-                    for d in dirs
-                    if not self._should_ignore(os.path.join(rel_root, d) if rel_root else d, ignore_patterns, True)
-                ]
+                zinfo = zipfile.ZipInfo.from_file(file_path, file_rel)
+                stat = file_path.stat()
+                stats[zinfo.filename] = stat
+
+                entry = previous.get(zinfo.filename)
+                cached = self._read_cached_entry(zinfo, file_path, stat, entry, cached_zip) if entry else None
+
+                if cached:
+                    writer.add_raw(cached.zinfo, cached.raw, cached.sha256)
+                    reused += 1
+                else:
+                    writer.add_file(file_path, file_rel)
 
-                # Add files
-                for file in files:
-                    file_rel = os.path.join(rel_root, file) if rel_root else file
+        if cache:
+            cache.save_code_manifest(output_zip, manifest)
+            log.debug("Reused %d of %d compressed source entries from cache", reused, len(manifest))
 
-                    if self._should_ignore(file_rel, ignore_patterns, False):
-                        continue
+    def _iter_source_files(self, source_dir: Path) -> Iterator[Tuple[Path, str]]:
+        """Walk the source tree, yielding files that are not excluded by ignore patterns.
 
-                    zipf.write(Path(root) / file, file_rel)
+        Args:
+            source_dir: Source directory
+
+        Yields:
+            Tuples of (absolute file path, path relative to source_dir)
+        """
+        matcher = get_ignore_matcher(tuple(self._get_ignore_patterns()))
+
+        for root, dirs, files in os.walk(source_dir):
+            rel_root = os.path.relpath(root, source_dir)
+            if rel_root == ".":
+                rel_root = ""
+
+            # Filter directories
+            dirs[:] = [d for d in dirs if not matcher.is_ignored(os.path.join(rel_root, d) if rel_root else d, True)]
+
+            for file in files:
+                file_rel = os.path.join(rel_root, file) if rel_root else file
+
+                if matcher.is_ignored(file_rel, False):
+                    continue
+
+                yield Path(root) / file, file_rel
+
+    @staticmethod
+    def _read_cached_entry(
+        zinfo: zipfile.ZipInfo,
+        file_path: Path,
+        stat: os.stat_result,
+        entry: Dict[str, Any],
+        cached_zip: Optional[BinaryIO],
+    ) -> Optional[CompressedEntry]:
+        """Fetch a file's compressed bytes from the cached code.zip if it is unchanged.
+
+        A matching size and mtime is trusted as unchanged; otherwise a matching size is
+        confirmed by comparing content hashes before the cached bytes are reused.
+
+        Args:
+            zinfo: Entry metadata for the file (from ``ZipInfo.from_file``); updated in place
+            file_path: Source file
+            stat: Stat result of the source file
+            entry: Manifest record from the previous build
+            cached_zip: Open handle to the cached code.zip
+
+        Returns:
+            The reusable compressed entry, or None if the file must be recompressed
+        """
+        if cached_zip is None or entry["size"] != stat.st_size:
+            return None
+
+        if entry["mtime_ns"] == stat.st_mtime_ns:
+            digest = str(entry["sha256"])
+        else:
+            digest = PackageCache._compute_file_hash(file_path)
+            if digest != entry["sha256"]:
+                return None
+
+        try:
+            raw = read_raw_entry(cached_zip, entry["offset"], entry["compress_size"], zinfo.filename)
+        except zipfile.BadZipFile as e:
+            log.debug("Cached entry unusable, recompressing %s: %s", zinfo.filename, e)
+            return None
+
+        zinfo.compress_type = entry["compress_type"]
+        zinfo.CRC = entry["crc"]
+        zinfo.file_size = stat.st_size
+        return CompressedEntry(zinfo, raw, digest)
+
+    @staticmethod
+    def _manifest_entry(zinfo: zipfile.ZipInfo, stat: os.stat_result, digest: str) -> Dict[str, Any]:
+        """Build the code.zip manifest record for a written entry.
+
+        Args:
+            zinfo: Entry metadata after it has been written to the archive
+            stat: Stat result of the source file
+            digest: SHA256 hex digest of the file contents
+
+        Returns:
+            Manifest record for the entry
+        """
+        return {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": digest,
+            "offset": zinfo.header_offset,
+            "compress_size": zinfo.compress_size,
+            "compress_type": zinfo.compress_type,
+            "crc": zinfo.CRC,
+        }
 
     def _merge_zips(self, dependencies_zip: Optional[Path], direct_code_deploy: Path, output_zip: Path) -> None:
         """Merge dependencies and code layers into deployment.zip.
 
+        Entries are copied as already-compressed bytes (local headers are re-emitted,
+        payloads are not inflated or re-deflated), so the merge is bound by I/O.
+
         Args:
             dependencies_zip: Path to dependencies.zip (optional)
             direct_code_deploy: Path to code.zip
             output_zip: Path to output deployment.zip
         """
+        with zipfile.ZipFile(direct_code_deploy, "r") as code:
+            code_names = set(code.namelist())
+
         with zipfile.ZipFile(output_zip, "w", zipfile.ZIP_DEFLATED) as out:
-            # Layer 1: Dependencies
+            # Layer 1: Dependencies (skip conflicts - user code takes precedence)
             if dependencies_zip and dependencies_zip.exists():
-                with zipfile.ZipFile(dependencies_zip, "r") as dep:
-                    for item in dep.namelist():
-                        # Preserve original permissions for dependencies
-                        original_info = dep.getinfo(item)
-                        out.writestr(original_info, dep.read(item))
-
-            # Layer 2: Code (overwrites conflicts - user code takes precedence)
-            with zipfile.ZipFile(direct_code_deploy, "r") as code:
-                for item in code.namelist():
-                    # Preserve original permissions
-                    original_info = code.getinfo(item)
-                    out.writestr(original_info, code.read(item))
+                copy_raw_entries(dependencies_zip, out, skip=code_names)
+
+            # Layer 2: Code
+            copy_raw_entries(direct_code_deploy, out)
 
     def _get_ignore_patterns(self) -> List[str]:
         """Get ignore patterns from dockerignore.template (matches CodeBuild logic).
@@ -589,22 +1032,7 @@ class CodeZipPackager:
         Returns:
             True if path should be ignored
         """
-        # Normalize path
-        if path.startswith("./"):
-            path = path[2:]
-
-        should_ignore = False
-
-        for pattern in patterns:
-            # Handle negation patterns
-            if pattern.startswith("!"):
-                if self._matches_pattern(path, pattern[1:], is_dir):
-                    should_ignore = False
-            else:
-                if self._matches_pattern(path, pattern, is_dir):
-                    should_ignore = True
-
-        return should_ignore
+        return get_ignore_matcher(tuple(patterns)).is_ignored(path, is_dir)
 
     def _matches_pattern(self, path: str, pattern: str, is_dir: bool) -> bool:
         """Check if path matches a dockerignore pattern.
@@ -617,29 +1045,13 @@ class CodeZipPackager:
         Returns:
             True if path matches pattern
         """
-        # Directory-specific patterns
-        if pattern.endswith("/"):
-            if not is_dir:
-                return False
-            pattern = pattern[:-1]
-
-        # Exact match
-        if path == pattern:
-            return True
-
-        # Wildcard matching
-        if fnmatch.fnmatch(path, pattern):
-            return True
-
-        # Match directory prefix
-        if is_dir and pattern in path.split("/"):
-            return True
-
-        return False
+        return get_ignore_matcher((pattern,)).is_ignored(path, is_dir)
 
     def upload_to_s3(self, deployment_zip: Path, agent_name: str, session: boto3.Session, account_id: str) -> str:
         """Upload deployment.zip to S3 (reuses CodeBuild bucket infrastructure).
 
+        The upload is skipped when the stored object already has the same content digest.
+
         Args:
             deployment_zip: Path to deployment.zip
             agent_name: Name of the agent
@@ -650,6 +1062,7 @@ class CodeZipPackager:
             S3 location (s3://bucket/key)
         """
         from ...services.codebuild import CodeBuildService
+        from ...services.s3 import upload_file_if_changed
 
         codebuild = CodeBuildService(session)
 
@@ -659,6 +1072,6 @@ class CodeZipPackager:
         s3 = session.client("s3")
 
         log.info("Uploading to s3://%s/%s...", bucket, s3_key)
-        s3.upload_file(str(deployment_zip), bucket, s3_key, ExtraArgs={"ExpectedBucketOwner": account_id})
+        upload_file_if_changed(s3, deployment_zip, bucket, s3_key, account_id)
 
         return f"s3://{bucket}/{s3_key}"
@@ -0,0 +1,276 @@
+"""Low-level zip helpers for writing already-compressed entries.
+
+``zipfile`` has no public API for writing pre-compressed data, so these helpers
+write local file headers and raw payloads directly and register the entry with
+the ``ZipFile`` so its central directory is emitted normally on close. This lets
+entries be copied between archives without recompression, and lets deflate run
+on a worker pool while the archive itself is written sequentially.
+"""
+
+import collections
+import hashlib
+import os
+import struct
+import zipfile
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Deque, List, NamedTuple, Optional, Set
+
+# General purpose flag bit 3: sizes and CRC follow the data in a data descriptor
+_DATA_DESCRIPTOR_FLAG = 0x08
+# Extra field header ID for ZIP64 extended information
+_ZIP64_EXTRA_ID = 0x0001
+# Local file header layout (APPNOTE 4.3.7), mirroring zipfile's private constants
+_LOCAL_HEADER_STRUCT = "<4s2B4HL2L2H"
+_LOCAL_HEADER_SIZE = struct.calcsize(_LOCAL_HEADER_STRUCT)
+_LOCAL_HEADER_MAGIC = b"PK\003\004"
+
+
+def read_raw_entry(fp: BinaryIO, header_offset: int, compress_size: int, filename: str) -> bytes:
+    """Read the compressed payload of a zip entry without decompressing it.
+
+    Args:
+        fp: Binary file object of the source archive, opened for reading
+        header_offset: Offset of the entry's local file header
+        compress_size: Size of the compressed payload in bytes
+        filename: Expected entry name, used to validate the local header
+
+    Returns:
+        Compressed entry bytes exactly as stored in the archive
+
+    Raises:
+        zipfile.BadZipFile: If the local header is missing or names a different entry
+    """
+    fp.seek(header_offset)
+    header = fp.read(_LOCAL_HEADER_SIZE)
+    if len(header) != _LOCAL_HEADER_SIZE:
+        raise zipfile.BadZipFile(f"Truncated local header for {filename}")
+
+    fields = struct.unpack(_LOCAL_HEADER_STRUCT, header)
+    if fields[0] != _LOCAL_HEADER_MAGIC:
+        raise zipfile.BadZipFile(f"Bad local header magic for {filename}")
+
+    name_length, extra_length = fields[10], fields[11]
+    stored_name = fp.read(name_length)
+    flags = fields[3]
+    encoding = "utf-8" if flags & 0x800 else "cp437"
+    if stored_name.decode(encoding) != filename:
+        raise zipfile.BadZipFile(f"Local header name mismatch for {filename}")
+
+    fp.seek(extra_length, 1)
+    raw = fp.read(compress_size)
+    if len(raw) != compress_size:
+        raise zipfile.BadZipFile(f"Truncated payload for {filename}")
+    return raw
+
+
+def write_raw_entry(out: zipfile.ZipFile, zinfo: zipfile.ZipInfo, raw: bytes) -> None:
+    """Append an already-compressed entry to a zip opened for writing.
+
+    ``zinfo`` must carry the entry's ``CRC``, ``file_size``, ``compress_size`` and
+    ``compress_type`` matching ``raw``. Its ``header_offset`` is updated in place.
+
+    Args:
+        out: Destination ``ZipFile`` opened in ``"w"`` mode on a seekable file
+        zinfo: Entry metadata
+        raw: Compressed payload bytes
+    """
+    if out.fp is None:
+        raise ValueError("Attempt to write to a closed ZIP archive")
+
+    zinfo.flag_bits &= ~_DATA_DESCRIPTOR_FLAG
+    zinfo.extra = _strip_zip64_extra(zinfo.extra)
+    zinfo.compress_size = len(raw)
+
+    out.fp.seek(out.start_dir)
+    zinfo.header_offset = out.fp.tell()
+    out._writecheck(zinfo)  # type: ignore[attr-defined]
+    out._didModify = True  # type: ignore[attr-defined]
+
+    out.fp.write(zinfo.FileHeader())
+    out.fp.write(raw)
+
+    out.filelist.append(zinfo)
+    out.NameToInfo[zinfo.filename] = zinfo
+    out.start_dir = out.fp.tell()
+
+
+def copy_entry_info(source: zipfile.ZipInfo) -> zipfile.ZipInfo:
+    """Create a fresh ``ZipInfo`` carrying the metadata needed to re-emit ``source``.
+
+    Args:
+        source: Entry metadata read from an existing archive
+
+    Returns:
+        New ``ZipInfo`` with timestamps, attributes, sizes and CRC copied over
+    """
+    zinfo = zipfile.ZipInfo(source.filename, source.date_time)
+    zinfo.compress_type = source.compress_type
+    zinfo.comment = source.comment
+    zinfo.extra = source.extra
+    zinfo.create_system = source.create_system
+    zinfo.create_version = source.create_version
+    zinfo.extract_version = source.extract_version
+    zinfo.flag_bits = source.flag_bits
+    zinfo.internal_attr = source.internal_attr
+    zinfo.external_attr = source.external_attr
+    zinfo.CRC = source.CRC
+    zinfo.file_size = source.file_size
+    zinfo.compress_size = source.compress_size
+    return zinfo
+
+
+def copy_raw_entries(source: Path, out: zipfile.ZipFile, skip: Optional[Set[str]] = None) -> List[str]:
+    """Copy every entry of ``source`` into ``out`` byte-for-byte, without recompressing.
+
+    Args:
+        source: Path to the archive to copy from
+        out: Destination ``ZipFile`` opened in ``"w"`` mode on a seekable file
+        skip: Entry names to leave out (e.g. names overridden by a later layer)
+
+    Returns:
+        Names of the entries copied
+    """
+    skip = skip or set()
+    copied = []
+    with zipfile.ZipFile(source, "r") as src, open(source, "rb") as fp:
+        for info in src.infolist():
+            if info.filename in skip:
+                continue
+            raw = read_raw_entry(fp, info.header_offset, info.compress_size, info.filename)
+            write_raw_entry(out, copy_entry_info(info), raw)
+            copied.append(info.filename)
+    return copied
+
+
+class CompressedEntry(NamedTuple):
+    """A zip entry whose payload has already been compressed."""
+
+    zinfo: zipfile.ZipInfo
+    raw: bytes
+    sha256: str
+
+
+def compress_file(path: Path, arcname: str, compress_level: int) -> CompressedEntry:
+    """Read and deflate a file into a ready-to-write zip entry.
+
+    Args:
+        path: File to compress
+        arcname: Name of the entry inside the archive
+        compress_level: zlib compression level (0-9, or -1 for the zlib default)
+
+    Returns:
+        Compressed entry with CRC, sizes and SHA256 of the uncompressed content
+    """
+    zinfo = zipfile.ZipInfo.from_file(path, arcname)
+    data = path.read_bytes()
+
+    compressor = zlib.compressobj(compress_level, zlib.DEFLATED, -15)
+    raw = compressor.compress(data) + compressor.flush()
+
+    zinfo.compress_type = zipfile.ZIP_DEFLATED
+    zinfo.file_size = len(data)
+    zinfo.CRC = zlib.crc32(data)
+    return CompressedEntry(zinfo, raw, hashlib.sha256(data).hexdigest())
+
+
+class ParallelZipWriter:
+    """Deflate zip entries on a thread pool and write them in submission order.
+
+    zlib and hashlib release the GIL on large buffers, so threads give real
+    multi-core compression without pickling file contents to worker processes.
+    Entries are written in exactly the order they were added, so output is
+    deterministic regardless of which worker finishes first. At most a few
+    entries per worker are held in memory at once.
+
+    Example:
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+            with ParallelZipWriter(zf, workers=8, compress_level=1) as writer:
+                writer.add_file(Path("agent.py"), "agent.py")
+    """
+
+    def __init__(
+        self,
+        out: zipfile.ZipFile,
+        workers: Optional[int] = None,
+        compress_level: int = zlib.Z_DEFAULT_COMPRESSION,
+        on_write: Optional[Callable[[CompressedEntry], None]] = None,
+    ):
+        """Initialize the writer.
+
+        Args:
+            out: Destination ``ZipFile`` opened in ``"w"`` mode on a seekable file
+            workers: Number of compression threads (defaults to the CPU count)
+            compress_level: zlib compression level (0-9, or -1 for the zlib default)
+            on_write: Optional callback invoked with each entry after it is written
+        """
+        self.out = out
+        self.workers = workers or os.cpu_count() or 1
+        self.compress_level = compress_level
+        self.on_write = on_write
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="agentcore-zip")
+        self._pending: Deque[Future] = collections.deque()
+        self._max_pending = self.workers * 4
+
+    def add_file(self, path: Path, arcname: str) -> None:
+        """Queue a file for compression and writing.
+
+        Args:
+            path: File to add
+            arcname: Name of the entry inside the archive
+        """
+        self._pending.append(self._executor.submit(compress_file, path, arcname, self.compress_level))
+        self._drain(self._max_pending)
+
+    def add_raw(self, zinfo: zipfile.ZipInfo, raw: bytes, sha256: str = "") -> None:
+        """Queue an already-compressed entry, keeping its position in the output order.
+
+        Args:
+            zinfo: Entry metadata with CRC, sizes and compression type matching ``raw``
+            raw: Compressed payload bytes
+            sha256: Optional digest of the uncompressed content, passed through to ``on_write``
+        """
+        future: Future = Future()
+        future.set_result(CompressedEntry(zinfo, raw, sha256))
+        self._pending.append(future)
+        self._drain(self._max_pending)
+
+    def close(self) -> None:
+        """Write all queued entries and shut down the worker pool."""
+        try:
+            self._drain(0)
+        finally:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self) -> "ParallelZipWriter":
+        """Enter context manager."""
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Flush queued entries on success; discard them on error."""
+        if exc_type is None:
+            self.close()
+        else:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def _drain(self, limit: int) -> None:
+        """Write completed entries from the head of the queue until at most ``limit`` remain."""
+        while len(self._pending) > limit:
+            entry = self._pending.popleft().result()
+            write_raw_entry(self.out, entry.zinfo, entry.raw)
+            if self.on_write:
+                self.on_write(entry)
+
+
+def _strip_zip64_extra(extra: bytes) -> bytes:
+    """Remove ZIP64 extended information records; ``FileHeader`` re-adds them as needed."""
+    result = bytearray()
+    i = 0
+    while i + 4 <= len(extra):
+        header_id, size = struct.unpack("<HH", extra[i : i + 4])
+        end = i + 4 + size
+        if header_id != _ZIP64_EXTRA_ID:
+            result += extra[i:end]
+        i = end
+    return bytes(result)
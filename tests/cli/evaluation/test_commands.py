@@ -3,6 +3,8 @@
 Tests all CLI commands with data-driven approach.
 """
 
+import json
+from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
@@ -13,6 +15,7 @@ from bedrock_agentcore_starter_toolkit.cli.evaluation.commands import (
     evaluation_app,
     evaluator_app,
 )
+from bedrock_agentcore_starter_toolkit.operations.evaluation.cache import EvaluationResultCache
 from bedrock_agentcore_starter_toolkit.operations.evaluation.models import (
     EvaluationResult,
     EvaluationResults,
@@ -149,6 +152,26 @@ class TestRunEvaluationCommand:
         assert result.exit_code == 0
         mock_processor.evaluate_session.assert_called_once()
 
+    @pytest.mark.parametrize("args,cached", [([], True), (["--no-result-cache"], False)])
+    @patch("bedrock_agentcore_starter_toolkit.cli.evaluation.commands.EvaluationProcessor")
+    def test_run_evaluation_result_cache(
+        self, mock_processor_class, runner, sample_evaluation_results, tmp_path, args, cached
+    ):
+        """Results are cached in the project unless --no-result-cache is given."""
+        mock_processor_class.return_value.evaluate_session.return_value = sample_evaluation_results
+
+        with patch("bedrock_agentcore_starter_toolkit.cli.evaluation.commands.Path.cwd", return_value=tmp_path):
+            result = runner.invoke(
+                evaluation_app, ["run", "--agent-id", "agent-123", "--session-id", "session-456", *args]
+            )
+
+        assert result.exit_code == 0
+        result_cache = mock_processor_class.call_args.kwargs["result_cache"]
+        if cached:
+            assert result_cache.path == tmp_path / ".bedrock_agentcore" / "evaluation_cache.sqlite3"
+        else:
+            assert result_cache is None
+
     @patch("bedrock_agentcore_starter_toolkit.cli.evaluation.commands.EvaluationProcessor")
     @patch("bedrock_agentcore_starter_toolkit.cli.evaluation.commands._get_agent_config_from_file")
     def test_run_evaluation_with_trace_id(
@@ -291,6 +314,201 @@ class TestRunEvaluationCommand:
 # =============================================================================
 
 
+class TestRunEvaluationFromFiles:
+    """Test 'agentcore eval run --file'."""
+
+    FIXTURES_DIR = Path(__file__).parents[2] / "operations" / "observability" / "fixtures"
+
+    @patch("bedrock_agentcore_starter_toolkit.cli.evaluation.commands.EvaluationProcessor")
+    @patch("bedrock_agentcore_starter_toolkit.cli.evaluation.commands._get_agent_config_from_file", return_value=None)
+    def test_evaluates_latest_session_in_files(
+        self, mock_get_config, mock_processor_class, runner, sample_evaluation_results
+    ):
+        """The session is read from the files; no agent or CloudWatch query is needed."""
+        mock_processor = mock_processor_class.return_value
+        mock_processor.evaluate_trace_data.return_value = sample_evaluation_results
+
+        result = runner.invoke(
+            evaluation_app,
+            [
+                "run",
+                "-f",
+                str(self.FIXTURES_DIR / "raw_otel_strands_bedrock_spans.json"),
+                "-f",
+                str(self.FIXTURES_DIR / "raw_otel_strands_bedrock_runtime_logs.json"),
+            ],
+        )
+
+        assert result.exit_code == 0, result.stdout
+        mock_processor.evaluate_session.assert_not_called()
+        trace_data = mock_processor.evaluate_trace_data.call_args.args[0]
+        assert trace_data.session_id == "cc8a8e69-8bed-4e5f-9a06-9a58550fd713"
+        assert len(trace_data.spans) == 50
+        assert trace_data.runtime_logs
+        assert mock_processor_class.call_args.args[2] is None
+
+    @patch("bedrock_agentcore_starter_toolkit.cli.evaluation.commands.EvaluationProcessor")
+    def test_unknown_session_in_files(self, mock_processor_class, runner):
+        """Asking for a session the files do not contain fails."""
+        result = runner.invoke(
+            evaluation_app,
+            ["run", "-f", str(self.FIXTURES_DIR / "raw_otel_strands_bedrock_spans.json"), "-s", "other"],
+        )
+
+        assert result.exit_code == 1
+        assert "No spans found for session other" in result.stdout
+        mock_processor_class.return_value.evaluate_trace_data.assert_not_called()
+
+
+class TestBatchEvaluationCommand:
+    """Test 'agentcore eval batch' command."""
+
+    @staticmethod
+    def evaluate_sessions(processor, session_ids, evaluators, *args, **kwargs):
+        for session_id in session_ids:
+            results = EvaluationResults(session_id=session_id)
+            results.add_result(
+                EvaluationResult(
+                    evaluator_id=evaluators[0],
+                    evaluator_name=evaluators[0],
+                    evaluator_arn="arn:test",
+                    explanation="ok",
+                    context={},
+                    value=1.0,
+                    error="boom" if session_id == "bad" else None,
+                )
+            )
+            yield results
+
+    @patch("bedrock_agentcore_starter_toolkit.cli.evaluation.commands.evaluate_sessions")
+    @patch("bedrock_agentcore_starter_toolkit.cli.evaluation.commands.EvaluationProcessor")
+    @patch(
+        "bedrock_agentcore_starter_toolkit.cli.evaluation.commands._get_agent_config_from_file",
+        return_value={"region": "us-west-2"},
+    )
+    def test_batch_last_sessions_and_resume(
+        self, mock_get_config, mock_processor_class, mock_evaluate_sessions, runner, tmp_path
+    ):
+        """The latest sessions are evaluated into JSONL, and --resume picks up the rest."""
+        mock_processor_class.return_value.get_latest_sessions.return_value = ["s1", "s2", "s3"]
+        output = tmp_path / "batch.jsonl"
+
+        # Interrupt after the first session
+        def interrupted(*args, **kwargs):
+            batch = self.evaluate_sessions(*args, **kwargs)
+            yield next(batch)
+            raise KeyboardInterrupt
+
+        mock_evaluate_sessions.side_effect = interrupted
+        result = runner.invoke(
+            evaluation_app, ["batch", "--agent-id", "agent-123", "--last", "3", "-e", "Custom.Eval", "-o", str(output)]
+        )
+
+        assert result.exit_code == 130
+        assert "--resume" in result.stdout
+        mock_processor_class.return_value.get_latest_sessions.assert_called_once_with(
+            "agent-123", "us-west-2", limit=3, days=7
+        )
+        assert [json.loads(line)["session_id"] for line in output.read_text().splitlines()] == ["s1"]
+
+        mock_evaluate_sessions.side_effect = self.evaluate_sessions
+        result = runner.invoke(evaluation_app, ["batch", "-o", str(output), "--resume"])
+
+        assert result.exit_code == 0, result.stdout
+        assert "1 of 3 sessions already evaluated" in result.stdout
+        args = mock_evaluate_sessions.call_args.args
+        assert args[1:5] == (["s2", "s3"], ["Custom.Eval"], "agent-123", "us-west-2")
+        assert [json.loads(line)["session_id"] for line in output.read_text().splitlines()] == ["s1", "s2", "s3"]
+
+    @patch("bedrock_agentcore_starter_toolkit.cli.evaluation.commands.evaluate_sessions")
+    @patch("bedrock_agentcore_starter_toolkit.cli.evaluation.commands.EvaluationProcessor")
+    @patch("bedrock_agentcore_starter_toolkit.cli.evaluation.commands._get_agent_config_from_file", return_value=None)
+    def test_batch_session_file_with_failures(
+        self, mock_get_config, mock_processor_class, mock_evaluate_sessions, runner, tmp_path
+    ):
+        """Sessions from -s and --sessions-file are combined, and failures set the exit code."""
+        mock_evaluate_sessions.side_effect = self.evaluate_sessions
+        sessions_file = tmp_path / "sessions.txt"
+        sessions_file.write_text("bad\ns2\n")
+
+        result = runner.invoke(
+            evaluation_app,
+            [
+                "batch",
+                "--agent-id",
+                "agent-123",
+                "-s",
+                "s1",
+                "--sessions-file",
+                str(sessions_file),
+                "-o",
+                str(tmp_path / "out.jsonl"),
+            ],
+        )
+
+        assert result.exit_code == 1
+        assert mock_evaluate_sessions.call_args.args[1] == ["s1", "bad", "s2"]
+        assert "1 session(s) had failed evaluations" in result.stdout
+
+    @pytest.mark.parametrize(
+        "args,message",
+        [
+            (["--resume", "--last", "2"], "cannot be combined"),
+            (["--resume"], "No batch checkpoint found"),
+            (["--last", "2", "-s", "s1"], "Use either --last or --session-id"),
+        ],
+    )
+    @patch("bedrock_agentcore_starter_toolkit.cli.evaluation.commands.EvaluationProcessor")
+    def test_batch_invalid_options(self, mock_processor_class, runner, tmp_path, args, message):
+        """Conflicting session options and missing checkpoints are reported."""
+        result = runner.invoke(
+            evaluation_app, ["batch", "--agent-id", "agent-123", "-o", str(tmp_path / "out.jsonl"), *args]
+        )
+
+        assert result.exit_code == 1
+        assert message in result.stdout
+
+    @patch("bedrock_agentcore_starter_toolkit.cli.evaluation.commands.EvaluationProcessor")
+    @patch("bedrock_agentcore_starter_toolkit.cli.evaluation.commands._get_agent_config_from_file", return_value=None)
+    def test_batch_empty_sessions_file(self, mock_get_config, mock_processor_class, runner, tmp_path):
+        """An empty session list prints guidance once and exits without a traceback."""
+        sessions_file = tmp_path / "empty.txt"
+        sessions_file.write_text("")
+
+        with patch("bedrock_agentcore_starter_toolkit.cli.evaluation.commands.logger") as mock_logger:
+            result = runner.invoke(
+                evaluation_app,
+                ["batch", "--agent-id", "a", "--sessions-file", str(sessions_file), "-o", str(tmp_path / "out.jsonl")],
+            )
+
+        assert result.exit_code == 1
+        assert "No sessions to evaluate" in result.stdout
+        assert "Error: 1" not in result.stdout
+        mock_logger.exception.assert_not_called()
+
+
+class TestClearCacheCommand:
+    """Test 'agentcore eval clear-cache' command."""
+
+    @pytest.fixture
+    def populated_cache(self, tmp_path):
+        cache = EvaluationResultCache.for_project(tmp_path)
+        for evaluator in ("Builtin.Helpfulness", "Builtin.Correctness"):
+            cache.put(cache.key(evaluator, evaluator, "digest"), evaluator, [{"evaluatorId": evaluator}])
+        cache.close()
+        return cache
+
+    @pytest.mark.parametrize("args,removed", [([], 2), (["-e", "Builtin.Helpfulness"], 1)])
+    def test_clear_cache(self, runner, tmp_path, populated_cache, args, removed):
+        """All cached results, or only those of the given evaluators, are removed."""
+        with patch("bedrock_agentcore_starter_toolkit.cli.evaluation.commands.Path.cwd", return_value=tmp_path):
+            result = runner.invoke(evaluation_app, ["clear-cache", *args])
+
+        assert result.exit_code == 0
+        assert f"Removed {removed} cached evaluation result(s)" in result.stdout
+        assert populated_cache.invalidate() == 2 - removed
+
+
 class TestListEvaluatorsCommand:
     """Test 'agentcore eval evaluator list' command."""
 
@@ -568,45 +568,19 @@ class TestCollectAllEvents:
     """Test _collect_all_events function."""
 
     def test_collect_events_basic(self):
-        """Test collecting events from actors and sessions."""
+        """Test collecting events crawled across actors and sessions."""
         from bedrock_agentcore_starter_toolkit.cli.memory.commands import _collect_all_events
 
         manager = MagicMock()
-        manager.list_actors.return_value = [{"actorId": "user1"}]
-        manager.list_sessions.return_value = [{"sessionId": "sess1"}]
-        manager.list_events.return_value = [{"eventId": "e1", "eventTimestamp": "2024-01-01T00:00:00Z"}]
+        manager.crawl_events.return_value = iter(
+            [{"eventId": "e1", "eventTimestamp": "2024-01-01T00:00:00Z", "_actorId": "user1", "_sessionId": "sess1"}]
+        )
 
         events = _collect_all_events(manager, "mem-123")
 
         assert len(events) == 1
         assert events[0]["_actorId"] == "user1"
-        assert events[0]["_sessionId"] == "sess1"
-
-    def test_collect_events_skips_missing_actor_id(self):
-        """Test that actors without actorId are skipped."""
-        from bedrock_agentcore_starter_toolkit.cli.memory.commands import _collect_all_events
-
-        manager = MagicMock()
-        manager.list_actors.return_value = [{"actorId": "user1"}, {}]  # Second actor has no actorId
-        manager.list_sessions.return_value = [{"sessionId": "sess1"}]
-        manager.list_events.return_value = [{"eventId": "e1"}]
-
-        events = _collect_all_events(manager, "mem-123")
-
-        assert len(events) == 1
-
-    def test_collect_events_skips_missing_session_id(self):
-        """Test that sessions without sessionId are skipped."""
-        from bedrock_agentcore_starter_toolkit.cli.memory.commands import _collect_all_events
-
-        manager = MagicMock()
-        manager.list_actors.return_value = [{"actorId": "user1"}]
-        manager.list_sessions.return_value = [{"sessionId": "sess1"}, {}]  # Second session has no sessionId
-        manager.list_events.return_value = [{"eventId": "e1"}]
-
-        events = _collect_all_events(manager, "mem-123")
-
-        assert len(events) == 1
+        manager.crawl_events.assert_called_once_with("mem-123")
 
 
 class TestCollectAllRecords:
@@ -625,103 +599,38 @@ class TestCollectAllRecords:
         assert records[0]["_namespace"] == "/test/"
 
     def test_collect_records_all_namespaces(self):
-        """Test collecting records from all namespaces."""
+        """Test crawling the namespaces of every strategy at once."""
         from bedrock_agentcore_starter_toolkit.cli.memory.commands import _collect_all_records
 
         manager = MagicMock()
-        manager.get_memory.return_value = {"strategies": [{"name": "Facts", "namespaces": ["/facts/"]}]}
-        manager.list_records.return_value = [{"memoryRecordId": "r1"}]
-        manager.list_actors.return_value = []
+        manager.get_memory.return_value = {
+            "strategies": [
+                {"name": "Facts", "namespaces": ["/facts/"]},
+                {"name": "Prefs", "namespaces": ["/users/{actorId}/preferences/"]},
+            ]
+        }
+        manager.crawl_records.return_value = iter([{"memoryRecordId": "r1", "_namespace": "/facts/"}])
 
         records = _collect_all_records(manager, "mem-123", None, 10)
 
         assert len(records) == 1
+        manager.crawl_records.assert_called_once_with("mem-123", ["/facts/", "/users/{actorId}/preferences/"], 10)
 
+    def test_crawl_error_keeps_collected_records(self):
+        """Test that records found before a failure are still returned."""
+        from bedrock_agentcore_starter_toolkit.cli.memory.commands import _collect_all_records
 
-class TestCollectRecordsFromNamespaceTemplate:
-    """Test _collect_records_from_namespace_template function."""
-
-    def test_static_namespace(self):
-        """Test collecting from static namespace."""
-        from bedrock_agentcore_starter_toolkit.cli.memory.commands import _collect_records_from_namespace_template
-
-        manager = MagicMock()
-        manager.list_records.return_value = [{"memoryRecordId": "r1"}]
-        all_records = []
-
-        _collect_records_from_namespace_template(manager, "mem-123", "/facts/", 10, all_records)
-
-        assert len(all_records) == 1
-
-    def test_actor_template(self):
-        """Test collecting from actor template namespace."""
-        from bedrock_agentcore_starter_toolkit.cli.memory.commands import _collect_records_from_namespace_template
-
-        manager = MagicMock()
-        manager.list_actors.return_value = [{"actorId": "user1"}]
-        manager.list_records.return_value = [{"memoryRecordId": "r1"}]
-        all_records = []
-
-        _collect_records_from_namespace_template(manager, "mem-123", "/users/{actorId}/facts/", 10, all_records)
-
-        assert len(all_records) == 1
-
-    def test_session_template(self):
-        """Test collecting from session template namespace."""
-        from bedrock_agentcore_starter_toolkit.cli.memory.commands import _collect_records_from_namespace_template
-
-        manager = MagicMock()
-        manager.list_actors.return_value = [{"actorId": "user1"}]
-        manager.list_sessions.return_value = [{"sessionId": "sess1"}]
-        manager.list_records.return_value = [{"memoryRecordId": "r1"}]
-        all_records = []
-
-        _collect_records_from_namespace_template(
-            manager, "mem-123", "/users/{actorId}/sessions/{sessionId}/", 10, all_records
-        )
-
-        assert len(all_records) == 1
-
-    def test_template_error_handling(self):
-        """Test error handling in template resolution."""
-        from bedrock_agentcore_starter_toolkit.cli.memory.commands import _collect_records_from_namespace_template
-
-        manager = MagicMock()
-        manager.list_actors.side_effect = Exception("API error")
-        all_records = []
-
-        _collect_records_from_namespace_template(manager, "mem-123", "/users/{actorId}/facts/", 10, all_records)
-
-        assert len(all_records) == 0
-
-
-class TestTryCollectRecords:
-    """Test _try_collect_records function."""
-
-    def test_successful_collection(self):
-        """Test successful record collection."""
-        from bedrock_agentcore_starter_toolkit.cli.memory.commands import _try_collect_records
-
-        manager = MagicMock()
-        manager.list_records.return_value = [{"memoryRecordId": "r1"}]
-        all_records = []
-
-        _try_collect_records(manager, "mem-123", "/test/", 10, all_records)
-
-        assert len(all_records) == 1
-        assert all_records[0]["_namespace"] == "/test/"
-
-    def test_error_handling(self):
-        """Test error handling in record collection."""
-        from bedrock_agentcore_starter_toolkit.cli.memory.commands import _try_collect_records
+        def crawl(*args):
+            yield {"memoryRecordId": "r1", "_namespace": "/facts/"}
+            raise Exception("API error")
 
         manager = MagicMock()
-        manager.list_records.side_effect = Exception("API error")
-        all_records = []
+        manager.get_memory.return_value = {"strategies": [{"namespaces": ["/facts/", "/users/{actorId}/"]}]}
+        manager.crawl_records.side_effect = crawl
 
-        _try_collect_records(manager, "mem-123", "/test/", 10, all_records)
+        records = _collect_all_records(manager, "mem-123", None, 10)
 
-        assert len(all_records) == 0
+        assert [r["memoryRecordId"] for r in records] == ["r1"]
 
 
 class TestResolveMemoryConfig:
@@ -1,11 +1,15 @@
 """Tests for observability CLI commands."""
 
+import json
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 from typer.testing import CliRunner
 
 from bedrock_agentcore_starter_toolkit.cli.observability.commands import observability_app
-from bedrock_agentcore_starter_toolkit.operations.observability.telemetry import Span
+from bedrock_agentcore_starter_toolkit.operations.observability.client import ObservabilityClient
+from bedrock_agentcore_starter_toolkit.operations.observability.tail import TailBatch
+from bedrock_agentcore_starter_toolkit.operations.observability.telemetry import LatencyStats, Span, TraceData
 
 runner = CliRunner()
 
@@ -52,8 +56,8 @@ class TestCreateObservabilityClient:
             agent_id="test-agent-123", agent=None, region="us-east-1", runtime_suffix="DEFAULT"
         )
 
-        # Verify client was created with ONLY region_name
-        mock_client_class.assert_called_once_with(region_name="us-east-1")
+        # Verify client was created with ONLY region_name (caching is opt-in)
+        mock_client_class.assert_called_once_with(region_name="us-east-1", cache=None)
 
 
 class TestObservabilityListCommand:
@@ -137,8 +141,7 @@ class TestShowCommand:
             duration_ms=1000,
             status_code="OK",
         )
-        mock_client.query_spans_by_trace.return_value = [test_span]
-        mock_client.query_runtime_logs_by_traces.return_value = []
+        mock_client.fetch_trace_telemetry.return_value = ([test_span], [])
 
         mock_client_class.return_value = mock_client
 
@@ -147,7 +150,7 @@ class TestShowCommand:
 
         # Verify success
         assert result.exit_code == 0
-        mock_client.query_spans_by_trace.assert_called_once()
+        mock_client.fetch_trace_telemetry.assert_called_once()
 
     @patch("bedrock_agentcore_starter_toolkit.cli.observability.commands.ObservabilityClient")
     @patch("bedrock_agentcore_starter_toolkit.cli.observability.commands._get_agent_config_from_file")
@@ -639,7 +642,7 @@ class TestShowCommandEmptyResults:
 
         mock_client = MagicMock()
         mock_client.region = "us-west-2"
-        mock_client.query_spans_by_trace.return_value = []  # No spans!
+        mock_client.fetch_trace_telemetry.return_value = ([], [])  # No spans!
 
         mock_client_class.return_value = mock_client
 
@@ -707,8 +710,7 @@ class TestShowCommandWithOutput:
             duration_ms=1000,
             status_code="OK",
         )
-        mock_client.query_spans_by_trace.return_value = [span]
-        mock_client.query_runtime_logs_by_traces.return_value = []
+        mock_client.fetch_trace_telemetry.return_value = ([span], [])
 
         mock_client_class.return_value = mock_client
 
@@ -741,8 +743,7 @@ class TestShowCommandWithOutput:
             duration_ms=1000,
             status_code="OK",
         )
-        mock_client.query_spans_by_trace.return_value = [span]
-        mock_client.query_runtime_logs_by_traces.return_value = []
+        mock_client.fetch_trace_telemetry.return_value = ([span], [])
 
         mock_client_class.return_value = mock_client
 
@@ -782,6 +783,10 @@ class TestShowCommandRuntimeLogErrors:
         mock_client.query_spans_by_trace.return_value = [span]
         # Runtime logs query raises exception
         mock_client.query_runtime_logs_by_traces.side_effect = Exception("Runtime logs error")
+        mock_client._runtime_logs_window.side_effect = lambda trace_ids, start, end: (start, end)
+        mock_client.fetch_trace_telemetry.side_effect = lambda *args, **kwargs: (
+            ObservabilityClient.fetch_trace_telemetry(mock_client, *args, **kwargs)
+        )
 
         mock_client_class.return_value = mock_client
 
@@ -944,3 +949,175 @@ class TestShowSessionErrorFiltering:
 
         # Should complete
         assert result.exit_code == 0
+
+
+class TestTailCommand:
+    """Test the 'tail' command."""
+
+    @staticmethod
+    def _trace(span):
+        trace_data = TraceData(spans=[span])
+        trace_data.traces = {span.trace_id: [span]}
+        return trace_data
+
+    @patch("bedrock_agentcore_starter_toolkit.cli.observability.commands.time.sleep", side_effect=KeyboardInterrupt)
+    @patch("bedrock_agentcore_starter_toolkit.cli.observability.commands.TraceTailer")
+    @patch("bedrock_agentcore_starter_toolkit.cli.observability.commands.ObservabilityClient")
+    def test_tail_renders_completed_traces_and_errors(self, mock_client_class, mock_tailer_class, mock_sleep):
+        """Failed spans are reported immediately and completed traces rendered."""
+        failed = Span(trace_id="t1", span_id="s1", span_name="InvokeModel", status_code="ERROR", status_message="boom")
+        ok = Span(trace_id="t2", span_id="s2", span_name="Healthy", status_code="OK")
+        mock_tailer = mock_tailer_class.return_value
+        mock_tailer.poll.return_value = TailBatch(spans=[failed], completed=[self._trace(failed)])
+        mock_tailer.flush.return_value = [self._trace(ok)]
+
+        result = runner.invoke(observability_app, ["tail", "--agent-id", "test-agent", "--errors"])
+
+        assert result.exit_code == 0
+        assert "ERROR" in result.stdout
+        assert "boom" in result.stdout
+        assert "rendered 1 traces" in result.stdout
+        kwargs = mock_tailer_class.call_args.kwargs
+        assert kwargs["agent_id"] == "test-agent"
+        assert kwargs["resume"] is False
+
+    @patch("bedrock_agentcore_starter_toolkit.cli.observability.commands.time.sleep", side_effect=KeyboardInterrupt)
+    @patch("bedrock_agentcore_starter_toolkit.cli.observability.commands.TraceTailer")
+    @patch("bedrock_agentcore_starter_toolkit.cli.observability.commands.ObservabilityClient")
+    def test_tail_resume(self, mock_client_class, mock_tailer_class, mock_sleep):
+        """--resume continues from the saved cursor."""
+        mock_tailer_class.return_value.poll.return_value = TailBatch()
+        mock_tailer_class.return_value.flush.return_value = []
+
+        result = runner.invoke(observability_app, ["tail", "--agent-id", "test-agent", "--resume"])
+
+        assert result.exit_code == 0
+        assert mock_tailer_class.call_args.kwargs["resume"] is True
+
+    @patch("bedrock_agentcore_starter_toolkit.cli.observability.commands.TraceTailer")
+    @patch("bedrock_agentcore_starter_toolkit.cli.observability.commands.ObservabilityClient")
+    def test_tail_poll_failure_exits(self, mock_client_class, mock_tailer_class):
+        """A CloudWatch error stops the tail with a non-zero exit code."""
+        mock_tailer_class.return_value.poll.side_effect = Exception("AccessDenied")
+
+        result = runner.invoke(observability_app, ["tail", "--agent-id", "test-agent"])
+
+        assert result.exit_code == 1
+        assert "AccessDenied" in result.stdout
+
+
+class TestStatsCommand:
+    """Test the 'stats' command."""
+
+    @patch("bedrock_agentcore_starter_toolkit.cli.observability.commands.ObservabilityClient")
+    def test_stats_renders_tables(self, mock_client_class):
+        """Each requested dimension gets a table."""
+        mock_client = mock_client_class.return_value
+        mock_client.query_latency_report.return_value = {
+            "tool": [LatencyStats(group="search_web", span_count=10, p50_ms=100, p90_ms=900, error_count=1)],
+        }
+
+        result = runner.invoke(observability_app, ["stats", "--agent-id", "test-agent", "--by", "tool"])
+
+        assert result.exit_code == 0
+        assert "Latency by Tool" in result.stdout
+        assert "search_web" in result.stdout
+        args = mock_client.query_latency_report.call_args.args
+        assert args[2:4] == ("test-agent", ("tool",))
+
+    @patch("bedrock_agentcore_starter_toolkit.cli.observability.commands.ObservabilityClient")
+    def test_stats_compare_queries_previous_period(self, mock_client_class, tmp_path):
+        """--compare aggregates the preceding window of the same length."""
+        mock_client = mock_client_class.return_value
+        mock_client.query_latency_report.side_effect = [
+            {"tool": [LatencyStats(group="search_web", span_count=10, p90_ms=1500)]},
+            {"tool": [LatencyStats(group="search_web", span_count=12, p90_ms=1000)]},
+        ]
+        output = tmp_path / "stats.json"
+
+        result = runner.invoke(
+            observability_app,
+            ["stats", "--agent-id", "test-agent", "--by", "tool", "--compare", "-o", str(output)],
+        )
+
+        assert result.exit_code == 0
+        assert "+50%" in result.stdout
+        current, previous = (call.args for call in mock_client.query_latency_report.call_args_list)
+        assert previous[1] == current[0]
+        assert previous[1] - previous[0] == current[1] - current[0]
+        exported = json.loads(output.read_text())
+        assert exported["stats"]["tool"][0]["p90_ms"] == 1500
+        assert exported["baseline"]["tool"][0]["p90_ms"] == 1000
+
+    @patch("bedrock_agentcore_starter_toolkit.cli.observability.commands.ObservabilityClient")
+    def test_stats_rejects_unknown_dimension(self, mock_client_class):
+        """Unknown --by values fail before any query runs."""
+        result = runner.invoke(observability_app, ["stats", "--agent-id", "test-agent", "--by", "region"])
+
+        assert result.exit_code == 1
+        assert "Unknown --by value" in result.stdout
+        mock_client_class.return_value.query_latency_report.assert_not_called()
+
+
+class TestLocalFiles:
+    """Test reading spans and runtime logs from files with --file."""
+
+    FIXTURES_DIR = Path(__file__).parents[2] / "operations" / "observability" / "fixtures"
+
+    def files_args(self):
+        return [
+            "-f",
+            str(self.FIXTURES_DIR / "raw_otel_strands_bedrock_spans.json"),
+            "-f",
+            str(self.FIXTURES_DIR / "raw_otel_strands_bedrock_runtime_logs.json"),
+        ]
+
+    @patch("bedrock_agentcore_starter_toolkit.cli.observability.commands.ObservabilityClient")
+    def test_show_latest_session_from_files(self, mock_client_class, tmp_path):
+        """No agent or CloudWatch access is needed, and the export can be re-opened."""
+        output = tmp_path / "trace.json"
+
+        result = runner.invoke(observability_app, ["show", *self.files_args(), "-o", str(output)])
+
+        assert result.exit_code == 0, result.stdout
+        assert "Using latest session: cc8a8e69-8bed-4e5f-9a06-9a58550fd713" in result.stdout
+        mock_client_class.assert_not_called()
+
+        reopened = runner.invoke(observability_app, ["show", "-f", str(output), "--all"])
+        assert reopened.exit_code == 0, reopened.stdout
+        assert "Found 1 traces" in reopened.stdout
+
+    @patch("bedrock_agentcore_starter_toolkit.cli.observability.commands.ObservabilityClient")
+    def test_list_from_files(self, mock_client_class):
+        """Traces of the session in the files are listed."""
+        result = runner.invoke(
+            observability_app, ["list", *self.files_args(), "-s", "cc8a8e69-8bed-4e5f-9a06-9a58550fd713"]
+        )
+
+        assert result.exit_code == 0, result.stdout
+        assert "Fetching traces from session" in result.stdout
+        mock_client_class.assert_not_called()
+
+    def test_show_tree_limits(self):
+        """--max-depth and --max-children are passed to the visualizer."""
+        with patch(
+            "bedrock_agentcore_starter_toolkit.cli.observability.commands.TraceVisualizer.visualize_all_traces"
+        ) as mock_visualize:
+            result = runner.invoke(
+                observability_app, ["show", *self.files_args(), "--all", "--max-depth", "2", "--max-children", "0"]
+            )
+
+        assert result.exit_code == 0, result.stdout
+        assert mock_visualize.call_args.kwargs["max_depth"] == 2
+        assert mock_visualize.call_args.kwargs["max_children"] == 0
+
+        collapsed = runner.invoke(observability_app, ["show", *self.files_args(), "--all", "--max-depth", "1"])
+        assert collapsed.exit_code == 0, collapsed.stdout
+        assert "nested deeper" in collapsed.stdout
+
+    def test_missing_file(self, tmp_path):
+        """A missing file is reported as an error."""
+        result = runner.invoke(observability_app, ["show", "-f", str(tmp_path / "missing.json")])
+
+        assert result.exit_code == 1
+        assert "not found" in result.stdout
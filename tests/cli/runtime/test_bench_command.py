@@ -0,0 +1,83 @@
+"""Tests for bench_command.py - Benchmark command."""
+
+import json
+from unittest.mock import patch
+
+from typer.testing import CliRunner
+
+from bedrock_agentcore_starter_toolkit.cli.cli import app
+from bedrock_agentcore_starter_toolkit.operations.runtime.bench import summarize_benchmark
+from bedrock_agentcore_starter_toolkit.services.async_runtime import InvokeMetrics
+
+runner = CliRunner()
+
+
+def _result(errors=0):
+    results = [
+        InvokeMetrics(index=i, session_id=str(i), status_code=200, ttfb=0.1, ttlb=0.5, events=4) for i in range(3)
+    ]
+    for metrics in results[:errors]:
+        metrics.error = "500 Internal Server Error: boom"
+    return summarize_benchmark(results, wall_time=1.0, target="dev", concurrency=2, started_at="t")
+
+
+class TestBenchCommand:
+    """Test the agentcore bench command."""
+
+    def test_dev_benchmark_writes_json(self, tmp_path, monkeypatch):
+        """Test a dev benchmark prints a summary and writes results."""
+        monkeypatch.chdir(tmp_path)
+        payload_file = tmp_path / "payloads.json"
+        payload_file.write_text('[{"prompt": "hi"}]')
+        output = tmp_path / "out.json"
+
+        with patch(
+            "bedrock_agentcore_starter_toolkit.cli.runtime.bench_command.run_benchmark", return_value=_result()
+        ) as mock_run:
+            result = runner.invoke(
+                app, ["bench", str(payload_file), "--dev", "--port", "9000", "-n", "3", "-c", "2", "-o", str(output)]
+            )
+
+        assert result.exit_code == 0, result.output
+        assert "TTFB (ms)" in result.output
+        assert json.loads(output.read_text())["requests"] == 3
+        args, kwargs = mock_run.call_args
+        assert args[1] == [{"prompt": "hi"}]
+        assert kwargs["target"] == "dev"
+        assert kwargs["port"] == 9000
+        assert kwargs["total_requests"] == 3
+        assert kwargs["concurrency"] == 2
+
+    def test_all_failed_exits_nonzero(self, tmp_path, monkeypatch):
+        """Test the command fails when every request fails."""
+        monkeypatch.chdir(tmp_path)
+        payload_file = tmp_path / "payloads.json"
+        payload_file.write_text("{}")
+
+        with patch(
+            "bedrock_agentcore_starter_toolkit.cli.runtime.bench_command.run_benchmark", return_value=_result(errors=3)
+        ):
+            result = runner.invoke(app, ["bench", str(payload_file), "--dev"])
+
+        assert result.exit_code == 1
+        assert "boom" in result.output
+
+    def test_cloud_requires_config(self, tmp_path, monkeypatch):
+        """Test cloud benchmarks need a project configuration."""
+        monkeypatch.chdir(tmp_path)
+        payload_file = tmp_path / "payloads.json"
+        payload_file.write_text("{}")
+
+        result = runner.invoke(app, ["bench", str(payload_file)])
+
+        assert result.exit_code == 1
+        assert "bedrock_agentcore.yaml" in result.output
+
+    def test_conflicting_targets(self, tmp_path):
+        """Test --local and --dev cannot be combined."""
+        payload_file = tmp_path / "payloads.json"
+        payload_file.write_text("{}")
+
+        result = runner.invoke(app, ["bench", str(payload_file), "--local", "--dev"])
+
+        assert result.exit_code == 1
@@ -245,6 +245,53 @@ class TestRun:
             client.run(agent_id="agent-456")
 
 
+class TestRunBatch:
+    """Test run_batch evaluation method."""
+
+    @staticmethod
+    def make_client():
+        client = Evaluation.__new__(Evaluation)
+        client.region = "us-west-2"
+        client.console = Mock()
+        client._processor = Mock()
+        client._processor.get_latest_sessions.return_value = ["s1", "s2"]
+        return client
+
+    @staticmethod
+    def evaluate_sessions(processor, session_ids, *args, **kwargs):
+        for session_id in session_ids:
+            yield EvaluationResults(session_id=session_id, input_data={"spans": []})
+
+    @patch("bedrock_agentcore_starter_toolkit.notebook.evaluation.client.evaluate_sessions")
+    def test_run_batch_last_sessions_with_output(self, mock_evaluate_sessions, tmp_path):
+        """The latest sessions are evaluated, saved, and can be resumed without re-running them."""
+        mock_evaluate_sessions.side_effect = self.evaluate_sessions
+        client = self.make_client()
+        output = str(tmp_path / "batch.jsonl")
+
+        results = client.run_batch(agent_id="agent-456", last=2, output=output)
+
+        assert [r.session_id for r in results] == ["s1", "s2"]
+        assert all(r.input_data is None for r in results)
+        client._processor.get_latest_sessions.assert_called_once_with("agent-456", "us-west-2", limit=2, days=7)
+
+        assert client.run_batch(agent_id="agent-456", output=output, resume=True) == []
+
+    @pytest.mark.parametrize(
+        "kwargs,error_match",
+        [
+            ({"agent_id": ""}, "agent_id is required"),
+            ({"agent_id": "agent-456", "resume": True}, "resume requires output"),
+            ({"agent_id": "agent-456", "session_ids": ["s1"], "last": 2}, "either session_ids or last"),
+            ({"agent_id": "agent-456"}, "No sessions to evaluate"),
+        ],
+    )
+    def test_run_batch_invalid_arguments(self, kwargs, error_match):
+        """Missing or conflicting arguments are rejected."""
+        with pytest.raises(ValueError, match=error_match):
+            self.make_client().run_batch(**kwargs)
+
+
 # =============================================================================
 # Evaluator Management Tests
 # =============================================================================
@@ -25,7 +25,7 @@ class TestObservabilityInit:
         assert obs.endpoint_name == "DEFAULT"
         assert obs.client == mock_client
         mock_create.assert_called_once_with(
-            agent=None, agent_id="test-agent", region="us-east-1", runtime_suffix="DEFAULT"
+            agent=None, agent_id="test-agent", region="us-east-1", runtime_suffix="DEFAULT", use_cache=True
         )
 
     @patch("bedrock_agentcore_starter_toolkit.cli.observability.commands._create_observability_client")
@@ -40,7 +40,9 @@ class TestObservabilityInit:
         assert obs.agent_id == "config-agent"
         assert obs.region == "us-west-2"
         assert obs.endpoint_name == "PROD"
-        mock_create.assert_called_once_with(agent="my-agent", agent_id=None, region=None, runtime_suffix="PROD")
+        mock_create.assert_called_once_with(
+            agent="my-agent", agent_id=None, region=None, runtime_suffix="PROD", use_cache=True
+        )
 
     @patch("bedrock_agentcore_starter_toolkit.cli.observability.commands._create_observability_client")
     def test_init_creates_visualizer(self, mock_create):
@@ -169,15 +171,14 @@ class TestObservabilityShow:
             duration_ms=1000,
             status_code="OK",
         )
-        mock_client.query_spans_by_trace.return_value = [span]
-        mock_client.query_runtime_logs_by_traces.return_value = []
+        mock_client.fetch_trace_telemetry.return_value = ([span], [])
 
         obs = Observability(agent_id="test-agent")
         result = obs.show(trace_id="trace-123")
 
         mock_show_trace.assert_called_once()
         assert isinstance(result, TraceData)
-        mock_client.query_spans_by_trace.assert_called_once()
+        mock_client.fetch_trace_telemetry.assert_called_once()
 
     @patch("bedrock_agentcore_starter_toolkit.cli.observability.commands._create_observability_client")
     @patch("bedrock_agentcore_starter_toolkit.cli.observability.commands._show_session_view")
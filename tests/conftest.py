@@ -140,6 +140,15 @@ def no_sleep(monkeypatch):
     monkeypatch.setattr(time, "sleep", lambda *_: None)
 
 
+@pytest.fixture(autouse=True)
+def reset_shared_invoke_clients():
+    """Drop HTTP invoke clients cached by a test so mocks do not leak into the next one."""
+    yield
+    from bedrock_agentcore_starter_toolkit.operations.runtime.invoke import close_shared_clients
+
+    close_shared_clients()
+
+
 @pytest.fixture
 def mock_container_runtime(monkeypatch):
     """Mock container runtime operations."""
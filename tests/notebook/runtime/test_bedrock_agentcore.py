@@ -416,6 +416,31 @@ bedrock_agentcore:
             )
             assert response == {"result": "success"}
 
+    def test_invoke_concurrently(self, tmp_path):
+        """Test concurrent invocation delegates to the operation."""
+        bedrock_agentcore = Runtime()
+
+        with pytest.raises(ValueError, match="Must configure and launch first"):
+            bedrock_agentcore.invoke_concurrently([{"test": "payload"}])
+
+        bedrock_agentcore._config_path = tmp_path / ".bedrock_agentcore.yaml"
+        with patch(
+            "bedrock_agentcore_starter_toolkit.notebook.runtime.bedrock_agentcore.invoke_bedrock_agentcore_concurrently"
+        ) as mock_invoke:
+            results = bedrock_agentcore.invoke_concurrently([{"m": 1}], max_concurrency=5, rate_limit=2.0)
+
+            assert results is mock_invoke.return_value
+            mock_invoke.assert_called_once_with(
+                config_path=bedrock_agentcore._config_path,
+                payloads=[{"m": 1}],
+                bearer_token=None,
+                local_mode=False,
+                user_id=None,
+                max_concurrency=5,
+                rate_limit=2.0,
+                capture_response=False,
+            )
+
     def test_invoke_with_bearer_token(self, tmp_path):
         """Test invocation with bearer token."""
         bedrock_agentcore = Runtime()
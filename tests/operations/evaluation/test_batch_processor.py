@@ -0,0 +1,229 @@
+"""Unit tests for batch evaluation across many sessions."""
+
+import json
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from bedrock_agentcore_starter_toolkit.operations.evaluation.batch_processor import (
+    BatchCheckpoint,
+    BatchEvaluationRun,
+    evaluate_sessions,
+    read_session_ids,
+)
+from bedrock_agentcore_starter_toolkit.operations.evaluation.models import EvaluationResult, EvaluationResults
+from bedrock_agentcore_starter_toolkit.operations.observability.telemetry import TraceData
+
+# Apply mock_boto3_clients fixture to prevent real AWS calls
+pytestmark = pytest.mark.usefixtures("mock_boto3_clients")
+
+
+def make_results(session_id, error=None):
+    results = EvaluationResults(session_id=session_id, input_data={"spans": [{"spanId": "span-1"}]})
+    results.add_result(
+        EvaluationResult(
+            evaluator_id="Builtin.Helpfulness",
+            evaluator_name="Helpfulness",
+            evaluator_arn="arn:test",
+            explanation="ok",
+            context={"spanContext": {"sessionId": session_id}},
+            value=None if error else 0.9,
+            error=error,
+        )
+    )
+    return results
+
+
+@pytest.fixture
+def processor():
+    """Processor whose fetch and evaluate calls are mocked."""
+    processor = MagicMock()
+    processor.observability_cache = None
+    processor.fetch_session_data.side_effect = lambda session_id, *args: TraceData(session_id=session_id)
+    processor.evaluate_trace_data.side_effect = lambda trace_data, *args, **kwargs: make_results(trace_data.session_id)
+    return processor
+
+
+@pytest.fixture(autouse=True)
+def mock_observability_client():
+    with patch(
+        "bedrock_agentcore_starter_toolkit.operations.evaluation.batch_processor.ObservabilityClient"
+    ) as mock_client_class:
+        yield mock_client_class
+
+
+class TestReadSessionIds:
+    """Test reading session lists."""
+
+    def test_skips_blanks_comments_and_duplicates(self, tmp_path):
+        """Only the first occurrence of each ID is kept, in file order."""
+        path = tmp_path / "sessions.txt"
+        path.write_text("# nightly\nsession-b\n\n  session-a  \nsession-b\n")
+
+        assert read_session_ids(path) == ["session-b", "session-a"]
+
+
+class TestBatchEvaluationRun:
+    """Test the JSONL output and checkpoint of a batch."""
+
+    def test_start_append_and_resume(self, tmp_path):
+        """Sessions with results in the output are skipped on resume."""
+        run = BatchEvaluationRun(tmp_path / "out.jsonl")
+        run.start(["s1", "s2", "s3"], ["Builtin.Helpfulness"], agent_id="agent-1")
+        run.append(make_results("s1"))
+
+        checkpoint, pending = BatchEvaluationRun(tmp_path / "out.jsonl").resume()
+
+        assert run.checkpoint_path == tmp_path / "out.jsonl.checkpoint.json"
+        assert checkpoint.evaluators == ["Builtin.Helpfulness"]
+        assert checkpoint.agent_id == "agent-1"
+        assert pending == ["s2", "s3"]
+
+        (line,) = run.output_path.read_text().splitlines()
+        record = json.loads(line)
+        assert record["session_id"] == "s1"
+        assert record["summary"]["successful"] == 1
+        assert "input_data" not in record
+
+    def test_resume_after_interrupted_write(self, tmp_path):
+        """A line cut short is ignored and later lines are still written separately."""
+        run = BatchEvaluationRun(tmp_path / "out.jsonl")
+        run.start(["s1", "s2"], ["Builtin.Helpfulness"])
+        run.append(make_results("s1"))
+        with open(run.output_path, "a") as f:
+            f.write('{"session_id": "s2", "summ')
+
+        _, pending = run.resume()
+        run.append(make_results("s2"))
+
+        assert pending == ["s2"]
+        assert run.completed_session_ids() == {"s1", "s2"}
+
+    def test_failed_sessions_are_retried_on_resume(self, tmp_path):
+        """A session whose every evaluator failed, e.g. a throttled fetch, is evaluated again."""
+        run = BatchEvaluationRun(tmp_path / "out.jsonl")
+        run.start(["s1", "s2", "s3"], ["Builtin.Helpfulness"])
+        run.append(make_results("s1", error="ThrottlingException"))
+        run.append(make_results("s2"))
+
+        _, pending = run.resume()
+
+        assert pending == ["s1", "s3"]
+
+        run.append(make_results("s1"))
+        assert run.completed_session_ids() == {"s1", "s2"}
+
+    def test_malformed_results_are_skipped(self, tmp_path):
+        """Lines whose results are not evaluator result objects do not abort a resume."""
+        run = BatchEvaluationRun(tmp_path / "out.jsonl")
+        run.start(["s1", "s2", "s3"], ["Builtin.Helpfulness"])
+        with open(run.output_path, "a") as f:
+            f.write(json.dumps({"session_id": "s1", "results": ["oops"]}) + "\n")
+            f.write(json.dumps({"session_id": "s2", "results": 3}) + "\n")
+        run.append(make_results("s3"))
+
+        _, pending = run.resume()
+
+        assert pending == ["s1", "s2"]
+
+    def test_start_replaces_previous_run(self, tmp_path):
+        """Starting again clears the output of the previous run."""
+        run = BatchEvaluationRun(tmp_path / "out.jsonl")
+        run.start(["s1"], ["Builtin.Helpfulness"])
+        run.append(make_results("s1"))
+
+        run.start(["s1"], ["Builtin.Helpfulness"])
+
+        assert run.completed_session_ids() == set()
+
+    def test_resume_without_checkpoint(self, tmp_path):
+        """Resuming a run that was never started fails."""
+        with pytest.raises(FileNotFoundError):
+            BatchEvaluationRun(tmp_path / "out.jsonl").resume()
+
+    def test_invalid_checkpoint(self, tmp_path):
+        """A damaged checkpoint is reported."""
+        path = tmp_path / "out.jsonl.checkpoint.json"
+        path.write_text('{"evaluators": []}')
+
+        with pytest.raises(ValueError, match="Invalid batch checkpoint"):
+            BatchCheckpoint.load(path)
+
+
+class TestEvaluateSessions:
+    """Test pipelined fetching and evaluation."""
+
+    def test_results_in_session_order(self, processor):
+        """Every session is evaluated once, and results keep the input order."""
+        session_ids = [f"s{i}" for i in range(7)]
+
+        results = list(
+            evaluate_sessions(processor, session_ids, ["Builtin.Helpfulness"], "agent-1", "us-west-2", prefetch=3)
+        )
+
+        assert [r.session_id for r in results] == session_ids
+        assert processor.fetch_session_data.call_count == 7
+        # All fetches share one observability client
+        clients = {call.args[4] for call in processor.fetch_session_data.call_args_list}
+        assert len(clients) == 1
+
+    def test_next_session_fetched_during_evaluation(self, processor):
+        """The next session is fetched while the current one is being evaluated."""
+        second_fetched = threading.Event()
+
+        def fetch(session_id, *args):
+            if session_id == "s2":
+                second_fetched.set()
+            return TraceData(session_id=session_id)
+
+        def evaluate(trace_data, *args, **kwargs):
+            if trace_data.session_id == "s1":
+                assert second_fetched.wait(timeout=5)
+            return make_results(trace_data.session_id)
+
+        processor.fetch_session_data.side_effect = fetch
+        processor.evaluate_trace_data.side_effect = evaluate
+
+        results = list(evaluate_sessions(processor, ["s1", "s2"], ["Builtin.Helpfulness"], "agent-1", "us-west-2"))
+
+        assert [r.session_id for r in results] == ["s1", "s2"]
+
+    def test_failed_session_does_not_stop_batch(self, processor):
+        """A session that cannot be fetched yields an error per evaluator."""
+
+        def fetch(session_id, *args):
+            if session_id == "s2":
+                raise RuntimeError("No spans found for session s2")
+            return TraceData(session_id=session_id)
+
+        processor.fetch_session_data.side_effect = fetch
+        evaluators = ["Builtin.Helpfulness", "Builtin.Correctness"]
+
+        results = list(evaluate_sessions(processor, ["s1", "s2", "s3"], evaluators, "agent-1", "us-west-2"))
+
+        assert [r.session_id for r in results] == ["s1", "s2", "s3"]
+        failed = results[1]
+        assert [r.evaluator_id for r in failed.results] == evaluators
+        assert all("No spans found" in r.error for r in failed.results)
+        assert not results[2].has_errors()
+
+    def test_stopping_early_fetches_no_further(self, processor):
+        """Closing the generator does not fetch beyond the prefetch window."""
+        session_ids = [f"s{i}" for i in range(20)]
+        batch = evaluate_sessions(processor, session_ids, ["Builtin.Helpfulness"], "agent-1", "us-west-2", prefetch=2)
+
+        next(batch)
+        batch.close()
+
+        assert processor.fetch_session_data.call_count <= 3
+
+    @pytest.mark.parametrize(
+        "evaluators,prefetch,error_match",
+        [([], 1, "evaluators must be a non-empty list"), (["Builtin.Helpfulness"], 0, "prefetch")],
+    )
+    def test_invalid_arguments(self, processor, evaluators, prefetch, error_match):
+        """Invalid evaluators or prefetch are rejected before anything is fetched."""
+        with pytest.raises(ValueError, match=error_match):
+            next(evaluate_sessions(processor, ["s1"], evaluators, "agent-1", "us-west-2", prefetch=prefetch))
+        processor.fetch_session_data.assert_not_called()
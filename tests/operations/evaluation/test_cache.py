@@ -0,0 +1,94 @@
+"""Tests for the local evaluation result cache."""
+
+import pytest
+
+from bedrock_agentcore_starter_toolkit.operations.evaluation.cache import EvaluationResultCache, evaluator_version
+
+SPANS = [{"spanId": "span-1", "traceId": "trace-1"}, {"spanId": "span-2", "traceId": "trace-1"}]
+RESULTS = [{"evaluatorId": "Builtin.Helpfulness", "value": 0.9, "explanation": "ok"}]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = EvaluationResultCache(tmp_path / "cache.sqlite3")
+    yield cache
+    cache.close()
+
+
+def _key(evaluator_id="Builtin.Helpfulness", spans=SPANS, target=None, reference_inputs=None, version=None):
+    spans_digest = EvaluationResultCache.digest_spans(spans)
+    return EvaluationResultCache.key(evaluator_id, version or evaluator_id, spans_digest, target, reference_inputs)
+
+
+class TestKeys:
+    """Test what goes into a cache key."""
+
+    def test_key_ignores_dict_order(self):
+        reordered = [{"traceId": "trace-1", "spanId": "span-1"}, {"traceId": "trace-1", "spanId": "span-2"}]
+        assert _key(spans=reordered) == _key()
+
+    @pytest.mark.parametrize(
+        "changes",
+        [
+            {"evaluator_id": "Builtin.Correctness"},
+            {"version": "v2"},
+            {"spans": SPANS[:1]},
+            {"spans": list(reversed(SPANS))},
+            {"target": {"traceIds": ["trace-1"]}},
+            {"reference_inputs": [{"assertions": [{"text": "is polite"}]}]},
+        ],
+    )
+    def test_any_input_changes_key(self, changes):
+        assert _key(**changes) != _key()
+
+    def test_evaluator_version_from_details(self):
+        details = {"evaluatorId": "custom-1", "level": "TRACE", "evaluatorConfig": {"llmAsAJudge": {}}}
+        edited = {**details, "evaluatorConfig": {"llmAsAJudge": {"instructions": "be strict"}}}
+
+        assert evaluator_version(details) == evaluator_version({**details, "ResponseMetadata": {"RequestId": "x"}})
+        assert evaluator_version(edited) != evaluator_version(details)
+        assert evaluator_version({"evaluatorId": "custom-1"}) is None
+
+    def test_summary_and_details_share_version(self):
+        """A list_evaluators summary and get_evaluator details of the same revision agree."""
+        summary = {"evaluatorId": "custom-1", "level": "TRACE", "updatedAt": "2024-01-01T00:00:00Z"}
+        details = {**summary, "evaluatorConfig": {"llmAsAJudge": {}}}
+
+        assert evaluator_version(summary) == evaluator_version(details)
+        assert evaluator_version({**summary, "updatedAt": "2024-02-01T00:00:00Z"}) != evaluator_version(summary)
+
+
+class TestStorage:
+    """Test storing and invalidating results."""
+
+    def test_miss_then_hit(self, cache):
+        key = _key()
+        assert cache.get(key) is None
+
+        cache.put(key, "Builtin.Helpfulness", RESULTS)
+
+        assert cache.get(key) == RESULTS
+
+    def test_persists_across_instances(self, cache):
+        cache.put(_key(), "Builtin.Helpfulness", RESULTS)
+        cache.close()
+
+        assert EvaluationResultCache(cache.path).get(_key()) == RESULTS
+
+    def test_invalidate_one_evaluator(self, cache):
+        cache.put(_key(), "Builtin.Helpfulness", RESULTS)
+        cache.put(_key("Builtin.Correctness"), "Builtin.Correctness", RESULTS)
+
+        assert cache.invalidate("Builtin.Helpfulness") == 1
+
+        assert cache.get(_key()) is None
+        assert cache.get(_key("Builtin.Correctness")) == RESULTS
+
+    def test_clear(self, cache):
+        cache.put(_key(), "Builtin.Helpfulness", RESULTS)
+        cache.clear()
+        assert cache.get(_key()) is None
+
+    def test_for_project_path(self, tmp_path):
+        cache = EvaluationResultCache.for_project(tmp_path)
+        assert cache.path == tmp_path / ".bedrock_agentcore" / "evaluation_cache.sqlite3"
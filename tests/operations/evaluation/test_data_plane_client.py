@@ -10,6 +10,7 @@ import pytest
 from botocore.exceptions import ClientError
 
 from bedrock_agentcore_starter_toolkit.operations.evaluation.data_plane_client import (
+    EVALUATE_MAX_ATTEMPTS,
     EvaluationDataPlaneClient,
 )
 
@@ -116,7 +117,7 @@ class TestInitialization:
 
         call_args = mock_boto3_client.call_args
         config = call_args.kwargs["config"]
-        assert config.retries["max_attempts"] == 3
+        assert config.retries["max_attempts"] == EVALUATE_MAX_ATTEMPTS
         assert config.retries["mode"] == "adaptive"
 
     @pytest.mark.parametrize(
@@ -0,0 +1,143 @@
+"""Tests for the evaluator metadata cache."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+from bedrock_agentcore_starter_toolkit.operations.evaluation.evaluator_metadata import (
+    EvaluatorMetadataCache,
+)
+
+
+def summary(evaluator_id, level="TRACE", updated_at="2024-01-01T00:00:00Z"):
+    return {"evaluatorId": evaluator_id, "level": level, "updatedAt": updated_at}
+
+
+@pytest.fixture
+def client():
+    client = MagicMock()
+    client.list_evaluators.return_value = {"evaluators": []}
+    client.get_evaluator.side_effect = lambda evaluator_id: summary(evaluator_id, level="SESSION")
+    return client
+
+
+class TestResolve:
+    """Test resolving evaluator levels and versions."""
+
+    def test_builtins_need_no_calls(self, client):
+        resolved = EvaluatorMetadataCache().resolve(
+            client, ["Builtin.Helpfulness", "Builtin.GoalSuccessRate", "Builtin.ToolSelectionAccuracy"]
+        )
+
+        assert {e: m.level for e, m in resolved.items()} == {
+            "Builtin.Helpfulness": "TRACE",
+            "Builtin.GoalSuccessRate": "SESSION",
+            "Builtin.ToolSelectionAccuracy": "TOOL_CALL",
+        }
+        client.list_evaluators.assert_not_called()
+        client.get_evaluator.assert_not_called()
+
+    def test_one_sweep_across_pages(self, client):
+        client.list_evaluators.side_effect = [
+            {"evaluators": [summary("custom-1")], "nextToken": "page-2"},
+            {"evaluators": [summary("custom-2", level="SESSION")]},
+        ]
+        cache = EvaluatorMetadataCache()
+
+        resolved = cache.resolve(client, ["custom-1", "custom-2"])
+        cache.resolve(client, ["custom-1", "custom-2"])
+
+        assert resolved["custom-2"].level == "SESSION"
+        assert resolved["custom-1"].version is not None
+        assert [c.kwargs["next_token"] for c in client.list_evaluators.call_args_list] == [None, "page-2"]
+        client.get_evaluator.assert_not_called()
+
+    def test_evaluators_missing_from_sweep_are_looked_up(self, client):
+        client.list_evaluators.return_value = {"evaluators": [summary("custom-1")]}
+
+        resolved = EvaluatorMetadataCache().resolve(client, ["custom-1", "custom-2", "custom-3"])
+
+        assert sorted(c.args[0] for c in client.get_evaluator.call_args_list) == ["custom-2", "custom-3"]
+        assert resolved["custom-3"].level == "SESSION"
+
+    def test_failed_sweep_falls_back_to_lookups(self, client):
+        client.list_evaluators.side_effect = ClientError({"Error": {"Code": "AccessDenied"}}, "ListEvaluators")
+
+        resolved = EvaluatorMetadataCache().resolve(client, ["custom-1"])
+
+        assert resolved["custom-1"].level == "SESSION"
+
+    def test_fetches_run_without_the_lock(self, client):
+        """Other threads can use the cache while a resolve waits on the service."""
+        cache = EvaluatorMetadataCache()
+        locked = []
+        client.list_evaluators.side_effect = lambda **_: locked.append(cache._lock.locked()) or {"evaluators": []}
+        client.get_evaluator.side_effect = lambda evaluator_id: (
+            locked.append(cache._lock.locked()) or summary(evaluator_id)
+        )
+
+        resolved = cache.resolve(client, ["custom-1"])
+
+        assert locked == [False, False]
+        assert resolved["custom-1"].level == "TRACE"
+
+    def test_unfetchable_evaluator_left_out(self, client):
+        client.get_evaluator.side_effect = RuntimeError("not found")
+
+        assert EvaluatorMetadataCache().resolve(client, ["custom-1"]) == {}
+
+
+class TestStaleness:
+    """Test TTL expiry, persistence and invalidation."""
+
+    def test_entries_expire(self, client):
+        client.list_evaluators.return_value = {"evaluators": [summary("custom-1")]}
+        cache = EvaluatorMetadataCache(ttl_seconds=60)
+
+        with patch("time.time", return_value=1000.0):
+            cache.resolve(client, ["custom-1"])
+        with patch("time.time", return_value=1030.0):
+            cache.resolve(client, ["custom-1"])
+        assert client.list_evaluators.call_count == 1
+
+        with patch("time.time", return_value=1061.0):
+            cache.resolve(client, ["custom-1"])
+        assert client.list_evaluators.call_count == 2
+
+    def test_persists_across_instances(self, client, tmp_path):
+        client.list_evaluators.return_value = {"evaluators": [summary("custom-1", level="SESSION")]}
+        EvaluatorMetadataCache.for_project(tmp_path, "us-east-1").resolve(client, ["custom-1"])
+        client.reset_mock()
+
+        resolved = EvaluatorMetadataCache.for_project(tmp_path, "us-east-1").resolve(client, ["custom-1"])
+
+        assert resolved["custom-1"].level == "SESSION"
+        client.list_evaluators.assert_not_called()
+        assert (tmp_path / ".bedrock_agentcore" / "evaluator_metadata.json").exists()
+
+    def test_regions_are_separate(self, client, tmp_path):
+        EvaluatorMetadataCache.for_project(tmp_path, "us-east-1").resolve(client, ["custom-1"])
+        client.reset_mock()
+
+        EvaluatorMetadataCache.for_project(tmp_path, "us-west-2").resolve(client, ["custom-1"])
+
+        client.get_evaluator.assert_called_once_with("custom-1")
+
+    def test_invalidate_one_evaluator(self, client, tmp_path):
+        cache = EvaluatorMetadataCache.for_project(tmp_path, "us-east-1")
+        cache.resolve(client, ["custom-1", "custom-2"])
+        client.reset_mock()
+
+        EvaluatorMetadataCache.for_project(tmp_path, "us-east-1").invalidate("custom-1")
+        EvaluatorMetadataCache.for_project(tmp_path, "us-east-1").resolve(client, ["custom-1", "custom-2"])
+
+        client.get_evaluator.assert_called_once_with("custom-1")
+
+    def test_unreadable_file_starts_empty(self, client, tmp_path):
+        path = tmp_path / "evaluator_metadata.json"
+        path.write_text("{not json")
+
+        resolved = EvaluatorMetadataCache(path).resolve(client, ["custom-1"])
+
+        assert resolved["custom-1"].level == "SESSION"
@@ -4,11 +4,15 @@ Tests all business logic in the evaluation processor with data-driven approach.
 This is the most critical module as it contains all evaluation orchestration logic.
 """
 
+import json
+import threading
+import time
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
 from bedrock_agentcore_starter_toolkit.operations.constants import InstrumentationScopes
+from bedrock_agentcore_starter_toolkit.operations.evaluation.cache import EvaluationResultCache
 from bedrock_agentcore_starter_toolkit.operations.evaluation.models import (
     EvaluationResult,
     EvaluationResults,
@@ -40,7 +44,9 @@ def mock_data_plane_client():
 @pytest.fixture
 def mock_control_plane_client():
     """Mock control plane client."""
-    return MagicMock()
+    client = MagicMock()
+    client.list_evaluators.return_value = {"evaluators": []}
+    return client
 
 
 @pytest.fixture
@@ -180,6 +186,31 @@ class TestGetLatestSession:
 
         assert result is None
 
+    @patch("bedrock_agentcore_starter_toolkit.operations.evaluation.on_demand_processor.ObservabilityClient")
+    def test_get_latest_sessions(self, mock_obs_client_class, processor):
+        """Test several recent sessions are fetched with the requested limit."""
+        mock_obs_instance = mock_obs_client_class.return_value
+        mock_obs_instance.get_latest_session_ids.return_value = ["session-2", "session-1"]
+
+        result = processor.get_latest_sessions("agent-456", "us-west-2", limit=2, days=3)
+
+        assert result == ["session-2", "session-1"]
+        call_kwargs = mock_obs_instance.get_latest_session_ids.call_args.kwargs
+        assert call_kwargs["limit"] == 2
+        assert call_kwargs["agent_id"] == "agent-456"
+        assert call_kwargs["end_time_ms"] - call_kwargs["start_time_ms"] == pytest.approx(3 * 86_400_000, abs=1000)
+
+    @patch("bedrock_agentcore_starter_toolkit.operations.evaluation.on_demand_processor.ObservabilityClient")
+    def test_get_latest_sessions_error(self, mock_obs_client_class, processor):
+        """Test query failures are raised as RuntimeError."""
+        from botocore.exceptions import ClientError
+
+        error_response = {"Error": {"Code": "ServiceError", "Message": "API error"}}
+        mock_obs_client_class.return_value.get_latest_session_ids.side_effect = ClientError(error_response, "query")
+
+        with pytest.raises(RuntimeError, match="Failed to fetch latest sessions"):
+            processor.get_latest_sessions("agent-456", "us-west-2", limit=2)
+
 
 # =============================================================================
 # Fetch Session Data Tests
@@ -211,8 +242,7 @@ class TestFetchSessionData:
         mock_spans = [Mock(spec=Span, trace_id="trace-123")]
         mock_logs = [Mock(spec=RuntimeLog, trace_id="trace-123")]
 
-        mock_obs_instance.query_spans_by_session.return_value = mock_spans
-        mock_obs_instance.query_runtime_logs_by_traces.return_value = mock_logs
+        mock_obs_instance.fetch_session_telemetry.return_value = (mock_spans, mock_logs)
 
         result = processor.fetch_session_data("session-123", "agent-456", "us-west-2")
 
@@ -227,7 +257,7 @@ class TestFetchSessionData:
         """Test error when no spans found."""
         mock_obs_instance = MagicMock()
         mock_obs_client_class.return_value = mock_obs_instance
-        mock_obs_instance.query_spans_by_session.return_value = []
+        mock_obs_instance.fetch_session_telemetry.return_value = ([], [])
 
         with pytest.raises(RuntimeError, match="No spans found"):
             processor.fetch_session_data("session-123", "agent-456", "us-west-2")
@@ -389,6 +419,33 @@ class TestTraceFiltering:
 
         assert len(result) == 5
 
+    def test_get_most_recent_spans_fills_byte_budget(self, processor):
+        """Spans are compacted and the most recent ones that fit in max_bytes are kept."""
+        spans = [
+            Span(
+                trace_id="trace-123",
+                span_id=f"span-{i}",
+                span_name=f"Span{i}",
+                start_time_unix_nano=1000000000 + i,
+                raw_message={
+                    "spanId": f"span-{i}",
+                    "startTimeUnixNano": 1000000000 + i,
+                    "flags": 768,
+                    "scope": {"name": InstrumentationScopes.STRANDS},
+                    "attributes": {"tool.result": "x" * 100_000},
+                },
+            )
+            for i in range(20)
+        ]
+        trace_data = TraceData(session_id="session-123", agent_id="agent-456", spans=spans, runtime_logs=[])
+
+        result = processor.get_most_recent_spans(trace_data, max_bytes=100_000)
+
+        assert [span["spanId"] for span in result] == [f"span-{i}" for i in range(19, 19 - len(result), -1)]
+        assert 1 < len(result) < 20
+        assert all("flags" not in span for span in result)
+        assert len(json.dumps(result, separators=(",", ":"))) <= 100_000
+
 
 # =============================================================================
 # Evaluator Execution Tests
@@ -611,6 +668,80 @@ class TestEvaluatorExecution:
         # No trace ID found, so expected_response can't be serialized — empty list
         assert call_args.kwargs["evaluation_reference_inputs"] == []
 
+    def test_execute_evaluators_runs_concurrently_in_order(self, mock_data_plane_client):
+        """Evaluators run at once, and results keep the order of the evaluators."""
+        evaluators = [f"Custom.Eval{i}" for i in range(6)]
+        started = threading.Barrier(3, timeout=5)
+
+        def evaluate(evaluator_id, **kwargs):
+            started.wait()
+            # Finish in the reverse order of submission within each group
+            time.sleep(0.01 * (5 - evaluators.index(evaluator_id)))
+            return {
+                "evaluationResults": [
+                    {
+                        "evaluatorId": evaluator_id,
+                        "evaluatorName": evaluator_id,
+                        "evaluatorArn": "arn",
+                        "explanation": "ok",
+                        "context": {},
+                    }
+                ]
+            }
+
+        mock_data_plane_client.evaluate.side_effect = evaluate
+        processor = EvaluationProcessor(mock_data_plane_client, max_concurrency=3)
+        otel_spans = [{"spanId": "span-123", "traceId": "trace-1"}]
+
+        results = processor.execute_evaluators(
+            evaluators=evaluators,
+            otel_spans=otel_spans,
+            session_id="session-123",
+            reference_inputs=ReferenceInputs(expected_response="Hello!"),
+        )
+
+        assert [r.evaluator_id for r in results] == evaluators
+        assert not any(r.has_error() for r in results)
+        # Every call shares the same spans and reference inputs
+        calls = mock_data_plane_client.evaluate.call_args_list
+        assert all(call.kwargs["session_spans"] is otel_spans for call in calls)
+        assert len({id(call.kwargs["evaluation_reference_inputs"]) for call in calls}) == 1
+
+    def test_execute_evaluators_error_keeps_position(self, mock_data_plane_client):
+        """A failing evaluator is reported in its own position among the results."""
+
+        def evaluate(evaluator_id, **kwargs):
+            if evaluator_id == "Builtin.Accuracy":
+                raise RuntimeError("Evaluation API error (ThrottlingException): Rate exceeded")
+            return {
+                "evaluationResults": [
+                    {
+                        "evaluatorId": evaluator_id,
+                        "evaluatorName": evaluator_id,
+                        "evaluatorArn": "arn",
+                        "explanation": "ok",
+                        "context": {},
+                    }
+                ]
+            }
+
+        mock_data_plane_client.evaluate.side_effect = evaluate
+        processor = EvaluationProcessor(mock_data_plane_client, max_concurrency=4)
+
+        results = processor.execute_evaluators(
+            evaluators=["Builtin.Helpfulness", "Builtin.Accuracy", "Builtin.Correctness"],
+            otel_spans=[{"spanId": "span-123"}],
+            session_id="session-123",
+        )
+
+        assert [r.evaluator_id for r in results] == ["Builtin.Helpfulness", "Builtin.Accuracy", "Builtin.Correctness"]
+        assert [r.has_error() for r in results] == [False, True, False]
+
+    def test_invalid_max_concurrency(self, mock_data_plane_client):
+        """A concurrency limit below 1 is rejected."""
+        with pytest.raises(ValueError, match="max_concurrency"):
+            EvaluationProcessor(mock_data_plane_client, max_concurrency=0)
+
 
 # =============================================================================
 # Evaluate Session Tests
@@ -805,6 +936,159 @@ class TestEvaluateSession:
         assert ref_items[0]["expectedResponse"] == {"text": "Hello!"}
 
 
+class TestEvaluateTraceData:
+    """Test evaluating already loaded session data."""
+
+    @patch.object(EvaluationProcessor, "fetch_session_data")
+    @patch.object(EvaluationProcessor, "execute_evaluators")
+    def test_evaluates_without_fetching(self, mock_execute, mock_fetch, processor):
+        """Loaded spans are evaluated without querying CloudWatch."""
+        span = Span(
+            trace_id="trace-123",
+            span_id="span-456",
+            span_name="invoke_agent",
+            session_id="session-123",
+            start_time_unix_nano=1234567890000000000,
+            raw_message={
+                "spanId": "span-456",
+                "startTimeUnixNano": 1234567890000000000,
+                "scope": {"name": InstrumentationScopes.OTEL_LANGCHAIN},
+            },
+        )
+        mock_execute.return_value = []
+
+        results = processor.evaluate_trace_data(
+            TraceData(session_id="session-123", spans=[span]), evaluators=["Builtin.Helpfulness"]
+        )
+
+        mock_fetch.assert_not_called()
+        assert results.session_id == "session-123"
+        assert results.input_data == {"spans": [span.raw_message]}
+        assert mock_execute.call_args.args[2] == "session-123"
+
+    def test_requires_session_id(self, processor):
+        """Evaluation requests are scoped to a session."""
+        with pytest.raises(ValueError, match="session_id"):
+            processor.evaluate_trace_data(TraceData(), evaluators=["Builtin.Helpfulness"])
+
+
+class TestResultCache:
+    """Test reusing cached evaluation results."""
+
+    @pytest.fixture
+    def result_cache(self, tmp_path):
+        cache = EvaluationResultCache(tmp_path / "evaluation_cache.sqlite3")
+        yield cache
+        cache.close()
+
+    @pytest.fixture
+    def cached_processor(self, mock_data_plane_client, mock_control_plane_client, result_cache):
+        def evaluate(evaluator_id, **kwargs):
+            return {"evaluationResults": [{"evaluatorId": evaluator_id, "value": 0.9, "explanation": "ok"}]}
+
+        mock_data_plane_client.evaluate.side_effect = evaluate
+        mock_control_plane_client.get_evaluator.side_effect = lambda evaluator_id: {
+            "evaluatorId": evaluator_id,
+            "level": "TRACE",
+            "updatedAt": "2024-01-01T00:00:00Z",
+        }
+        return EvaluationProcessor(mock_data_plane_client, mock_control_plane_client, result_cache=result_cache)
+
+    def _evaluated(self, mock_data_plane_client):
+        return [call.kwargs["evaluator_id"] for call in mock_data_plane_client.evaluate.call_args_list]
+
+    def test_only_new_evaluator_runs(self, cached_processor, mock_data_plane_client, sample_trace_data):
+        """Re-running with one more evaluator only calls the new one."""
+        suite = [f"Builtin.Eval{i}" for i in range(10)]
+        cached_processor.evaluate_trace_data(sample_trace_data, suite)
+        mock_data_plane_client.evaluate.reset_mock()
+
+        results = cached_processor.evaluate_trace_data(sample_trace_data, suite + ["custom-new"])
+
+        assert self._evaluated(mock_data_plane_client) == ["custom-new"]
+        assert [r.evaluator_id for r in results.results] == suite + ["custom-new"]
+        assert all(r.value == 0.9 for r in results.results)
+
+    def test_changed_inputs_are_evaluated_again(self, cached_processor, mock_data_plane_client, sample_trace_data):
+        """Other spans, reference inputs or an edited evaluator miss the cache."""
+        cached_processor.evaluate_trace_data(sample_trace_data, ["custom-1"])
+
+        cached_processor.evaluate_trace_data(
+            sample_trace_data, ["custom-1"], reference_inputs=ReferenceInputs(assertions=["is polite"])
+        )
+        cached_processor.evaluate_trace_data(sample_trace_data, ["custom-1"], trace_id="trace-123")
+        cached_processor.control_plane_client.get_evaluator.side_effect = lambda evaluator_id: {
+            "evaluatorId": evaluator_id,
+            "level": "TRACE",
+            "updatedAt": "2024-02-01T00:00:00Z",
+        }
+        cached_processor.evaluator_metadata.invalidate("custom-1")
+        cached_processor.evaluate_trace_data(sample_trace_data, ["custom-1"])
+
+        assert self._evaluated(mock_data_plane_client) == ["custom-1"] * 4
+
+    def test_custom_evaluator_without_version_not_cached(self, mock_data_plane_client, result_cache, sample_trace_data):
+        """Without a control plane, custom evaluators may have changed and are always called."""
+        mock_data_plane_client.evaluate.return_value = {
+            "evaluationResults": [{"evaluatorId": "custom-1", "value": 0.5, "explanation": "ok"}]
+        }
+        processor = EvaluationProcessor(mock_data_plane_client, result_cache=result_cache)
+
+        processor.evaluate_trace_data(sample_trace_data, ["custom-1", "Builtin.Helpfulness"])
+        processor.evaluate_trace_data(sample_trace_data, ["custom-1", "Builtin.Helpfulness"])
+
+        assert self._evaluated(mock_data_plane_client) == ["custom-1", "Builtin.Helpfulness", "custom-1"]
+
+    def test_errors_are_not_cached(self, cached_processor, mock_data_plane_client, sample_trace_data):
+        """Failed evaluations are retried on the next run."""
+        mock_data_plane_client.evaluate.side_effect = [
+            RuntimeError("Evaluation API error (ThrottlingException): Rate exceeded"),
+            {"evaluationResults": [{"evaluatorId": "Builtin.Helpfulness", "error": "Model timed out"}]},
+            {"evaluationResults": [{"evaluatorId": "Builtin.Helpfulness", "value": 0.9}]},
+        ]
+
+        for _ in range(4):
+            cached_processor.evaluate_trace_data(sample_trace_data, ["Builtin.Helpfulness"])
+
+        assert mock_data_plane_client.evaluate.call_count == 3
+
+    def test_broken_cache_is_disabled(self, cached_processor, mock_data_plane_client, sample_trace_data, tmp_path):
+        """A cache that cannot be opened does not fail the evaluation."""
+        cached_processor.result_cache = EvaluationResultCache(tmp_path)
+
+        results = cached_processor.evaluate_trace_data(sample_trace_data, ["Builtin.Helpfulness"])
+
+        assert not results.has_errors()
+        assert cached_processor.result_cache is None
+
+    def test_uncreatable_cache_directory_is_disabled(
+        self, cached_processor, mock_data_plane_client, sample_trace_data, tmp_path
+    ):
+        """A cache directory that cannot be created, e.g. in a read-only project, is bypassed."""
+        (tmp_path / "read-only").write_text("")
+        cached_processor.result_cache = EvaluationResultCache(tmp_path / "read-only" / "evaluation_cache.sqlite3")
+
+        results = cached_processor.evaluate_trace_data(sample_trace_data, ["Builtin.Helpfulness"])
+
+        assert not results.has_errors()
+        assert cached_processor.result_cache is None
+
+    def test_corrupt_cached_results_are_bypassed(
+        self, cached_processor, mock_data_plane_client, result_cache, sample_trace_data
+    ):
+        """Stored results that cannot be read are evaluated again instead of becoming errors."""
+        cached_processor.evaluate_trace_data(sample_trace_data, ["Builtin.Helpfulness"])
+        with result_cache._connect() as conn:
+            conn.execute("UPDATE evaluation_results SET data = '{not json'")
+
+        results = cached_processor.evaluate_trace_data(sample_trace_data, ["Builtin.Helpfulness"])
+
+        assert not results.has_errors()
+        assert results.results[0].value == 0.9
+        assert mock_data_plane_client.evaluate.call_count == 2
+        assert cached_processor.result_cache is None
+
+
 # =============================================================================
 # Evaluator Grouping Tests
 # =============================================================================
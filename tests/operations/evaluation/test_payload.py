@@ -0,0 +1,132 @@
+"""Tests for compacting the spans sent to the evaluation API."""
+
+import copy
+import json
+
+import pytest
+
+from bedrock_agentcore_starter_toolkit.operations.evaluation.payload import (
+    PayloadCompactor,
+    compact_documents,
+    truncate_value,
+)
+
+RESOURCE = {
+    "attributes": {
+        "service.name": "my-agent.DEFAULT",
+        "aws.service.type": "gen_ai_agent",
+        "telemetry.sdk.version": "1.33.1",
+        "cloud.resource_id": "arn:aws:bedrock-agentcore:us-east-1:123456789012:runtime/my-agent",
+    }
+}
+
+
+def make_span(span_id, start=1, **overrides):
+    span = {
+        "resource": RESOURCE,
+        "scope": {"name": "strands.telemetry.tracer", "version": "1.0", "attributes": {"extra": True}},
+        "traceId": "trace-1",
+        "spanId": span_id,
+        "flags": 768,
+        "name": "invoke_agent",
+        "kind": "INTERNAL",
+        "startTimeUnixNano": start,
+        "endTimeUnixNano": start + 10,
+        "attributes": {"gen_ai.agent.name": "agent"},
+        "status": {"code": "UNSET"},
+    }
+    span.update(overrides)
+    return span
+
+
+def make_log(body):
+    return {
+        "resource": RESOURCE,
+        "scope": {"name": "strands.telemetry.tracer"},
+        "timeUnixNano": 5,
+        "observedTimeUnixNano": 6,
+        "flags": 1,
+        "traceId": "trace-1",
+        "spanId": "span-1",
+        "body": body,
+    }
+
+
+class TestTruncateValue:
+    """Test trimming oversized values."""
+
+    def test_nested_strings_are_truncated(self):
+        value = {"output": {"messages": [{"content": "x" * 100}]}, "count": 3}
+
+        trimmed = truncate_value(value, max_bytes=10)
+
+        assert trimmed["output"]["messages"][0]["content"] == "x" * 10 + "... [truncated 90 bytes]"
+        assert trimmed["count"] == 3
+        assert value["output"]["messages"][0]["content"] == "x" * 100
+
+    def test_multibyte_characters_are_not_split(self):
+        assert truncate_value("é" * 4, max_bytes=3) == "é... [truncated 5 bytes]"
+
+    def test_short_values_are_unchanged(self):
+        value = {"a": "short", "b": [1, 2]}
+        assert truncate_value(value, max_bytes=10) == value
+
+
+class TestPayloadCompactor:
+    """Test compacting individual documents."""
+
+    def test_span_keeps_evaluated_fields(self):
+        compacted = PayloadCompactor().compact(make_span("span-1"))
+
+        assert "flags" not in compacted
+        assert compacted["scope"] == {"name": "strands.telemetry.tracer", "version": "1.0"}
+        assert compacted["attributes"] == {"gen_ai.agent.name": "agent"}
+        assert compacted["startTimeUnixNano"] == 1
+
+    def test_log_keeps_evaluated_fields(self):
+        compacted = PayloadCompactor().compact(make_log({"input": {"messages": []}}))
+
+        assert set(compacted) == {"resource", "scope", "timeUnixNano", "traceId", "spanId", "body"}
+
+    def test_repeated_resource_reduced_to_identity(self):
+        compactor = PayloadCompactor()
+
+        first = compactor.compact(make_span("span-1"))
+        second = compactor.compact(make_span("span-2"))
+
+        assert first["resource"] == RESOURCE
+        assert second["resource"] == {
+            "attributes": {"service.name": "my-agent.DEFAULT", "aws.service.type": "gen_ai_agent"}
+        }
+
+    def test_oversized_attributes_and_body_trimmed(self):
+        compactor = PayloadCompactor(max_value_bytes=20)
+        span = make_span("span-1", attributes={"tool.result": "r" * 1000})
+        log = make_log({"output": {"messages": [{"content": "c" * 1000}]}})
+        originals = copy.deepcopy([span, log])
+
+        compacted_span = compactor.compact(span)
+        compacted_log = compactor.compact(log)
+
+        assert compacted_span["attributes"]["tool.result"].startswith("r" * 20 + "... [truncated")
+        assert compacted_log["body"]["output"]["messages"][0]["content"].startswith("c" * 20 + "... [truncated")
+        assert [span, log] == originals
+
+
+class TestCompactDocuments:
+    """Test filling a request up to its byte budget."""
+
+    def test_stops_at_byte_budget(self):
+        documents = [make_span(f"span-{i}", start=100 - i) for i in range(50)]
+        everything = compact_documents(documents)
+        budget = len(json.dumps(everything[:10], separators=(",", ":")))
+
+        compacted = compact_documents(documents, max_bytes=budget)
+
+        assert compacted == everything[:10]
+        assert len(json.dumps(compacted, separators=(",", ":"))) <= budget
+
+    @pytest.mark.parametrize("max_items,expected", [(None, 5), (3, 3)])
+    def test_optional_item_limit(self, max_items, expected):
+        documents = [make_span(f"span-{i}") for i in range(5)]
+        assert len(compact_documents(documents, max_items=max_items)) == expected
@@ -0,0 +1,228 @@
+"""Tests for the concurrent memory crawler."""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+from bedrock_agentcore_starter_toolkit.operations.memory.crawler import MemoryCrawler, _AdaptiveLimit
+from bedrock_agentcore_starter_toolkit.operations.memory.manager import MemoryManager
+
+
+def throttle():
+    return ClientError({"Error": {"Code": "ThrottlingException"}}, "ListEvents")
+
+
+class FakeDataPlane:
+    """In-memory data plane with paginated list calls."""
+
+    def __init__(self, actors=3, sessions=2, events=3, page_size=2):
+        self.actors = {f"actor-{a}": [f"session-{a}-{s}" for s in range(sessions)] for a in range(actors)}
+        self.events = events
+        self.page_size = page_size
+        self.records = {}
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def _page(self, items, key, nextToken=None, maxResults=100, **_):
+        start = int(nextToken or 0)
+        size = min(maxResults, self.page_size)
+        response = {key: items[start : start + size]}
+        if start + size < len(items):
+            response["nextToken"] = str(start + size)
+        return response
+
+    def _record(self, operation, kwargs):
+        with self._lock:
+            self.calls.append((operation, kwargs))
+
+    def list_actors(self, memoryId, **kwargs):
+        self._record("list_actors", kwargs)
+        return self._page([{"actorId": a} for a in self.actors], "actorSummaries", **kwargs)
+
+    def list_sessions(self, memoryId, actorId, **kwargs):
+        self._record("list_sessions", kwargs)
+        return self._page([{"sessionId": s} for s in self.actors[actorId]], "sessionSummaries", **kwargs)
+
+    def list_events(self, memoryId, actorId, sessionId, **kwargs):
+        self._record("list_events", kwargs)
+        events = [{"eventId": f"{sessionId}-event-{e}"} for e in range(self.events)]
+        return self._page(events, "events", **kwargs)
+
+    def list_memory_records(self, memoryId, namespace, **kwargs):
+        self._record("list_memory_records", kwargs)
+        if namespace not in self.records:
+            raise ClientError({"Error": {"Code": "ValidationException"}}, "ListMemoryRecords")
+        return self._page(self.records[namespace], "memoryRecordSummaries", **kwargs)
+
+
+class TestEvents:
+    """Test crawling events."""
+
+    def test_every_event_without_truncation(self):
+        """All actors and sessions are walked, not only the first few."""
+        client = FakeDataPlane(actors=12, sessions=5, events=3)
+
+        events = list(MemoryCrawler(client, max_workers=4).events("mem-123"))
+
+        assert len(events) == 12 * 5 * 3
+        assert len({e["eventId"] for e in events}) == len(events)
+        assert {e["_actorId"] for e in events} == set(client.actors)
+        assert all(e["eventId"].startswith(e["_sessionId"]) for e in events)
+
+    def test_max_results_per_session(self):
+        client = FakeDataPlane(actors=2, sessions=2, events=5)
+
+        events = list(MemoryCrawler(client).events("mem-123", max_results_per_session=3))
+
+        assert len(events) == 2 * 2 * 3
+
+    def test_skips_missing_ids(self):
+        client = MagicMock()
+        client.list_actors.return_value = {"actorSummaries": [{"actorId": "user1"}, {}]}
+        client.list_sessions.return_value = {"sessionSummaries": [{"sessionId": "sess1"}, {}]}
+        client.list_events.return_value = {"events": [{"eventId": "e1"}]}
+
+        events = list(MemoryCrawler(client).events("mem-123"))
+
+        assert events == [{"eventId": "e1", "_actorId": "user1", "_sessionId": "sess1"}]
+
+    def test_streams_before_crawl_finishes(self):
+        """The first events are yielded before every actor has been listed."""
+        client = FakeDataPlane(actors=50, sessions=1, events=1)
+
+        stream = MemoryCrawler(client, max_workers=2).events("mem-123")
+        next(stream)
+        listed = sum(1 for operation, _ in client.calls if operation == "list_sessions")
+        stream.close()
+
+        assert listed < 50
+
+    def test_calls_run_concurrently(self):
+        """The first sessions are only listed once max_workers calls are in flight together."""
+        client = FakeDataPlane(actors=8, sessions=1, events=1)
+        barrier = threading.Barrier(4, timeout=5)
+        started = []
+        list_sessions = client.list_sessions
+
+        def list_sessions_together(**kwargs):
+            started.append(kwargs["actorId"])
+            if len(started) <= 4:
+                barrier.wait()
+            return list_sessions(**kwargs)
+
+        client.list_sessions = list_sessions_together
+
+        events = list(MemoryCrawler(client, max_workers=4).events("mem-123"))
+
+        assert len(events) == 8
+
+
+class TestThrottling:
+    """Test adaptive handling of throttled calls."""
+
+    @patch("time.sleep")
+    def test_throttled_calls_are_retried(self, mock_sleep):
+        client = FakeDataPlane(actors=2, sessions=1, events=2)
+        list_events = client.list_events
+        failures = iter([throttle(), throttle()])
+
+        def flaky_list_events(**kwargs):
+            error = next(failures, None)
+            if error:
+                raise error
+            return list_events(**kwargs)
+
+        client.list_events = flaky_list_events
+
+        events = list(MemoryCrawler(client, max_workers=4).events("mem-123"))
+
+        assert len(events) == 4
+        assert mock_sleep.call_count == 2
+
+    def test_throttles_halve_and_successes_restore_concurrency(self):
+        limit = _AdaptiveLimit(8)
+
+        limit.throttled()
+        limit.throttled()
+        assert limit.current == 2
+
+        for _ in range(2 + 3):
+            limit.succeeded()
+        assert limit.current == 4
+
+        for _ in range(100):
+            limit.succeeded()
+        assert limit.current == 8
+
+    @patch("time.sleep")
+    def test_gives_up_after_retries(self, mock_sleep):
+        client = MagicMock()
+        client.list_actors.side_effect = throttle()
+
+        with pytest.raises(ClientError):
+            list(MemoryCrawler(client).events("mem-123"))
+
+        assert client.list_actors.call_count == MemoryCrawler.MAX_THROTTLE_RETRIES + 1
+
+    def test_other_errors_fail_the_crawl(self):
+        client = MagicMock()
+        client.list_actors.side_effect = ClientError({"Error": {"Code": "AccessDeniedException"}}, "ListActors")
+
+        with pytest.raises(ClientError):
+            list(MemoryCrawler(client).events("mem-123"))
+
+
+class TestRecords:
+    """Test crawling records from namespace templates."""
+
+    def test_resolves_placeholders_for_every_actor_and_session(self):
+        client = FakeDataPlane(actors=7, sessions=4)
+        client.records["/facts/"] = [{"memoryRecordId": "fact"}]
+        for actor_id, sessions in client.actors.items():
+            client.records[f"/users/{actor_id}/"] = [{"memoryRecordId": actor_id}]
+            for session_id in sessions:
+                client.records[f"/summaries/{actor_id}/{session_id}/"] = [{"memoryRecordId": session_id}]
+
+        records = list(
+            MemoryCrawler(client).records(
+                "mem-123", ["/facts/", "/users/{actorId}/", "/summaries/{actorId}/{sessionId}/"]
+            )
+        )
+
+        assert len(records) == 1 + 7 + 7 * 4
+        assert {r["_namespace"] for r in records} == set(client.records)
+        assert sum(1 for operation, _ in client.calls if operation == "list_actors") == 4
+
+    def test_static_namespaces_do_not_list_actors(self):
+        client = FakeDataPlane()
+        client.records["/facts/"] = [{"memoryRecordId": f"r{i}"} for i in range(5)]
+
+        records = list(MemoryCrawler(client).records("mem-123", ["/facts/", "/facts/"], max_results_per_namespace=3))
+
+        assert [r["memoryRecordId"] for r in records] == ["r0", "r1", "r2"]
+        assert {operation for operation, _ in client.calls} == {"list_memory_records"}
+
+    def test_unlistable_namespaces_are_skipped(self):
+        client = FakeDataPlane(actors=2)
+        client.records["/users/actor-1/"] = [{"memoryRecordId": "r1"}]
+
+        records = list(MemoryCrawler(client).records("mem-123", ["/users/{actorId}/"]))
+
+        assert [r["memoryRecordId"] for r in records] == ["r1"]
+
+
+class TestManager:
+    """Test the MemoryManager entry points."""
+
+    def test_crawl_events_and_records(self):
+        with patch("boto3.client"):
+            manager = MemoryManager(region_name="us-east-1")
+        manager._data_plane_client = FakeDataPlane(actors=2, sessions=1, events=1)
+        manager._data_plane_client.records["/facts/"] = [{"memoryRecordId": "r1"}]
+
+        assert len(list(manager.crawl_events("mem-123"))) == 2
+        assert list(manager.crawl_records("mem-123", ["/facts/"])) == [
+            {"memoryRecordId": "r1", "_namespace": "/facts/"}
+        ]
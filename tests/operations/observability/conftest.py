@@ -41,6 +41,8 @@ def observability_client(monkeypatch, mock_logs_client):
 
     # Create the client (stateless - only needs region)
     client = ObservabilityClient(region_name="us-east-1")
+    # One shard per query so call counts are deterministic; sharding is tested explicitly
+    client.MAX_CONCURRENT_QUERIES = 1
     return client
 
 
@@ -235,3 +235,145 @@ class TestCloudWatchRuntimeLogBuilder:
         result.append({"field": "@message", "value": json.dumps(otel_log)})
 
         return result
+
+
+class TestLazyDecoding:
+    """Test that JSON payloads are only decoded when accessed."""
+
+    ROW = [
+        {"field": "traceId", "value": "trace-1"},
+        {"field": "spanId", "value": "span-1"},
+        {"field": "@message", "value": '{"attributes": {"a": 1}, "resource": {"attributes": {"r": 2}}}'},
+        {"field": "events", "value": '[{"name": "event"}]'},
+    ]
+
+    def test_span_payload_decoded_on_access(self):
+        span = CloudWatchResultBuilder.build_span(self.ROW)
+
+        assert span._raw_message is not None and not isinstance(span._raw_message, dict)
+        assert span.attributes == {"a": 1}
+        assert span.resource_attributes == {"r": 2}
+        assert span.events == [{"name": "event"}]
+        assert span.raw_message["attributes"] == {"a": 1}
+
+    def test_span_without_message(self):
+        span = CloudWatchResultBuilder.build_span([{"field": "spanId", "value": "span-1"}])
+
+        assert span.raw_message is None
+        assert span.attributes == {}
+        assert span.resource_attributes == {}
+        assert span.events == []
+
+    def test_invalid_json_kept_as_string(self):
+        span = CloudWatchResultBuilder.build_span([{"field": "@message", "value": "not json"}])
+
+        assert span.raw_message == "not json"
+        assert span.attributes == {}
+
+    def test_lazy_span_equals_eager_span(self):
+        lazy = CloudWatchResultBuilder.build_span(self.ROW)
+        eager = Span(
+            trace_id="trace-1",
+            span_id="span-1",
+            span_name="",
+            events=[{"name": "event"}],
+            attributes={"a": 1},
+            resource_attributes={"r": 2},
+            raw_message={"attributes": {"a": 1}, "resource": {"attributes": {"r": 2}}},
+        )
+
+        assert lazy == eager
+
+    def test_spans_have_no_instance_dict(self):
+        span = CloudWatchResultBuilder.build_span(self.ROW)
+        runtime_log = CloudWatchResultBuilder.build_runtime_log(self.ROW)
+
+        assert not hasattr(span, "__dict__")
+        assert not hasattr(runtime_log, "__dict__")
+
+    def test_runtime_log_parsed_from_message(self):
+        runtime_log = CloudWatchResultBuilder.build_runtime_log(self.ROW)
+
+        assert runtime_log.raw_message["attributes"] == {"a": 1}
+
+    def test_runtime_log_constructed_directly_is_not_parsed(self):
+        runtime_log = RuntimeLog(timestamp="1", message='{"a": 1}')
+
+        assert runtime_log.raw_message is None
+
+
+class TestLogEventBuilders:
+    """Test building models from raw FilterLogEvents events."""
+
+    def test_build_span_from_event_matches_insights_projection(self, strands_bedrock_spans):
+        otel_span = strands_bedrock_spans[0]
+        event = {"timestamp": 1763423917517, "message": json.dumps(otel_span)}
+
+        span = CloudWatchResultBuilder.build_span_from_event(event)
+
+        assert span.trace_id == otel_span["traceId"]
+        assert span.span_id == otel_span["spanId"]
+        assert span.span_name == otel_span["name"]
+        assert span.parent_span_id == otel_span.get("parentSpanId")
+        assert span.duration_ms == otel_span["durationNano"] / 1_000_000
+        assert span.session_id == otel_span["attributes"].get("session.id")
+        assert span.resource_id == otel_span["resource"]["attributes"]["cloud.resource_id"]
+        assert span.timestamp == "2025-11-17 23:58:37.517"
+        assert span.raw_message == otel_span
+
+    def test_build_span_from_event_ignores_non_span_messages(self):
+        assert CloudWatchResultBuilder.build_span_from_event({"timestamp": 0, "message": "plain text"}) is None
+        assert CloudWatchResultBuilder.build_span_from_event({"timestamp": 0, "message": '{"a": 1}'}) is None
+
+    def test_build_runtime_log_from_event(self, strands_bedrock_runtime_logs):
+        document = strands_bedrock_runtime_logs[0]
+        event = {"timestamp": 0, "message": json.dumps(document), "logStreamName": "otel-rt-logs"}
+
+        runtime_log = CloudWatchResultBuilder.build_runtime_log_from_event(event)
+
+        assert runtime_log.trace_id == document.get("traceId")
+        assert runtime_log.span_id == document.get("spanId")
+        assert runtime_log.log_stream == "otel-rt-logs"
+        assert runtime_log.timestamp == "1970-01-01 00:00:00.000"
+        assert runtime_log.raw_message == document
+
+    def test_build_runtime_log_from_plain_text_event(self):
+        runtime_log = CloudWatchResultBuilder.build_runtime_log_from_event({"timestamp": 0, "message": "started"})
+
+        assert runtime_log.message == "started"
+        assert runtime_log.trace_id is None
+        assert runtime_log.raw_message is None
+
+
+class TestLatencyStatsBuilder:
+    """Test building aggregated statistics rows."""
+
+    def test_build_latency_stats(self):
+        row = [
+            {"field": "groupName", "value": "search_web"},
+            {"field": "spanCount", "value": "200"},
+            {"field": "p50Ms", "value": "120.5"},
+            {"field": "p90Ms", "value": "480"},
+            {"field": "p99Ms", "value": "1500.25"},
+            {"field": "errorCount", "value": "10"},
+            {"field": "throttleCount", "value": "4"},
+            {"field": "inputTokens", "value": "5000"},
+            {"field": "outputTokens", "value": "0"},
+        ]
+
+        stats = CloudWatchResultBuilder.build_latency_stats(row)
+
+        assert stats.group == "search_web"
+        assert stats.span_count == 200
+        assert (stats.p50_ms, stats.p90_ms, stats.p99_ms) == (120.5, 480.0, 1500.25)
+        assert stats.avg_ms is None
+        assert stats.error_rate == 0.05
+        assert stats.throttle_rate == 0.02
+        assert (stats.input_tokens, stats.output_tokens) == (5000, 0)
+
+    def test_empty_group_has_zero_rates(self):
+        stats = CloudWatchResultBuilder.build_latency_stats([{"field": "groupName", "value": "x"}])
+
+        assert stats.span_count == 0
+        assert stats.error_rate == 0.0
+        assert stats.throttle_rate == 0.0
@@ -0,0 +1,281 @@
+"""Tests for the local observability query cache."""
+
+import sqlite3
+from unittest.mock import Mock
+
+import pytest
+
+from bedrock_agentcore_starter_toolkit.operations.observability.cache import (
+    START_ALIGNMENT_MS,
+    ObservabilityCache,
+    parse_timestamp_ms,
+    subtract_ranges,
+)
+from bedrock_agentcore_starter_toolkit.operations.observability.client import ObservabilityClient
+from bedrock_agentcore_starter_toolkit.operations.observability.telemetry import Span
+from bedrock_agentcore_starter_toolkit.operations.observability.windows import MARGIN_MS
+
+HOUR = 60 * 60 * 1000
+DAY = 24 * HOUR
+# An hour-aligned "now" so window arithmetic in tests is exact
+NOW = 1_700_000_000_000 - 1_700_000_000_000 % START_ALIGNMENT_MS
+
+
+def _row(timestamp_ms, span_id, trace_id="trace-1", start_nano=None):
+    row = [
+        {"field": "@timestamp", "value": str(timestamp_ms)},
+        {"field": "traceId", "value": trace_id},
+        {"field": "spanId", "value": span_id},
+        {"field": "spanName", "value": f"span-{span_id}"},
+    ]
+    if start_nano is not None:
+        row.append({"field": "startTimeUnixNano", "value": str(start_nano)})
+    return row
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ObservabilityCache(tmp_path / "cache.sqlite3", settle_seconds=300, ttl_seconds=60)
+    yield cache
+    cache.close()
+
+
+class TestHelpers:
+    """Test range and timestamp helpers."""
+
+    def test_subtract_ranges_uncovered(self):
+        assert subtract_ranges(0, 100, []) == [(0, 100)]
+
+    def test_subtract_ranges_gaps(self):
+        assert subtract_ranges(0, 100, [(60, 80), (10, 20), (15, 30)]) == [(0, 10), (30, 60), (80, 100)]
+
+    def test_subtract_ranges_fully_covered(self):
+        assert subtract_ranges(10, 20, [(0, 50)]) == []
+
+    def test_parse_insights_timestamp(self):
+        assert parse_timestamp_ms("1970-01-01 00:00:01.500") == 1500
+
+    def test_parse_numeric_timestamps(self):
+        assert parse_timestamp_ms("1700000000000") == 1_700_000_000_000
+        assert parse_timestamp_ms("1700000000000000000") == 1_700_000_000_000
+
+    def test_parse_invalid_timestamp(self):
+        assert parse_timestamp_ms("yesterday") is None
+        assert parse_timestamp_ms(None) is None
+
+
+class TestObservabilityCache:
+    """Test coverage tracking, staleness and row storage."""
+
+    def test_empty_cache_misses_whole_window(self, cache):
+        scope = cache.scope("us-east-1", "aws/spans", "query")
+        assert cache.missing_ranges(scope, NOW - DAY, NOW, now_ms=NOW) == [(NOW - DAY, NOW)]
+
+    def test_window_start_is_aligned(self, cache):
+        scope = cache.scope("us-east-1", "aws/spans", "query")
+        assert cache.missing_ranges(scope, NOW - DAY + 123, NOW, now_ms=NOW) == [(NOW - DAY, NOW)]
+
+    def test_settled_range_is_cached_permanently(self, cache):
+        scope = cache.scope("us-east-1", "aws/spans", "query")
+        cache.store(scope, [], NOW - DAY, NOW - HOUR, now_ms=NOW)
+
+        later = NOW + 30 * DAY
+        assert cache.missing_ranges(scope, NOW - DAY, NOW - HOUR, now_ms=later) == []
+
+    def test_unsettled_tail_expires_after_ttl(self, cache):
+        scope = cache.scope("us-east-1", "aws/spans", "query")
+        cache.store(scope, [], NOW - DAY, NOW, now_ms=NOW)
+
+        assert cache.missing_ranges(scope, NOW - DAY, NOW, now_ms=NOW + 30_000) == []
+        settled_end = NOW - 300_000
+        assert cache.missing_ranges(scope, NOW - DAY, NOW + 90_000, now_ms=NOW + 90_000) == [
+            (settled_end, NOW + 90_000)
+        ]
+
+    def test_incomplete_results_do_not_record_coverage(self, cache):
+        scope = cache.scope("us-east-1", "aws/spans", "query")
+        cache.store(scope, [_row(NOW - HOUR, "a")], NOW - DAY, NOW - HOUR, complete=False, now_ms=NOW)
+
+        assert cache.missing_ranges(scope, NOW - DAY, NOW - HOUR, now_ms=NOW) == [(NOW - DAY, NOW - HOUR)]
+        assert len(cache.get_rows([scope], NOW - DAY, NOW)) == 1
+
+    def test_adjacent_ranges_are_merged(self, cache):
+        scope = cache.scope("us-east-1", "aws/spans", "query")
+        cache.store(scope, [], NOW - 2 * DAY, NOW - DAY, now_ms=NOW)
+        cache.store(scope, [], NOW - DAY, NOW - HOUR, now_ms=NOW)
+
+        covered = cache._connect().execute("SELECT start_ms, end_ms FROM coverage").fetchall()
+        assert covered == [(NOW - 2 * DAY, NOW - HOUR)]
+
+    def test_rows_are_deduplicated_and_filtered_by_window(self, cache):
+        scope = cache.scope("us-east-1", "aws/spans", "query")
+        rows = [_row(NOW - 3 * HOUR, "a"), _row(NOW - 2 * HOUR, "b")]
+        cache.store(scope, rows, NOW - DAY, NOW - HOUR, now_ms=NOW)
+        cache.store(scope, rows, NOW - DAY, NOW - HOUR, now_ms=NOW)
+
+        assert cache.get_rows([scope], NOW - DAY, NOW) == rows
+        assert cache.get_rows([scope], NOW - 150 * 60 * 1000, NOW) == [rows[1]]
+
+    def test_rows_are_ordered_by_sort_field(self, cache):
+        scope = cache.scope("us-east-1", "aws/spans", "query")
+        late = _row(NOW - 3 * HOUR, "late", start_nano=2_000_000_000)
+        early = _row(NOW - 2 * HOUR, "early", start_nano=999_999_999)
+        cache.store(scope, [late, early], NOW - DAY, NOW - HOUR, sort_field="startTimeUnixNano", now_ms=NOW)
+
+        assert cache.get_rows([scope], NOW - DAY, NOW) == [early, late]
+
+    def test_scopes_are_isolated(self, cache):
+        first = cache.scope("us-east-1", "aws/spans", "session-a")
+        second = cache.scope("us-east-1", "aws/spans", "session-b")
+        cache.store(first, [_row(NOW - 2 * HOUR, "a")], NOW - DAY, NOW - HOUR, now_ms=NOW)
+
+        assert cache.get_rows([second], NOW - DAY, NOW) == []
+        assert cache.missing_ranges(second, NOW - DAY, NOW - HOUR, now_ms=NOW) == [(NOW - DAY, NOW - HOUR)]
+
+    def test_clear(self, cache):
+        scope = cache.scope("us-east-1", "aws/spans", "query")
+        cache.store(scope, [_row(NOW - 2 * HOUR, "a")], NOW - DAY, NOW - HOUR, now_ms=NOW)
+        cache.clear()
+
+        assert cache.get_rows([scope], NOW - DAY, NOW) == []
+        assert cache.missing_ranges(scope, NOW - DAY, NOW - HOUR, now_ms=NOW) == [(NOW - DAY, NOW - HOUR)]
+
+    def test_persists_across_instances(self, tmp_path):
+        path = tmp_path / "nested" / "cache.sqlite3"
+        first = ObservabilityCache(path)
+        scope = first.scope("us-east-1", "aws/spans", "query")
+        first.store(scope, [_row(NOW - 2 * HOUR, "a")], NOW - DAY, NOW - HOUR, now_ms=NOW)
+        first.close()
+
+        second = ObservabilityCache(path)
+        assert len(second.get_rows([scope], NOW - DAY, NOW)) == 1
+        second.close()
+
+    def test_for_project_uses_bedrock_agentcore_directory(self, tmp_path):
+        cache = ObservabilityCache.for_project(tmp_path)
+        assert cache.path == tmp_path / ".bedrock_agentcore" / "observability_cache.sqlite3"
+
+
+@pytest.fixture
+def cached_client(monkeypatch, mock_logs_client, cache):
+    monkeypatch.setattr("boto3.client", lambda service_name, **kwargs: mock_logs_client)
+    client = ObservabilityClient(region_name="us-east-1", cache=cache)
+    client.MAX_CONCURRENT_QUERIES = 1
+    return client
+
+
+def _settled_window():
+    # A window that ended well before the settle period, so nothing expires
+    end = NOW - DAY
+    return end - 7 * DAY, end
+
+
+class TestObservabilityClientWithCache:
+    """Test that the client only queries CloudWatch for uncovered ranges."""
+
+    def test_second_session_query_served_from_cache(self, cached_client, mock_logs_client):
+        mock_logs_client.get_query_results.return_value = {
+            "status": "Complete",
+            "results": [_row(NOW - 2 * DAY, "a", start_nano=1)],
+        }
+        start, end = _settled_window()
+
+        first = cached_client.query_spans_by_session("session-1", start, end, agent_id="agent-1")
+        second = cached_client.query_spans_by_session("session-1", start, end, agent_id="agent-1")
+
+        assert mock_logs_client.start_query.call_count == 1
+        assert [s.span_id for s in first] == [s.span_id for s in second] == ["a"]
+
+    def test_new_client_narrows_known_session(self, cached_client, mock_logs_client, cache):
+        """An explicit session lookup in a later process only scans the session's known bounds."""
+        session_start = NOW - 2 * DAY
+        mock_logs_client.get_query_results.return_value = {
+            "status": "Complete",
+            "results": [_row(session_start, "a", start_nano=session_start * 1_000_000)],
+        }
+        cached_client.query_spans_by_session("session-1", NOW - 30 * DAY, NOW, agent_id="agent-1")
+        # Drop the cached rows so the later lookup has to query CloudWatch again
+        with cache._connect() as conn:
+            conn.execute("DELETE FROM coverage")
+
+        later = ObservabilityClient(region_name="us-east-1", cache=cache)
+        later.query_spans_by_session("session-1", NOW - 30 * DAY, NOW, agent_id="agent-1")
+
+        later_call = mock_logs_client.start_query.call_args.kwargs
+        assert later_call["startTime"] >= (session_start - DAY) // 1000
+        assert later_call["endTime"] <= (session_start + DAY) // 1000
+
+    def test_narrowed_window_is_not_widened_to_the_hour(self, cached_client, mock_logs_client):
+        """Aligning a narrowed trace window adds minutes, not an hour, to the scan."""
+        trace_start = NOW - 2 * DAY + 37 * 60 * 1000
+        cached_client.windows.record_spans(
+            ("trace", "trace-1"),
+            [Span(trace_id="trace-1", span_id="a", span_name="a", start_time_unix_nano=trace_start * 1_000_000)],
+            now_ms=NOW,
+        )
+
+        cached_client.query_spans_by_trace("trace-1", NOW - 7 * DAY, NOW, agent_id="agent-1")
+
+        query_start_ms = mock_logs_client.start_query.call_args_list[0].kwargs["startTime"] * 1000
+        lower = trace_start - MARGIN_MS
+        assert 0 <= lower - query_start_ms < 5 * 60 * 1000
+
+    def test_wider_window_only_queries_new_range(self, cached_client, mock_logs_client):
+        start, end = _settled_window()
+        cached_client.query_spans_by_trace("trace-1", start, end, agent_id="agent-1")
+        cached_client.query_spans_by_trace("trace-1", start - 2 * DAY, end, agent_id="agent-1")
+
+        assert mock_logs_client.start_query.call_count == 2
+        second_call = mock_logs_client.start_query.call_args.kwargs
+        assert second_call["startTime"] == (start - 2 * DAY) // 1000
+        assert second_call["endTime"] == start // 1000
+
+    def test_truncated_results_are_fetched_again(self, cached_client, mock_logs_client):
+        cached_client.MAX_QUERY_RESULTS = 1
+        mock_logs_client.get_query_results.return_value = {
+            "status": "Complete",
+            "results": [_row(NOW - 2 * DAY, "a")],
+        }
+        # A window inside one second cannot be bisected any further
+        start = NOW - DAY
+        end = start + 500
+
+        cached_client.query_spans_by_session("session-1", start, end, agent_id="agent-1")
+        cached_client.query_spans_by_session("session-1", start, end, agent_id="agent-1")
+
+        assert mock_logs_client.start_query.call_count == 2
+
+    def test_runtime_logs_cached_per_trace(self, cached_client, mock_logs_client):
+        mock_logs_client.get_query_results.return_value = {
+            "status": "Complete",
+            "results": [_row(NOW - 3 * DAY, "a", trace_id="trace-1"), _row(NOW - 2 * DAY, "b", trace_id="trace-2")],
+        }
+        start, end = _settled_window()
+
+        cached_client.query_runtime_logs_by_traces(["trace-1", "trace-2"], start, end, agent_id="agent-1")
+        logs = cached_client.query_runtime_logs_by_traces(["trace-2"], start, end, agent_id="agent-1")
+
+        assert mock_logs_client.start_query.call_count == 1
+        assert [log.trace_id for log in logs] == ["trace-2"]
+
+    def test_runtime_logs_only_query_uncached_traces(self, cached_client, mock_logs_client):
+        start, end = _settled_window()
+        cached_client.query_runtime_logs_by_traces(["trace-1"], start, end, agent_id="agent-1")
+        cached_client.query_runtime_logs_by_traces(["trace-1", "trace-2"], start, end, agent_id="agent-1")
+
+        assert mock_logs_client.start_query.call_count == 2
+        query = mock_logs_client.start_query.call_args.kwargs["queryString"]
+        assert "'trace-2'" in query
+        assert "'trace-1'" not in query
+
+    def test_cache_errors_fall_back_to_cloudwatch(self, cached_client, mock_logs_client):
+        broken = Mock(spec=ObservabilityCache)
+        broken.scope.return_value = "scope"
+        broken.missing_ranges.side_effect = sqlite3.OperationalError("database is locked")
+        cached_client.cache = broken
+        start, end = _settled_window()
+
+        cached_client.query_spans_by_session("session-1", start, end, agent_id="agent-1")
+
+        assert cached_client.cache is None
+        assert mock_logs_client.start_query.call_count == 1
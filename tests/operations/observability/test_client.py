@@ -1,8 +1,13 @@
 """Unit tests for stateless ObservabilityClient."""
 
+import asyncio
+from unittest.mock import patch
+
 import pytest
 from botocore.exceptions import ClientError
 
+from bedrock_agentcore_starter_toolkit.operations.observability.telemetry import Span
+
 
 class TestObservabilityClientInit:
     """Test stateless ObservabilityClient initialization."""
@@ -280,6 +285,70 @@ class TestGetLatestSessionId:
 
         assert session_id is None
 
+    def test_get_latest_session_ids(self, observability_client, mock_logs_client, agent_id, time_range):
+        """Test that several sessions are returned, most recent first."""
+        mock_logs_client.start_query.return_value = {"queryId": "query-123"}
+        mock_logs_client.get_query_results.return_value = {
+            "status": "Complete",
+            "results": [
+                [{"field": "attributes.session.id", "value": "session-2"}, {"field": "maxEnd", "value": "2000"}],
+                [{"field": "maxEnd", "value": "1500"}],
+                [{"field": "attributes.session.id", "value": "session-1"}, {"field": "maxEnd", "value": "1000"}],
+            ],
+        }
+
+        session_ids = observability_client.get_latest_session_ids(
+            time_range["start_time_ms"], time_range["end_time_ms"], agent_id=agent_id, limit=50000
+        )
+
+        assert session_ids == ["session-2", "session-1"]
+        query_string = mock_logs_client.start_query.call_args.kwargs["queryString"]
+        assert f"| limit {observability_client.MAX_QUERY_RESULTS}" in query_string
+
+
+class TestLatencyStats:
+    """Test server-side latency aggregation."""
+
+    ROW = [
+        {"field": "groupName", "value": "invoke_agent"},
+        {"field": "spanCount", "value": "42"},
+        {"field": "p90Ms", "value": "900"},
+    ]
+
+    def test_query_latency_stats(self, observability_client, mock_logs_client, agent_id, time_range):
+        """Test that one unsharded stats query runs over the whole window."""
+        observability_client.MAX_CONCURRENT_QUERIES = 4
+        mock_logs_client.get_query_results.return_value = {"status": "Complete", "results": [self.ROW]}
+
+        stats = observability_client.query_latency_stats(
+            time_range["start_time_ms"], time_range["end_time_ms"], agent_id=agent_id, group_by="span"
+        )
+
+        assert [(item.group, item.span_count, item.p90_ms) for item in stats] == [("invoke_agent", 42, 900.0)]
+        call = mock_logs_client.start_query.call_args.kwargs
+        assert mock_logs_client.start_query.call_count == 1
+        assert call["logGroupName"] == "aws/spans"
+        assert (call["startTime"], call["endTime"]) == (
+            time_range["start_time_ms"] // 1000,
+            time_range["end_time_ms"] // 1000,
+        )
+        assert "by groupName" in call["queryString"]
+
+    def test_query_latency_report_runs_each_dimension(
+        self, observability_client, mock_logs_client, agent_id, time_range
+    ):
+        """Test that a report has one entry per requested dimension."""
+        mock_logs_client.get_query_results.return_value = {"status": "Complete", "results": [self.ROW]}
+
+        report = observability_client.query_latency_report(
+            time_range["start_time_ms"], time_range["end_time_ms"], agent_id=agent_id, group_bys=("tool", "model")
+        )
+
+        assert list(report) == ["tool", "model"]
+        queries = [call.kwargs["queryString"] for call in mock_logs_client.start_query.call_args_list]
+        assert any("gen_ai.tool.name as groupName" in query for query in queries)
+        assert any("gen_ai.request.model as groupName" in query for query in queries)
+
 
 class TestErrorHandling:
     """Test error handling."""
@@ -314,3 +383,303 @@ class TestErrorHandling:
                 end_time_ms=time_range["end_time_ms"],
                 agent_id=agent_id,
             )
+
+
+class TestShardedQueries:
+    """Test time-sharded execution of row-returning queries."""
+
+    @staticmethod
+    def _serve_rows(mock_logs_client, timestamps_s):
+        """Answer each query with the rows inside its window, truncated at the row limit."""
+        windows = {}
+
+        def start_query(**kwargs):
+            query_id = f"query-{len(windows)}"
+            windows[query_id] = (kwargs["startTime"], kwargs["endTime"])
+            return {"queryId": query_id}
+
+        def get_query_results(queryId):
+            start_s, end_s = windows[queryId]
+            rows = [
+                [
+                    {"field": "@timestamp", "value": str(ts)},
+                    {"field": "spanId", "value": f"span-{ts}"},
+                    {"field": "startTimeUnixNano", "value": str(ts * 1_000_000_000)},
+                ]
+                for ts in timestamps_s
+                if start_s <= ts <= end_s
+            ]
+            return {"status": "Complete", "results": rows[:3]}
+
+        mock_logs_client.start_query.side_effect = start_query
+        mock_logs_client.get_query_results.side_effect = get_query_results
+        return windows
+
+    def test_long_window_split_into_shards(self, observability_client, mock_logs_client, agent_id, time_range):
+        """Test that a multi-day window runs as several contiguous shards."""
+        observability_client.MAX_CONCURRENT_QUERIES = 4
+        windows = self._serve_rows(mock_logs_client, [])
+
+        observability_client.query_spans_by_session(
+            session_id="session-1",
+            start_time_ms=time_range["start_time_ms"],
+            end_time_ms=time_range["end_time_ms"],
+            agent_id=agent_id,
+        )
+
+        shards = sorted(windows.values())
+        assert len(shards) == 4
+        assert shards[0][0] == time_range["start_time_ms"] // 1000
+        assert shards[-1][1] == time_range["end_time_ms"] // 1000
+        assert all(prev[1] == nxt[0] for prev, nxt in zip(shards, shards[1:], strict=False))
+
+    def test_short_window_not_split(self, observability_client, mock_logs_client, agent_id):
+        """Test that windows shorter than two minimum shards run as one query."""
+        observability_client.MAX_CONCURRENT_QUERIES = 4
+        self._serve_rows(mock_logs_client, [])
+
+        observability_client.query_spans_by_session(
+            session_id="session-1", start_time_ms=0, end_time_ms=60 * 60 * 1000, agent_id=agent_id
+        )
+
+        assert mock_logs_client.start_query.call_count == 1
+
+    def test_truncated_shard_is_bisected(self, observability_client, mock_logs_client, agent_id):
+        """Test that a shard at the row limit is split until every row is returned."""
+        observability_client.MAX_QUERY_RESULTS = 3
+        timestamps = [10, 20, 30, 40, 50, 60, 70, 80]
+        self._serve_rows(mock_logs_client, timestamps)
+
+        spans = observability_client.query_spans_by_session(
+            session_id="session-1", start_time_ms=0, end_time_ms=100_000, agent_id=agent_id
+        )
+
+        assert [span.span_id for span in spans] == [f"span-{ts}" for ts in timestamps]
+        assert mock_logs_client.start_query.call_count > 1
+
+    def test_boundary_rows_not_duplicated(self, observability_client, mock_logs_client, agent_id):
+        """Test that rows in the second shared by two shards are returned once."""
+        observability_client.MAX_QUERY_RESULTS = 3
+        # 50 is the midpoint of the first bisection and falls in both halves
+        timestamps = [10, 50, 90, 95]
+        self._serve_rows(mock_logs_client, timestamps)
+
+        spans = observability_client.query_spans_by_session(
+            session_id="session-1", start_time_ms=0, end_time_ms=100_000, agent_id=agent_id
+        )
+
+        assert [span.span_id for span in spans] == [f"span-{ts}" for ts in timestamps]
+
+    def test_start_query_retried_when_quota_exceeded(
+        self, observability_client, mock_logs_client, mock_query_response_empty, session_id, agent_id, time_range
+    ):
+        """Test that start_query backs off while the concurrent query quota is used up."""
+        mock_query_response_empty(mock_logs_client)
+        # botocore models each service error as its own ClientError subclass
+        mock_logs_client.exceptions.ResourceNotFoundException = type("ResourceNotFoundException", (ClientError,), {})
+        limit_error = ClientError({"Error": {"Code": "LimitExceededException"}}, "StartQuery")
+        mock_logs_client.start_query.side_effect = [limit_error, {"queryId": "query-1"}]
+
+        with patch("bedrock_agentcore_starter_toolkit.operations.observability.client.time.sleep"):
+            spans = observability_client.query_spans_by_session(
+                session_id=session_id,
+                start_time_ms=time_range["start_time_ms"],
+                end_time_ms=time_range["end_time_ms"],
+                agent_id=agent_id,
+            )
+
+        assert spans == []
+        assert mock_logs_client.start_query.call_count == 2
+
+
+class TestAdaptivePolling:
+    """Test the poll interval backoff."""
+
+    def test_poll_interval_backs_off_to_cap(self, observability_client, mock_logs_client, agent_id):
+        """Test that polling starts fast and never waits longer than the cap."""
+        running = {"status": "Running"}
+        mock_logs_client.get_query_results.side_effect = [running] * 12 + [{"status": "Complete", "results": []}]
+
+        with patch("bedrock_agentcore_starter_toolkit.operations.observability.client.time.sleep") as mock_sleep:
+            observability_client.query_spans_by_trace("trace-1", 0, 60_000, agent_id=agent_id)
+
+        delays = [call.args[0] for call in mock_sleep.call_args_list]
+        assert len(delays) == 12
+        assert delays[0] == observability_client.POLL_INITIAL_INTERVAL_SECONDS
+        assert delays == sorted(delays)
+        assert delays[-1] == observability_client.POLL_INTERVAL_SECONDS
+
+
+class TestFetchTelemetry:
+    """Test combined span and runtime-log fetches."""
+
+    def test_fetch_trace_telemetry(
+        self, observability_client, mock_logs_client, mock_query_response_single_span, trace_id, agent_id, time_range
+    ):
+        """Test that a trace fetch returns spans and runtime logs from two queries."""
+        mock_query_response_single_span(mock_logs_client)
+
+        spans, runtime_logs = observability_client.fetch_trace_telemetry(
+            trace_id, time_range["start_time_ms"], time_range["end_time_ms"], agent_id=agent_id
+        )
+
+        assert len(spans) == 1
+        assert len(runtime_logs) == 1
+        log_groups = sorted(call.kwargs["logGroupName"] for call in mock_logs_client.start_query.call_args_list)
+        assert log_groups == [f"/aws/bedrock-agentcore/runtimes/{agent_id}-DEFAULT", "aws/spans"]
+
+    def test_fetch_session_telemetry_queries_logs_for_session_traces(
+        self, observability_client, mock_logs_client, mock_query_response_single_span, session_id, agent_id, time_range
+    ):
+        """Test that runtime logs are queried for the traces found in the session's spans."""
+        mock_query_response_single_span(mock_logs_client)
+
+        spans, _ = observability_client.fetch_session_telemetry(
+            session_id, time_range["start_time_ms"], time_range["end_time_ms"], agent_id=agent_id
+        )
+
+        logs_query = mock_logs_client.start_query.call_args.kwargs["queryString"]
+        assert f"'{spans[0].trace_id}'" in logs_query
+
+    def test_fetch_session_telemetry_without_spans(
+        self, observability_client, mock_logs_client, mock_query_response_empty, session_id, agent_id, time_range
+    ):
+        """Test that no runtime-log query is made for a session without spans."""
+        mock_query_response_empty(mock_logs_client)
+
+        result = observability_client.fetch_session_telemetry(
+            session_id, time_range["start_time_ms"], time_range["end_time_ms"], agent_id=agent_id
+        )
+
+        assert result == ([], [])
+        assert mock_logs_client.start_query.call_count == 1
+
+    def test_fetch_session_telemetry_async(
+        self, observability_client, mock_logs_client, mock_query_response_single_span, session_id, agent_id, time_range
+    ):
+        """Test the awaitable variant returns the same data."""
+        mock_query_response_single_span(mock_logs_client)
+
+        spans, runtime_logs = asyncio.run(
+            observability_client.fetch_session_telemetry_async(
+                session_id, time_range["start_time_ms"], time_range["end_time_ms"], agent_id=agent_id
+            )
+        )
+
+        assert len(spans) == 1
+        assert len(runtime_logs) == 1
+
+
+class TestWindowNarrowing:
+    """Test that lookups scan only the known bounds of a session or trace."""
+
+    XRAY_TRACE_ID = "691bb6a875f4b80435ad36816864e7c2"
+    XRAY_START_S = 0x691BB6A8
+
+    def _span_row(self, trace_id, start_s):
+        return [
+            {"field": "traceId", "value": trace_id},
+            {"field": "spanId", "value": "span-1"},
+            {"field": "startTimeUnixNano", "value": str(start_s * 1_000_000_000)},
+            {"field": "endTimeUnixNano", "value": str((start_s + 5) * 1_000_000_000)},
+        ]
+
+    def test_trace_lookup_narrowed_by_trace_id(self, observability_client, mock_logs_client, agent_id):
+        """Test that an X-Ray trace ID bounds the span query."""
+        mock_logs_client.get_query_results.return_value = {
+            "status": "Complete",
+            "results": [self._span_row(self.XRAY_TRACE_ID, self.XRAY_START_S)],
+        }
+        start_ms = (self.XRAY_START_S - 7 * 86400) * 1000
+        end_ms = (self.XRAY_START_S + 86400) * 1000
+
+        observability_client.query_spans_by_trace(self.XRAY_TRACE_ID, start_ms, end_ms, agent_id=agent_id)
+
+        call = mock_logs_client.start_query.call_args.kwargs
+        assert mock_logs_client.start_query.call_count == 1
+        assert call["startTime"] == self.XRAY_START_S - 15 * 60
+        assert call["endTime"] == self.XRAY_START_S + 8 * 3600 + 15 * 60
+
+    def test_trace_lookup_retries_full_window_on_miss(self, observability_client, mock_logs_client, agent_id):
+        """Test that a hex trace ID whose prefix is not a start time still finds its spans."""
+        mock_logs_client.get_query_results.side_effect = [
+            {"status": "Complete", "results": []},
+            {"status": "Complete", "results": [self._span_row(self.XRAY_TRACE_ID, self.XRAY_START_S - 86400)]},
+        ]
+        start_ms = (self.XRAY_START_S - 7 * 86400) * 1000
+        end_ms = (self.XRAY_START_S + 86400) * 1000
+
+        spans = observability_client.query_spans_by_trace(self.XRAY_TRACE_ID, start_ms, end_ms, agent_id=agent_id)
+
+        assert len(spans) == 1
+        last_call = mock_logs_client.start_query.call_args.kwargs
+        assert (last_call["startTime"], last_call["endTime"]) == (start_ms // 1000, end_ms // 1000)
+
+    def test_trace_logs_refetch_failure_keeps_spans(self, observability_client, agent_id):
+        """Test that a failed runtime-log re-query for the real trace window is not fatal."""
+        span = Span(
+            trace_id=self.XRAY_TRACE_ID,
+            span_id="span-1",
+            span_name="",
+            start_time_unix_nano=(self.XRAY_START_S - 86400) * 1_000_000_000,
+            end_time_unix_nano=(self.XRAY_START_S - 86400 + 5) * 1_000_000_000,
+        )
+
+        def query_spans(trace_id, start_ms, end_ms, agent_id):
+            observability_client.windows.record_spans(("trace", trace_id), [span])
+            return [span]
+
+        start_ms = (self.XRAY_START_S - 7 * 86400) * 1000
+        end_ms = (self.XRAY_START_S + 86400) * 1000
+        with (
+            patch.object(observability_client, "query_spans_by_trace", side_effect=query_spans),
+            patch.object(observability_client, "query_runtime_logs_by_traces", side_effect=Exception("throttled")),
+        ):
+            spans, runtime_logs = observability_client.fetch_trace_telemetry(
+                self.XRAY_TRACE_ID, start_ms, end_ms, agent_id=agent_id
+            )
+
+        assert spans == [span]
+        assert runtime_logs == []
+
+    def test_runtime_logs_narrowed_to_session_traces(
+        self, observability_client, mock_logs_client, session_id, agent_id, time_range
+    ):
+        """Test that runtime logs are only scanned around the traces the span query found."""
+        span_start_s = time_range["start_time_ms"] // 1000 + 86400
+        mock_logs_client.get_query_results.return_value = {
+            "status": "Complete",
+            "results": [self._span_row("trace-1", span_start_s)],
+        }
+
+        observability_client.fetch_session_telemetry(
+            session_id, time_range["start_time_ms"], time_range["end_time_ms"], agent_id=agent_id
+        )
+
+        logs_call = mock_logs_client.start_query.call_args.kwargs
+        assert logs_call["startTime"] == span_start_s - 15 * 60
+        assert logs_call["endTime"] == span_start_s + 5 + 15 * 60
+
+    def test_latest_session_bounds_span_query(self, observability_client, mock_logs_client, agent_id, time_range):
+        """Test that the latest-session lookup bounds the following session query."""
+        max_end_s = time_range["end_time_ms"] // 1000 - 3600
+        mock_logs_client.get_query_results.return_value = {
+            "status": "Complete",
+            "results": [
+                [
+                    {"field": "attributes.session.id", "value": "session-latest"},
+                    {"field": "maxEnd", "value": str(max_end_s * 1_000_000_000)},
+                ]
+            ],
+        }
+        session_id = observability_client.get_latest_session_id(
+            time_range["start_time_ms"], time_range["end_time_ms"], agent_id=agent_id
+        )
+
+        observability_client.query_spans_by_session(
+            session_id, time_range["start_time_ms"], time_range["end_time_ms"], agent_id=agent_id
+        )
+
+        spans_call = mock_logs_client.start_query.call_args.kwargs
+        assert spans_call["startTime"] == max_end_s - 8 * 3600 - 15 * 60
+        assert spans_call["endTime"] == time_range["end_time_ms"] // 1000
@@ -362,8 +362,7 @@ class TestE2EObservabilityShow:
         ) as mock_create:
             mock_client = MagicMock()
             mock_client.region = "us-east-1"
-            mock_client.query_spans_by_trace.return_value = trace_spans
-            mock_client.query_runtime_logs_by_traces.return_value = logs
+            mock_client.fetch_trace_telemetry.return_value = (trace_spans, logs)
             # Return tuple: (client, agent_id, endpoint_name)
             mock_create.return_value = (mock_client, "test-agent", "DEFAULT")
 
@@ -377,8 +376,7 @@ class TestE2EObservabilityShow:
             trace_data = obs.show(trace_id=trace_id)
 
             # Verify client was called (called twice: once by CLI helper, once for return data)
-            assert mock_client.query_spans_by_trace.call_count >= 1
-            assert mock_client.query_runtime_logs_by_traces.call_count >= 1
+            assert mock_client.fetch_trace_telemetry.call_count >= 1
 
             # Verify data
             assert isinstance(trace_data, TraceData)
@@ -400,8 +398,7 @@ class TestE2EObservabilityShow:
         ) as mock_create:
             mock_client = MagicMock()
             mock_client.region = "us-east-1"
-            mock_client.query_spans_by_trace.return_value = trace_spans
-            mock_client.query_runtime_logs_by_traces.return_value = logs
+            mock_client.fetch_trace_telemetry.return_value = (trace_spans, logs)
             # Return tuple: (client, agent_id, endpoint_name)
             mock_create.return_value = (mock_client, "test-agent", "DEFAULT")
 
@@ -415,7 +412,7 @@ class TestE2EObservabilityShow:
             trace_data = obs.show(trace_id=trace_id, verbose=True)
 
             # Verify client was called
-            assert mock_client.query_spans_by_trace.call_count >= 1
+            assert mock_client.fetch_trace_telemetry.call_count >= 1
 
             # Verify data
             assert isinstance(trace_data, TraceData)
@@ -619,8 +616,7 @@ class TestE2EObservabilityMessageDisplay:
         ) as mock_create:
             mock_client = MagicMock()
             mock_client.region = "us-east-1"
-            mock_client.query_spans_by_trace.return_value = trace_spans
-            mock_client.query_runtime_logs_by_traces.return_value = logs
+            mock_client.fetch_trace_telemetry.return_value = (trace_spans, logs)
             # Return tuple: (client, agent_id, endpoint_name)
             mock_create.return_value = (mock_client, "test-agent", "DEFAULT")
 
@@ -667,8 +663,7 @@ class TestE2EObservabilityOutputFormats:
         ) as mock_create:
             mock_client = MagicMock()
             mock_client.region = "us-east-1"
-            mock_client.query_spans_by_trace.return_value = trace_spans
-            mock_client.query_runtime_logs_by_traces.return_value = logs
+            mock_client.fetch_trace_telemetry.return_value = (trace_spans, logs)
             # Return tuple: (client, agent_id, endpoint_name)
             mock_create.return_value = (mock_client, "test-agent", "DEFAULT")
 
@@ -703,8 +698,7 @@ class TestE2EObservabilityOutputFormats:
         ) as mock_create:
             mock_client = MagicMock()
             mock_client.region = "us-east-1"
-            mock_client.query_spans_by_trace.return_value = trace_spans
-            mock_client.query_runtime_logs_by_traces.return_value = logs
+            mock_client.fetch_trace_telemetry.return_value = (trace_spans, logs)
             # Return tuple: (client, agent_id, endpoint_name)
             mock_create.return_value = (mock_client, "test-agent", "DEFAULT")
 
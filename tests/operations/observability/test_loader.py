@@ -0,0 +1,246 @@
+"""Unit tests for loading spans and runtime logs from local files."""
+
+import base64
+import json
+from pathlib import Path
+
+import pytest
+
+from bedrock_agentcore_starter_toolkit.operations.observability import loader
+from bedrock_agentcore_starter_toolkit.operations.observability.loader import (
+    LocalTelemetrySource,
+    iter_json_values,
+    iter_telemetry,
+    load_trace_data,
+)
+from bedrock_agentcore_starter_toolkit.operations.observability.telemetry import RuntimeLog, Span
+from bedrock_agentcore_starter_toolkit.operations.observability.trace_processor import TraceProcessor
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+SPANS_FILE = FIXTURES_DIR / "raw_otel_strands_bedrock_spans.json"
+LOGS_FILE = FIXTURES_DIR / "raw_otel_strands_bedrock_runtime_logs.json"
+
+TRACE_ID = "6553f1000000000000000000000000aa"
+
+
+def otlp_span(span_id, parent=None, **overrides):
+    span = {
+        "traceId": TRACE_ID,
+        "spanId": span_id,
+        "name": f"span-{span_id}",
+        "kind": 2,
+        "startTimeUnixNano": "1700000000000000000",
+        "endTimeUnixNano": "1700000000500000000",
+        "attributes": [
+            {"key": "session.id", "value": {"stringValue": "session-1"}},
+            {"key": "gen_ai.usage.input_tokens", "value": {"intValue": "12"}},
+            {
+                "key": "tags",
+                "value": {"arrayValue": {"values": [{"stringValue": "a"}, {"boolValue": True}]}},
+            },
+        ],
+        "status": {"code": 2, "message": "boom"},
+    }
+    if parent:
+        span["parentSpanId"] = parent
+    span.update(overrides)
+    return span
+
+
+def otlp_request(spans=(), log_records=()):
+    resource = {"attributes": [{"key": "service.name", "value": {"stringValue": "my-agent"}}]}
+    scope = {"name": "strands.telemetry.tracer", "version": "1.0"}
+    request = {}
+    if spans:
+        request["resourceSpans"] = [{"resource": resource, "scopeSpans": [{"scope": scope, "spans": list(spans)}]}]
+    if log_records:
+        request["resourceLogs"] = [
+            {"resource": resource, "scopeLogs": [{"scope": scope, "logRecords": list(log_records)}]}
+        ]
+    return request
+
+
+class TestIterJsonValues:
+    """Test incremental JSON decoding."""
+
+    def test_newline_delimited_and_concatenated(self, tmp_path):
+        """Documents are yielded one at a time however they are separated."""
+        path = tmp_path / "docs.jsonl"
+        path.write_text('{"a": 1}\n{"b": 2}{"c": 3}\n\n')
+
+        assert list(iter_json_values(path)) == [{"a": 1}, {"b": 2}, {"c": 3}]
+
+    def test_top_level_array_is_streamed(self, tmp_path):
+        """Elements of a top-level array are yielded individually."""
+        path = tmp_path / "docs.json"
+        path.write_text('[\n  {"a": 1},\n  {"b": [1, 2]}\n]\n[]')
+
+        assert list(iter_json_values(path)) == [{"a": 1}, {"b": [1, 2]}]
+
+    def test_values_spanning_read_chunks(self, tmp_path, monkeypatch):
+        """Values larger than one read are decoded once the rest has been read."""
+        monkeypatch.setattr(loader, "READ_CHUNK_SIZE", 4)
+        values = [{"message": "x" * 50, "n": i} for i in range(5)]
+        path = tmp_path / "docs.json"
+        path.write_text(json.dumps(values))
+
+        assert list(iter_json_values(path)) == values
+
+    @pytest.mark.parametrize("content", ['{"a": 1}\n{"b": ', "[{}, {}"])
+    def test_invalid_json_raises(self, tmp_path, content):
+        """Truncated files are reported rather than silently cut short."""
+        path = tmp_path / "bad.json"
+        path.write_text(content)
+
+        with pytest.raises(ValueError, match="bad.json"):
+            list(iter_json_values(path))
+
+
+class TestOtlpConversion:
+    """Test OTLP/JSON export requests are converted to the aws/spans shape."""
+
+    def test_span_fields(self, tmp_path):
+        """Enums, timestamps and attributes match what CloudWatch stores."""
+        path = tmp_path / "traces.jsonl"
+        path.write_text(json.dumps(otlp_request(spans=[otlp_span("00000000000000b1", parent="00000000000000a1")])))
+
+        (span,) = list(iter_telemetry([path]))
+
+        assert isinstance(span, Span)
+        assert span.kind == "SERVER"
+        assert span.status_code == "ERROR"
+        assert span.status_message == "boom"
+        assert span.start_time_unix_nano == 1_700_000_000_000_000_000
+        assert span.duration_ms == 500
+        assert span.parent_span_id == "00000000000000a1"
+        assert span.session_id == "session-1"
+        assert span.attributes["gen_ai.usage.input_tokens"] == 12
+        assert span.attributes["tags"] == ["a", True]
+        assert span.service_name == "my-agent"
+        assert span.raw_message["scope"]["name"] == "strands.telemetry.tracer"
+        assert span.timestamp == "2023-11-14 22:13:20.500"
+
+    def test_protobuf_json_names_and_base64_ids(self, tmp_path):
+        """Exporters using the generic protobuf JSON mapping are understood too."""
+        trace_id = bytes.fromhex(TRACE_ID)
+        span = otlp_span(
+            base64.b64encode(bytes.fromhex("00000000000000b1")).decode(),
+            traceId=base64.b64encode(trace_id).decode(),
+            kind="SPAN_KIND_CLIENT",
+            status={},
+        )
+        path = tmp_path / "traces.jsonl"
+        path.write_text(json.dumps(otlp_request(spans=[span])))
+
+        (built,) = list(iter_telemetry([path]))
+
+        assert built.trace_id == TRACE_ID
+        assert built.span_id == "00000000000000b1"
+        assert built.kind == "CLIENT"
+        assert built.status_code == "UNSET"
+
+    def test_log_records(self, tmp_path):
+        """Log record bodies are flattened into the runtime log document."""
+        record = {
+            "timeUnixNano": "1700000000000000000",
+            "severityNumber": 9,
+            "traceId": TRACE_ID,
+            "spanId": "00000000000000b1",
+            "body": {"kvlistValue": {"values": [{"key": "content", "value": {"stringValue": "hi"}}]}},
+            "attributes": [{"key": "event.name", "value": {"stringValue": "gen_ai.user.message"}}],
+        }
+        path = tmp_path / "logs.jsonl"
+        path.write_text(json.dumps(otlp_request(log_records=[record])))
+
+        (log,) = list(iter_telemetry([path]))
+
+        assert isinstance(log, RuntimeLog)
+        assert log.trace_id == TRACE_ID
+        assert log.span_id == "00000000000000b1"
+        assert log.timestamp == "2023-11-14 22:13:20.000"
+        assert log.raw_message["body"] == {"content": "hi"}
+        assert log.raw_message["attributes"] == {"event.name": "gen_ai.user.message"}
+        assert json.loads(log.message) == log.raw_message
+
+
+class TestLoadTraceData:
+    """Test building TraceData from files."""
+
+    def test_fixture_records(self):
+        """Records captured from CloudWatch load with their timestamps."""
+        trace_data = load_trace_data([SPANS_FILE, LOGS_FILE])
+
+        assert len(trace_data.spans) == 50
+        assert trace_data.runtime_logs
+        assert set(trace_data.traces) == {span.trace_id for span in trace_data.spans}
+        starts = [span.start_time_unix_nano for span in trace_data.spans]
+        assert starts == sorted(starts)
+        assert trace_data.spans[0].timestamp
+
+    def test_filter_keeps_logs_of_matching_traces(self):
+        """Runtime logs are kept for the traces of the selected spans only."""
+        everything = load_trace_data([SPANS_FILE, LOGS_FILE])
+        trace_id = everything.runtime_logs[0].trace_id
+
+        trace_data = load_trace_data([LOGS_FILE, SPANS_FILE], trace_id=trace_id)
+
+        assert set(trace_data.traces) == {trace_id}
+        assert trace_data.runtime_logs
+        assert {log.trace_id for log in trace_data.runtime_logs} == {trace_id}
+
+    def test_agent_filter_uses_resource_id(self):
+        """Spans of other agents are dropped."""
+        assert load_trace_data([SPANS_FILE], agent_id="some-other-agent").spans == []
+
+    def test_filter_log_events_output(self, tmp_path):
+        """``aws logs filter-log-events`` output is read event by event."""
+        span = json.loads(SPANS_FILE.read_text())[0]["raw_otel_json"]
+        path = tmp_path / "events.json"
+        path.write_text(
+            json.dumps({"events": [{"timestamp": 0, "message": json.dumps(span), "logStreamName": "default"}]})
+        )
+
+        trace_data = load_trace_data([path])
+
+        assert [s.span_id for s in trace_data.spans] == [span["spanId"]]
+        assert trace_data.spans[0].timestamp == "1970-01-01 00:00:00.000"
+
+    def test_export_round_trip(self, tmp_path):
+        """Data exported with ``obs show -o`` loads back with instrumentation scopes."""
+        original = load_trace_data([SPANS_FILE, LOGS_FILE])
+        path = tmp_path / "session.json"
+        path.write_text(json.dumps(TraceProcessor.to_dict(original)))
+
+        reloaded = load_trace_data([path])
+
+        assert {s.span_id for s in reloaded.spans} == {s.span_id for s in original.spans}
+        assert len(reloaded.runtime_logs) == len(original.runtime_logs)
+        by_id = {s.span_id: s for s in reloaded.spans}
+        for span in original.spans:
+            assert by_id[span.span_id].raw_message.get("scope") == span.raw_message.get("scope")
+            assert by_id[span.span_id].parent_span_id == span.parent_span_id
+
+
+class TestLocalTelemetrySource:
+    """Test the ObservabilityClient stand-in for local files."""
+
+    def test_latest_session_and_telemetry(self):
+        """The latest session and its telemetry are served from the files."""
+        source = LocalTelemetrySource([SPANS_FILE, LOGS_FILE])
+
+        session_id = source.get_latest_session_id()
+        spans, runtime_logs = source.fetch_session_telemetry(session_id, 0, 0, agent_id="")
+
+        assert session_id == "cc8a8e69-8bed-4e5f-9a06-9a58550fd713"
+        assert len(spans) == 50
+        assert runtime_logs
+
+        trace_id = spans[0].trace_id
+        trace_spans, trace_logs = source.fetch_trace_telemetry(trace_id, 0, 0, agent_id="")
+        assert {s.trace_id for s in trace_spans} == {trace_id}
+        assert trace_logs == source.query_runtime_logs_by_traces([trace_id], 0, 0)
+
+    def test_missing_file(self, tmp_path):
+        """Missing files are reported up front."""
+        with pytest.raises(FileNotFoundError):
+            LocalTelemetrySource([tmp_path / "missing.json"])
@@ -1,5 +1,7 @@
 """Tests for CloudWatchQueryBuilder."""
 
+import pytest
+
 from bedrock_agentcore_starter_toolkit.operations.observability.query_builder import CloudWatchQueryBuilder
 
 
@@ -313,6 +315,34 @@ class TestQueryStructure:
         assert "| limit" in query
 
 
+class TestLatencyStatsQuery:
+    """Test the server-side latency aggregation query."""
+
+    def test_aggregates_percentiles_by_dimension(self):
+        query = CloudWatchQueryBuilder.build_latency_stats_query("test-agent", group_by="tool", limit=10)
+
+        assert "attributes.gen_ai.tool.name as groupName" in query
+        for percentile in (50, 90, 99):
+            assert f"pct(durationMs, {percentile}) as p{percentile}Ms" in query
+        assert "by groupName" in query
+        assert "ispresent(groupName)" in query
+        assert "| sort p90Ms desc" in query
+        assert "| limit 10" in query
+
+    def test_counts_errors_throttles_and_tokens(self):
+        query = CloudWatchQueryBuilder.build_latency_stats_query("test-agent")
+
+        assert "name as groupName" in query
+        assert "as errorCount" in query
+        assert "sum(httpStatusCode = 429) as throttleCount" in query
+        assert "attributes.gen_ai.usage.prompt_tokens" in query
+        assert "sum(outTokens) as outputTokens" in query
+
+    def test_unknown_dimension_rejected(self):
+        with pytest.raises(ValueError, match="Unknown stats dimension"):
+            CloudWatchQueryBuilder.build_latency_stats_query("test-agent", group_by="region")
+
+
 class TestQueryConsistency:
     """Test consistency across different query builders."""
 
@@ -339,6 +369,7 @@ class TestQueryConsistency:
         query1 = CloudWatchQueryBuilder.build_spans_by_session_query("session-1", agent_id)
         query2 = CloudWatchQueryBuilder.build_latest_session_query(agent_id)
         query3 = CloudWatchQueryBuilder.build_session_summary_query("session-1", agent_id)
+        query4 = CloudWatchQueryBuilder.build_latency_stats_query(agent_id)
 
         # All should use same parsing pattern
         parse_pattern = 'parse resource.attributes.cloud.resource_id "runtime/*/"'
@@ -346,7 +377,8 @@ class TestQueryConsistency:
         assert parse_pattern in query1
         assert parse_pattern in query2
         assert parse_pattern in query3
+        assert parse_pattern in query4
 
         # All should filter by parsed agent ID
-        for query in [query1, query2, query3]:
+        for query in [query1, query2, query3, query4]:
             assert f"parsedAgentId = '{agent_id}'" in query
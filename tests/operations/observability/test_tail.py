@@ -0,0 +1,235 @@
+"""Unit tests for live tailing of spans and runtime logs."""
+
+import json
+
+import pytest
+from botocore.exceptions import ClientError
+
+from bedrock_agentcore_starter_toolkit.operations.observability.tail import (
+    LATE_ARRIVAL_MS,
+    ROOT_SETTLE_MS,
+    TRACE_IDLE_MS,
+    LogGroupFollower,
+    TailCursorStore,
+    TraceTailer,
+)
+
+AGENT_ID = "test-agent-456"
+RESOURCE_ID = f"arn:aws:bedrock-agentcore:us-east-1:123456789012:runtime/{AGENT_ID}/runtime-endpoint/DEFAULT:DEFAULT"
+NOW = 1_700_000_000_000
+TRACE_ID = "6553f1000000000000000000000000aa"
+
+
+def span_event(
+    event_id, span_id, parent=None, start=0, end=10, status="UNSET", trace_id=TRACE_ID, resource=RESOURCE_ID
+):
+    document = {
+        "resource": {"attributes": {"cloud.resource_id": resource, "service.name": "agent.DEFAULT"}},
+        "traceId": trace_id,
+        "spanId": span_id,
+        "name": f"span-{span_id}",
+        "kind": "INTERNAL",
+        "startTimeUnixNano": start,
+        "endTimeUnixNano": end,
+        "durationNano": end - start,
+        "attributes": {"session.id": "session-1"},
+        "status": {"code": status},
+    }
+    if parent:
+        document["parentSpanId"] = parent
+    return {"eventId": event_id, "timestamp": NOW, "message": json.dumps(document), "logStreamName": "default"}
+
+
+def log_event(event_id, span_id, trace_id=TRACE_ID):
+    message = json.dumps({"traceId": trace_id, "spanId": span_id, "body": "hello"})
+    return {"eventId": event_id, "timestamp": NOW, "message": message, "logStreamName": "otel-rt-logs"}
+
+
+def respond(mock_logs_client, spans=(), logs=()):
+    """Route filter_log_events responses by log group."""
+
+    def filter_log_events(**kwargs):
+        events = spans if kwargs["logGroupName"] == "aws/spans" else logs
+        return {"events": list(events)}
+
+    mock_logs_client.filter_log_events.side_effect = filter_log_events
+
+
+class TestLogGroupFollower:
+    """Test incremental reads with overlap and de-duplication."""
+
+    def test_deduplicates_overlapping_reads(self, mock_logs_client):
+        """Events returned again by the overlap window are dropped."""
+        follower = LogGroupFollower(mock_logs_client, "group", start_time_ms=NOW)
+        first = {"eventId": "a", "timestamp": NOW + 100, "message": "x"}
+        second = {"eventId": "b", "timestamp": NOW + 200, "message": "y"}
+
+        mock_logs_client.filter_log_events.return_value = {"events": [first]}
+        assert follower.poll() == [first]
+
+        mock_logs_client.filter_log_events.return_value = {"events": [first, second]}
+        assert follower.poll() == [second]
+
+        call = mock_logs_client.filter_log_events.call_args.kwargs
+        assert call["startTime"] == NOW + 100 - LATE_ARRIVAL_MS
+
+    def test_follows_pagination(self, mock_logs_client):
+        """All pages of one poll are read."""
+        follower = LogGroupFollower(mock_logs_client, "group", start_time_ms=NOW, filter_pattern='"x"')
+        mock_logs_client.filter_log_events.side_effect = [
+            {"events": [{"eventId": "a", "timestamp": NOW}], "nextToken": "t"},
+            {"events": [{"eventId": "b", "timestamp": NOW + 1}]},
+        ]
+
+        assert [e["eventId"] for e in follower.poll()] == ["a", "b"]
+        second_call = mock_logs_client.filter_log_events.call_args_list[1].kwargs
+        assert second_call["nextToken"] == "t"
+        assert second_call["filterPattern"] == '"x"'
+
+    def test_missing_log_group_yields_nothing(self, mock_logs_client):
+        """A runtime log group that does not exist yet is not an error."""
+        error = ClientError({"Error": {"Code": "ResourceNotFoundException"}}, "FilterLogEvents")
+        mock_logs_client.filter_log_events.side_effect = error
+        follower = LogGroupFollower(mock_logs_client, "group", start_time_ms=NOW)
+
+        assert follower.poll() == []
+
+    def test_prunes_ids_outside_overlap(self, mock_logs_client):
+        """Only IDs that a later poll could return again are kept."""
+        follower = LogGroupFollower(mock_logs_client, "group", start_time_ms=NOW)
+        mock_logs_client.filter_log_events.return_value = {
+            "events": [
+                {"eventId": "old", "timestamp": NOW},
+                {"eventId": "new", "timestamp": NOW + LATE_ARRIVAL_MS + 1},
+            ]
+        }
+        follower.poll()
+
+        assert follower.cursor() == {
+            "timestamp": NOW + LATE_ARRIVAL_MS + 1,
+            "event_ids": {"new": NOW + LATE_ARRIVAL_MS + 1},
+        }
+
+
+class TestTailCursorStore:
+    """Test persisted read positions."""
+
+    def test_round_trip(self, tmp_path):
+        """Cursors for several log groups share one file."""
+        store = TailCursorStore(tmp_path / ".bedrock_agentcore" / "cursor.json")
+        store.save("a", {"timestamp": 1, "event_ids": {"x": 1}})
+        store.save("b", {"timestamp": 2, "event_ids": {}})
+
+        reopened = TailCursorStore(store.path)
+        assert reopened.load("a") == {"timestamp": 1, "event_ids": {"x": 1}}
+        assert reopened.load("b")["timestamp"] == 2
+        assert reopened.load("c") is None
+
+    def test_corrupt_file_is_ignored(self, tmp_path):
+        """An unreadable cursor file means starting fresh."""
+        path = tmp_path / "cursor.json"
+        path.write_text("not json")
+
+        assert TailCursorStore(path).load("a") is None
+
+
+class TestTraceTailer:
+    """Test incremental trace assembly."""
+
+    @pytest.fixture
+    def tailer(self, observability_client):
+        return TraceTailer(observability_client, agent_id=AGENT_ID, start_time_ms=NOW)
+
+    def test_trace_completes_after_root_settles(self, tailer, mock_logs_client):
+        """A trace is emitted shortly after its root span arrives, with its logs."""
+        respond(
+            mock_logs_client,
+            spans=[span_event("1", "child", parent="root", start=2, end=5)],
+            logs=[log_event("l1", "child")],
+        )
+        batch = tailer.poll(now_ms=NOW)
+        assert [s.span_id for s in batch.spans] == ["child"]
+        assert batch.completed == []
+
+        respond(mock_logs_client, spans=[span_event("2", "root", start=0, end=10)])
+        assert tailer.poll(now_ms=NOW + 100).completed == []
+
+        respond(mock_logs_client)
+        completed = tailer.poll(now_ms=NOW + 100 + ROOT_SETTLE_MS).completed
+
+        assert len(completed) == 1
+        trace = completed[0]
+        assert [s.span_id for s in trace.traces[TRACE_ID]] == ["root", "child"]
+        assert [log.span_id for log in trace.runtime_logs] == ["child"]
+        assert tailer.pending_trace_count == 0
+        assert tailer.trace_data.runtime_logs == []
+
+    def test_enclosing_span_with_external_parent_is_root(self, tailer, mock_logs_client):
+        """The server span's parent lives outside aws/spans but it still completes the trace."""
+        respond(
+            mock_logs_client,
+            spans=[
+                span_event("1", "child", parent="server", start=2, end=5),
+                span_event("2", "server", parent="caller", start=0, end=10),
+            ],
+        )
+        tailer.poll(now_ms=NOW)
+
+        assert len(tailer.poll(now_ms=NOW + ROOT_SETTLE_MS).completed) == 1
+
+    def test_trace_without_root_completes_when_idle(self, tailer, mock_logs_client):
+        """Traces whose root never arrives are still rendered eventually."""
+        # Neither span encloses the other, so the root is unknown
+        respond(
+            mock_logs_client,
+            spans=[
+                span_event("1", "a", parent="missing", start=2, end=5),
+                span_event("2", "b", parent="missing", start=1, end=3),
+            ],
+        )
+        tailer.poll(now_ms=NOW)
+
+        respond(mock_logs_client)
+        assert tailer.poll(now_ms=NOW + ROOT_SETTLE_MS).completed == []
+        assert len(tailer.poll(now_ms=NOW + TRACE_IDLE_MS).completed) == 1
+
+    def test_filters_other_agents_spans(self, tailer, mock_logs_client):
+        """Spans whose resource ID only mentions the agent elsewhere are dropped."""
+        respond(mock_logs_client, spans=[span_event("1", "s", resource="arn:...:runtime/other-agent/x")])
+
+        assert tailer.poll(now_ms=NOW).spans == []
+        call = mock_logs_client.filter_log_events.call_args_list[0].kwargs
+        assert call["filterPattern"] == f'"runtime/{AGENT_ID}/"'
+
+    def test_orphan_logs_are_discarded(self, tailer, mock_logs_client):
+        """Runtime logs whose spans never arrive do not accumulate."""
+        respond(mock_logs_client, logs=[log_event("l1", "s", trace_id="f" * 32)])
+        tailer.poll(now_ms=NOW)
+
+        respond(mock_logs_client)
+        assert tailer.poll(now_ms=NOW + TRACE_IDLE_MS).completed == []
+        assert tailer.trace_data.runtime_logs == []
+
+    def test_flush_returns_pending_traces(self, tailer, mock_logs_client):
+        """Stopping the tail renders what has been collected so far."""
+        respond(mock_logs_client, spans=[span_event("1", "child", parent="root")])
+        tailer.poll(now_ms=NOW)
+
+        assert len(tailer.flush()) == 1
+        assert tailer.pending_trace_count == 0
+
+    def test_resume_from_saved_cursor(self, observability_client, mock_logs_client, tmp_path):
+        """A resumed tail starts at the saved position and skips seen events."""
+        store = TailCursorStore(tmp_path / "cursor.json")
+        respond(mock_logs_client, spans=[span_event("1", "root")])
+        TraceTailer(observability_client, agent_id=AGENT_ID, start_time_ms=NOW, cursor_store=store).poll(now_ms=NOW)
+
+        resumed = TraceTailer(
+            observability_client, agent_id=AGENT_ID, start_time_ms=NOW + 60_000, cursor_store=store, resume=True
+        )
+        mock_logs_client.filter_log_events.reset_mock()
+        batch = resumed.poll(now_ms=NOW + 60_000)
+
+        assert batch.spans == []
+        call = mock_logs_client.filter_log_events.call_args_list[0].kwargs
+        assert call["startTime"] == NOW - LATE_ARRIVAL_MS
@@ -2,11 +2,12 @@
 
 import json
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from bedrock_agentcore_starter_toolkit.operations.observability.builders import CloudWatchResultBuilder
-from bedrock_agentcore_starter_toolkit.operations.observability.telemetry import Span, TraceData
+from bedrock_agentcore_starter_toolkit.operations.observability.telemetry import RuntimeLog, Span, TraceData
 from bedrock_agentcore_starter_toolkit.operations.observability.trace_processor import TraceProcessor
 
 # Load real fixtures
@@ -277,6 +278,37 @@ class TestTraceProcessorMessages:
         if logs_with_span_ids:
             assert len(messages_by_span) > 0
 
+    def test_index_messages_by_span_parses_on_demand(
+        self, strands_bedrock_spans_data, strands_bedrock_runtime_logs_data
+    ):
+        """Runtime logs are only parsed for the spans that are looked up."""
+        trace_data = TraceData(spans=strands_bedrock_spans_data, runtime_logs=strands_bedrock_runtime_logs_data)
+        eager = TraceProcessor.get_messages_by_span(trace_data)
+        span_id = next(iter(eager))
+
+        messages = TraceProcessor.index_messages_by_span(trace_data)
+        with patch.object(messages._parser, "parse", wraps=messages._parser.parse) as parse:
+            assert span_id in messages
+            parse.assert_not_called()
+
+            assert messages[span_id] == eager[span_id]
+            assert messages[span_id] is messages[span_id]
+
+        logs_for_span = [log for log in strands_bedrock_runtime_logs_data if log.span_id == span_id]
+        assert parse.call_count == len(logs_for_span)
+
+    def test_index_messages_by_span_filters_trace(self, strands_bedrock_runtime_logs_data):
+        """Only logs of the requested trace are indexed."""
+        trace_id = strands_bedrock_runtime_logs_data[0].trace_id
+        trace_data = TraceData(runtime_logs=strands_bedrock_runtime_logs_data)
+
+        messages = TraceProcessor.index_messages_by_span(trace_data, trace_id)
+
+        expected = {
+            log.span_id for log in strands_bedrock_runtime_logs_data if log.span_id and log.trace_id == trace_id
+        }
+        assert set(messages) == expected
+
     def test_get_trace_messages(self, strands_bedrock_spans_data, strands_bedrock_runtime_logs_data):
         """Test extracting input/output messages for a trace."""
         trace_data = TraceData(spans=strands_bedrock_spans_data, runtime_logs=strands_bedrock_runtime_logs_data)
@@ -405,3 +437,48 @@ class TestTraceProcessorEdgeCases:
         # Orphan should be treated as root
         assert len(root_spans) == 1
         assert root_spans[0].span_id == "orphan"
+
+
+class TestTraceProcessorIncremental:
+    """Test incremental grouping used by live tailing."""
+
+    def test_add_spans_groups_and_sorts(self):
+        trace_data = TraceData()
+        late = Span(trace_id="t1", span_id="b", span_name="B", start_time_unix_nano=20)
+
+        assert TraceProcessor.add_spans(trace_data, [late]) == ["t1"]
+        touched = TraceProcessor.add_spans(
+            trace_data,
+            [
+                Span(trace_id="t2", span_id="c", span_name="C", start_time_unix_nano=5),
+                Span(trace_id="t1", span_id="a", span_name="A", start_time_unix_nano=10),
+            ],
+        )
+
+        assert touched == ["t2", "t1"]
+        assert [s.span_id for s in trace_data.traces["t1"]] == ["a", "b"]
+        assert len(trace_data.spans) == 3
+
+    def test_pop_trace_takes_spans_and_logs(self):
+        trace_data = TraceData(agent_id="agent")
+        TraceProcessor.add_spans(
+            trace_data,
+            [
+                Span(trace_id="t1", span_id="a", span_name="A", session_id="s1"),
+                Span(trace_id="t2", span_id="b", span_name="B"),
+            ],
+        )
+        trace_data.runtime_logs = [
+            RuntimeLog(timestamp="1", message="x", trace_id="t1"),
+            RuntimeLog(timestamp="2", message="y", trace_id="t2"),
+        ]
+
+        popped = TraceProcessor.pop_trace(trace_data, "t1")
+
+        assert list(popped.traces) == ["t1"]
+        assert popped.session_id == "s1"
+        assert popped.agent_id == "agent"
+        assert [log.message for log in popped.runtime_logs] == ["x"]
+        assert list(trace_data.traces) == ["t2"]
+        assert [s.span_id for s in trace_data.spans] == ["b"]
+        assert [log.message for log in trace_data.runtime_logs] == ["y"]
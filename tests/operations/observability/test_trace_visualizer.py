@@ -1181,3 +1181,86 @@ class TestTraceVisualizerRuntimeLogFormatting:
 
         # Should show both messages
         assert len(output) > 0
+
+
+class TestTraceVisualizerLargeTraces:
+    """Test depth and width limits for traces with many spans."""
+
+    @staticmethod
+    def _trace(fan_out, depth):
+        """Build a trace where every span has ``fan_out`` children, ``depth`` levels deep."""
+        from bedrock_agentcore_starter_toolkit.operations.observability.telemetry import Span
+
+        spans = [Span(trace_id="big-trace", span_id="s", span_name="Root", duration_ms=100.0, status_code="OK")]
+        level = ["s"]
+        for _ in range(depth):
+            next_level = []
+            for parent in level:
+                for i in range(fan_out):
+                    span_id = f"{parent}.{i}"
+                    spans.append(
+                        Span(
+                            trace_id="big-trace",
+                            span_id=span_id,
+                            span_name=f"Span{span_id}",
+                            parent_span_id=parent,
+                            start_time_unix_nano=i,
+                            duration_ms=10.0,
+                            status_code="ERROR" if i == 3 else "OK",
+                        )
+                    )
+                    next_level.append(span_id)
+            level = next_level
+
+        trace_data = TraceData(spans=spans)
+        TraceProcessor.group_spans_by_trace(trace_data)
+        return trace_data
+
+    @staticmethod
+    def _render(trace_data, **kwargs):
+        console = Console(file=StringIO(), width=200, color_system=None)
+        TraceVisualizer(console).visualize_trace(trace_data, "big-trace", **kwargs)
+        return console.file.getvalue()
+
+    def test_no_limits_shows_every_span(self):
+        """Without limits every span is printed."""
+        output = self._render(self._trace(fan_out=3, depth=3))
+
+        assert "Spans.2.2.2" in output
+        assert "collapsed" not in output
+        assert "nested deeper" not in output
+
+    def test_max_depth_summarizes_deeper_spans(self):
+        """Spans below the depth limit are replaced by one summary per parent."""
+        output = self._render(self._trace(fan_out=2, depth=3), max_depth=2)
+
+        assert "Spans.1" in output
+        assert "Spans.1.1" not in output
+        # Each of the two spans at depth 1 summarizes its 2 + 4 descendants
+        assert output.count("… 6 spans nested deeper") == 2
+
+    def test_max_children_keeps_first_and_last(self):
+        """Wide spans list the first and last children around a summary of the rest."""
+        output = self._render(self._trace(fan_out=10, depth=1), max_children=4)
+
+        for shown in ("Spans.0 ", "Spans.1 ", "Spans.8 ", "Spans.9 "):
+            assert shown in output
+        assert "Spans.5 " not in output
+        assert "… 6 spans collapsed" in output
+        assert "1 error" in output
+        assert output.index("Spans.1 ") < output.index("collapsed") < output.index("Spans.8 ")
+
+    def test_max_children_zero_is_unlimited(self):
+        """A limit of 0 shows all children."""
+        output = self._render(self._trace(fan_out=10, depth=1), max_children=0)
+
+        assert "Spans.5 " in output
+        assert "collapsed" not in output
+
+    def test_tree_guides_are_printed_per_line(self):
+        """Nested spans are indented with tree guides as each line is printed."""
+        lines = self._render(self._trace(fan_out=2, depth=2)).splitlines()
+
+        assert any(line.startswith("└── ") and "Root" in line for line in lines)
+        assert any(line.startswith("    ├── ") and "Spans.0 " in line for line in lines)
+        assert any(line.startswith("    │   └── ") and "Spans.0.1" in line for line in lines)
@@ -0,0 +1,136 @@
+"""Tests for session and trace time bounds."""
+
+import sqlite3
+from unittest.mock import Mock
+
+from bedrock_agentcore_starter_toolkit.operations.observability.cache import ObservabilityCache
+from bedrock_agentcore_starter_toolkit.operations.observability.telemetry import Span
+from bedrock_agentcore_starter_toolkit.operations.observability.windows import (
+    MARGIN_MS,
+    MAX_ACTIVITY_MS,
+    ActivityWindows,
+    narrow,
+    xray_trace_start_ms,
+)
+
+HOUR = 60 * 60 * 1000
+DAY = 24 * HOUR
+NOW = 1_763_500_000_000
+
+
+def _span(start_ms, end_ms, trace_id="trace-1"):
+    return Span(
+        trace_id=trace_id,
+        span_id=f"span-{start_ms}",
+        span_name="span",
+        start_time_unix_nano=start_ms * 1_000_000,
+        end_time_unix_nano=end_ms * 1_000_000,
+    )
+
+
+class TestXrayTraceStart:
+    def test_decodes_epoch_prefix(self):
+        assert xray_trace_start_ms("691bb6a875f4b80435ad36816864e7c2") == 0x691BB6A8 * 1000
+
+    def test_ignores_non_hex_ids(self):
+        assert xray_trace_start_ms("test-trace-789") is None
+        assert xray_trace_start_ms("z" * 32) is None
+        assert xray_trace_start_ms(None) is None
+
+
+class TestNarrow:
+    def test_unknown_bounds_keep_window(self):
+        assert narrow(0, 100, None) == (0, 100)
+
+    def test_intersects_bounds(self):
+        assert narrow(0, 100, (20, 60)) == (20, 60)
+
+    def test_open_upper_bound_keeps_end(self):
+        assert narrow(0, 100, (20, None)) == (20, 100)
+
+    def test_disjoint_bounds_keep_window(self):
+        assert narrow(0, 100, (200, 300)) == (0, 100)
+
+
+class TestActivityWindows:
+    def test_finished_activity_bounded_by_last_span(self):
+        windows = ActivityWindows()
+        start = NOW - 2 * DAY
+        windows.record_spans("key", [_span(start, start + 1000), _span(start + 500, start + 5000)], now_ms=NOW)
+
+        assert windows.get("key") == (start - MARGIN_MS, start + 5000 + MARGIN_MS)
+
+    def test_running_activity_bounded_by_max_lifetime(self):
+        windows = ActivityWindows()
+        start = NOW - HOUR
+        windows.record_spans("key", [_span(start, start + 1000)], now_ms=NOW)
+
+        assert windows.get("key") == (start - MARGIN_MS, start + MAX_ACTIVITY_MS + MARGIN_MS)
+
+    def test_last_end_only_bounds_start(self):
+        windows = ActivityWindows()
+        windows.record_last_end("key", NOW)
+
+        assert windows.get("key") == (NOW - MAX_ACTIVITY_MS - MARGIN_MS, None)
+
+    def test_last_end_does_not_replace_exact_bounds(self):
+        windows = ActivityWindows()
+        start = NOW - 2 * DAY
+        windows.record_spans("key", [_span(start, start + 1000)], now_ms=NOW)
+        windows.record_last_end("key", NOW)
+
+        assert windows.get("key")[0] == start - MARGIN_MS
+
+    def test_trace_bounds_fall_back_to_trace_id(self):
+        windows = ActivityWindows()
+        trace_id = "691bb6a875f4b80435ad36816864e7c2"
+        start = 0x691BB6A8 * 1000
+
+        assert windows.trace_bounds(trace_id) == (start - MARGIN_MS, start + MAX_ACTIVITY_MS + MARGIN_MS)
+        assert windows.trace_bounds("not-xray") is None
+
+    def test_union(self):
+        assert ActivityWindows.union([(10, 20), (5, 15)]) == (5, 20)
+        assert ActivityWindows.union([(10, 20), (5, None)]) == (5, None)
+        assert ActivityWindows.union([(10, 20), None]) is None
+        assert ActivityWindows.union([]) is None
+
+
+class TestPersistedWindows:
+    def test_bounds_survive_a_new_process(self, tmp_path):
+        path = tmp_path / "cache.sqlite3"
+        start = NOW - 2 * DAY
+        first = ObservabilityCache(path)
+        ActivityWindows(first, "us-east-1").record_spans(
+            ("session", "agent-1", "session-1"), [_span(start, start + 1000)], now_ms=NOW
+        )
+        first.close()
+
+        second = ObservabilityCache(path)
+        windows = ActivityWindows(second, "us-east-1")
+
+        assert windows.get(("session", "agent-1", "session-1")) == (start - MARGIN_MS, start + 1000 + MARGIN_MS)
+        assert ActivityWindows(second, "us-west-2").get(("session", "agent-1", "session-1")) is None
+        second.close()
+
+    def test_persisted_last_end_does_not_replace_exact_bounds(self, tmp_path):
+        cache = ObservabilityCache(tmp_path / "cache.sqlite3")
+        start = NOW - 2 * DAY
+        ActivityWindows(cache).record_spans("key", [_span(start, start + 1000)], now_ms=NOW)
+
+        windows = ActivityWindows(cache)
+        windows.record_last_end("key", NOW)
+
+        assert ActivityWindows(cache).get("key")[0] == start - MARGIN_MS
+        cache.close()
+
+    def test_cache_errors_keep_bounds_in_memory(self):
+        cache = Mock(spec=ObservabilityCache)
+        cache.get_bounds.return_value = None
+        cache.store_bounds.side_effect = sqlite3.OperationalError("disk I/O error")
+        windows = ActivityWindows(cache)
+
+        windows.record_last_end("key", NOW)
+
+        assert windows.get("key") == (NOW - MAX_ACTIVITY_MS - MARGIN_MS, None)
+        assert windows.cache is None
@@ -0,0 +1,190 @@
+"""Tests for Bedrock AgentCore benchmark operation."""
+
+import json
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from bedrock_agentcore_starter_toolkit.operations.runtime.bench import (
+    load_benchmark_payloads,
+    percentile,
+    run_benchmark,
+    summarize_benchmark,
+)
+from bedrock_agentcore_starter_toolkit.services.async_runtime import InvokeMetrics
+
+
+class TestLoadBenchmarkPayloads:
+    """Test payload file parsing."""
+
+    def test_json_array(self, tmp_path):
+        """Test a JSON array yields one payload per element."""
+        path = tmp_path / "payloads.json"
+        path.write_text(json.dumps([{"prompt": "a"}, {"prompt": "b"}]))
+
+        assert load_benchmark_payloads(path) == [{"prompt": "a"}, {"prompt": "b"}]
+
+    def test_json_lines_and_single_object(self, tmp_path):
+        """Test JSON Lines files and single JSON objects are accepted."""
+        lines = tmp_path / "payloads.jsonl"
+        lines.write_text('{"prompt": "a"}\n\n{"prompt": "b"}\n')
+        single = tmp_path / "payload.json"
+        single.write_text('{"prompt": "a"}')
+
+        assert load_benchmark_payloads(lines) == [{"prompt": "a"}, {"prompt": "b"}]
+        assert load_benchmark_payloads(single) == [{"prompt": "a"}]
+
+    @pytest.mark.parametrize("content", ["", "not json\n{also not"])
+    def test_invalid(self, tmp_path, content):
+        """Test empty and malformed files are rejected."""
+        path = tmp_path / "payloads.json"
+        path.write_text(content)
+
+        with pytest.raises(ValueError):
+            load_benchmark_payloads(path)
+
+
+class TestSummarizeBenchmark:
+    """Test aggregation of per-request metrics."""
+
+    def test_percentile(self):
+        """Test linear-interpolated percentiles."""
+        values = [float(v) for v in range(1, 101)]
+
+        assert percentile(values, 50) == pytest.approx(50.5)
+        assert percentile(values, 99) == pytest.approx(99.01)
+        assert percentile([3.0], 90) == 3.0
+        assert percentile([], 50) is None
+
+    def test_summary(self):
+        """Test rates, percentiles over successes and per-request token rates."""
+        results = [
+            InvokeMetrics(index=1, session_id="b", status_code=200, ttfb=0.2, ttlb=1.2, events=10),
+            InvokeMetrics(index=0, session_id="a", status_code=200, ttfb=0.1, ttlb=0.6, events=5),
+            InvokeMetrics(index=2, session_id="c", status_code=429, ttfb=0.05, ttlb=0.05, error="429", throttled=True),
+            InvokeMetrics(index=3, session_id="d", ttlb=1.0, error="ConnectError"),
+        ]
+
+        summary = summarize_benchmark(results, wall_time=2.0, target="cloud", concurrency=2, started_at="t")
+
+        assert [r.index for r in summary.results] == [0, 1, 2, 3]
+        assert summary.requests == 4
+        assert summary.throughput == 2.0
+        assert (summary.errors, summary.error_rate) == (2, 0.5)
+        assert (summary.throttles, summary.throttle_rate) == (1, 0.25)
+        assert summary.ttfb.p50 == pytest.approx(0.15)
+        assert summary.latency.max == pytest.approx(1.2)
+        assert summary.tokens_per_second.p50 == pytest.approx(10.0)
+        assert summary.results[2].tokens_per_second is None
+
+    def test_empty(self):
+        """Test a run with no results produces empty statistics."""
+        summary = summarize_benchmark([], wall_time=0.0, target="dev", concurrency=1, started_at="t")
+
+        assert summary.requests == 0
+        assert summary.error_rate == 0.0
+        assert summary.ttfb.p50 is None
+
+
+class TestRunBenchmark:
+    """Test running benchmarks against targets."""
+
+    def test_dev_target(self, tmp_path):
+        """Test the dev target replays payloads against the local dev server."""
+        seen = []
+
+        def handler(request):
+            seen.append(json.loads(request.content))
+            return httpx.Response(200, headers={"content-type": "text/event-stream"}, content=b"data: 1\n\ndata: 2\n\n")
+
+        original_init = httpx.AsyncClient.__init__
+
+        def init_with_transport(self, *args, **kwargs):
+            kwargs["transport"] = httpx.MockTransport(handler)
+            original_init(self, *args, **kwargs)
+
+        completed = []
+        with patch.object(httpx.AsyncClient, "__init__", init_with_transport):
+            result = run_benchmark(
+                tmp_path / "missing.yaml",
+                [{"prompt": "a"}, {"prompt": "b"}],
+                total_requests=5,
+                concurrency=2,
+                target="dev",
+                sessions=2,
+                on_result=completed.append,
+            )
+
+        assert seen == [{"prompt": p} for p in "ababa"]
+        assert len(completed) == 5
+        assert result.requests == 5
+        assert result.errors == 0
+        assert len({r.session_id for r in result.results}) == 2
+        assert all(r.events == 2 for r in result.results)
+
+    def test_cloud_target_uses_concurrent_invoke(self, tmp_path):
+        """Test cloud targets go through invoke_bedrock_agentcore_concurrently."""
+
+        async def fake_stream():
+            yield InvokeMetrics(index=0, session_id="s", status_code=200, ttfb=0.1, ttlb=0.2)
+
+        with (
+            patch("bedrock_agentcore_starter_toolkit.operations.runtime.bench.load_config") as mock_load,
+            patch(
+                "bedrock_agentcore_starter_toolkit.operations.runtime.bench.invoke_bedrock_agentcore_concurrently",
+                return_value=fake_stream(),
+            ) as mock_invoke,
+        ):
+            mock_load.return_value.is_agentcore_create_with_iac = False
+            agent_config = mock_load.return_value.get_agent_config.return_value
+            agent_config.name = "my-agent"
+            agent_config.bedrock_agentcore.agent_arn = "arn:agent"
+
+            result = run_benchmark(tmp_path / "config.yaml", [{}], concurrency=3, rate_limit=5.0, target="cloud")
+
+        assert result.agent_name == "my-agent"
+        assert result.agent_arn == "arn:agent"
+        kwargs = mock_invoke.call_args.kwargs
+        assert kwargs["local_mode"] is False
+        assert kwargs["max_concurrency"] == 3
+        assert kwargs["rate_limit"] == 5.0
+
+    def test_create_with_iac_project_is_resolved(self, tmp_path):
+        """Test projects created with IaC resolve their deployed config, as invoke does."""
+
+        async def fake_stream():
+            yield InvokeMetrics(index=0, session_id="s", status_code=200, ttfb=0.1, ttlb=0.2)
+
+        config_path = tmp_path / "config.yaml"
+        with (
+            patch("bedrock_agentcore_starter_toolkit.operations.runtime.bench.load_config") as mock_load,
+            patch(
+                "bedrock_agentcore_starter_toolkit.operations.runtime.bench.resolve_create_with_iac_project_config"
+            ) as mock_resolve,
+            patch(
+                "bedrock_agentcore_starter_toolkit.operations.runtime.bench.invoke_bedrock_agentcore_concurrently",
+                return_value=fake_stream(),
+            ),
+        ):
+            mock_load.return_value.is_agentcore_create_with_iac = True
+            agent_config = mock_resolve.return_value.get_agent_config.return_value
+            agent_config.name = "iac-agent"
+            agent_config.bedrock_agentcore.agent_arn = "arn:iac-agent"
+
+            result = run_benchmark(config_path, [{}], target="cloud")
+
+        mock_resolve.assert_called_once_with(config_path)
+        mock_load.return_value.get_agent_config.assert_not_called()
+        assert result.agent_arn == "arn:iac-agent"
+
+    @pytest.mark.parametrize(
+        "kwargs,match",
+        [({"target": "prod"}, "Invalid target"), ({"sessions": 0}, "sessions"), ({"payloads": []}, "payload")],
+    )
+    def test_invalid_arguments(self, tmp_path, kwargs, match):
+        """Test invalid arguments are rejected before sending requests."""
+        arguments = {"config_path": tmp_path / "c.yaml", "payloads": [{}], "target": "dev", **kwargs}
+
+        with pytest.raises(ValueError, match=match):
+            run_benchmark(**arguments)
@@ -1,10 +1,16 @@
 """Tests for Bedrock AgentCore invoke operation."""
 
+import asyncio
 from unittest.mock import Mock, patch
 
 import pytest
 
-from bedrock_agentcore_starter_toolkit.operations.runtime.invoke import invoke_bedrock_agentcore
+from bedrock_agentcore_starter_toolkit.operations.runtime.invoke import (
+    invoke_bedrock_agentcore,
+    invoke_bedrock_agentcore_concurrently,
+)
+from bedrock_agentcore_starter_toolkit.services.async_runtime import InvokeMetrics
+from bedrock_agentcore_starter_toolkit.services.runtime import HttpBedrockAgentCoreClient
 from bedrock_agentcore_starter_toolkit.utils.runtime.config import save_config
 from bedrock_agentcore_starter_toolkit.utils.runtime.schema import (
     AWSConfig,
@@ -221,6 +227,69 @@ class TestInvokeBedrockAgentCore:
                 custom_headers=None,
             )
 
+    def test_consecutive_invocations_share_session(self, tmp_path):
+        """Test repeated bearer-token invocations reuse one pooled HTTP session."""
+        config_path = tmp_path / ".bedrock_agentcore.yaml"
+        agent_config = BedrockAgentCoreAgentSchema(
+            name="test-agent",
+            entrypoint="test.py",
+            aws=AWSConfig(
+                region="us-west-2",
+                account="123456789012",
+                network_configuration=NetworkConfiguration(),
+                observability=ObservabilityConfig(),
+            ),
+            bedrock_agentcore=BedrockAgentCoreDeploymentInfo(
+                agent_arn="arn:aws:bedrock_agentcore:us-west-2:123456789012:agent-runtime/test-agent-id"
+            ),
+        )
+        project_config = BedrockAgentCoreConfigSchema(default_agent="test-agent", agents={"test-agent": agent_config})
+        save_config(project_config, config_path)
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {"content-type": "application/json"}
+        mock_response.content = b"ok"
+        mock_response.text = "ok"
+
+        with (
+            patch("requests.Session.post", autospec=True, return_value=mock_response) as mock_post,
+            patch("requests.Session.close", autospec=True) as mock_close,
+        ):
+            invoke_bedrock_agentcore(config_path, {"message": "one"}, bearer_token="token")
+            invoke_bedrock_agentcore(config_path, {"message": "two"}, bearer_token="token")
+
+            sessions = [call.args[0] for call in mock_post.call_args_list]
+            assert len(sessions) == 2
+            assert sessions[0] is sessions[1]
+            mock_close.assert_not_called()
+
+    def test_invoke_uses_given_http_client(self, tmp_path):
+        """Test a caller-owned HTTP client is used instead of the shared one."""
+        config_path = tmp_path / ".bedrock_agentcore.yaml"
+        agent_config = BedrockAgentCoreAgentSchema(
+            name="test-agent",
+            entrypoint="test.py",
+            aws=AWSConfig(
+                region="us-west-2",
+                account="123456789012",
+                network_configuration=NetworkConfiguration(),
+                observability=ObservabilityConfig(),
+            ),
+            bedrock_agentcore=BedrockAgentCoreDeploymentInfo(
+                agent_arn="arn:aws:bedrock_agentcore:us-west-2:123456789012:agent-runtime/test-agent-id"
+            ),
+        )
+        project_config = BedrockAgentCoreConfigSchema(default_agent="test-agent", agents={"test-agent": agent_config})
+        save_config(project_config, config_path)
+        http_client = Mock(spec=HttpBedrockAgentCoreClient)
+        http_client.invoke_endpoint.return_value = {"response": "ok"}
+
+        result = invoke_bedrock_agentcore(config_path, {"message": "hi"}, bearer_token="token", http_client=http_client)
+
+        assert result.response == {"response": "ok"}
+        http_client.close.assert_not_called()
+
     def test_invoke_without_bearer_token_uses_boto3(self, mock_boto3_clients, tmp_path):
         """Test invocation without bearer token uses boto3 client."""
         # Create config file
@@ -478,6 +547,66 @@ class TestInvokeBedrockAgentCore:
             assert result.response == {"response": "workload creation test"}
 
 
+class TestInvokeBedrockAgentCoreConcurrently:
+    """Test invoke_bedrock_agentcore_concurrently functionality."""
+
+    def _save_config(self, config_path, agent_arn="arn:aws:bedrock_agentcore:us-west-2:123456789012:agent-runtime/a"):
+        agent_config = BedrockAgentCoreAgentSchema(
+            name="test-agent",
+            entrypoint="test.py",
+            aws=AWSConfig(
+                region="us-west-2",
+                account="123456789012",
+                network_configuration=NetworkConfiguration(),
+                observability=ObservabilityConfig(),
+            ),
+            bedrock_agentcore=BedrockAgentCoreDeploymentInfo(agent_arn=agent_arn),
+        )
+        save_config(
+            BedrockAgentCoreConfigSchema(default_agent="test-agent", agents={"test-agent": agent_config}), config_path
+        )
+
+    def test_bearer_token_uses_async_http_client(self, tmp_path):
+        """Test payloads are sent through the async HTTP client and results streamed back."""
+        config_path = tmp_path / ".bedrock_agentcore.yaml"
+        self._save_config(config_path)
+
+        async def invoke_many(payloads):
+            for index, _ in enumerate(payloads):
+                yield InvokeMetrics(index=index, session_id=f"s{index}")
+
+        with patch(
+            "bedrock_agentcore_starter_toolkit.operations.runtime.invoke.AsyncHttpBedrockAgentCoreClient"
+        ) as mock_client_class:
+            mock_client = mock_client_class.return_value
+            mock_client.__aenter__.return_value = mock_client
+            mock_client.invoke_many = invoke_many
+
+            async def collect():
+                results = invoke_bedrock_agentcore_concurrently(
+                    config_path, [{"a": 1}, {"a": 2}], bearer_token="token", user_id="ignored", max_concurrency=4
+                )
+                return [result async for result in results]
+
+            results = asyncio.run(collect())
+
+        assert [r.index for r in results] == [0, 1]
+        args, kwargs = mock_client_class.call_args
+        assert args == ("arn:aws:bedrock_agentcore:us-west-2:123456789012:agent-runtime/a", "us-west-2")
+        assert kwargs["bearer_token"] == "token"
+        assert kwargs["user_id"] is None
+        assert kwargs["max_concurrency"] == 4
+        mock_client.__aexit__.assert_called_once()
+
+    def test_not_deployed(self, tmp_path):
+        """Test cloud invocation requires a deployed agent."""
+        config_path = tmp_path / ".bedrock_agentcore.yaml"
+        self._save_config(config_path, agent_arn=None)
+
+        with pytest.raises(ValueError, match="Run launch first"):
+            invoke_bedrock_agentcore_concurrently(config_path, [{}])
+
+
 class TestGetWorkloadName:
     """Test _get_workload_name functionality."""
 
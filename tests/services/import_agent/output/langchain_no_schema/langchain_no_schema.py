@@ -0,0 +1,175 @@
+# ---------- NOTE: This file is auto-generated by the Bedrock AgentCore Starter Toolkit. ----------
+# Use this agent definition as a starting point for your custom agent implementation.
+# Review the generated code, evaluate agent behavior, and make necessary changes before deploying.
+# Extend the agent with additional tools, memory, and other features as required.
+# -------------------------------------------------------------------------------------------------
+
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.prebuilt import create_react_agent, InjectedState
+from langchain.tools import tool
+from langchain_core.globals import set_verbose, set_debug
+from langchain_core.messages import HumanMessage, SystemMessage, AIMessage, ToolMessage
+from langchain_aws.retrievers import AmazonKnowledgeBasesRetriever
+from langchain_aws import ChatBedrock
+import json
+import sys
+import os
+import re
+import io
+import uuid
+import asyncio
+from typing import Union, Optional, Annotated, Dict, List, Any, Literal
+from inputimeout import inputimeout, TimeoutOccurred  # pylint: disable=import-error # type: ignore
+from pydantic import BaseModel, Field
+import boto3
+from dotenv import load_dotenv
+
+from bedrock_agentcore.runtime.context import RequestContext
+from bedrock_agentcore import BedrockAgentCoreApp
+
+load_dotenv()
+
+app = BedrockAgentCoreApp()
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+
+class test_with_function_schema_testfunction_Input(BaseModel):
+    testParam: str = Field(..., description="test parameter")
+
+
+@tool(args_schema=test_with_function_schema_testfunction_Input)
+def test_with_function_schema_testfunction(testParam: str = None) -> str:
+    """Test function\nThis tool is part of the group of tools called test_with_function_schema (description: Test action group with function schema)"""
+    return input(
+        f"Return of control: test_with_function_schema_testFunction was called with the input {testParam}, enter desired output:")
+
+
+action_group_tools = [test_with_function_schema_testfunction]
+
+
+checkpointer_STM = InMemorySaver()
+
+
+tools = []
+tools_used = set()
+tools += action_group_tools
+config = {"configurable": {"thread_id": "1"}}
+set_verbose(False)
+set_debug(False)
+
+_agent = None
+first_turn = True
+last_input = ""
+user_id = ""
+
+
+# agent update loop
+def get_agent():
+
+    global _agent, user_id, memory_id
+
+    if _agent is None:
+
+        system_prompt = ORCHESTRATION_TEMPLATE
+
+        _agent = create_react_agent(
+            model=llm_ORCHESTRATION,
+            prompt=system_prompt,
+            tools=tools,
+            checkpointer=checkpointer_STM,
+            debug=False
+        )
+
+    return _agent
+
+
+def invoke_agent(question: str):
+
+    global last_input, memory_id
+    last_input = question
+    agent = get_agent()
+
+    response = asyncio.run(agent.ainvoke({"messages": [{"role": "user", "content": question}]}, config))
+
+    return response['messages']
+
+
+@app.entrypoint
+def endpoint(payload, context):
+    try:
+
+        session_id = context.session_id or payload.get("sessionId", uuid.uuid4().hex[:8])
+
+        tools_used.clear()
+        agent_query = payload.get("message", "")
+        if not agent_query:
+            return {'error': "No query provided, please provide a 'message' field in the payload."}
+
+        agent_result = invoke_agent(agent_query)
+
+        tools_used.update([msg.name for msg in agent_result if isinstance(msg, ToolMessage)])
+        response_content = agent_result[-1].content
+
+        # Gathering sources from the response
+        sources = []
+        urls = re.findall('(?:https?://|www\\.)(?:[a-zA-Z0-9-]+\\.)+[a-zA-Z]{2,}(?:/[^/\\s]*)*', response_content)
+        source_tags = re.findall(r"<source>(.*?)</source>", response_content)
+        sources.extend(urls)
+        sources.extend(source_tags)
+        sources = list(set(sources))
+
+        formatted_messages = [
+            (agent_query, "USER"), (response_content if response_content else "No Response.", "ASSISTANT")]
+
+        return {'result': {'response': response_content, 'sources': sources, 'tools_used': list(
+            tools_used), 'sessionId': session_id, 'messages': formatted_messages}}
+    except Exception as e:
+        return {'error': str(e)}
+
+
+def cli():
+    global user_id
+    user_id = "af169b04"  # change user_id if necessary
+    session_id = uuid.uuid4().hex[:8].lower()
+    try:
+        while True:
+            try:
+                query = inputimeout("\nEnter your question (or 'exit' to quit): ", timeout=600)
+
+                if query.lower() == "exit":
+                    break
+
+                result = endpoint({"message": query}, RequestContext(session_id=session_id)).get('result', {})
+                if not result:
+                    print("  Error:" + str(result.get('error', {})))
+                    continue
+
+                print(f"\nResponse: {result.get('response', 'No response provided')}")
+
+                if result["sources"]:
+                    print(f"  Sources: {', '.join(set(result.get('sources', [])))}")
+
+                if result["tools_used"]:
+                    tools_used.update(result.get('tools_used', []))
+                    print(f"\n  Tools Used: {', '.join(tools_used)}")
+
+                tools_used.clear()
+            except KeyboardInterrupt:
+                print("\n\nExiting...")
+                break
+            except TimeoutOccurred:
+                print("\n\nNo input received in the last 0 seconds. Exiting...")
+                break
+    except Exception as e:
+        print("\n\nError: {}".format(e))
+    finally:
+
+        print("Session ended.")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--cli":
+        cli()  # Run the CLI interface
+    else:
+        app.run()
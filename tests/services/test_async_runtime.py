@@ -0,0 +1,202 @@
+"""Tests for concurrent async invoke clients."""
+
+import asyncio
+import json
+import time
+from unittest.mock import patch
+
+import httpx
+import pytest
+from botocore.credentials import Credentials
+
+from bedrock_agentcore_starter_toolkit.services.async_runtime import (
+    AsyncHttpBedrockAgentCoreClient,
+    AsyncLocalBedrockAgentCoreClient,
+    InvokeRequest,
+    _AsyncInvokeClient,
+)
+
+AGENT_ARN = "arn:aws:bedrock-agentcore:us-west-2:123456789012:runtime/test-agent"
+
+
+def _with_transport(client, handler):
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+async def _collect(client, payloads, **kwargs):
+    async with client:
+        return [result async for result in client.invoke_many(payloads, **kwargs)]
+
+
+class TestAsyncInvoke:
+    """Test single invocations and their metrics."""
+
+    def test_streaming_response_metrics(self):
+        """Test SSE responses are timed, counted and optionally captured."""
+
+        def handler(request):
+            return httpx.Response(
+                200,
+                headers={"content-type": "text/event-stream"},
+                content=b'data: "Hello"\n\ndata: " world"\n\n',
+            )
+
+        client = _with_transport(
+            AsyncHttpBedrockAgentCoreClient(AGENT_ARN, "us-west-2", "token", capture_response=True), handler
+        )
+        (result,) = asyncio.run(_collect(client, [{"prompt": "hi"}]))
+
+        assert result.ok
+        assert result.status_code == 200
+        assert result.events == 2
+        assert result.response == '"Hello"\n" world"'
+        assert 0 <= result.ttfb <= result.ttlb
+        assert result.bytes_received == len(b'data: "Hello"\n\ndata: " world"\n\n')
+
+    def test_incomplete_client_cannot_be_created(self):
+        """Test a client without _build_request fails at construction, not on the first request."""
+
+        class IncompleteClient(_AsyncInvokeClient):
+            pass
+
+        with pytest.raises(TypeError, match="_build_request"):
+            IncompleteClient()
+
+    def test_bearer_token_request(self):
+        """Test the request matches the synchronous HTTP client's wire format."""
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            return httpx.Response(200, json={"ok": True})
+
+        client = _with_transport(
+            AsyncHttpBedrockAgentCoreClient(AGENT_ARN, "us-west-2", "token", custom_headers={"X-Custom": "1"}), handler
+        )
+        (result,) = asyncio.run(_collect(client, ['{"prompt": "hi"}'], session_id="s" * 40))
+
+        request = seen[0]
+        assert request.url.params["qualifier"] == "DEFAULT"
+        assert "arn%3Aaws%3Abedrock-agentcore" in str(request.url)
+        assert request.headers["Authorization"] == "Bearer token"
+        assert request.headers["X-Amzn-Bedrock-AgentCore-Runtime-Session-Id"] == "s" * 40
+        assert request.headers["X-Custom"] == "1"
+        assert json.loads(request.content) == {"prompt": "hi"}
+        assert result.session_id == "s" * 40
+        assert result.response is None
+
+    def test_sigv4_signing(self):
+        """Test requests are SigV4-signed when no bearer token is given."""
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            return httpx.Response(200, json={})
+
+        session = type("Session", (), {"get_credentials": lambda self: Credentials("AKID", "SECRET")})()
+        client = _with_transport(
+            AsyncHttpBedrockAgentCoreClient(AGENT_ARN, "us-west-2", user_id="user-1", boto_session=session), handler
+        )
+        asyncio.run(_collect(client, [{}]))
+
+        headers = seen[0].headers
+        assert headers["Authorization"].startswith("AWS4-HMAC-SHA256 Credential=AKID/")
+        assert "/us-west-2/bedrock-agentcore/aws4_request" in headers["Authorization"]
+        assert "X-Amz-Date" in headers
+        assert headers["X-Amzn-Bedrock-AgentCore-Runtime-User-Id"] == "user-1"
+
+    def test_errors_and_throttles_are_recorded(self):
+        """Test HTTP errors, throttles and transport errors are reported, not raised."""
+
+        def handler(request):
+            prompt = json.loads(request.content)["prompt"]
+            if prompt == "throttle":
+                return httpx.Response(429, json={"message": "ThrottlingException: slow down"})
+            if prompt == "fail":
+                return httpx.Response(500, text="boom")
+            if prompt == "drop":
+                raise httpx.ConnectError("connection refused")
+            return httpx.Response(200, text="ok")
+
+        client = _with_transport(AsyncLocalBedrockAgentCoreClient("http://localhost:8080/"), handler)
+        payloads = [{"prompt": p} for p in ("ok", "throttle", "fail", "drop")]
+        results = sorted(asyncio.run(_collect(client, payloads)), key=lambda r: r.index)
+
+        assert [r.ok for r in results] == [True, False, False, False]
+        assert [r.throttled for r in results] == [False, True, False, False]
+        assert results[2].error.startswith("500 Internal Server Error: boom")
+        assert results[3].status_code is None
+        assert "ConnectError" in results[3].error
+
+    def test_local_headers(self):
+        """Test the local client forwards workload identity headers."""
+        from bedrock_agentcore.runtime.models import ACCESS_TOKEN_HEADER, OAUTH2_CALLBACK_URL_HEADER, SESSION_HEADER
+
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            return httpx.Response(200, text="ok")
+
+        client = _with_transport(AsyncLocalBedrockAgentCoreClient("http://localhost:8080", "wat", "http://cb"), handler)
+        asyncio.run(_collect(client, [InvokeRequest({}, "session-1")]))
+
+        assert str(seen[0].url) == "http://localhost:8080/invocations"
+        assert seen[0].headers[ACCESS_TOKEN_HEADER] == "wat"
+        assert seen[0].headers[OAUTH2_CALLBACK_URL_HEADER] == "http://cb"
+        assert seen[0].headers[SESSION_HEADER] == "session-1"
+
+
+class TestInvokeMany:
+    """Test concurrency and rate limiting."""
+
+    def test_concurrency_limit(self):
+        """Test no more than max_concurrency requests are in flight."""
+        in_flight = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, text="ok")
+
+        client = _with_transport(AsyncLocalBedrockAgentCoreClient("http://localhost", max_concurrency=3), handler)
+        results = asyncio.run(_collect(client, ({"i": i} for i in range(20))))
+
+        assert sorted(r.index for r in results) == list(range(20))
+        assert len({r.session_id for r in results}) == 20
+        assert peak == 3
+
+    def test_rate_limit(self):
+        """Test request starts are spaced by the rate limit."""
+        starts = []
+
+        def handler(request):
+            starts.append(time.monotonic())
+            return httpx.Response(200, text="ok")
+
+        client = _with_transport(
+            AsyncLocalBedrockAgentCoreClient("http://localhost", max_concurrency=5, rate_limit=50), handler
+        )
+        asyncio.run(_collect(client, [{}] * 6))
+
+        assert starts[-1] - starts[0] >= 5 / 50 * 0.9
+
+    def test_invalid_limits(self):
+        """Test invalid concurrency and rate values are rejected."""
+        with pytest.raises(ValueError, match="max_concurrency"):
+            AsyncLocalBedrockAgentCoreClient("http://localhost", max_concurrency=0)
+        with pytest.raises(ValueError, match="rate_limit"):
+            AsyncLocalBedrockAgentCoreClient("http://localhost", rate_limit=0)
+
+    def test_unexpected_errors_propagate(self):
+        """Test errors other than transport errors stop the run."""
+        client = AsyncLocalBedrockAgentCoreClient("http://localhost")
+
+        with patch.object(client, "_build_request", side_effect=RuntimeError("bad payload")):
+            with pytest.raises(RuntimeError, match="bad payload"):
+                asyncio.run(_collect(client, [{}]))
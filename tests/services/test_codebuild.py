@@ -164,12 +164,13 @@ class TestCodeBuildService:
             Bucket="bedrock-agentcore-codebuild-sources-123456789012-us-east-1"
         )
 
+    @patch("bedrock_agentcore_starter_toolkit.services.codebuild.upload_file_if_changed")
     @patch("os.walk")
     @patch("zipfile.ZipFile")
     @patch("tempfile.NamedTemporaryFile")
     @patch("os.unlink")
     def test_upload_source_success(
-        self, mock_unlink, mock_tempfile, mock_zipfile, mock_walk, codebuild_service, mock_clients
+        self, mock_unlink, mock_tempfile, mock_zipfile, mock_walk, mock_upload, codebuild_service, mock_clients
     ):
         """Test successful source upload."""
         # Mock file system
@@ -191,11 +192,12 @@ class TestCodeBuildService:
         expected_s3_url = f"s3://bedrock-agentcore-codebuild-sources-123456789012-us-west-2/{expected_key}"
 
         assert result == expected_s3_url
-        mock_clients["s3"].upload_file.assert_called_once_with(
+        mock_upload.assert_called_once_with(
+            mock_clients["s3"],
             "/tmp/test.zip",
             "bedrock-agentcore-codebuild-sources-123456789012-us-west-2",
             "test-agent/source.zip",
-            ExtraArgs={"ExpectedBucketOwner": "123456789012"},
+            "123456789012",
         )
         mock_unlink.assert_called_once_with("/tmp/test.zip")
 
@@ -485,6 +487,7 @@ node_modules
             patch("tempfile.NamedTemporaryFile") as mock_tempfile,
             patch("os.unlink") as mock_unlink,
             patch.object(codebuild_service, "_parse_dockerignore") as mock_parse,
+            patch("bedrock_agentcore_starter_toolkit.services.codebuild.upload_file_if_changed"),
         ):
             # Mock file system with files to test negation patterns
             mock_walk.return_value = [(".", [], ["debug.log", "important.log", "temp.tmp", "keep.tmp", "code.py"])]
@@ -541,6 +544,7 @@ node_modules
             patch("tempfile.NamedTemporaryFile") as mock_tempfile,
             patch("os.unlink") as mock_unlink,
             patch.object(codebuild_service, "_parse_dockerignore") as mock_parse,
+            patch("bedrock_agentcore_starter_toolkit.services.codebuild.upload_file_if_changed"),
         ):
             # Mock file system with files to ignore
             mock_walk.return_value = [(".", [], ["test.py", "test.pyc", ".git", "README.md"])]
@@ -581,6 +585,7 @@ node_modules
             patch("tempfile.NamedTemporaryFile") as mock_tempfile,
             patch("os.unlink") as mock_unlink,
             patch.object(codebuild_service, "_parse_dockerignore") as mock_parse,
+            patch("bedrock_agentcore_starter_toolkit.services.codebuild.upload_file_if_changed"),
         ):
             # Mock file system - source directory contains code only (no Dockerfile)
             mock_walk.return_value = [("./my_agent", [], ["agent.py", "requirements.txt"])]
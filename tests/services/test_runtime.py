@@ -54,8 +54,8 @@ def test_handle_streaming_response_json_decode_error():
 
     # Mock response with invalid JSON in data line
     mock_response = Mock()
-    mock_response.iter_lines.return_value = [
-        b"data: {invalid json}",  # This will cause JSONDecodeError
+    mock_response.iter_content.return_value = [
+        b"data: {invalid json}\n\n",  # This will cause JSONDecodeError
     ]
 
     # The console.print is called but with different arguments than expected
@@ -899,7 +899,7 @@ class TestHttpBedrockAgentCoreClient:
         mock_response.raise_for_status.return_value = None
         mock_response.headers = {"content-type": "application/json"}
 
-        with patch("requests.post", return_value=mock_response) as mock_post:
+        with patch("requests.Session.post", return_value=mock_response) as mock_post:
             result = client.invoke_endpoint(
                 agent_arn="arn:aws:bedrock_agentcore:us-west-2:123456789012:agent-runtime/test-id",
                 payload='{"message": "hello"}',  # JSON string as it comes from invoke_bedrock_agentcore
@@ -947,7 +947,7 @@ class TestHttpBedrockAgentCoreClient:
         mock_response.raise_for_status.return_value = None
         mock_response.headers = {"content-type": "application/json"}
 
-        with patch("requests.post", return_value=mock_response) as mock_post:
+        with patch("requests.Session.post", return_value=mock_response) as mock_post:
             client.invoke_endpoint(
                 agent_arn="arn:aws:bedrock_agentcore:us-east-1:123456789012:agent-runtime/test-id",
                 payload='"test payload"',  # JSON string as it would come from invoke_bedrock_agentcore
@@ -969,7 +969,7 @@ class TestHttpBedrockAgentCoreClient:
         mock_response = Mock()
         mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("404 Not Found")
 
-        with patch("requests.post", return_value=mock_response):
+        with patch("requests.Session.post", return_value=mock_response):
             with pytest.raises(requests.exceptions.HTTPError):
                 client.invoke_endpoint(
                     agent_arn="arn:aws:bedrock_agentcore:us-west-2:123456789012:agent-runtime/nonexistent",
@@ -982,7 +982,7 @@ class TestHttpBedrockAgentCoreClient:
         """Test handling of connection errors."""
         client = HttpBedrockAgentCoreClient("us-west-2")
 
-        with patch("requests.post", side_effect=requests.exceptions.ConnectionError("Connection failed")):
+        with patch("requests.Session.post", side_effect=requests.exceptions.ConnectionError("Connection failed")):
             with pytest.raises(requests.exceptions.ConnectionError):
                 client.invoke_endpoint(
                     agent_arn="arn:aws:bedrock_agentcore:us-west-2:123456789012:agent-runtime/test-id",
@@ -995,7 +995,7 @@ class TestHttpBedrockAgentCoreClient:
         """Test handling of request timeout."""
         client = HttpBedrockAgentCoreClient("us-west-2")
 
-        with patch("requests.post", side_effect=requests.exceptions.Timeout("Request timed out")):
+        with patch("requests.Session.post", side_effect=requests.exceptions.Timeout("Request timed out")):
             with pytest.raises(requests.exceptions.Timeout):
                 client.invoke_endpoint(
                     agent_arn="arn:aws:bedrock_agentcore:us-west-2:123456789012:agent-runtime/test-id",
@@ -1015,7 +1015,7 @@ class TestHttpBedrockAgentCoreClient:
         mock_response.raise_for_status.return_value = None
         mock_response.headers = {"content-type": "application/json"}
 
-        with patch("requests.post", return_value=mock_response):
+        with patch("requests.Session.post", return_value=mock_response):
             with pytest.raises(ValueError, match="Empty response from agent endpoint"):
                 client.invoke_endpoint(
                     agent_arn="arn:aws:bedrock_agentcore:us-west-2:123456789012:agent-runtime/test-id",
@@ -1035,7 +1035,7 @@ class TestHttpBedrockAgentCoreClient:
         mock_response.raise_for_status.return_value = None
         mock_response.headers = {"content-type": "application/json"}
 
-        with patch("requests.post", return_value=mock_response) as mock_post:
+        with patch("requests.Session.post", return_value=mock_response) as mock_post:
             # ARN with special characters that need encoding
             complex_arn = "arn:aws:bedrock_agentcore:us-west-2:123456789012:agent-runtime/test-id:with:colons"
 
@@ -1070,7 +1070,7 @@ class TestHttpBedrockAgentCoreClient:
             ("invalid json string", {"payload": "invalid json string"}),  # Invalid JSON - fallback
         ]
 
-        with patch("requests.post", return_value=mock_response) as mock_post:
+        with patch("requests.Session.post", return_value=mock_response) as mock_post:
             for payload_input, expected_body in test_cases:
                 client.invoke_endpoint(
                     agent_arn="arn:aws:bedrock_agentcore:us-west-2:123456789012:agent-runtime/test-id",
@@ -1097,7 +1097,7 @@ class TestHttpBedrockAgentCoreClient:
         mock_response.raise_for_status.return_value = None
         mock_response.headers = {"content-type": "application/json"}
 
-        with patch("requests.post", return_value=mock_response) as mock_post:
+        with patch("requests.Session.post", return_value=mock_response) as mock_post:
             # Instead of checking log, verify the behavior directly
             client.invoke_endpoint(
                 agent_arn="arn:aws:bedrock:us-west-2:123456789012:agent-runtime/test-id",
@@ -1135,7 +1135,7 @@ class TestLocalBedrockAgentCoreClient:
         mock_response.headers = {"content-type": "application/json"}
 
         with (
-            patch("requests.post", return_value=mock_response) as mock_post,
+            patch("requests.Session.post", return_value=mock_response) as mock_post,
             patch(
                 "bedrock_agentcore_starter_toolkit.services.runtime._handle_http_response",
                 return_value={"response": "test response"},
@@ -1189,7 +1189,7 @@ class TestLocalBedrockAgentCoreClient:
         mock_response.headers = {"content-type": "application/json"}
 
         with (
-            patch("requests.post", return_value=mock_response) as mock_post,
+            patch("requests.Session.post", return_value=mock_response) as mock_post,
             patch(
                 "bedrock_agentcore_starter_toolkit.services.runtime._handle_http_response",
                 return_value={"response": "wrapped"},
@@ -1226,7 +1226,7 @@ class TestLocalBedrockAgentCoreClient:
         mock_response.headers = {"content-type": "application/json"}
 
         with (
-            patch("requests.post", return_value=mock_response) as mock_post,
+            patch("requests.Session.post", return_value=mock_response) as mock_post,
             patch(
                 "bedrock_agentcore_starter_toolkit.services.runtime._handle_http_response",
                 return_value={"response": "local response with custom headers"},
@@ -1277,7 +1277,7 @@ class TestLocalBedrockAgentCoreClient:
         mock_response.headers = {"content-type": "application/json"}
 
         with (
-            patch("requests.post", return_value=mock_response) as mock_post,
+            patch("requests.Session.post", return_value=mock_response) as mock_post,
             patch(
                 "bedrock_agentcore_starter_toolkit.services.runtime._handle_http_response",
                 return_value={"response": "local response"},
@@ -1324,7 +1324,7 @@ class TestLocalBedrockAgentCoreClient:
         mock_response.headers = {"content-type": "application/json"}
 
         with (
-            patch("requests.post", return_value=mock_response) as mock_post,
+            patch("requests.Session.post", return_value=mock_response) as mock_post,
             patch(
                 "bedrock_agentcore_starter_toolkit.services.runtime._handle_http_response",
                 return_value={"response": "local response"},
@@ -1362,7 +1362,7 @@ class TestLocalBedrockAgentCoreClient:
         """Test LocalBedrockAgentCoreClient error handling."""
         client = LocalBedrockAgentCoreClient("http://localhost:8080")
 
-        with patch("requests.post", side_effect=requests.exceptions.ConnectionError("Connection refused")):
+        with patch("requests.Session.post", side_effect=requests.exceptions.ConnectionError("Connection refused")):
             # Just test the exception is propagated
             with pytest.raises(requests.exceptions.ConnectionError, match="Connection refused"):
                 client.invoke_endpoint(
@@ -1373,6 +1373,65 @@ class TestLocalBedrockAgentCoreClient:
                 )
 
 
+class TestPooledHttpSessions:
+    """Test HTTP invoke clients reuse a pooled session."""
+
+    @pytest.mark.parametrize(
+        "make_client,invoke",
+        [
+            (
+                lambda **kwargs: HttpBedrockAgentCoreClient("us-west-2", **kwargs),
+                lambda client: client.invoke_endpoint(
+                    agent_arn="arn:aws:bedrock-agentcore:us-west-2:123456789012:runtime/test",
+                    payload="{}",
+                    session_id="session",
+                    bearer_token="token",
+                ),
+            ),
+            (
+                lambda **kwargs: LocalBedrockAgentCoreClient("http://localhost:8080", **kwargs),
+                lambda client: client.invoke_endpoint(
+                    session_id="session",
+                    payload="{}",
+                    workload_access_token="token",
+                    oauth2_callback_url="http://local",
+                ),
+            ),
+        ],
+    )
+    def test_session_reused_and_closed(self, make_client, invoke):
+        """Test repeated invokes share one session, responses are released and close() closes it."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {"content-type": "application/json"}
+        mock_response.content = b"ok"
+        mock_response.text = "ok"
+
+        client = make_client(pool_size=4)
+        assert client.session.get_adapter("https://example.com")._pool_maxsize == 4
+        assert client.session.headers["Connection"] == "keep-alive"
+
+        with (
+            patch.object(client.session, "post", return_value=mock_response) as mock_post,
+            patch.object(client.session, "close") as mock_close,
+        ):
+            with client:
+                assert invoke(client) == {"response": "ok"}
+                assert invoke(client) == {"response": "ok"}
+                mock_close.assert_not_called()
+
+            assert mock_post.call_count == 2
+            assert mock_response.close.call_count == 2
+            mock_close.assert_called_once()
+
+    def test_keep_alive_disabled(self):
+        """Test keep_alive=False asks the server to close connections."""
+        client = HttpBedrockAgentCoreClient("us-west-2", keep_alive=False)
+
+        assert client.session.headers["Connection"] == "close"
+        client.close()
+
+
 class TestHandleStreamingResponse:
     """Test _handle_streaming_response functionality."""
 
@@ -1380,10 +1439,10 @@ class TestHandleStreamingResponse:
         """Test streaming response with data: prefixed lines."""
         # Mock response object with JSON data chunks
         mock_response = Mock()
-        mock_response.iter_lines.return_value = [
-            b'data: "Hello from agent"',
-            b'data: "This is a streaming response"',
-            b'data: "Final chunk"',
+        mock_response.iter_content.return_value = [
+            b'data: "Hello from agent"\n\n',
+            b'data: "This is a streaming response"\n\n',
+            b'data: "Final chunk"\n\n',
         ]
 
         # Mock console to capture print calls
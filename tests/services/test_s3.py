@@ -1,14 +1,19 @@
 """Tests for S3 service integration."""
 
+import hashlib
 from unittest.mock import Mock, patch
 
 import pytest
 from botocore.exceptions import ClientError
 
 from bedrock_agentcore_starter_toolkit.services.s3 import (
+    PACKAGE_DIGEST_METADATA_KEY,
+    UPLOAD_TRANSFER_CONFIG,
+    compute_file_digest,
     create_s3_bucket,
     get_or_create_s3_bucket,
     sanitize_s3_bucket_name,
+    upload_file_if_changed,
 )
 
 
@@ -165,3 +170,68 @@ class TestCreateS3Bucket:
 
         with pytest.raises(RuntimeError, match="Failed to create S3 bucket"):
             create_s3_bucket("test-bucket", "us-east-1", "123456789012")
+
+
+class TestUploadFileIfChanged:
+    """Test content-addressed package uploads."""
+
+    def test_compute_file_digest(self, tmp_path):
+        """Test chunked digest matches hashlib."""
+        path = tmp_path / "package.zip"
+        path.write_bytes(b"x" * (3 * 1024 * 1024 + 7))
+
+        assert compute_file_digest(path) == hashlib.sha256(path.read_bytes()).hexdigest()
+
+    def test_uploads_when_object_missing(self, tmp_path):
+        """Test upload with digest metadata and multipart config when no object exists."""
+        path = tmp_path / "package.zip"
+        path.write_bytes(b"package")
+        s3_client = Mock()
+        s3_client.head_object.side_effect = ClientError({"Error": {"Code": "404"}}, "HeadObject")
+
+        assert upload_file_if_changed(s3_client, path, "bucket", "agent/deployment.zip", "123456789012") is True
+
+        s3_client.upload_file.assert_called_once_with(
+            str(path),
+            "bucket",
+            "agent/deployment.zip",
+            ExtraArgs={
+                "ExpectedBucketOwner": "123456789012",
+                "Metadata": {PACKAGE_DIGEST_METADATA_KEY: hashlib.sha256(b"package").hexdigest()},
+            },
+            Config=UPLOAD_TRANSFER_CONFIG,
+        )
+
+    def test_skips_when_digest_matches(self, tmp_path):
+        """Test upload is skipped when the stored digest matches."""
+        path = tmp_path / "package.zip"
+        path.write_bytes(b"package")
+        s3_client = Mock()
+        s3_client.head_object.return_value = {
+            "Metadata": {PACKAGE_DIGEST_METADATA_KEY: hashlib.sha256(b"package").hexdigest()}
+        }
+
+        assert upload_file_if_changed(s3_client, path, "bucket", "key", "123456789012") is False
+
+        s3_client.head_object.assert_called_once_with(Bucket="bucket", Key="key", ExpectedBucketOwner="123456789012")
+        s3_client.upload_file.assert_not_called()
+
+    def test_uploads_when_digest_differs(self, tmp_path):
+        """Test upload proceeds when the stored object has different content."""
+        path = tmp_path / "package.zip"
+        path.write_bytes(b"package")
+        s3_client = Mock()
+        s3_client.head_object.return_value = {"Metadata": {PACKAGE_DIGEST_METADATA_KEY: "stale"}}
+
+        assert upload_file_if_changed(s3_client, path, "bucket", "key", "123456789012") is True
+        s3_client.upload_file.assert_called_once()
+
+    def test_uploads_when_head_fails(self, tmp_path):
+        """Test upload proceeds when the existing object cannot be inspected."""
+        path = tmp_path / "package.zip"
+        path.write_bytes(b"package")
+        s3_client = Mock()
+        s3_client.head_object.side_effect = ClientError({"Error": {"Code": "403"}}, "HeadObject")
+
+        assert upload_file_if_changed(s3_client, path, "bucket", "key", "123456789012") is True
+        s3_client.upload_file.assert_called_once()
@@ -0,0 +1,142 @@
+"""Tests for incremental Server-Sent Events parsing."""
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from bedrock_agentcore_starter_toolkit.services.sse import (
+    FALLBACK_READ_SIZE,
+    SSEEvent,
+    SSEParser,
+    aiter_sse_events,
+    iter_response_chunks,
+    iter_sse_events,
+)
+
+
+def _split(data, size):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+class TestSSEParser:
+    """Test SSEParser field handling."""
+
+    def test_fields_and_multiline_data(self):
+        """Test event, id, retry and multi-line data are combined into one event."""
+        stream = b'event: delta\nid: 7\nretry: 1500\ndata: {"a":\ndata: 1}\n\n'
+
+        assert list(iter_sse_events([stream])) == [SSEEvent('{"a":\n1}', "delta", "7", 1500)]
+
+    def test_comments_blank_events_and_defaults(self):
+        """Test comments are skipped, empty events dropped and the event type reset."""
+        stream = b": keep-alive\n\nevent: ping\n\ndata: x\n\ndata:y\n\n"
+
+        assert list(iter_sse_events([stream])) == [SSEEvent("x"), SSEEvent("y")]
+
+    def test_id_persists_across_events(self):
+        """Test the last event id carries over to later events."""
+        events = list(iter_sse_events([b"id: 1\ndata: a\n\ndata: b\n\n"]))
+
+        assert [event.id for event in events] == ["1", "1"]
+
+    @pytest.mark.parametrize("newline", [b"\n", b"\r\n", b"\r"])
+    @pytest.mark.parametrize("size", [1, 2, 3, 7, 1024])
+    def test_any_fragmentation_and_line_ending(self, newline, size):
+        """Test events are identical however the stream is split and terminated."""
+        text = 'data: "héllo"\n\nevent: end\ndata: line1\ndata: line2\n\n'
+        stream = text.replace("\n", newline.decode()).encode("utf-8")
+
+        events = list(iter_sse_events(_split(stream, size)))
+
+        assert events == [SSEEvent('"héllo"'), SSEEvent("line1\nline2", "end")]
+
+    def test_unterminated_final_event_is_dispatched(self):
+        """Test a stream closed without a trailing blank line still yields its last event."""
+        assert list(iter_sse_events([b"data: a\n\ndata: b"])) == [SSEEvent("a"), SSEEvent("b")]
+
+    def test_feed_returns_events_as_soon_as_complete(self):
+        """Test events are emitted by the chunk that completes them."""
+        parser = SSEParser()
+
+        assert parser.feed(b"data: a\n") == []
+        assert parser.feed(b"\ndata: b") == [SSEEvent("a")]
+        assert parser.close() == [SSEEvent("b")]
+
+    def test_async_iterator(self):
+        """Test the async variant yields the same events."""
+
+        async def chunks():
+            for chunk in _split(b"data: a\n\ndata: b\n\n", 3):
+                yield chunk
+
+        async def collect():
+            return [event async for event in aiter_sse_events(chunks())]
+
+        assert asyncio.run(collect()) == [SSEEvent("a"), SSEEvent("b")]
+
+
+class TestIterResponseChunks:
+    """Test reading response bodies without waiting for full buffers."""
+
+    def test_requests_response(self):
+        """Test requests responses are read with chunk_size=None."""
+        response = Mock()
+        response.iter_content.return_value = [b"a", b"", b"b"]
+
+        assert list(iter_response_chunks(response)) == [b"a", b"b"]
+        response.iter_content.assert_called_once_with(chunk_size=None)
+
+    def test_streaming_body_uses_read1(self):
+        """Test botocore StreamingBody is read with read1 on the raw stream."""
+        body = Mock(spec=["_raw_stream", "iter_chunks"])
+        body._raw_stream.read1.side_effect = [b"data: a", b"\n\n", b""]
+
+        assert list(iter_response_chunks(body, read_size=10)) == [b"data: a", b"\n\n"]
+        body._raw_stream.read1.assert_called_with(10)
+        body.iter_chunks.assert_not_called()
+
+    def test_urllib3_1_response_reads_underlying_response(self):
+        """Test a raw stream without read1 (urllib3 1.26) yields each event before more data arrives."""
+        reads = []
+        frames = iter([b"data: a\n\n", b"data: b\n\n", b""])
+
+        def read1(size):
+            reads.append(size)
+            return next(frames)
+
+        body = Mock(spec=["_raw_stream", "iter_chunks"])
+        body._raw_stream = Mock(spec=["read", "headers", "_fp"])
+        body._raw_stream.headers = {}
+        body._raw_stream._fp.read1 = read1
+
+        events = iter_sse_events(iter_response_chunks(body))
+
+        assert next(events) == SSEEvent("a")
+        assert len(reads) == 1
+        assert next(events) == SSEEvent("b")
+        assert len(reads) == 2
+        body.iter_chunks.assert_not_called()
+
+    def test_encoded_urllib3_1_response_falls_back(self):
+        """Test compressed bodies are left to urllib3 to decode, in small reads."""
+        body = Mock(spec=["_raw_stream", "iter_chunks"])
+        body._raw_stream = Mock(spec=["read", "headers", "_fp"])
+        body._raw_stream.headers = {"content-encoding": "gzip"}
+        body.iter_chunks.return_value = iter([b"x"])
+
+        assert list(iter_response_chunks(body)) == [b"x"]
+        body._raw_stream._fp.read1.assert_not_called()
+        body.iter_chunks.assert_called_once_with(chunk_size=FALLBACK_READ_SIZE)
+
+    def test_streaming_body_fallback(self):
+        """Test streams that cannot return early are read in small chunks."""
+        body = Mock(spec=["iter_chunks"])
+        body.iter_chunks.return_value = iter([b"data: a\n\n", b"", b"x"])
+
+        assert list(iter_response_chunks(body)) == [b"data: a\n\n", b"x"]
+        body.iter_chunks.assert_called_once_with(chunk_size=FALLBACK_READ_SIZE)
+
+        body.iter_chunks.reset_mock()
+        list(iter_response_chunks(body, read_size=10))
+        body.iter_chunks.assert_called_once_with(chunk_size=10)
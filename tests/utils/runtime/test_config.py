@@ -10,6 +10,7 @@ import yaml
 from bedrock_agentcore_starter_toolkit.operations.runtime.exceptions import RuntimeToolkitException
 from bedrock_agentcore_starter_toolkit.utils.runtime.config import (
     get_agentcore_directory,
+    get_package_cache_directory,
     is_project_config_format,
     load_config,
     merge_agent_config,
@@ -775,6 +776,12 @@ class TestGetAgentcoreDirectory:
         assert result.exists()
         assert result == expected_path
 
+    def test_get_package_cache_directory(self, tmp_path):
+        """Test the shared package cache lives under .bedrock_agentcore/ alongside agent directories."""
+        result = get_package_cache_directory(tmp_path)
+
+        assert result == tmp_path / ".bedrock_agentcore" / ".package_cache"
+
 
 class TestGetEntrypointFromConfig:
     """Test get_entrypoint_from_config function."""
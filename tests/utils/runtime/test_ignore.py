@@ -0,0 +1,72 @@
+"""Tests for compiled dockerignore-style pattern matching."""
+
+import pytest
+
+from bedrock_agentcore_starter_toolkit.utils.runtime.ignore import IgnoreMatcher, get_ignore_matcher
+from bedrock_agentcore_starter_toolkit.utils.runtime.package import CodeZipPackager
+
+
+class TestIgnoreMatcher:
+    """Test IgnoreMatcher semantics."""
+
+    @pytest.mark.parametrize(
+        "path,is_dir,expected",
+        [
+            ("app.pyc", False, True),
+            ("pkg/app.pyc", False, True),  # "*" crosses separators like fnmatch
+            ("app.py", False, False),
+            ("__pycache__", True, True),
+            ("pkg/__pycache__", True, True),  # slash-free pattern matches any directory component
+            ("venv", True, True),
+            ("venv", False, False),  # trailing slash restricts to directories
+            ("docs/guide.md", False, True),
+            ("README.md", False, True),  # "**/" matches zero directories
+            ("./app.pyc", False, True),
+        ],
+    )
+    def test_matches(self, path, is_dir, expected):
+        """Test basic pattern forms."""
+        matcher = IgnoreMatcher(["*.pyc", "__pycache__", "venv/", "**/*.md"])
+        assert matcher.is_ignored(path, is_dir) is expected
+
+    def test_negation_last_match_wins(self):
+        """Test that later negations re-include and later patterns re-exclude."""
+        matcher = IgnoreMatcher(["*.md", "!README.md", "docs/README.md"])
+
+        assert matcher.is_ignored("CHANGES.md")
+        assert not matcher.is_ignored("README.md")
+        assert matcher.is_ignored("docs/README.md")
+
+    def test_nested_files(self):
+        """Test slash-free patterns match nested file components only when enabled."""
+        assert not IgnoreMatcher([".env"]).is_ignored("config/.env")
+        assert IgnoreMatcher([".env"], match_nested_files=True).is_ignored("config/.env")
+        assert IgnoreMatcher(["*.log"], match_nested_files=True).is_ignored("logs/app.log")
+
+    def test_character_classes(self):
+        """Test bracket expressions including negated classes."""
+        matcher = IgnoreMatcher(["file[0-9].txt", "tmp[!a].txt"])
+
+        assert matcher.is_ignored("file1.txt")
+        assert not matcher.is_ignored("filex.txt")
+        assert matcher.is_ignored("tmpb.txt")
+        assert not matcher.is_ignored("tmpa.txt")
+
+    def test_empty_patterns(self):
+        """Test that no patterns ignores nothing."""
+        assert not IgnoreMatcher([]).is_ignored("anything", True)
+
+    def test_get_ignore_matcher_is_cached(self):
+        """Test compiled matchers are reused for identical pattern tuples."""
+        patterns = ("*.pyc", "!keep.pyc")
+        assert get_ignore_matcher(patterns) is get_ignore_matcher(patterns)
+        assert get_ignore_matcher(patterns) is not get_ignore_matcher(patterns, match_nested_files=True)
+
+    def test_template_patterns(self):
+        """Test the bundled dockerignore template excludes the usual build artifacts."""
+        matcher = IgnoreMatcher(CodeZipPackager()._get_ignore_patterns())
+
+        assert matcher.is_ignored(".git", True)
+        assert matcher.is_ignored("src/__pycache__", True)
+        assert not matcher.is_ignored("agent.py")
+        assert not matcher.is_ignored("src/tools/search.py")
@@ -1,10 +1,14 @@
 """Tests for code zip packaging with dependency caching."""
 
 import hashlib
+import os
+import subprocess
 import zipfile
+from pathlib import Path
 from unittest.mock import Mock, patch
 
-from bedrock_agentcore_starter_toolkit.utils.runtime.package import CodeZipPackager, PackageCache
+from bedrock_agentcore_starter_toolkit.utils.runtime.package import CodeZipPackager, PackageCache, SharedPackageCache
+from bedrock_agentcore_starter_toolkit.utils.runtime.zip_writer import ParallelZipWriter
 
 
 class TestPackageCache:
@@ -368,6 +372,153 @@ class TestCodeZipPackager:
             assert "agent.py" in names
             assert "utils/helper.py" in names
 
+    def test_build_direct_code_deploy_writes_manifest(self, tmp_path):
+        """Test code zip build persists code.zip and a per-file manifest to the cache."""
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+        (source_dir / "agent.py").write_text("print('hello')")
+
+        cache = PackageCache(tmp_path / "cache")
+        output_zip = tmp_path / "code.zip"
+
+        CodeZipPackager()._build_direct_code_deploy(source_dir, output_zip, cache)
+
+        assert cache.code_zip.exists()
+        manifest = cache.load_code_manifest()
+        entry = manifest["agent.py"]
+        assert entry["size"] == len("print('hello')")
+        assert entry["sha256"] == hashlib.sha256(b"print('hello')").hexdigest()
+        with zipfile.ZipFile(cache.code_zip, "r") as zf:
+            info = zf.getinfo("agent.py")
+            assert entry["offset"] == info.header_offset
+            assert entry["compress_size"] == info.compress_size
+            assert entry["crc"] == info.CRC
+
+    def test_build_direct_code_deploy_reuses_unchanged_entries(self, tmp_path):
+        """Test incremental build copies unchanged entries and recompresses modified files."""
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+        (source_dir / "agent.py").write_text("print('hello')")
+        (source_dir / "utils.py").write_text("def helper(): pass")
+
+        cache = PackageCache(tmp_path / "cache")
+        packager = CodeZipPackager()
+        packager._build_direct_code_deploy(source_dir, tmp_path / "first.zip", cache)
+
+        (source_dir / "utils.py").write_text("def helper(): return 42")
+        output_zip = tmp_path / "second.zip"
+
+        with patch.object(
+            ParallelZipWriter, "add_file", autospec=True, side_effect=ParallelZipWriter.add_file
+        ) as mock_add_file:
+            packager._build_direct_code_deploy(source_dir, output_zip, cache)
+
+        assert [c.args[2] for c in mock_add_file.call_args_list] == ["utils.py"]
+        with zipfile.ZipFile(output_zip, "r") as zf:
+            assert zf.testzip() is None
+            assert zf.read("agent.py") == b"print('hello')"
+            assert zf.read("utils.py") == b"def helper(): return 42"
+        assert (
+            cache.load_code_manifest()["utils.py"]["sha256"] == hashlib.sha256(b"def helper(): return 42").hexdigest()
+        )
+
+    def test_build_direct_code_deploy_touched_file_reused_by_hash(self, tmp_path):
+        """Test a file with a new mtime but identical content is still reused."""
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+        agent = source_dir / "agent.py"
+        agent.write_text("print('hello')")
+
+        cache = PackageCache(tmp_path / "cache")
+        packager = CodeZipPackager()
+        packager._build_direct_code_deploy(source_dir, tmp_path / "first.zip", cache)
+
+        stat = agent.stat()
+        os.utime(agent, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+
+        with patch.object(ParallelZipWriter, "add_file", autospec=True) as mock_add_file:
+            packager._build_direct_code_deploy(source_dir, tmp_path / "second.zip", cache)
+
+        mock_add_file.assert_not_called()
+        assert cache.load_code_manifest()["agent.py"]["mtime_ns"] == agent.stat().st_mtime_ns
+
+    def test_build_direct_code_deploy_corrupt_cache_falls_back(self, tmp_path):
+        """Test a cached code.zip that no longer matches the manifest is ignored per entry."""
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+        (source_dir / "agent.py").write_text("print('hello')")
+
+        cache = PackageCache(tmp_path / "cache")
+        packager = CodeZipPackager()
+        packager._build_direct_code_deploy(source_dir, tmp_path / "first.zip", cache)
+
+        cache.code_zip.write_bytes(b"not a zip at all")
+        output_zip = tmp_path / "second.zip"
+        packager._build_direct_code_deploy(source_dir, output_zip, cache)
+
+        with zipfile.ZipFile(output_zip, "r") as zf:
+            assert zf.read("agent.py") == b"print('hello')"
+
+    def test_load_code_manifest_version_mismatch(self, tmp_path):
+        """Test manifests from another format version are ignored."""
+        cache = PackageCache(tmp_path)
+        cache.code_zip.write_bytes(b"zip")
+        cache.code_manifest.write_text('{"version": 0, "entries": {"agent.py": {}}}')
+
+        assert cache.load_code_manifest() == {}
+
+    def test_packager_compression_settings(self):
+        """Test worker count and compression level knobs."""
+        packager = CodeZipPackager(workers=3, compress_level=1)
+        assert packager.workers == 3
+        assert packager.compress_level == 1
+
+        default = CodeZipPackager()
+        assert default.workers >= 1
+        assert 0 <= default.compress_level <= 9
+
+    def test_build_direct_code_deploy_deterministic_order(self, tmp_path):
+        """Test parallel compression produces identical archives across worker counts."""
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+        for i in range(40):
+            (source_dir / f"module_{i}.py").write_text(f"VALUE = {i}\n" * (i * 50 + 1))
+
+        single = tmp_path / "single.zip"
+        multi = tmp_path / "multi.zip"
+        CodeZipPackager(workers=1)._build_direct_code_deploy(source_dir, single)
+        CodeZipPackager(workers=8)._build_direct_code_deploy(source_dir, multi)
+
+        assert single.read_bytes() == multi.read_bytes()
+        with zipfile.ZipFile(multi, "r") as zf:
+            assert zf.testzip() is None
+            assert len(zf.namelist()) == 40
+
+    @patch("bedrock_agentcore_starter_toolkit.utils.runtime.package.CodeZipPackager._fix_shebangs_in_bin_dir")
+    @patch("bedrock_agentcore_starter_toolkit.utils.runtime.package.CodeZipPackager._install_dependencies")
+    def test_build_dependencies_zip_parallel(self, mock_install, mock_fix, tmp_path):
+        """Test dependencies.zip is built in sorted order and skips __pycache__."""
+
+        def fake_install(requirements_file, target_dir, runtime_version, cross_compile):
+            (target_dir / "zpkg").mkdir()
+            (target_dir / "zpkg" / "__init__.py").write_text("# z")
+            (target_dir / "apkg").mkdir()
+            (target_dir / "apkg" / "__init__.py").write_text("# a" * 1000)
+            (target_dir / "apkg" / "__pycache__").mkdir()
+            (target_dir / "apkg" / "__pycache__" / "x.pyc").write_bytes(b"compiled")
+
+        mock_install.side_effect = fake_install
+        reqs = tmp_path / "requirements.txt"
+        reqs.write_text("apkg\nzpkg\n")
+        output_zip = tmp_path / "dependencies.zip"
+
+        CodeZipPackager(workers=4, compress_level=1)._build_dependencies_zip(reqs, output_zip, "PYTHON_3_11")
+
+        with zipfile.ZipFile(output_zip, "r") as zf:
+            assert zf.namelist() == ["apkg/__init__.py", "zpkg/__init__.py"]
+            assert zf.testzip() is None
+            assert zf.read("apkg/__init__.py") == b"# a" * 1000
+
     def test_merge_zips_with_dependencies(self, tmp_path):
         """Test merging dependencies and code zips."""
         # Create dependencies.zip
@@ -415,6 +566,50 @@ class TestCodeZipPackager:
             # User code should win
             assert "SETTING = 'user'" in content
 
+    def test_merge_zips_drops_overridden_dependency_entries(self, tmp_path):
+        """Test overridden dependency entries are not duplicated in the merged zip."""
+        deps_zip = tmp_path / "dependencies.zip"
+        with zipfile.ZipFile(deps_zip, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("config.py", "SETTING = 'dependency'")
+            zf.writestr("flask/__init__.py", "# flask")
+
+        direct_code_deploy = tmp_path / "code.zip"
+        with zipfile.ZipFile(direct_code_deploy, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("config.py", "SETTING = 'user'")
+
+        output_zip = tmp_path / "deployment.zip"
+        CodeZipPackager()._merge_zips(deps_zip, direct_code_deploy, output_zip)
+
+        with zipfile.ZipFile(output_zip, "r") as zf:
+            assert zf.namelist() == ["flask/__init__.py", "config.py"]
+            assert zf.testzip() is None
+
+    def test_merge_zips_copies_without_decompressing(self, tmp_path):
+        """Test merge copies compressed bytes and preserves entry metadata."""
+        deps_zip = tmp_path / "dependencies.zip"
+        with zipfile.ZipFile(deps_zip, "w", zipfile.ZIP_DEFLATED) as zf:
+            info = zipfile.ZipInfo("bin/tool", date_time=(2024, 1, 2, 3, 4, 6))
+            info.external_attr = 0o755 << 16
+            zf.writestr(info, "#!/usr/bin/env python3\n" * 50, compress_type=zipfile.ZIP_DEFLATED)
+
+        direct_code_deploy = tmp_path / "code.zip"
+        with zipfile.ZipFile(direct_code_deploy, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("agent.py", "print('hello')")
+
+        output_zip = tmp_path / "deployment.zip"
+        with patch.object(zipfile.ZipFile, "read", side_effect=AssertionError("entry was decompressed")):
+            CodeZipPackager()._merge_zips(deps_zip, direct_code_deploy, output_zip)
+
+        with zipfile.ZipFile(deps_zip, "r") as zf:
+            original = zf.getinfo("bin/tool")
+        with zipfile.ZipFile(output_zip, "r") as zf:
+            merged = zf.getinfo("bin/tool")
+            assert merged.external_attr == 0o755 << 16
+            assert merged.date_time == (2024, 1, 2, 3, 4, 6)
+            assert merged.compress_size == original.compress_size
+            assert merged.CRC == original.CRC
+            assert zf.read("bin/tool") == b"#!/usr/bin/env python3\n" * 50
+
     def test_merge_zips_without_dependencies(self, tmp_path):
         """Test merging with no dependencies."""
         direct_code_deploy = tmp_path / "code.zip"
@@ -489,6 +684,25 @@ class TestCodeZipPackager:
         assert result == "s3://test-bucket/test-agent/deployment.zip"
         mock_codebuild.ensure_source_bucket.assert_called_once_with("123456789012")
         mock_s3.upload_file.assert_called_once()
+        extra_args = mock_s3.upload_file.call_args.kwargs["ExtraArgs"]
+        assert extra_args["Metadata"]["agentcore-sha256"] == hashlib.sha256(b"fake zip").hexdigest()
+
+    @patch("bedrock_agentcore_starter_toolkit.services.codebuild.CodeBuildService")
+    def test_upload_to_s3_skips_unchanged(self, mock_codebuild_class, tmp_path):
+        """Test S3 upload is skipped when the stored object has the same digest."""
+        deployment_zip = tmp_path / "deployment.zip"
+        deployment_zip.write_bytes(b"fake zip")
+
+        mock_session = Mock()
+        mock_s3 = Mock()
+        mock_s3.head_object.return_value = {"Metadata": {"agentcore-sha256": hashlib.sha256(b"fake zip").hexdigest()}}
+        mock_session.client.return_value = mock_s3
+        mock_codebuild_class.return_value.ensure_source_bucket.return_value = "test-bucket"
+
+        result = CodeZipPackager().upload_to_s3(deployment_zip, "test-agent", mock_session, "123456789012")
+
+        assert result == "s3://test-bucket/test-agent/deployment.zip"
+        mock_s3.upload_file.assert_not_called()
 
     def test_runtime_version_normalization(self, tmp_path):
         """Test Python version normalization in uv commands."""
@@ -513,6 +727,157 @@ class TestCodeZipPackager:
         assert "aarch64-manylinux2014" in cmd3
 
 
+class TestSharedPackageCache:
+    """Test per-package dependency cache and layered dependencies.zip builds."""
+
+    @staticmethod
+    def _fake_install(name, version, target_dir, python_version, platform):
+        module = name.replace("-", "_")
+        (target_dir / module).mkdir()
+        (target_dir / module / "__init__.py").write_text(f"__version__ = '{version}'\n")
+        (target_dir / f"{module}-{version}.dist-info").mkdir()
+        (target_dir / f"{module}-{version}.dist-info" / "METADATA").write_text(f"Name: {name}\n")
+
+    def test_fragment_key(self, tmp_path):
+        """Test fragment keys include name, version, platform and Python version."""
+        cache = SharedPackageCache(tmp_path / "shared")
+        path = cache.fragment_path("requests", "2.32.3", "aarch64-manylinux2014", "3.11")
+
+        assert path == tmp_path / "shared" / "requests-2.32.3-aarch64-manylinux2014-py3.11.zip"
+        assert cache.cache_dir.exists()
+
+    def test_parse_pinned_requirements(self):
+        """Test parsing compiled requirements into normalized pins."""
+        content = (
+            "# comment\n"
+            "Flask==3.0.0\n"
+            "typing_extensions==4.12.2  # via pydantic\n"
+            "uvicorn[standard]==0.30.1\n"
+            "\n"
+            "zope.interface==6.4 ; python_version >= '3.8'\n"
+        )
+
+        pins = CodeZipPackager._parse_pinned_requirements(content)
+
+        assert pins == [
+            ("flask", "3.0.0"),
+            ("typing-extensions", "4.12.2"),
+            ("uvicorn", "0.30.1"),
+            ("zope-interface", "6.4"),
+        ]
+
+    def test_parse_pinned_requirements_unpinnable(self):
+        """Test VCS and path requirements cannot be served from the package cache."""
+        assert CodeZipPackager._parse_pinned_requirements("git+https://github.com/org/pkg.git\n") is None
+        assert CodeZipPackager._parse_pinned_requirements("flask>=3.0\n") is None
+
+    @patch("subprocess.run")
+    @patch("shutil.which")
+    def test_resolve_pinned_requirements_falls_back_to_next_platform(self, mock_which, mock_run, tmp_path):
+        """Test resolution tries the next ARM64 platform when one fails."""
+        mock_which.return_value = "/usr/local/bin/uv"
+
+        def fake_compile(cmd, **kwargs):
+            if "aarch64-manylinux2014" in cmd:
+                raise subprocess.CalledProcessError(1, cmd, stderr="no wheels")
+            Path(cmd[cmd.index("--output-file") + 1]).write_text("flask==3.0.0\n")
+            return Mock(returncode=0)
+
+        mock_run.side_effect = fake_compile
+        reqs = tmp_path / "requirements.txt"
+        reqs.write_text("flask\n")
+
+        result = CodeZipPackager()._resolve_pinned_requirements(reqs, "3.11", tmp_path)
+
+        assert result == ("aarch64-manylinux_2_17", [("flask", "3.0.0")])
+
+    def test_layered_build_installs_only_changed_packages(self, tmp_path):
+        """Test a version bump reinstalls only the bumped package and reuses the rest."""
+        shared = SharedPackageCache(tmp_path / "shared")
+        reqs = tmp_path / "requirements.txt"
+        reqs.write_text("flask\nrequests\n")
+        packager = CodeZipPackager(workers=2)
+
+        resolutions = [
+            ("aarch64-manylinux2014", [("flask", "3.0.0"), ("requests", "2.32.3")]),
+            ("aarch64-manylinux2014", [("flask", "3.0.1"), ("requests", "2.32.3")]),
+        ]
+        with (
+            patch.object(CodeZipPackager, "_resolve_pinned_requirements", side_effect=resolutions),
+            patch.object(CodeZipPackager, "_install_package", side_effect=self._fake_install) as mock_install,
+            patch.object(CodeZipPackager, "_install_dependencies") as mock_full_install,
+        ):
+            packager._build_dependencies_zip(reqs, tmp_path / "first.zip", "PYTHON_3_11", shared)
+            assert sorted(c.args[0] for c in mock_install.call_args_list) == ["flask", "requests"]
+
+            mock_install.reset_mock()
+            packager._build_dependencies_zip(reqs, tmp_path / "second.zip", "PYTHON_3_11", shared)
+            assert [(c.args[0], c.args[1]) for c in mock_install.call_args_list] == [("flask", "3.0.1")]
+
+        mock_full_install.assert_not_called()
+        with zipfile.ZipFile(tmp_path / "second.zip", "r") as zf:
+            assert zf.testzip() is None
+            assert zf.read("flask/__init__.py") == b"__version__ = '3.0.1'\n"
+            assert "requests/__init__.py" in zf.namelist()
+            assert "flask-3.0.0.dist-info/METADATA" not in zf.namelist()
+
+    def test_layered_build_shared_across_agents(self, tmp_path):
+        """Test a second agent with the same dependencies installs nothing."""
+        shared = SharedPackageCache(tmp_path / "shared")
+        reqs = tmp_path / "requirements.txt"
+        reqs.write_text("flask\n")
+        resolution = ("aarch64-manylinux2014", [("flask", "3.0.0")])
+
+        with (
+            patch.object(CodeZipPackager, "_resolve_pinned_requirements", return_value=resolution),
+            patch.object(CodeZipPackager, "_install_package", side_effect=self._fake_install) as mock_install,
+        ):
+            CodeZipPackager()._build_dependencies_zip(reqs, tmp_path / "agent_a.zip", "PYTHON_3_11", shared)
+            CodeZipPackager()._build_dependencies_zip(reqs, tmp_path / "agent_b.zip", "PYTHON_3_11", shared)
+
+        mock_install.assert_called_once()
+        with zipfile.ZipFile(tmp_path / "agent_b.zip", "r") as zf:
+            assert zf.read("flask/__init__.py") == b"__version__ = '3.0.0'\n"
+
+    def test_layered_build_falls_back_to_full_install(self, tmp_path):
+        """Test requirements that cannot be pinned use the full install path."""
+        shared = SharedPackageCache(tmp_path / "shared")
+        reqs = tmp_path / "requirements.txt"
+        reqs.write_text("git+https://github.com/org/pkg.git\n")
+
+        def fake_full_install(requirements_file, target_dir, runtime_version, cross_compile):
+            (target_dir / "pkg").mkdir()
+            (target_dir / "pkg" / "__init__.py").write_text("# pkg")
+
+        with (
+            patch.object(CodeZipPackager, "_resolve_pinned_requirements", return_value=None),
+            patch.object(CodeZipPackager, "_install_dependencies", side_effect=fake_full_install) as mock_full,
+            patch.object(CodeZipPackager, "_install_package") as mock_install,
+        ):
+            CodeZipPackager()._build_dependencies_zip(reqs, tmp_path / "deps.zip", "PYTHON_3_11", shared)
+
+        mock_full.assert_called_once()
+        mock_install.assert_not_called()
+        with zipfile.ZipFile(tmp_path / "deps.zip", "r") as zf:
+            assert zf.namelist() == ["pkg/__init__.py"]
+
+    def test_code_zip_excludes_cache_artifacts(self, tmp_path):
+        """Test cache files are not packaged when the cache lives in the source directory."""
+        source_dir = tmp_path / "project"
+        source_dir.mkdir()
+        (source_dir / "agent.py").write_text("print('hello')")
+        cache = PackageCache(source_dir)
+        cache.dependencies_zip.write_bytes(b"deps")
+        cache.dependencies_hash.write_text("hash")
+
+        packager = CodeZipPackager()
+        packager._build_direct_code_deploy(source_dir, tmp_path / "first.zip", cache)
+        packager._build_direct_code_deploy(source_dir, tmp_path / "second.zip", cache)
+
+        with zipfile.ZipFile(tmp_path / "second.zip", "r") as zf:
+            assert zf.namelist() == ["agent.py"]
+
+
 class TestFixShebangsInBinDir:
     """Test shebang fixing in bin/ scripts during dependency packaging."""
 
@@ -0,0 +1,172 @@
+"""Tests for raw zip entry helpers."""
+
+import zipfile
+
+import pytest
+
+from bedrock_agentcore_starter_toolkit.utils.runtime.zip_writer import (
+    ParallelZipWriter,
+    compress_file,
+    copy_raw_entries,
+    read_raw_entry,
+    write_raw_entry,
+)
+
+
+def _make_zip(path, entries):
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, data in entries.items():
+            zf.writestr(name, data)
+
+
+class TestRawEntries:
+    """Test reading and writing already-compressed entries."""
+
+    def test_round_trip_copies_compressed_bytes(self, tmp_path):
+        """Test raw entries copied between archives decompress to the original data."""
+        source = tmp_path / "source.zip"
+        _make_zip(source, {"a.py": "print('a')" * 100, "pkg/b.py": "print('b')"})
+
+        target = tmp_path / "target.zip"
+        with zipfile.ZipFile(source, "r") as src, open(source, "rb") as fp:
+            with zipfile.ZipFile(target, "w") as out:
+                for info in src.infolist():
+                    raw = read_raw_entry(fp, info.header_offset, info.compress_size, info.filename)
+                    new_info = zipfile.ZipInfo(info.filename, info.date_time)
+                    new_info.compress_type = info.compress_type
+                    new_info.CRC = info.CRC
+                    new_info.file_size = info.file_size
+                    write_raw_entry(out, new_info, raw)
+
+        with zipfile.ZipFile(target, "r") as zf:
+            assert zf.testzip() is None
+            assert zf.read("a.py") == b"print('a')" * 100
+            assert zf.read("pkg/b.py") == b"print('b')"
+            assert zf.getinfo("a.py").compress_type == zipfile.ZIP_DEFLATED
+
+    def test_raw_entries_mix_with_regular_writes(self, tmp_path):
+        """Test raw writes interleave correctly with ZipFile.writestr."""
+        source = tmp_path / "source.zip"
+        _make_zip(source, {"raw.txt": "raw"})
+
+        target = tmp_path / "target.zip"
+        with zipfile.ZipFile(source, "r") as src, open(source, "rb") as fp:
+            info = src.getinfo("raw.txt")
+            raw = read_raw_entry(fp, info.header_offset, info.compress_size, info.filename)
+            with zipfile.ZipFile(target, "w", zipfile.ZIP_DEFLATED) as out:
+                out.writestr("before.txt", "before")
+                new_info = zipfile.ZipInfo("raw.txt", info.date_time)
+                new_info.compress_type = info.compress_type
+                new_info.CRC = info.CRC
+                new_info.file_size = info.file_size
+                write_raw_entry(out, new_info, raw)
+                out.writestr("after.txt", "after")
+
+        with zipfile.ZipFile(target, "r") as zf:
+            assert zf.namelist() == ["before.txt", "raw.txt", "after.txt"]
+            assert zf.testzip() is None
+            assert zf.read("raw.txt") == b"raw"
+
+    def test_read_raw_entry_name_mismatch(self, tmp_path):
+        """Test a stale offset pointing at another entry is rejected."""
+        source = tmp_path / "source.zip"
+        _make_zip(source, {"a.py": "a", "b.py": "b"})
+
+        with zipfile.ZipFile(source, "r") as src, open(source, "rb") as fp:
+            info = src.getinfo("a.py")
+            with pytest.raises(zipfile.BadZipFile):
+                read_raw_entry(fp, info.header_offset, info.compress_size, "b.py")
+
+    def test_read_raw_entry_bad_offset(self, tmp_path):
+        """Test an offset that does not point at a local header is rejected."""
+        source = tmp_path / "source.zip"
+        _make_zip(source, {"a.py": "a"})
+
+        with open(source, "rb") as fp:
+            with pytest.raises(zipfile.BadZipFile):
+                read_raw_entry(fp, 3, 1, "a.py")
+
+    def test_copy_raw_entries_with_skip(self, tmp_path):
+        """Test copying a whole archive while skipping selected names."""
+        source = tmp_path / "source.zip"
+        _make_zip(source, {"a.py": "a", "b.py": "b", "c.py": "c"})
+
+        target = tmp_path / "target.zip"
+        with zipfile.ZipFile(target, "w") as out:
+            copied = copy_raw_entries(source, out, skip={"b.py"})
+
+        assert copied == ["a.py", "c.py"]
+        with zipfile.ZipFile(target, "r") as zf:
+            assert zf.namelist() == ["a.py", "c.py"]
+            assert zf.testzip() is None
+
+
+class TestParallelZipWriter:
+    """Test ParallelZipWriter."""
+
+    def test_writes_entries_in_submission_order(self, tmp_path):
+        """Test entries land in the order they were added regardless of completion order."""
+        files = []
+        for i in range(30):
+            path = tmp_path / f"f{i}.txt"
+            # Larger files first so later (smaller) files tend to finish compressing earlier
+            path.write_bytes(b"x" * (30 - i) * 10000)
+            files.append(path)
+
+        target = tmp_path / "out.zip"
+        written = []
+        with zipfile.ZipFile(target, "w") as out:
+            with ParallelZipWriter(out, workers=4, on_write=lambda e: written.append(e.zinfo.filename)) as writer:
+                for path in files:
+                    writer.add_file(path, path.name)
+
+        expected = [p.name for p in files]
+        assert written == expected
+        with zipfile.ZipFile(target, "r") as zf:
+            assert zf.namelist() == expected
+            assert zf.testzip() is None
+
+    def test_add_raw_keeps_position(self, tmp_path):
+        """Test raw entries interleave with compressed files in order."""
+        a = tmp_path / "a.txt"
+        a.write_text("a")
+        c = tmp_path / "c.txt"
+        c.write_text("c")
+        b_entry = compress_file(a, "b.txt", 6)
+
+        target = tmp_path / "out.zip"
+        with zipfile.ZipFile(target, "w") as out:
+            with ParallelZipWriter(out, workers=2) as writer:
+                writer.add_file(a, "a.txt")
+                writer.add_raw(b_entry.zinfo, b_entry.raw)
+                writer.add_file(c, "c.txt")
+
+        with zipfile.ZipFile(target, "r") as zf:
+            assert zf.namelist() == ["a.txt", "b.txt", "c.txt"]
+            assert zf.read("b.txt") == b"a"
+
+    def test_compress_level_affects_size(self, tmp_path):
+        """Test the compression level knob is applied."""
+        path = tmp_path / "data.txt"
+        path.write_text("".join(f"line {i} of some repetitive text\n" for i in range(5000)))
+
+        stored = compress_file(path, "data.txt", 0)
+        best = compress_file(path, "data.txt", 9)
+
+        assert len(best.raw) < len(stored.raw)
+        assert stored.zinfo.file_size == best.zinfo.file_size == path.stat().st_size
+
+    def test_error_discards_pending_entries(self, tmp_path):
+        """Test an exception inside the context does not write queued entries."""
+        path = tmp_path / "a.txt"
+        path.write_text("a")
+        target = tmp_path / "out.zip"
+
+        with zipfile.ZipFile(target, "w") as out:
+            with pytest.raises(RuntimeError):
+                with ParallelZipWriter(out, workers=1) as writer:
+                    writer.add_file(path, "a.txt")
+                    raise RuntimeError("boom")
+
+        with zipfile.ZipFile(target, "r") as zf:
+            assert zf.namelist() == []
@@ -0,0 +1,86 @@
+"""Benchmark for building spans from large CloudWatch Logs Insights results.
+
+Run explicitly (not part of the unit suite):
+
+    pytest -s tests_integ/observability/test_telemetry_benchmark.py
+
+Set AGENTCORE_BENCH_SPANS to change the number of generated spans (default 100000).
+"""
+
+import json
+import os
+import time
+import tracemalloc
+
+import pytest
+
+from bedrock_agentcore_starter_toolkit.operations.observability.builders import CloudWatchResultBuilder
+from bedrock_agentcore_starter_toolkit.operations.observability.telemetry import TraceData
+from bedrock_agentcore_starter_toolkit.operations.observability.trace_processor import TraceProcessor
+
+SPANS = int(os.getenv("AGENTCORE_BENCH_SPANS", "100000"))
+SPANS_PER_TRACE = 50
+
+
+@pytest.fixture(scope="module")
+def result_rows():
+    """Generate Insights result rows shaped like aws/spans query results."""
+    rows = []
+    for i in range(SPANS):
+        trace_index = i // SPANS_PER_TRACE
+        parent = "" if i % SPANS_PER_TRACE == 0 else f"span-{trace_index * SPANS_PER_TRACE}"
+        message = {
+            "traceId": f"trace-{trace_index}",
+            "spanId": f"span-{i}",
+            "attributes": {"session.id": "session-1", "gen_ai.operation.name": "chat", "payload": "x" * 200},
+            "resource": {"attributes": {"service.name": "agent.DEFAULT", "cloud.resource_id": "runtime/agent-1/"}},
+        }
+        rows.append(
+            [
+                {"field": "@timestamp", "value": "2025-11-17 23:58:37.517"},
+                {"field": "@message", "value": json.dumps(message)},
+                {"field": "traceId", "value": f"trace-{trace_index}"},
+                {"field": "spanId", "value": f"span-{i}"},
+                {"field": "spanName", "value": "chat"},
+                {"field": "kind", "value": "SPAN_KIND_INTERNAL"},
+                {"field": "statusCode", "value": "UNSET"},
+                {"field": "durationMs", "value": "12.5"},
+                {"field": "sessionId", "value": "session-1"},
+                {"field": "startTimeUnixNano", "value": str(1_763_423_917_000_000_000 + i)},
+                {"field": "endTimeUnixNano", "value": str(1_763_423_918_000_000_000 + i)},
+                {"field": "parentSpanId", "value": parent},
+                {"field": "events", "value": json.dumps([{"name": "gen_ai.choice", "attributes": {}}])},
+                {"field": "serviceName", "value": "agent.DEFAULT"},
+            ]
+        )
+    return rows
+
+
+def _build(rows, decode):
+    tracemalloc.start()
+    start = time.perf_counter()
+    spans = [CloudWatchResultBuilder.build_span(row) for row in rows]
+    if decode:
+        for span in spans:
+            _ = (span.attributes, span.resource_attributes, span.events)
+    trace_data = TraceData(spans=spans)
+    TraceProcessor.group_spans_by_trace(trace_data)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return trace_data, elapsed, peak
+
+
+def test_build_spans_without_decoding_payloads(result_rows):
+    """Building and grouping spans skips payload decoding until it is needed."""
+    lazy_data, lazy_time, lazy_peak = _build(result_rows, decode=False)
+    eager_data, eager_time, eager_peak = _build(result_rows, decode=True)
+
+    print(
+        f"\n{SPANS} spans: lazy {lazy_time:.2f}s / {lazy_peak / 2**20:.0f} MiB, "
+        f"all payloads decoded {eager_time:.2f}s / {eager_peak / 2**20:.0f} MiB"
+    )
+
+    assert len(lazy_data.traces) == len(eager_data.traces) == -(-SPANS // SPANS_PER_TRACE)
+    assert lazy_time < eager_time
+    assert lazy_peak < eager_peak
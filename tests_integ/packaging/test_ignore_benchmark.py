@@ -0,0 +1,101 @@
+"""Benchmark for ignore-pattern matching on a large source tree.
+
+Run explicitly (not part of the unit suite):
+
+    pytest -s tests_integ/packaging/test_ignore_benchmark.py
+
+Set AGENTCORE_BENCH_FILES to change the number of generated files (default 50000).
+"""
+
+import fnmatch
+import os
+import time
+
+import pytest
+
+from bedrock_agentcore_starter_toolkit.utils.runtime.ignore import IgnoreMatcher
+from bedrock_agentcore_starter_toolkit.utils.runtime.package import CodeZipPackager
+
+FILES = int(os.getenv("AGENTCORE_BENCH_FILES", "50000"))
+FILES_PER_DIR = 100
+
+
+def _legacy_matches(path, pattern, is_dir):
+    """Baseline CodeZipPackager._matches_pattern, copied verbatim."""
+    if pattern.endswith("/"):
+        if not is_dir:
+            return False
+        pattern = pattern[:-1]
+    if path == pattern:
+        return True
+    if fnmatch.fnmatch(path, pattern):
+        return True
+    if is_dir and pattern in path.split("/"):
+        return True
+    return False
+
+
+def _legacy_is_ignored(path, patterns, is_dir):
+    """Baseline CodeZipPackager._should_ignore, copied verbatim."""
+    if path.startswith("./"):
+        path = path[2:]
+    ignored = False
+    for pattern in patterns:
+        if pattern.startswith("!"):
+            if _legacy_matches(path, pattern[1:], is_dir):
+                ignored = False
+        elif _legacy_matches(path, pattern, is_dir):
+            ignored = True
+    return ignored
+
+
+def _walk(root, is_ignored):
+    kept = 0
+    for current, dirs, files in os.walk(root):
+        rel_root = os.path.relpath(current, root)
+        rel_root = "" if rel_root == "." else rel_root
+        dirs[:] = [d for d in dirs if not is_ignored(os.path.join(rel_root, d) if rel_root else d, True)]
+        for name in files:
+            if not is_ignored(os.path.join(rel_root, name) if rel_root else name, False):
+                kept += 1
+    return kept
+
+
+def _timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+@pytest.fixture(scope="module")
+def source_tree(tmp_path_factory):
+    """Generate a tree of FILES empty files spread over nested packages."""
+    root = tmp_path_factory.mktemp("ignore_bench")
+    suffixes = [".py", ".py", ".py", ".json", ".md", ".pyc", ".txt", ".log"]
+    for i in range(FILES):
+        directory = root / f"pkg{i // (FILES_PER_DIR * 10)}" / f"mod{(i // FILES_PER_DIR) % 10}"
+        if i % FILES_PER_DIR == 0:
+            directory.mkdir(parents=True, exist_ok=True)
+        (directory / f"file_{i}{suffixes[i % len(suffixes)]}").touch()
+    return root
+
+
+def test_compiled_matcher_is_not_the_bottleneck(source_tree):
+    """Compiled matching agrees with the baseline fnmatch loop and costs a fraction of it."""
+    patterns = CodeZipPackager()._get_ignore_patterns()
+    matcher = IgnoreMatcher(patterns)
+
+    walk_count, walk_time = _timed(_walk, source_tree, lambda path, is_dir: False)
+    compiled_count, compiled_time = _timed(_walk, source_tree, matcher.is_ignored)
+    legacy_count, legacy_time = _timed(
+        _walk, source_tree, lambda path, is_dir: _legacy_is_ignored(path, patterns, is_dir)
+    )
+
+    print(
+        f"\n{FILES} files, {len(patterns)} patterns: walk only {walk_time:.2f}s, "
+        f"compiled {compiled_time:.2f}s, fnmatch loop {legacy_time:.2f}s "
+        f"(kept {compiled_count} of {walk_count})"
+    )
+
+    assert compiled_count == legacy_count
+    assert compiled_time - walk_time < (legacy_time - walk_time) * 0.5
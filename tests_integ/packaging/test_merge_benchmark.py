@@ -0,0 +1,80 @@
+"""Benchmark for CodeZipPackager._merge_zips on a large dependency set.
+
+Run explicitly (not part of the unit suite):
+
+    pytest -s tests_integ/packaging/test_merge_benchmark.py
+
+Set AGENTCORE_BENCH_DEPS_MB to change the size of the generated dependencies.zip (default 200).
+"""
+
+import os
+import random
+import time
+import zipfile
+
+import pytest
+
+from bedrock_agentcore_starter_toolkit.utils.runtime.package import CodeZipPackager
+
+DEPS_MB = int(os.getenv("AGENTCORE_BENCH_DEPS_MB", "200"))
+FILE_SIZE = 256 * 1024
+
+
+def _legacy_merge(dependencies_zip, direct_code_deploy, output_zip):
+    """Previous merge implementation: inflate and re-deflate every entry."""
+    with zipfile.ZipFile(output_zip, "w", zipfile.ZIP_DEFLATED) as out:
+        with zipfile.ZipFile(dependencies_zip, "r") as dep:
+            for item in dep.namelist():
+                out.writestr(dep.getinfo(item), dep.read(item))
+        with zipfile.ZipFile(direct_code_deploy, "r") as code:
+            for item in code.namelist():
+                out.writestr(code.getinfo(item), code.read(item))
+
+
+def _timed(func, *args):
+    wall, cpu = time.perf_counter(), time.process_time()
+    func(*args)
+    return time.perf_counter() - wall, time.process_time() - cpu
+
+
+@pytest.fixture(scope="module")
+def layers(tmp_path_factory):
+    """Generate a dependencies.zip of roughly DEPS_MB uncompressed bytes and a small code.zip."""
+    root = tmp_path_factory.mktemp("merge_bench")
+    rng = random.Random(0)
+    words = [bytes(rng.choice(b"abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(2, 10))) for _ in range(2000)]
+
+    deps_zip = root / "dependencies.zip"
+    with zipfile.ZipFile(deps_zip, "w", zipfile.ZIP_DEFLATED) as zf:
+        for i in range(DEPS_MB * 1024 * 1024 // FILE_SIZE):
+            # Mix of text-like and random content, roughly matching wheel contents
+            text = b" ".join(rng.choice(words) for _ in range(FILE_SIZE // 12))[: FILE_SIZE // 2]
+            zf.writestr(f"pkg{i % 50}/module_{i}.py", text + rng.randbytes(FILE_SIZE - len(text)))
+
+    code_zip = root / "code.zip"
+    with zipfile.ZipFile(code_zip, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("agent.py", "print('hello')\n" * 100)
+
+    return deps_zip, code_zip, root
+
+
+def test_merge_is_io_bound(layers):
+    """Raw-copy merge spends little CPU compared with the inflate/re-deflate merge."""
+    deps_zip, code_zip, root = layers
+    packager = CodeZipPackager()
+
+    raw_wall, raw_cpu = _timed(packager._merge_zips, deps_zip, code_zip, root / "raw.zip")
+    legacy_wall, legacy_cpu = _timed(_legacy_merge, deps_zip, code_zip, root / "legacy.zip")
+
+    size_mb = deps_zip.stat().st_size / (1024 * 1024)
+    print(
+        f"\nmerge of {size_mb:.0f} MB dependencies.zip: "
+        f"raw copy {raw_wall:.2f}s wall / {raw_cpu:.2f}s cpu ({size_mb / raw_wall:.0f} MB/s), "
+        f"recompress {legacy_wall:.2f}s wall / {legacy_cpu:.2f}s cpu"
+    )
+
+    with zipfile.ZipFile(root / "raw.zip", "r") as zf:
+        assert len(zf.namelist()) == DEPS_MB * 1024 * 1024 // FILE_SIZE + 1
+
+    # The raw merge never runs zlib, so it should cost a small fraction of the recompressing merge
+    assert raw_cpu < legacy_cpu * 0.25